@@ -6,14 +6,20 @@ Advanced analytics endpoints for the admin panel including:
 - User search and timeline
 
 All analytics exclude internal users (is_internal=true) by default.
-Use include_internal=true to include them.
+Use include_internal=true to include them. On user_events this is the
+is_internal stamp written at ingestion (see user_analytics.stamp_event_audience).
+
+Callers pass the analytics read handle (see analytics_db): reads may be
+served by a secondary up to its max staleness and are bounded by its time budget.
 """
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, AsyncIterator
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 import logging
 from collections import defaultdict
+from query_batch import QueryBatch
+from user_analytics import audience_filter
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +33,32 @@ async def get_internal_user_ids(db: AsyncIOMotorDatabase) -> Set[str]:
     return {str(u["_id"]) for u in internal_users}
 
 
+# Funnel steps sourced from users.created_at instead of user_events
+SIGNUP_STEPS = {"user_registered", "signup"}
+
+
+def _advance_funnel(progress: List[Optional[datetime]], step_indexes: List[int], ts: datetime, window: Optional[timedelta]) -> None:
+    """
+    Advance one user's ordered-funnel state with a single event.
+    
+    progress[k] holds the latest entry (step 0) time of any sequence that has
+    reached step k in order. Keeping the latest entry maximises the time left
+    inside the conversion window. Indexes are visited high-to-low so one event
+    cannot satisfy two consecutive identical steps.
+    """
+    for k in sorted(step_indexes, reverse=True):
+        if k == 0:
+            progress[0] = ts
+            continue
+        entry = progress[k - 1]
+        if entry is None:
+            continue
+        if window is not None and ts - entry > window:
+            continue
+        if progress[k] is None or entry > progress[k]:
+            progress[k] = entry
+
+
 async def get_funnel_analysis(
     db: AsyncIOMotorDatabase,
     start_date: datetime,
@@ -34,7 +66,9 @@ async def get_funnel_analysis(
     steps: Optional[List[str]] = None,
     include_users: bool = False,
     limit_users: int = 100,
-    include_internal: bool = False
+    include_internal: bool = False,
+    ordered: bool = True,
+    window: Optional[timedelta] = None
 ) -> Dict[str, Any]:
     """
     Get funnel analysis with conversion rates between steps.
@@ -46,15 +80,17 @@ async def get_funnel_analysis(
     4. workout_completed
     5. post_created
     
-    Returns conversion rates and optionally user lists for each step.
+    Streams step events once, sorted by (user_id, timestamp), and evaluates
+    each user as the stream passes:
+    - ordered=True: a user reaches step k only after doing steps 0..k in order,
+      each within `window` of their step-0 event (if a window is given)
+    - ordered=False: legacy semantics - a step counts every user who did it,
+      conversion is measured against the previous step's users
+    
+    Returns conversion rates and optionally sampled user IDs for each step.
     Excludes internal users by default (include_internal=False).
     """
     try:
-        # Get internal user IDs to exclude
-        excluded_user_ids = set()
-        if not include_internal:
-            excluded_user_ids = await get_internal_user_ids(db)
-        
         # Default funnel steps if not provided
         if not steps:
             steps = [
@@ -65,73 +101,145 @@ async def get_funnel_analysis(
                 "post_created"
             ]
         
-        # Base filter
-        base_filter = {
-            "timestamp": {"$gte": start_date, "$lte": end_date},
-        }
-        if excluded_user_ids:
-            base_filter["user_id"] = {"$nin": list(excluded_user_ids)}
+        step_positions: Dict[str, List[int]] = defaultdict(list)
+        for i, step in enumerate(steps):
+            step_positions[step].append(i)
         
-        funnel_data = []
-        previous_users = None
+        # Signup steps: one synthetic event per user at created_at
+        signup_steps = [step for step in step_positions if step in SIGNUP_STEPS]
+        signups: Dict[str, datetime] = {}
+        if signup_steps:
+            user_filter = {"created_at": {"$gte": start_date, "$lte": end_date}}
+            if not include_internal:
+                user_filter["is_internal"] = {"$ne": True}
+            async for user in db.users.find(user_filter, {"_id": 1, "created_at": 1}):
+                signups[str(user["_id"])] = user["created_at"]
+        
+        # Per-step state. Ordered funnels keep counts and capped samples only;
+        # unordered ones keep every user id per step (set intersections)
+        reached = [0] * len(steps)
+        samples: List[List[str]] = [[] for _ in steps]
+        dropped_samples: List[List[str]] = [[] for _ in steps]
+        step_user_sets: List[Set[str]] = [set() for _ in steps]
+        
+        def evaluate_user(user_id: str, events: List[tuple]) -> None:
+            # Popped, so the users left in signups afterwards are the ones without events
+            signed_up_at = signups.pop(user_id, None)
+            if signed_up_at is not None:
+                for step in signup_steps:
+                    events.append((signed_up_at, step))
+                events.sort(key=lambda e: e[0])
+            
+            if not ordered:
+                for _, event_type in events:
+                    for k in step_positions[event_type]:
+                        step_user_sets[k].add(user_id)
+                return
+            
+            progress: List[Optional[datetime]] = [None] * len(steps)
+            for ts, event_type in events:
+                _advance_funnel(progress, step_positions[event_type], ts, window)
+            
+            depth = 0
+            while depth < len(steps) and progress[depth] is not None:
+                depth += 1
+            for k in range(depth):
+                reached[k] += 1
+                if include_users and len(samples[k]) < limit_users:
+                    samples[k].append(user_id)
+            if include_users and 0 < depth < len(steps) and len(dropped_samples[depth]) < limit_users:
+                dropped_samples[depth].append(user_id)
+        
+        # Single pass over events, grouped by user. The (user_id asc, timestamp desc)
+        # order matches the existing user_id/timestamp index; each user's short
+        # buffer is reversed into chronological order.
+        event_types = [step for step in step_positions if step not in SIGNUP_STEPS]
+        if event_types:
+            query = {
+                "timestamp": {"$gte": start_date, "$lte": end_date},
+                "event_type": {"$in": event_types},
+                **audience_filter(include_internal),
+            }
+            cursor = db.user_events.find(
+                query,
+                {"_id": 0, "user_id": 1, "event_type": 1, "timestamp": 1}
+            ).sort([("user_id", 1), ("timestamp", -1)]).allow_disk_use(True).batch_size(5000)
+            
+            current_user = None
+            buffer: List[tuple] = []
+            async for event in cursor:
+                user_id = event.get("user_id")
+                if not user_id:
+                    continue
+                if user_id != current_user:
+                    if current_user is not None:
+                        buffer.reverse()
+                        evaluate_user(current_user, buffer)
+                    current_user = user_id
+                    buffer = []
+                buffer.append((event["timestamp"], event["event_type"]))
+            if current_user is not None:
+                buffer.reverse()
+                evaluate_user(current_user, buffer)
+        
+        # Signed-up users with no step events in the window
+        while signups:
+            evaluate_user(next(iter(signups)), [])
         
+        funnel_data = []
         for i, step in enumerate(steps):
-            # Get unique users who completed this step
-            step_filter = {**base_filter, "event_type": step}
-            
-            # For registration, check users collection
-            if step in ["user_registered", "signup"]:
-                user_filter = {"created_at": {"$gte": start_date, "$lte": end_date}}
-                if not include_internal:
-                    user_filter["is_internal"] = {"$ne": True}
-                users_cursor = db.users.find(user_filter, {"_id": 1})
-                user_ids = set()
-                async for user in users_cursor:
-                    user_ids.add(str(user["_id"]))
+            if ordered:
+                unique_users = reached[i]
+                previous = reached[i - 1] if i > 0 else unique_users
+                converted_count = unique_users
+                dropped_count = previous - unique_users if i > 0 else 0
+                converted_sample = samples[i]
+                dropped_sample = dropped_samples[i]
             else:
-                user_ids_list = await db.user_events.distinct("user_id", step_filter)
-                user_ids = set(uid for uid in user_ids_list if uid not in excluded_user_ids)
+                user_ids = step_user_sets[i]
+                unique_users = len(user_ids)
+                if i == 0:
+                    previous_users = user_ids
+                    converted_users = user_ids
+                    dropped_users = set()
+                else:
+                    previous_users = step_user_sets[i - 1]
+                    converted_users = user_ids & previous_users
+                    dropped_users = previous_users - user_ids
+                previous = len(previous_users)
+                converted_count = len(converted_users)
+                dropped_count = len(dropped_users)
+                converted_sample = list(converted_users)[:limit_users]
+                dropped_sample = list(dropped_users)[:limit_users]
             
             # Calculate conversion from previous step
             if i == 0:
                 conversion_rate = 100.0
                 dropoff_rate = 0.0
-                converted_users = user_ids
-                dropped_users = set()
+            elif previous > 0:
+                conversion_rate = round((converted_count / previous) * 100, 2)
+                dropoff_rate = round(100 - conversion_rate, 2)
             else:
-                if previous_users and len(previous_users) > 0:
-                    converted_users = user_ids & previous_users
-                    dropped_users = previous_users - user_ids
-                    conversion_rate = round((len(converted_users) / len(previous_users)) * 100, 2)
-                    dropoff_rate = round(100 - conversion_rate, 2)
-                else:
-                    converted_users = set()
-                    dropped_users = set()
-                    conversion_rate = 0.0
-                    dropoff_rate = 100.0
+                conversion_rate = 0.0
+                dropoff_rate = 100.0
             
             step_data = {
                 "step": step,
                 "step_index": i,
                 "step_label": _get_step_label(step),
-                "unique_users": len(user_ids),
-                "converted_users": len(converted_users) if i > 0 else len(user_ids),
-                "dropped_users": len(dropped_users),
+                "unique_users": unique_users,
+                "converted_users": converted_count,
+                "dropped_users": dropped_count,
                 "conversion_rate": conversion_rate,
                 "dropoff_rate": dropoff_rate,
             }
             
             # Include user samples if requested
             if include_users:
-                # Get user details for converted users (limited)
-                converted_sample = list(converted_users)[:limit_users] if i > 0 else list(user_ids)[:limit_users]
-                dropped_sample = list(dropped_users)[:limit_users]
-                
                 step_data["converted_user_ids"] = converted_sample
                 step_data["dropped_user_ids"] = dropped_sample
             
             funnel_data.append(step_data)
-            previous_users = user_ids
         
         # Calculate overall funnel conversion
         if funnel_data and len(funnel_data) >= 2:
@@ -148,6 +256,8 @@ async def get_funnel_analysis(
             "overall_conversion": overall_conversion,
             "total_entry_users": funnel_data[0]["unique_users"] if funnel_data else 0,
             "total_completed_users": funnel_data[-1]["unique_users"] if funnel_data else 0,
+            "ordered": ordered,
+            "window_hours": window.total_seconds() / 3600 if window else None,
         }
         
     except Exception as e:
@@ -605,46 +715,42 @@ async def get_comparison_stats(
     Excludes internal users by default.
     """
     try:
-        # Get internal user IDs to exclude
-        excluded_user_ids = set()
-        if not include_internal:
-            excluded_user_ids = await get_internal_user_ids(db)
-        
-        exclude_filter = {}
-        if excluded_user_ids:
-            exclude_filter = {"user_id": {"$nin": list(excluded_user_ids)}}
-        
-        async def count_events(event_type: str, start: datetime, end: datetime) -> int:
-            query = {
-                "event_type": event_type,
-                "timestamp": {"$gte": start, "$lte": end},
-            }
-            if excluded_user_ids:
-                query["user_id"] = {"$nin": list(excluded_user_ids)}
-            return await db.user_events.count_documents(query)
+        def event_query(start: datetime, end: datetime, event_type: Optional[str] = None) -> dict:
+            query = {**audience_filter(include_internal), "timestamp": {"$gte": start, "$lte": end}}
+            if event_type:
+                query["event_type"] = event_type
+            return query
         
-        async def count_unique_users(event_type: str, start: datetime, end: datetime) -> int:
-            query = {
-                "event_type": event_type,
-                "timestamp": {"$gte": start, "$lte": end},
-            }
-            if excluded_user_ids:
-                query["user_id"] = {"$nin": list(excluded_user_ids)}
-            users = await db.user_events.distinct("user_id", query)
-            return len([u for u in users if u not in excluded_user_ids])
-        
-        async def count_active_users(start: datetime, end: datetime) -> int:
-            query = {"timestamp": {"$gte": start, "$lte": end}}
-            if excluded_user_ids:
-                query["user_id"] = {"$nin": list(excluded_user_ids)}
-            users = await db.user_events.distinct("user_id", query)
-            return len([u for u in users if u not in excluded_user_ids])
-        
-        async def count_new_users(start: datetime, end: datetime) -> int:
+        def new_users_query(start: datetime, end: datetime) -> dict:
             query = {"created_at": {"$gte": start, "$lte": end}}
             if not include_internal:
                 query["is_internal"] = {"$ne": True}
-            return await db.users.count_documents(query)
+            return query
+        
+        event_metrics = [
+            ("workouts_started", "workout_started"),
+            ("workouts_completed", "workout_completed"),
+            ("posts_created", "post_created"),
+            ("likes", "post_liked"),
+            ("comments", "post_commented"),
+            ("follows", "user_followed"),
+            # Notification clicks (proxy for IG shares / push CTR)
+            ("notification_clicks", "notification_clicked"),
+            ("app_sessions", "app_session_start"),
+        ]
+        
+        # Every count/distinct for both periods is independent: run them concurrently
+        batch = QueryBatch(db)
+        periods = {
+            "current": (current_start, current_end),
+            "previous": (previous_start, previous_end),
+        }
+        for prefix, (start, end) in periods.items():
+            batch.distinct(f"{prefix}_active", "user_events", "user_id", event_query(start, end))
+            batch.count(f"{prefix}_new", "users", new_users_query(start, end))
+            for metric, event_type in event_metrics:
+                batch.count(f"{prefix}_{metric}", "user_events", event_query(start, end, event_type))
+        r = await batch.run()
         
         # Calculate metrics for both periods
         metrics = {}
@@ -653,8 +759,8 @@ async def get_comparison_stats(
         current_days = max(1, (current_end - current_start).days)
         previous_days = max(1, (previous_end - previous_start).days)
         
-        current_active = await count_active_users(current_start, current_end)
-        previous_active = await count_active_users(previous_start, previous_end)
+        current_active = len(r["current_active"])
+        previous_active = len(r["previous_active"])
         
         metrics["active_users"] = _calc_change(current_active, previous_active)
         metrics["dau_avg"] = _calc_change(
@@ -663,51 +769,22 @@ async def get_comparison_stats(
         )
         
         # New users
-        current_new = await count_new_users(current_start, current_end)
-        previous_new = await count_new_users(previous_start, previous_end)
-        metrics["new_users"] = _calc_change(current_new, previous_new)
+        metrics["new_users"] = _calc_change(r["current_new"], r["previous_new"])
         
         # Workouts
-        current_started = await count_events("workout_started", current_start, current_end)
-        previous_started = await count_events("workout_started", previous_start, previous_end)
-        metrics["workouts_started"] = _calc_change(current_started, previous_started)
-        
-        current_completed = await count_events("workout_completed", current_start, current_end)
-        previous_completed = await count_events("workout_completed", previous_start, previous_end)
-        metrics["workouts_completed"] = _calc_change(current_completed, previous_completed)
+        metrics["workouts_started"] = _calc_change(r["current_workouts_started"], r["previous_workouts_started"])
+        metrics["workouts_completed"] = _calc_change(r["current_workouts_completed"], r["previous_workouts_completed"])
         
         # Completion rate
+        current_started, current_completed = r["current_workouts_started"], r["current_workouts_completed"]
+        previous_started, previous_completed = r["previous_workouts_started"], r["previous_workouts_completed"]
         current_rate = round((current_completed / current_started * 100), 1) if current_started > 0 else 0
         previous_rate = round((previous_completed / previous_started * 100), 1) if previous_started > 0 else 0
         metrics["completion_rate"] = _calc_change(current_rate, previous_rate, is_percentage=True)
         
-        # Posts
-        current_posts = await count_events("post_created", current_start, current_end)
-        previous_posts = await count_events("post_created", previous_start, previous_end)
-        metrics["posts_created"] = _calc_change(current_posts, previous_posts)
-        
-        # Social engagement
-        current_likes = await count_events("post_liked", current_start, current_end)
-        previous_likes = await count_events("post_liked", previous_start, previous_end)
-        metrics["likes"] = _calc_change(current_likes, previous_likes)
-        
-        current_comments = await count_events("post_commented", current_start, current_end)
-        previous_comments = await count_events("post_commented", previous_start, previous_end)
-        metrics["comments"] = _calc_change(current_comments, previous_comments)
-        
-        current_follows = await count_events("user_followed", current_start, current_end)
-        previous_follows = await count_events("user_followed", previous_start, previous_end)
-        metrics["follows"] = _calc_change(current_follows, previous_follows)
-        
-        # Notification clicks (proxy for IG shares / push CTR)
-        current_notif = await count_events("notification_clicked", current_start, current_end)
-        previous_notif = await count_events("notification_clicked", previous_start, previous_end)
-        metrics["notification_clicks"] = _calc_change(current_notif, previous_notif)
-        
-        # App sessions
-        current_sessions = await count_events("app_session_start", current_start, current_end)
-        previous_sessions = await count_events("app_session_start", previous_start, previous_end)
-        metrics["app_sessions"] = _calc_change(current_sessions, previous_sessions)
+        # Posts, social engagement, notification clicks, app sessions
+        for metric in ["posts_created", "likes", "comments", "follows", "notification_clicks", "app_sessions"]:
+            metrics[metric] = _calc_change(r[f"current_{metric}"], r[f"previous_{metric}"])
         
         return {
             "current_period": {
@@ -755,11 +832,6 @@ async def get_engagement_metrics(
     try:
         now = datetime.now(timezone.utc)
         
-        # Get internal user IDs to exclude
-        excluded_user_ids = set()
-        if not include_internal:
-            excluded_user_ids = await get_internal_user_ids(db)
-        
         # Define time windows
         day_ago = now - timedelta(days=1)
         week_ago = now - timedelta(days=7)
@@ -767,25 +839,23 @@ async def get_engagement_metrics(
         
         # Build query filter
         def build_query(event_type: str, since: datetime) -> dict:
-            query = {
+            return {
+                **audience_filter(include_internal),
                 "event_type": event_type,
                 "timestamp": {"$gte": since},
             }
-            if excluded_user_ids:
-                query["user_id"] = {"$nin": list(excluded_user_ids)}
-            return query
         
         # DAU - unique users with app_session_start today
         dau_users = await db.user_events.distinct("user_id", build_query("app_session_start", day_ago))
-        dau = len([u for u in dau_users if u not in excluded_user_ids])
+        dau = len(dau_users)
         
         # WAU - unique users with app_session_start in last 7 days
         wau_users = await db.user_events.distinct("user_id", build_query("app_session_start", week_ago))
-        wau = len([u for u in wau_users if u not in excluded_user_ids])
+        wau = len(wau_users)
         
         # MAU - unique users with app_session_start in last 30 days
         mau_users = await db.user_events.distinct("user_id", build_query("app_session_start", month_ago))
-        mau = len([u for u in mau_users if u not in excluded_user_ids])
+        mau = len(mau_users)
         
         # DAU/MAU stickiness
         stickiness = round((dau / mau * 100), 1) if mau > 0 else 0
@@ -814,3 +884,85 @@ async def get_engagement_metrics(
             "wau_mau_ratio": 0,
             "error": str(e)
         }
+
+
+# Column order for user exports (CSV header / NDJSON keys)
+USER_EXPORT_FIELDS = [
+    "user_id",
+    "username",
+    "email",
+    "created_at",
+    "followers",
+    "following",
+    "total_workouts",
+    "events_in_period",
+]
+
+# Rows returned by the buffered format=json export; csv/ndjson stream everything
+USER_EXPORT_JSON_LIMIT = 10000
+
+
+async def iter_user_export_rows(
+    db: AsyncIOMotorDatabase,
+    start_date: datetime,
+    batch_size: int = 1000
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream one export row per user, keyset-paginated by _id.
+    
+    Per-user event counts come from one grouped aggregation per batch
+    (events in period + all-time workout_completed), so memory stays flat
+    at one batch regardless of user base size.
+    """
+    projection = {
+        "username": 1,
+        "email": 1,
+        "created_at": 1,
+        "followers_count": 1,
+        "following_count": 1,
+    }
+    last_id = None
+    while True:
+        query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+        users = await db.users.find(query, projection).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not users:
+            break
+        last_id = users[-1]["_id"]
+        
+        user_ids = [str(u["_id"]) for u in users]
+        pipeline = [
+            {"$match": {
+                "user_id": {"$in": user_ids},
+                "$or": [
+                    {"timestamp": {"$gte": start_date}},
+                    {"event_type": "workout_completed"},
+                ]
+            }},
+            {"$group": {
+                "_id": "$user_id",
+                "events_in_period": {"$sum": {"$cond": [{"$gte": ["$timestamp", start_date]}, 1, 0]}},
+                "total_workouts": {"$sum": {"$cond": [{"$eq": ["$event_type", "workout_completed"]}, 1, 0]}},
+            }}
+        ]
+        counts = {
+            row["_id"]: row
+            async for row in db.user_events.aggregate(pipeline, allowDiskUse=True)
+        }
+        
+        for user in users:
+            user_id = str(user["_id"])
+            user_counts = counts.get(user_id, {})
+            created_at = user.get("created_at")
+            yield {
+                "user_id": user_id,
+                "username": user.get("username", ""),
+                "email": user.get("email", ""),
+                "created_at": created_at.isoformat() if created_at else "",
+                "followers": user.get("followers_count", 0),
+                "following": user.get("following_count", 0),
+                "total_workouts": user_counts.get("total_workouts", 0),
+                "events_in_period": user_counts.get("events_in_period", 0),
+            }
+        
+        if len(users) < batch_size:
+            break
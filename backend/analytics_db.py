@@ -0,0 +1,91 @@
+"""
+Analytics Read Path
+Separate Motor client for dashboards, stats and exports, so one heavy
+aggregation can't take connections (or primary CPU) from feed and social
+traffic:
+- Its own connection pool (ANALYTICS_MAX_POOL_SIZE) and appname, so its
+  load shows up separately in server-side metrics and currentOp
+- secondaryPreferred reads bounded by ANALYTICS_MAX_STALENESS_SECONDS (Mongo
+  requires >= 90); with no secondary fresh enough, or on a standalone,
+  reads fall back to the primary
+- Every operation has a client-side time budget (ANALYTICS_TIMEOUT_MS) that
+  the driver sends as maxTimeMS, so a runaway query is killed server side
+  instead of holding a connection
+
+Writes (event tracking, backfills, saved views, deletes) stay on the
+primary handle in server.py; only reads are routed here.
+"""
+import logging
+import os
+from typing import Any, Dict, Optional
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+# Settings are read when the client is created, after .env is loaded:
+# ANALYTICS_MONGO_URL (defaults to MONGO_URL), ANALYTICS_READ_PREFERENCE
+# (secondaryPreferred), ANALYTICS_MAX_STALENESS_SECONDS (120),
+# ANALYTICS_MAX_POOL_SIZE (10), ANALYTICS_TIMEOUT_MS (20000)
+
+# Mongo rejects smaller maxStalenessSeconds values
+MIN_MAX_STALENESS_SECONDS = 90
+
+_client: Optional[AsyncIOMotorClient] = None
+_settings: Dict[str, Any] = {}
+
+
+def _settings_from_env() -> Dict[str, Any]:
+    read_preference = os.environ.get("ANALYTICS_READ_PREFERENCE", "secondaryPreferred")
+    settings: Dict[str, Any] = {
+        "read_preference": read_preference,
+        "max_pool_size": int(os.environ.get("ANALYTICS_MAX_POOL_SIZE", "10")),
+        "timeout_ms": int(os.environ.get("ANALYTICS_TIMEOUT_MS", "20000")),
+    }
+    # maxStalenessSeconds is only valid with a non-primary read preference
+    if read_preference != "primary":
+        settings["max_staleness_seconds"] = max(
+            int(os.environ.get("ANALYTICS_MAX_STALENESS_SECONDS", "120")),
+            MIN_MAX_STALENESS_SECONDS,
+        )
+    return settings
+
+
+def get_analytics_client(event_listeners=None) -> AsyncIOMotorClient:
+    """Get or create the analytics client singleton"""
+    global _client
+    if _client is None:
+        _settings.clear()
+        _settings.update(_settings_from_env())
+        options: Dict[str, Any] = {
+            "appname": "mood-analytics",
+            "readPreference": _settings["read_preference"],
+            "maxPoolSize": _settings["max_pool_size"],
+            "timeoutMS": _settings["timeout_ms"],
+        }
+        if "max_staleness_seconds" in _settings:
+            options["maxStalenessSeconds"] = _settings["max_staleness_seconds"]
+        if event_listeners:
+            options["event_listeners"] = event_listeners
+        mongo_url = os.environ.get("ANALYTICS_MONGO_URL") or os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+        _client = AsyncIOMotorClient(mongo_url, **options)
+        logger.info(
+            f"📊 Analytics read path: {_settings['read_preference']}, "
+            f"pool {_settings['max_pool_size']}, budget {_settings['timeout_ms']}ms"
+        )
+    return _client
+
+
+def get_analytics_db(event_listeners=None) -> AsyncIOMotorDatabase:
+    """Database handle for analytics reads (same DB_NAME as the primary handle)."""
+    return get_analytics_client(event_listeners)[os.environ.get("DB_NAME", "mood_app")]
+
+
+def close_analytics_client() -> None:
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def get_analytics_db_status() -> Dict[str, Any]:
+    return {"connected": _client is not None, **_settings}
@@ -7,6 +7,7 @@ from typing import Optional, List
 from pydantic import BaseModel
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+from log_writer import get_log_writer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -71,7 +72,7 @@ async def track_login_event(
             "failure_reason": failure_reason
         }
         
-        await db.login_events.insert_one(event)
+        get_log_writer(db).append("login_events", event)
         logger.info(f"Tracked login event for user {user_id}: method={login_method}, success={success}")
         
     except Exception as e:
@@ -85,47 +86,29 @@ async def update_auth_metadata(
     success: bool
 ) -> None:
     """
-    Update user's auth metadata after login attempt
+    Update user's auth metadata after login attempt (one atomic update, no read)
     """
     try:
-        user = await db.users.find_one({"_id": ObjectId(user_id)})
-        if not user:
-            return
-        
         now = datetime.now(timezone.utc)
         
-        # Get current auth metadata or initialize
-        auth_meta = user.get("auth_metadata", {})
-        login_methods = auth_meta.get("login_methods", [])
-        
         if success:
-            # Add login method if not already tracked
-            if login_method not in login_methods:
-                login_methods.append(login_method)
-            
-            # Update metadata
-            update_data = {
-                "auth_metadata.login_methods": login_methods,
-                "auth_metadata.last_login_at": now,
-                "auth_metadata.total_logins": auth_meta.get("total_logins", 0) + 1,
-                "auth_metadata.failed_login_attempts": 0  # Reset on successful login
+            update = {
+                "$addToSet": {"auth_metadata.login_methods": login_method},
+                "$set": {
+                    "auth_metadata.last_login_at": now,
+                    "auth_metadata.failed_login_attempts": 0  # Reset on successful login
+                },
+                "$inc": {"auth_metadata.total_logins": 1},
+                "$min": {"auth_metadata.first_login_at": now}  # Only set if missing
             }
-            
-            # Set first login if not set
-            if not auth_meta.get("first_login_at"):
-                update_data["auth_metadata.first_login_at"] = now
-            
         else:
             # Track failed attempt
-            update_data = {
-                "auth_metadata.failed_login_attempts": auth_meta.get("failed_login_attempts", 0) + 1,
-                "auth_metadata.last_failed_login": now
+            update = {
+                "$set": {"auth_metadata.last_failed_login": now},
+                "$inc": {"auth_metadata.failed_login_attempts": 1}
             }
         
-        await db.users.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$set": update_data}
-        )
+        await db.users.update_one({"_id": ObjectId(user_id)}, update)
         
         logger.info(f"Updated auth metadata for user {user_id}")
         
@@ -162,6 +145,7 @@ async def create_session_record(
             "is_active": True
         }
         
+        # Not buffered: logout and activity updates look the session up by token right away
         await db.user_sessions.insert_one(session)
         logger.info(f"Created session record for user {user_id}")
         
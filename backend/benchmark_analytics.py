@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Analytics Benchmark & Equivalence Harness
+Runs the admin analytics functions against a fixed local dataset (see
+generate_synthetic_data.py) and records, per case:
+- latency (median / p95 / max over --iterations runs)
+- MongoDB commands, DB time and documents returned (request_metrics listener)
+- peak Python memory (tracemalloc, measured on a separate run)
+
+Results are also compared with golden outputs, so a rollup, rewrite or cache
+can show that it is faster and that it returns the same numbers. The clock
+is frozen at the dataset's anchor date (synthetic_progress.params.now, or
+--now) so date windows line up between runs.
+
+Usage:
+    python benchmark_analytics.py --db mood_synthetic --update-golden    # record golden + baseline
+    python benchmark_analytics.py --db mood_synthetic                    # compare against both
+    python benchmark_analytics.py --db mood_synthetic --only funnel --iterations 10
+
+Exits 1 when an output differs from golden or a case regresses by more than
+--threshold (default 20%) against the baseline, so CI can gate on it.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).parent / "benchmarks"
+GOLDEN_DIR = BENCH_DIR / "golden"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "latest.json"
+
+# Regressions smaller than this are treated as timer noise
+MIN_REGRESSION_MS = 2.0
+
+# Modules whose datetime.now() is frozen at the dataset anchor
+FROZEN_MODULES = ("server", "admin_analytics", "user_analytics", "presence")
+
+BENCH_ADMIN_ID = "benchmark"
+
+CHART_TYPES = [
+    "user_growth", "session_trend", "mood_distribution", "page_views",
+    "workout_completion", "engagement_trend", "workouts_added", "workouts_completed",
+    "posts_created", "likes", "comments", "guest_signins", "completions_by_mood",
+    "build_for_me_generations", "build_for_me_by_mood", "custom_workouts_added",
+]
+
+Case = Callable[[], Awaitable[Any]]
+
+
+# ============================================
+# CLOCK
+# ============================================
+
+def freeze_clock(anchor: datetime) -> None:
+    """Make datetime.now()/utcnow() in the analytics modules return anchor."""
+    base = datetime
+
+    class FrozenDatetime(base):
+        @classmethod
+        def now(cls, tz=None):
+            return anchor.astimezone(tz) if tz else anchor.replace(tzinfo=None)
+
+        @classmethod
+        def utcnow(cls):
+            return anchor.replace(tzinfo=None)
+
+    for name in FROZEN_MODULES:
+        module = sys.modules.get(name)
+        if module is not None and getattr(module, "datetime", None) is base:
+            module.datetime = FrozenDatetime
+
+
+# ============================================
+# CASES
+# ============================================
+
+def build_cases(server, now: datetime) -> Dict[str, Case]:
+    from admin_analytics import (
+        get_retention_cohorts,
+        get_funnel_analysis,
+        get_engagement_metrics,
+        get_comparison_stats,
+    )
+    from user_analytics import (
+        get_admin_analytics,
+        get_screen_views_breakdown,
+        get_mood_selections_breakdown,
+        get_equipment_selections_breakdown,
+        get_difficulty_selections_breakdown,
+        get_exercises_breakdown,
+        get_social_activity_breakdown,
+        get_workout_funnel_detail,
+    )
+
+    db = server.db
+    days_ago = lambda n: now - timedelta(days=n)
+    # Measure the computation, not the result cache in front of the endpoints
+    comprehensive_stats = getattr(server.get_comprehensive_stats, "__wrapped__", server.get_comprehensive_stats)
+    # ...and compare the chart payload itself, not its pre-rendered fast_json response
+    chart_data = getattr(server.get_chart_data, "__wrapped__", server.get_chart_data)
+
+    cases: Dict[str, Case] = {
+        "retention_cohorts_week": lambda: get_retention_cohorts(db, days_ago(90), now, "week", 28),
+        "retention_cohorts_day": lambda: get_retention_cohorts(db, days_ago(14), now, "day", 7),
+        "funnel_ordered_30d": lambda: get_funnel_analysis(db, days_ago(30), now),
+        "funnel_unordered_30d": lambda: get_funnel_analysis(db, days_ago(30), now, ordered=False),
+        "engagement_metrics": lambda: get_engagement_metrics(db),
+        "comparison_stats_7d": lambda: get_comparison_stats(db, days_ago(7), now, days_ago(14), days_ago(7)),
+        "admin_analytics_30d": lambda: get_admin_analytics(db, 30),
+        "breakdown_screen_views": lambda: get_screen_views_breakdown(db, 30),
+        "breakdown_moods": lambda: get_mood_selections_breakdown(db, 30),
+        "breakdown_equipment": lambda: get_equipment_selections_breakdown(db, 30),
+        "breakdown_difficulty": lambda: get_difficulty_selections_breakdown(db, 30),
+        "breakdown_exercises": lambda: get_exercises_breakdown(db, 30),
+        "breakdown_social": lambda: get_social_activity_breakdown(db, 30),
+        "breakdown_workout_funnel": lambda: get_workout_funnel_detail(db, 30),
+    }
+    for days in (1, 7, 0):
+        cases[f"comprehensive_stats_{days or 'all'}d"] = (
+            lambda days=days: comprehensive_stats(days=days, user_type="all", current_user_id=BENCH_ADMIN_ID)
+        )
+    for chart_type in CHART_TYPES:
+        cases[f"chart_{chart_type}"] = (
+            lambda chart_type=chart_type: chart_data(
+                chart_type=chart_type, period="day", days=30, current_user_id=BENCH_ADMIN_ID
+            )
+        )
+    return cases
+
+
+# ============================================
+# MEASUREMENT
+# ============================================
+
+async def run_case(factory: Case, iterations: int, measure_db) -> Dict[str, Any]:
+    """Warm-up run (result kept for equivalence), timed runs, then a memory run."""
+    try:
+        result = await factory()
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    timings: List[float] = []
+    db_stats = None
+    for _ in range(iterations):
+        with measure_db() as stats:
+            started = time.perf_counter()
+            await factory()
+            timings.append((time.perf_counter() - started) * 1000)
+        db_stats = stats
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    await factory()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 2),
+        "max_ms": round(timings[-1], 2),
+        "db_commands": db_stats.commands,
+        "db_ms": round(db_stats.db_seconds * 1000, 2),
+        "db_documents": db_stats.documents,
+        "peak_memory_kb": round(peak_bytes / 1024, 1),
+        "_result": result,
+    }
+
+
+# ============================================
+# EQUIVALENCE
+# ============================================
+
+def normalize(value: Any) -> Any:
+    """JSON-shaped copy with stable float precision (ObjectIds/datetimes become strings)."""
+    value = json.loads(json.dumps(value, default=str))
+
+    def walk(v):
+        if isinstance(v, float):
+            return round(v, 6)
+        if isinstance(v, dict):
+            return {k: walk(x) for k, x in v.items()}
+        if isinstance(v, list):
+            return [walk(x) for x in v]
+        return v
+
+    return walk(value)
+
+
+def diff_paths(expected: Any, actual: Any, path: str = "$", limit: int = 5) -> List[str]:
+    """First few JSON paths where two normalized payloads differ."""
+    diffs: List[str] = []
+    if type(expected) is not type(actual):
+        return [f"{path}: {expected!r} != {actual!r}"]
+    if isinstance(expected, dict):
+        for key in sorted(set(expected) | set(actual)):
+            if key not in expected or key not in actual:
+                diffs.append(f"{path}.{key}: {'missing' if key not in actual else 'unexpected'}")
+            else:
+                diffs.extend(diff_paths(expected[key], actual[key], f"{path}.{key}", limit))
+            if len(diffs) >= limit:
+                break
+    elif isinstance(expected, list):
+        if len(expected) != len(actual):
+            diffs.append(f"{path}: length {len(expected)} != {len(actual)}")
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            diffs.extend(diff_paths(e, a, f"{path}[{i}]", limit))
+            if len(diffs) >= limit:
+                break
+    elif expected != actual:
+        diffs.append(f"{path}: {expected!r} != {actual!r}")
+    return diffs[:limit]
+
+
+def check_golden(name: str, result: Any, update: bool) -> Optional[List[str]]:
+    """None if no golden exists (or it was just written), else the list of diffs."""
+    path = GOLDEN_DIR / f"{name}.json"
+    normalized = normalize(result)
+    if update:
+        GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(normalized, indent=2, sort_keys=True))
+        return None
+    if not path.exists():
+        return None
+    return diff_paths(json.loads(path.read_text()), normalized)
+
+
+def find_regressions(case: Dict[str, Any], base: Dict[str, Any], threshold: float) -> List[str]:
+    regressions = []
+    for metric, floor in (("median_ms", MIN_REGRESSION_MS), ("db_commands", 0), ("peak_memory_kb", 64)):
+        now_value, base_value = case.get(metric), base.get(metric)
+        if now_value is None or base_value is None:
+            continue
+        if now_value > base_value * (1 + threshold) and now_value - base_value > floor:
+            regressions.append(f"{metric} {base_value} -> {now_value}")
+    return regressions
+
+
+# ============================================
+# CLI
+# ============================================
+
+async def resolve_anchor(db, override: Optional[str]) -> datetime:
+    if override:
+        anchor = datetime.fromisoformat(override)
+    else:
+        params = await db.synthetic_progress.find_one({"_id": "params"})
+        if not params:
+            sys.exit("❌ No synthetic_progress.params in this database; pass --now")
+        anchor = params["now"]
+    return anchor if anchor.tzinfo else anchor.replace(tzinfo=timezone.utc)
+
+
+async def main_async(args) -> int:
+    # server reads DB_NAME at import time
+    os.environ["DB_NAME"] = args.db
+    import server
+    from request_metrics import measure_db
+
+    anchor = await resolve_anchor(server.db, args.now)
+    freeze_clock(anchor)
+    cases = build_cases(server, anchor)
+    if args.only:
+        cases = {name: case for name, case in cases.items() if args.only in name}
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists() and not args.update_golden:
+        baseline = json.loads(baseline_path.read_text()).get("cases", {})
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "db": args.db,
+        "anchor": anchor.isoformat(),
+        "iterations": args.iterations,
+        "cases": {},
+    }
+    failures = []
+
+    print(f"{'case':34} {'median':>9} {'p95':>9} {'cmds':>6} {'db ms':>9} {'docs':>9} {'peak KB':>9}  status")
+    for name, factory in cases.items():
+        result = await run_case(factory, args.iterations, measure_db)
+        if "error" in result:
+            report["cases"][name] = result
+            failures.append(f"{name}: {result['error']}")
+            print(f"{name:34} ERROR {result['error']}")
+            continue
+
+        payload = result.pop("_result")
+        diffs = check_golden(name, payload, args.update_golden)
+        result["equivalent"] = None if diffs is None else not diffs
+        if diffs:
+            failures.append(f"{name}: output differs from golden: {'; '.join(diffs)}")
+
+        regressions = find_regressions(result, baseline[name], args.threshold) if name in baseline else []
+        if regressions:
+            result["regressions"] = regressions
+            failures.append(f"{name}: regressed {', '.join(regressions)}")
+
+        report["cases"][name] = result
+        status = "DIFF" if diffs else ("SLOWER" if regressions else "ok")
+        print(
+            f"{name:34} {result['median_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['db_commands']:>6} "
+            f"{result['db_ms']:>9.2f} {result['db_documents']:>9} {result['peak_memory_kb']:>9.1f}  {status}"
+        )
+
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.update_golden:
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(f"\n📌 Golden outputs and baseline written ({len(report['cases'])} cases)")
+
+    if failures:
+        print("\n❌ Failures:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\n✅ All cases equivalent and within threshold")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark admin analytics against a fixed dataset")
+    parser.add_argument("--db", default=os.getenv("SYNTHETIC_DB_NAME", "mood_synthetic"))
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--only", help="run cases whose name contains this substring")
+    parser.add_argument("--now", help="ISO timestamp to freeze the clock at (default: dataset anchor)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown vs baseline (0.2 = 20%%)")
+    parser.add_argument("--update-golden", action="store_true", help="record golden outputs and a new baseline")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Block Set Cache
+Per-user cache of everyone on the other side of a block (blocks are mutual):
+- One user_blocks read per user per TTL instead of one per feed/search call,
+  so block filtering is cheap enough to apply on every social read path
+- block_user/unblock_user invalidate both users on this worker; other
+  workers pick the change up within BLOCK_CACHE_TTL_SECONDS
+- blocked_nin() turns a block set into a pushed-down $nin that matches both
+  ObjectId (posts, users, follows) and string (comments, notifications) ids
+"""
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson import ObjectId
+
+logger = logging.getLogger(__name__)
+
+# TTL comes from BLOCK_CACHE_TTL_SECONDS (60), read when the cache is created,
+# after .env is loaded
+
+# Max users whose block sets are held (least recently used evicted first)
+MAX_ENTRIES = 10000
+
+EMPTY: FrozenSet[str] = frozenset()
+
+
+class BlockCache:
+    """LRU + TTL map of user id -> ids they blocked or were blocked by"""
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: int = MAX_ENTRIES):
+        self.ttl = ttl if ttl is not None else float(os.environ.get("BLOCK_CACHE_TTL_SECONDS", "60"))
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[FrozenSet[str], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, db: AsyncIOMotorDatabase, user_id: Optional[str]) -> FrozenSet[str]:
+        if not user_id:
+            return EMPTY
+        entry = self._entries.get(user_id)
+        if entry and time.monotonic() - entry[1] < self.ttl:
+            self.hits += 1
+            self._entries.move_to_end(user_id)
+            return entry[0]
+
+        self.misses += 1
+        blocks = await db.user_blocks.find(
+            {"$or": [{"blocker_id": user_id}, {"blocked_id": user_id}]},
+            {"_id": 0, "blocker_id": 1, "blocked_id": 1}
+        ).to_list(None)
+        blocked = frozenset(
+            b["blocked_id"] if b["blocker_id"] == user_id else b["blocker_id"]
+            for b in blocks
+        )
+        self._entries[user_id] = (blocked, time.monotonic())
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return blocked
+
+    def invalidate(self, *user_ids: str) -> None:
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl_seconds": self.ttl,
+        }
+
+
+# Global cache instance
+_cache: Optional[BlockCache] = None
+
+
+def get_block_cache() -> BlockCache:
+    """Get or create the block cache singleton"""
+    global _cache
+    if _cache is None:
+        _cache = BlockCache()
+    return _cache
+
+
+async def get_blocked_user_ids(db: AsyncIOMotorDatabase, user_id: Optional[str]) -> FrozenSet[str]:
+    """Ids that should be hidden from user_id and that user_id is hidden from."""
+    return await get_block_cache().get(db, user_id)
+
+
+def id_variants(user_ids: Iterable[str]) -> List[Any]:
+    """Both the string and ObjectId form of each id."""
+    values: List[Any] = []
+    for user_id in user_ids:
+        values.append(user_id)
+        if ObjectId.is_valid(user_id):
+            values.append(ObjectId(user_id))
+    return values
+
+
+def blocked_nin(blocked: Iterable[str]) -> Dict[str, Any]:
+    """$nin over both id forms, for fields that hold ObjectIds or strings."""
+    return {"$nin": id_variants(blocked)}
@@ -0,0 +1,385 @@
+"""
+Comment Threads
+Materialized-path layout for nested comment replies:
+- Every comment stores root_id (its top-level comment) and ancestor_ids
+  (root first, direct parent last), copied from the parent at insert time
+- Adding a reply or deleting a subtree updates counters in one bulk_write:
+  the direct parent's replies_count and every higher ancestor's
+  total_thread_replies (replies nested two or more levels below it)
+- A post's whole tree is one query on (post_id, created_at), a subtree is one
+  query on ancestor_ids, and authors are hydrated with one batched users read
+- Comments written before the path fields existed are resolved by walking
+  parents, and backfill_comment_paths() stamps them; sync_comment_paths()
+  runs it at startup, and until it has finished reads also pick up
+  unstamped replies by parent_comment_id
+"""
+import time
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Iterable, Tuple, Callable, Awaitable
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne, UpdateMany
+from bson import ObjectId
+from block_cache import blocked_nin
+from leases import acquire_lease, release_lease
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on comments loaded for one post's threaded view
+MAX_THREAD_COMMENTS = 500
+
+_PATH_PROJECTION = {"author_id": 1, "parent_comment_id": 1, "root_id": 1, "ancestor_ids": 1}
+
+# system document recording that every comment has its path stamped
+PATHS_STATE_ID = "comment_paths"
+
+# Lease held by the worker running the path backfill (renewed per batch)
+PATHS_BACKFILL_LEASE_SECONDS = 600
+
+# How often a worker that didn't run the backfill re-checks whether it finished
+PATHS_STATE_RECHECK_SECONDS = 300
+
+# Whether every comment carries root_id/ancestor_ids (set by sync_comment_paths)
+_paths_state: Dict[str, Any] = {"complete": False, "checked_at": 0.0}
+
+
+async def _paths_complete(db: AsyncIOMotorDatabase) -> bool:
+    """Whether the path backfill has finished, re-read from system every few minutes until it has."""
+    now = time.monotonic()
+    if not _paths_state["complete"] and now - _paths_state["checked_at"] > PATHS_STATE_RECHECK_SECONDS:
+        _paths_state["checked_at"] = now
+        state = await db.system.find_one({"_id": PATHS_STATE_ID}, {"complete": 1}) or {}
+        _paths_state["complete"] = bool(state.get("complete"))
+    return _paths_state["complete"]
+
+
+def thread_ancestors(comment: dict) -> List[str]:
+    """Ancestor ids of a comment, root first; legacy comments only know their parent."""
+    if comment.get("ancestor_ids") is not None:
+        return list(comment["ancestor_ids"])
+    parent_id = comment.get("parent_comment_id")
+    return [parent_id] if parent_id else []
+
+
+async def _walk_ancestors(db: AsyncIOMotorDatabase, comment: dict) -> List[str]:
+    """Ancestors of a comment without a stored path, one lookup per level."""
+    chain: List[str] = []
+    visited = set()
+    current = comment
+    while current and current.get("parent_comment_id") and current["parent_comment_id"] not in visited:
+        parent_id = current["parent_comment_id"]
+        visited.add(parent_id)
+        chain.append(parent_id)
+        if current.get("ancestor_ids") is not None:
+            chain.extend(reversed(current["ancestor_ids"][:-1]))
+            break
+        current = await db.comments.find_one({"_id": ObjectId(parent_id)}, _PATH_PROJECTION)
+    chain.reverse()
+    return chain
+
+
+async def resolve_ancestors(db: AsyncIOMotorDatabase, comment: dict) -> List[str]:
+    """Full ancestor path of an existing comment."""
+    if comment.get("ancestor_ids") is not None or not comment.get("parent_comment_id"):
+        return thread_ancestors(comment)
+    return await _walk_ancestors(db, comment)
+
+
+async def build_thread_fields(
+    db: AsyncIOMotorDatabase,
+    comment_id: ObjectId,
+    parent_comment_id: Optional[str]
+) -> Tuple[Dict[str, Any], Optional[dict]]:
+    """
+    Path fields for a new comment, plus the parent document (None for top-level).
+    A parent that no longer exists still becomes the root of the path.
+    """
+    if not parent_comment_id:
+        return {"root_id": str(comment_id), "ancestor_ids": []}, None
+
+    parent = await db.comments.find_one({"_id": ObjectId(parent_comment_id)}, _PATH_PROJECTION)
+    ancestors = (await resolve_ancestors(db, parent) if parent else []) + [parent_comment_id]
+    return {"root_id": ancestors[0], "ancestor_ids": ancestors}, parent
+
+
+# ============================================
+# COUNTERS
+# ============================================
+
+async def _apply_thread_delta(db: AsyncIOMotorDatabase, ancestors: List[str], removed: int, added: int) -> None:
+    """One bulk_write: direct parent's replies_count, higher ancestors' total_thread_replies."""
+    if not ancestors:
+        return
+    parent_id, higher = ancestors[-1], ancestors[:-1]
+    # The parent gains/loses one direct reply; anything below it counts as nested
+    nested = (added - 1) if added else -(removed - 1)
+    parent_update: Dict[str, int] = {"replies_count": 1 if added else -1}
+    if nested:
+        parent_update["total_thread_replies"] = nested
+    operations = [UpdateOne({"_id": ObjectId(parent_id)}, {"$inc": parent_update})]
+    if higher:
+        operations.append(UpdateMany(
+            {"_id": {"$in": [ObjectId(a) for a in higher if ObjectId.is_valid(a)]}},
+            {"$inc": {"total_thread_replies": added or -removed}}
+        ))
+    await db.comments.bulk_write(operations, ordered=False)
+
+
+async def record_reply(db: AsyncIOMotorDatabase, ancestors: List[str]) -> None:
+    """Counter updates for a newly inserted reply."""
+    await _apply_thread_delta(db, ancestors, removed=0, added=1)
+
+
+async def delete_comment_subtree(db: AsyncIOMotorDatabase, comment: dict) -> int:
+    """Delete a comment with every reply beneath it; returns documents removed."""
+    comment_id = str(comment["_id"])
+    ancestors = await resolve_ancestors(db, comment)
+    result = await db.comments.delete_many({"$or": [
+        {"_id": comment["_id"]},
+        {"ancestor_ids": comment_id},
+        {"parent_comment_id": comment_id},  # legacy replies without a path
+    ]})
+    if result.deleted_count:
+        await _apply_thread_delta(db, ancestors, removed=result.deleted_count, added=0)
+    return result.deleted_count
+
+
+async def recount_thread_counters(db: AsyncIOMotorDatabase, comment_ids: List[str]) -> None:
+    """Recompute replies_count/total_thread_replies from source (used by deletion jobs)."""
+    direct = {
+        row["_id"]: row["count"]
+        async for row in db.comments.aggregate([
+            {"$match": {"parent_comment_id": {"$in": comment_ids}}},
+            {"$group": {"_id": "$parent_comment_id", "count": {"$sum": 1}}},
+        ])
+    }
+    descendants = {
+        row["_id"]: row["count"]
+        async for row in db.comments.aggregate([
+            {"$match": {"ancestor_ids": {"$in": comment_ids}}},
+            {"$unwind": "$ancestor_ids"},
+            {"$match": {"ancestor_ids": {"$in": comment_ids}}},
+            {"$group": {"_id": "$ancestor_ids", "count": {"$sum": 1}}},
+        ])
+    }
+    operations = [
+        UpdateOne({"_id": ObjectId(cid)}, {"$set": {
+            "replies_count": direct.get(cid, 0),
+            "total_thread_replies": max(descendants.get(cid, 0) - direct.get(cid, 0), 0),
+        }})
+        for cid in comment_ids if ObjectId.is_valid(cid)
+    ]
+    if operations:
+        await db.comments.bulk_write(operations, ordered=False)
+
+
+# ============================================
+# READS
+# ============================================
+
+async def hydrate_comments(db: AsyncIOMotorDatabase, comments: List[dict]) -> List[Dict[str, Any]]:
+    """Serialize comments with their authors from one batched users query.
+    Comments whose author no longer exists are dropped."""
+    author_ids = {c.get("author_id") for c in comments if ObjectId.is_valid(c.get("author_id") or "")}
+    authors: Dict[str, dict] = {}
+    if author_ids:
+        users = await db.users.find(
+            {"_id": {"$in": [ObjectId(a) for a in author_ids]}},
+            {"username": 1, "avatar_url": 1, "avatar": 1}
+        ).to_list(len(author_ids))
+        authors = {str(u["_id"]): u for u in users}
+
+    result = []
+    for comment in comments:
+        author = authors.get(comment.get("author_id"))
+        if not author:
+            continue
+        ancestors = thread_ancestors(comment)
+        result.append({
+            "id": str(comment["_id"]),
+            "text": comment.get("text"),
+            "created_at": comment.get("created_at"),
+            "parent_comment_id": comment.get("parent_comment_id"),
+            "root_id": comment.get("root_id") or (ancestors[0] if ancestors else str(comment["_id"])),
+            "depth": len(ancestors),
+            "mentioned_user_ids": comment.get("mentioned_user_ids") or [],
+            "replies_count": comment.get("replies_count") or 0,
+            "total_thread_replies": comment.get("total_thread_replies") or 0,
+            "likes_count": comment.get("likes_count") or 0,
+            "author": {
+                "id": str(author["_id"]),
+                "username": author.get("username"),
+                "avatar": author.get("avatar_url") or author.get("avatar"),
+            },
+        })
+    return result
+
+
+async def get_post_thread(
+    db: AsyncIOMotorDatabase,
+    post_id: str,
+    limit: int = 50,
+    blocked: Iterable[str] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Newest top-level comments of a post, each with its replies (any depth,
+    oldest first) under "replies". One query for the roots, one for their
+    replies by root_id, one users query.
+    Replies under a blocked author's comment are hidden along with it.
+    """
+    author_filter = {"author_id": blocked_nin(blocked)} if blocked else {}
+    roots = await db.comments.find(
+        {"post_id": post_id, "parent_comment_id": None, **author_filter}
+    ).sort("created_at", -1).limit(limit).to_list(limit)
+    if not roots:
+        return []
+
+    root_ids = [str(c["_id"]) for c in roots]
+    reply_query: Dict[str, Any] = {"root_id": {"$in": root_ids}, "parent_comment_id": {"$ne": None}}
+    if not await _paths_complete(db):
+        # Replies that predate stored paths are matched by post and placed by parent
+        reply_query = {"$or": [reply_query, {
+            "post_id": post_id,
+            "parent_comment_id": {"$ne": None},
+            "ancestor_ids": {"$exists": False},
+        }]}
+    replies = await db.comments.find({**reply_query, **author_filter}).sort(
+        "created_at", 1
+    ).limit(MAX_THREAD_COMMENTS).to_list(MAX_THREAD_COMMENTS)
+
+    legacy = [c for c in replies if c.get("ancestor_ids") is None]
+    if legacy:
+        paths = _compute_paths(roots + replies)
+        for comment in legacy:
+            path = paths[str(comment["_id"])]
+            comment["ancestor_ids"] = path
+            comment["root_id"] = path[0] if path else str(comment["_id"])
+
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for comment in await hydrate_comments(db, roots + replies):
+        if comment["depth"] == 0:
+            comment["replies"] = []
+            by_id[comment["id"]] = comment
+        else:
+            root = by_id.get(comment["root_id"])
+            if root is not None:
+                root["replies"].append(comment)
+    return list(by_id.values())
+
+
+async def get_comment_subtree(
+    db: AsyncIOMotorDatabase,
+    comment_id: str,
+    limit: int = 100,
+    blocked: Iterable[str] = ()
+) -> List[Dict[str, Any]]:
+    """Every reply beneath a comment, oldest first, in one indexed query."""
+    query: Dict[str, Any] = {"ancestor_ids": comment_id}
+    if not await _paths_complete(db):
+        # Direct replies that predate stored paths
+        query = {"$or": [query, {"parent_comment_id": comment_id}]}
+    if blocked:
+        query["author_id"] = blocked_nin(blocked)
+    comments = await db.comments.find(query).sort("created_at", 1).limit(limit).to_list(limit)
+    return await hydrate_comments(db, comments)
+
+
+# ============================================
+# BACKFILL
+# ============================================
+
+def _compute_paths(comments: List[dict]) -> Dict[str, List[str]]:
+    """Ancestor paths for every comment of a set of posts, computed in memory."""
+    parent_of = {str(c["_id"]): c.get("parent_comment_id") for c in comments}
+    paths: Dict[str, List[str]] = {}
+
+    def path(comment_id: str) -> List[str]:
+        chain: List[str] = []
+        visited = {comment_id}
+        current = parent_of.get(comment_id)
+        while current and current not in visited:
+            if current in paths:
+                chain.append(current)
+                chain.extend(reversed(paths[current]))
+                break
+            visited.add(current)
+            chain.append(current)
+            current = parent_of.get(current)
+        chain.reverse()
+        return chain
+
+    for comment_id in parent_of:
+        paths[comment_id] = path(comment_id)
+    return paths
+
+
+async def backfill_comment_paths(
+    db: AsyncIOMotorDatabase,
+    batch_size: int = 200,
+    max_batches: Optional[int] = None,
+    on_batch: Optional[Callable[[], Awaitable[Any]]] = None
+) -> Dict[str, int]:
+    """
+    Stamp root_id/ancestor_ids on comments that predate them, a batch of posts
+    at a time (a post's comments are resolved together). Resumable: only posts
+    with unstamped comments are picked up.
+    """
+    stats = {"posts": 0, "comments": 0}
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        pending = await db.comments.find(
+            {"ancestor_ids": {"$exists": False}}, {"post_id": 1}
+        ).limit(batch_size * 10).to_list(batch_size * 10)
+        post_ids = list({c.get("post_id") for c in pending})[:batch_size]
+        if not post_ids:
+            break
+
+        comments = await db.comments.find(
+            {"post_id": {"$in": post_ids}}, {"parent_comment_id": 1, "ancestor_ids": 1}
+        ).to_list(None)
+        paths = _compute_paths(comments)
+        operations = [
+            UpdateOne({"_id": c["_id"]}, {"$set": {
+                "root_id": paths[str(c["_id"])][0] if paths[str(c["_id"])] else str(c["_id"]),
+                "ancestor_ids": paths[str(c["_id"])],
+            }})
+            for c in comments if c.get("ancestor_ids") is None
+        ]
+        if operations:
+            await db.comments.bulk_write(operations, ordered=False)
+        stats["posts"] += len(post_ids)
+        stats["comments"] += len(operations)
+        batches += 1
+        if on_batch:
+            await on_batch()
+
+    logger.info(f"Comment path backfill: {stats}")
+    return stats
+
+
+async def sync_comment_paths(db: AsyncIOMotorDatabase) -> Dict[str, Any]:
+    """
+    Startup step: run the path backfill to completion (resumable, one worker
+    at a time), then stop reads from looking for unstamped replies.
+    New comments are always stamped, so this only does work once.
+    """
+    state = await db.system.find_one({"_id": PATHS_STATE_ID}) or {}
+    if state.get("complete"):
+        _paths_state["complete"] = True
+        return {"up_to_date": True}
+
+    if not await acquire_lease(db, PATHS_STATE_ID, PATHS_BACKFILL_LEASE_SECONDS):
+        return {"running_elsewhere": True}
+    try:
+        stats = await backfill_comment_paths(
+            db, on_batch=lambda: acquire_lease(db, PATHS_STATE_ID, PATHS_BACKFILL_LEASE_SECONDS)
+        )
+        await db.system.update_one(
+            {"_id": PATHS_STATE_ID},
+            {"$set": {"complete": True, "completed_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+        _paths_state["complete"] = True
+        return stats
+    finally:
+        await release_lease(db, PATHS_STATE_ID)
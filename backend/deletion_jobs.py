@@ -0,0 +1,708 @@
+"""
+MOOD Deletion Jobs
+Resumable background cascades for data that is too large to remove inline:
+- The request makes the deletion visible immediately and enqueues a job
+  document in deletion_jobs; the worker claims it with a lease, so a job is
+  only ever run by one replica and is picked up again if that replica dies
+- Each job runs an ordered list of steps; a step removes matching documents
+  CHUNK_SIZE at a time with a single $in delete per collection
+- Denormalized counters a chunk touches (followers_count, likes_count, ...)
+  are recounted from the source collections in one aggregation and one
+  bulk_write. The ids to recount are saved on the job before the delete, so
+  replaying a chunk after a crash is harmless
+- Progress (completed steps, documents removed per step) lives on the job
+  document and is exposed to the admin API
+
+Small post removals (a single delete, a short admin cleanup) skip the queue
+and call remove_posts() inline; it runs the same cascade.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from pymongo import UpdateOne, ReturnDocument
+from bson import ObjectId
+from result_cache import get_result_cache
+from comment_threads import recount_thread_counters, thread_ancestors
+from leases import acquire_lease, release_lease
+
+logger = logging.getLogger(__name__)
+
+# Documents removed per delete round-trip
+CHUNK_SIZE = 500
+
+# How long a claimed job stays owned without a progress write
+LEASE_SECONDS = 300
+
+# Fallback poll for jobs enqueued by other replicas
+POLL_INTERVAL_SECONDS = 10
+
+# Failed steps are retried with backoff before the job is marked failed
+MAX_ATTEMPTS = 5
+RETRY_BACKOFF_SECONDS = 30
+
+JOB_ACCOUNT_DELETION = "account_deletion"
+JOB_POST_REMOVAL = "post_removal"
+
+# Post removals larger than this run as a background job
+POST_REMOVAL_INLINE_LIMIT = 200
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+# Per-user collections cleared by account deletion, keyed on the string user id
+ACCOUNT_OWNED_COLLECTIONS = (
+    "saved_posts",
+    "saved_workouts",
+    "workout_cards",
+    "user_workouts",
+    "device_tokens",
+    "notification_settings",
+    "user_heartbeats",
+    "user_sessions",
+    "user_events",
+)
+
+
+def _id_variants(ids: Iterable[str]) -> List[Any]:
+    """Both the string and ObjectId form of each id (references use either)."""
+    variants: List[Any] = []
+    for value in ids:
+        variants.append(value)
+        if ObjectId.is_valid(value):
+            variants.append(ObjectId(value))
+    return variants
+
+
+def _object_ids(ids: Iterable[str]) -> List[ObjectId]:
+    return [ObjectId(value) for value in ids if ObjectId.is_valid(value)]
+
+
+def post_removal_query(author_id: Optional[str] = None, username: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Posts selected by an admin bulk removal: by author id when the author is
+    known, otherwise by the username stored on the posts (case-insensitive).
+    post_removal jobs keep these criteria, not the post ids, in their params.
+    """
+    if author_id:
+        return {"author_id": {"$in": _id_variants([author_id])}}
+    pattern = {"$regex": f"^{username}$", "$options": "i"}
+    return {"$or": [{"username": pattern}, {"author_username": pattern}]}
+
+
+def _distinct_str(docs: List[dict], field: str) -> List[str]:
+    return sorted({str(doc[field]) for doc in docs if doc.get(field)})
+
+
+# ============================================
+# COUNTER RECOUNTS
+# ============================================
+
+async def _count_by(collection, field: str, ids: List[str]) -> Dict[str, int]:
+    """Number of documents referencing each id through field (either id form)."""
+    pipeline = [
+        {"$match": {field: {"$in": _id_variants(ids)}}},
+        {"$group": {"_id": {"$toString": f"${field}"}, "count": {"$sum": 1}}},
+    ]
+    return {row["_id"]: row["count"] async for row in collection.aggregate(pipeline)}
+
+
+async def _set_counts(collection, ids: List[str], fields: Dict[str, Dict[str, int]]) -> None:
+    """One bulk_write setting each counter field to its recounted value."""
+    operations = [
+        UpdateOne(
+            {"_id": ObjectId(value)},
+            {"$set": {name: counts.get(value, 0) for name, counts in fields.items()}}
+        )
+        for value in ids if ObjectId.is_valid(value)
+    ]
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+
+
+async def recount_followers(db, user_ids: List[str]) -> None:
+    counts = await _count_by(db.follows, "following_id", user_ids)
+    await _set_counts(db.users, user_ids, {"followers_count": counts})
+
+
+async def recount_following(db, user_ids: List[str]) -> None:
+    counts = await _count_by(db.follows, "follower_id", user_ids)
+    await _set_counts(db.users, user_ids, {"following_count": counts})
+
+
+async def recount_post_engagement(db, post_ids: List[str]) -> None:
+    likes = await _count_by(db.post_likes, "post_id", post_ids)
+    comments = await _count_by(db.comments, "post_id", post_ids)
+    await _set_counts(db.posts, post_ids, {"likes_count": likes, "comments_count": comments})
+
+
+async def recount_author_posts(db, user_ids: List[str]) -> None:
+    counts = await _count_by(db.posts, "author_id", user_ids)
+    await _set_counts(db.users, user_ids, {"posts_count": counts})
+
+
+# system document tracking the one-time posts_count backfill (checkpoint = last user _id)
+POSTS_COUNT_STATE_ID = "author_posts_count"
+
+# Lease held by the worker running the posts_count backfill (renewed per chunk)
+POSTS_COUNT_LEASE_SECONDS = 300
+
+
+async def sync_author_post_counts(db) -> Dict[str, Any]:
+    """
+    Startup step: set users.posts_count from posts for every user, once.
+    create_post keeps it with $inc and post removals recount it, but users
+    who posted before the counter existed start without one. Resumable:
+    progress is checkpointed per chunk of users, one worker at a time.
+    """
+    state = await db.system.find_one({"_id": POSTS_COUNT_STATE_ID}) or {}
+    if state.get("complete"):
+        return {"up_to_date": True}
+    if not await acquire_lease(db, POSTS_COUNT_STATE_ID, POSTS_COUNT_LEASE_SECONDS):
+        return {"running_elsewhere": True}
+    try:
+        checkpoint = state.get("checkpoint")
+        updated = 0
+        while True:
+            query = {"_id": {"$gt": checkpoint}} if checkpoint is not None else {}
+            users = await db.users.find(query, {"_id": 1}).sort("_id", 1).limit(CHUNK_SIZE).to_list(CHUNK_SIZE)
+            if not users:
+                break
+            await recount_author_posts(db, [str(u["_id"]) for u in users])
+            checkpoint = users[-1]["_id"]
+            updated += len(users)
+            await db.system.update_one(
+                {"_id": POSTS_COUNT_STATE_ID}, {"$set": {"checkpoint": checkpoint}}, upsert=True
+            )
+            await acquire_lease(db, POSTS_COUNT_STATE_ID, POSTS_COUNT_LEASE_SECONDS)
+        await db.system.update_one(
+            {"_id": POSTS_COUNT_STATE_ID},
+            {"$set": {"complete": True, "completed_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+        logger.info(f"🔢 Backfilled posts_count for {updated} users")
+        return {"users": updated}
+    finally:
+        await release_lease(db, POSTS_COUNT_STATE_ID)
+
+
+# name -> recount function; names are what gets persisted in pending_recounts
+RECOUNTS: Dict[str, Callable[[Any, List[str]], Awaitable[None]]] = {
+    "followers": recount_followers,
+    "following": recount_following,
+    "post_engagement": recount_post_engagement,
+    "comment_replies": recount_thread_counters,
+    "author_posts": recount_author_posts,
+}
+
+
+# ============================================
+# POST CASCADE
+# ============================================
+
+async def delete_post_dependents(db, post_ids: List[str]) -> None:
+    """Remove everything hanging off a set of posts with one $in delete per collection."""
+    str_ids = list(post_ids)
+    object_ids = _object_ids(str_ids)
+    await db.post_likes.delete_many({"post_id": {"$in": object_ids}})
+    await db.likes.delete_many({"post_id": {"$in": str_ids + object_ids}})
+    await db.comments.delete_many({"post_id": {"$in": str_ids}})
+    await db.saved_posts.delete_many({"post_id": {"$in": str_ids}})
+    await db.notifications.delete_many({"entity_id": {"$in": str_ids}})
+
+
+def invalidate_post_views() -> None:
+    """Drop cached results computed from the posts collection."""
+    get_result_cache().invalidate("time_series:")
+
+
+async def remove_posts(db, post_ids: List[str]) -> int:
+    """
+    Inline post cascade for small batches: dependents, posts and author
+    counters in a fixed number of round-trips regardless of batch size.
+    Returns the number of posts deleted.
+    """
+    object_ids = _object_ids(post_ids)
+    if not object_ids:
+        return 0
+    posts = await db.posts.find({"_id": {"$in": object_ids}}, {"author_id": 1}).to_list(len(object_ids))
+    if not posts:
+        return 0
+
+    await delete_post_dependents(db, [str(p["_id"]) for p in posts])
+    result = await db.posts.delete_many({"_id": {"$in": [p["_id"] for p in posts]}})
+    await recount_author_posts(db, _distinct_str(posts, "author_id"))
+    invalidate_post_views()
+    return result.deleted_count
+
+
+# ============================================
+# JOB RUNNER
+# ============================================
+
+# A recount spec: (RECOUNTS name, extracts the ids to recount from a chunk)
+RecountSpec = Tuple[str, Callable[[List[dict]], List[str]]]
+
+
+class DeletionJobRunner:
+    """Claims deletion jobs and runs their steps chunk by chunk"""
+
+    def __init__(self, db):
+        self.db = db
+        self.running = False
+        self._task = None
+        self._wake = asyncio.Event()
+        self._active_job_id: Optional[str] = None
+        self.steps: Dict[str, List[Tuple[str, Callable[[dict], Awaitable[None]]]]] = {
+            JOB_ACCOUNT_DELETION: self._account_deletion_steps(),
+            JOB_POST_REMOVAL: [("posts", self._purge_requested_posts)],
+        }
+
+    # ============================================
+    # ENQUEUE / READ
+    # ============================================
+
+    async def enqueue(
+        self,
+        kind: str,
+        target_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        requested_by: Optional[str] = None
+    ) -> str:
+        """Persist a pending job and wake the local worker."""
+        if kind not in self.steps:
+            raise ValueError(f"Unknown deletion job kind: {kind}")
+        now = datetime.now(timezone.utc)
+        job = {
+            "kind": kind,
+            "target_id": target_id,
+            "params": params or {},
+            "requested_by": requested_by,
+            "status": STATUS_PENDING,
+            "steps": [name for name, _ in self.steps[kind]],
+            "completed_steps": [],
+            "current_step": None,
+            "progress": {},
+            "pending_recounts": None,
+            "attempts": 0,
+            "error": None,
+            "retry_at": now,
+            "lease_expires_at": None,
+            "created_at": now,
+            "updated_at": now,
+            "started_at": None,
+            "completed_at": None,
+        }
+        result = await self.db.deletion_jobs.insert_one(job)
+        self._wake.set()
+        logger.info(f"🗑️ Enqueued {kind} job {result.inserted_id} for {target_id}")
+        return str(result.inserted_id)
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = await self.db.deletion_jobs.find_one({"_id": ObjectId(job_id)})
+        return serialize_job(job) if job else None
+
+    async def list_jobs(self, status: Optional[str] = None, kind: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        query: Dict[str, Any] = {}
+        if status:
+            query["status"] = status
+        if kind:
+            query["kind"] = kind
+        jobs = await self.db.deletion_jobs.find(query).sort("created_at", -1).to_list(limit)
+        return [serialize_job(job) for job in jobs]
+
+    async def retry(self, job_id: str) -> bool:
+        """Put a failed job back in the queue with a fresh attempt budget."""
+        result = await self.db.deletion_jobs.update_one(
+            {"_id": ObjectId(job_id), "status": STATUS_FAILED},
+            {"$set": {
+                "status": STATUS_PENDING,
+                "attempts": 0,
+                "error": None,
+                "retry_at": datetime.now(timezone.utc),
+                "updated_at": datetime.now(timezone.utc),
+            }}
+        )
+        if result.modified_count:
+            self._wake.set()
+        return result.modified_count > 0
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "active_job_id": self._active_job_id,
+            "chunk_size": CHUNK_SIZE,
+            "lease_seconds": LEASE_SECONDS,
+        }
+
+    # ============================================
+    # CLAIM / RUN
+    # ============================================
+
+    async def _claim(self) -> Optional[dict]:
+        """Take the oldest runnable job: pending and due, or running with an expired lease."""
+        now = datetime.now(timezone.utc)
+        return await self.db.deletion_jobs.find_one_and_update(
+            {"$or": [
+                {"status": STATUS_PENDING, "retry_at": {"$lte": now}},
+                {"status": STATUS_RUNNING, "lease_expires_at": {"$lt": now}},
+            ]},
+            {"$set": {
+                "status": STATUS_RUNNING,
+                "lease_expires_at": now + timedelta(seconds=LEASE_SECONDS),
+                "updated_at": now,
+            }},
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def run_pending(self) -> int:
+        """Run jobs until none are claimable. Returns how many were processed."""
+        processed = 0
+        while True:
+            job = await self._claim()
+            if not job:
+                return processed
+            await self._run_job(job)
+            processed += 1
+
+    async def _run_job(self, job: dict) -> None:
+        job_id = job["_id"]
+        self._active_job_id = str(job_id)
+        try:
+            if not job.get("started_at"):
+                await self._touch(job, {"$set": {"started_at": datetime.now(timezone.utc)}})
+            if job.get("pending_recounts"):
+                # Interrupted between a chunk's delete and its recount
+                await self._apply_recounts(job["pending_recounts"])
+                await self._touch(job, {"$set": {"pending_recounts": None}})
+
+            for name, step in self.steps[job["kind"]]:
+                if name in job.get("completed_steps", []):
+                    continue
+                job["current_step"] = name
+                await self._touch(job, {"$set": {"current_step": name}})
+                await step(job)
+                await self._touch(job, {"$addToSet": {"completed_steps": name}})
+
+            await self.db.deletion_jobs.update_one(
+                {"_id": job_id},
+                {"$set": {
+                    "status": STATUS_COMPLETED,
+                    "current_step": None,
+                    "lease_expires_at": None,
+                    "completed_at": datetime.now(timezone.utc),
+                    "updated_at": datetime.now(timezone.utc),
+                }}
+            )
+            logger.info(f"✅ {job['kind']} job {job_id} completed for {job['target_id']}")
+        except asyncio.CancelledError:
+            # Shutdown: leave the job running so its lease expires and it is resumed
+            raise
+        except Exception as e:
+            attempts = job.get("attempts", 0) + 1
+            failed = attempts >= MAX_ATTEMPTS
+            logger.error(f"❌ {job['kind']} job {job_id} step {job.get('current_step')} failed (attempt {attempts}): {e}")
+            await self.db.deletion_jobs.update_one(
+                {"_id": job_id},
+                {"$set": {
+                    "status": STATUS_FAILED if failed else STATUS_PENDING,
+                    "attempts": attempts,
+                    "error": str(e),
+                    "retry_at": datetime.now(timezone.utc) + timedelta(seconds=RETRY_BACKOFF_SECONDS * attempts),
+                    "lease_expires_at": None,
+                    "updated_at": datetime.now(timezone.utc),
+                }}
+            )
+        finally:
+            self._active_job_id = None
+
+    async def _touch(self, job: dict, update: Dict[str, Any]) -> None:
+        """Write job state and renew the lease."""
+        now = datetime.now(timezone.utc)
+        update.setdefault("$set", {}).update({
+            "lease_expires_at": now + timedelta(seconds=LEASE_SECONDS),
+            "updated_at": now,
+        })
+        await self.db.deletion_jobs.update_one({"_id": job["_id"]}, update)
+
+    async def _apply_recounts(self, pending: Dict[str, List[str]]) -> None:
+        for name, ids in pending.items():
+            if ids:
+                await RECOUNTS[name](self.db, ids)
+
+    async def _purge(
+        self,
+        job: dict,
+        step: str,
+        collection: str,
+        query: Dict[str, Any],
+        projection: Optional[Dict[str, int]] = None,
+        recounts: Tuple[RecountSpec, ...] = (),
+        before_delete: Optional[Callable[[List[dict]], Awaitable[None]]] = None,
+        delete_filter: Optional[Callable[[List[dict]], Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Delete query matches CHUNK_SIZE at a time.
+        Each chunk: save ids to recount -> dependents -> one $in delete -> recount.
+        """
+        coll = self.db[collection]
+        while True:
+            docs = await coll.find(query, projection or {"_id": 1}).limit(CHUNK_SIZE).to_list(CHUNK_SIZE)
+            if not docs:
+                return
+
+            pending = {name: extract(docs) for name, extract in recounts}
+            if any(pending.values()):
+                await self._touch(job, {"$set": {"pending_recounts": pending}})
+
+            if before_delete:
+                await before_delete(docs)
+            ids = [doc["_id"] for doc in docs]
+            chunk_filter = delete_filter(docs) if delete_filter else {"_id": {"$in": ids}}
+            result = await coll.delete_many(chunk_filter)
+
+            if any(pending.values()):
+                await self._apply_recounts(pending)
+            await self._touch(job, {
+                "$set": {"pending_recounts": None},
+                "$inc": {f"progress.{step}": result.deleted_count},
+            })
+
+    # ============================================
+    # ACCOUNT DELETION
+    # ============================================
+
+    def _account_deletion_steps(self) -> List[Tuple[str, Callable[[dict], Awaitable[None]]]]:
+        steps = [
+            ("follows_out", self._purge_follows_out),
+            ("follows_in", self._purge_follows_in),
+            ("post_likes", self._purge_post_likes),
+            ("comments", self._purge_comments),
+            ("posts", self._purge_posts),
+            ("conversations", self._purge_conversations),
+            ("inbox", self._purge_inbox),
+            ("notifications", self._purge_notifications),
+            ("user_blocks", self._purge_blocks),
+        ]
+        for collection in ACCOUNT_OWNED_COLLECTIONS:
+            steps.append((collection, self._owned_collection_step(collection)))
+        return steps
+
+    async def _purge_follows_out(self, job: dict) -> None:
+        """People the user followed lose a follower."""
+        await self._purge(
+            job, "follows_out", "follows",
+            {"follower_id": {"$in": _id_variants([job["target_id"]])}},
+            {"following_id": 1},
+            recounts=(("followers", lambda docs: _distinct_str(docs, "following_id")),),
+        )
+
+    async def _purge_follows_in(self, job: dict) -> None:
+        """The user's followers follow one account fewer."""
+        await self._purge(
+            job, "follows_in", "follows",
+            {"following_id": {"$in": _id_variants([job["target_id"]])}},
+            {"follower_id": 1},
+            recounts=(("following", lambda docs: _distinct_str(docs, "follower_id")),),
+        )
+
+    async def _purge_post_likes(self, job: dict) -> None:
+        await self._purge(
+            job, "post_likes", "post_likes",
+            {"user_id": {"$in": _id_variants([job["target_id"]])}},
+            {"post_id": 1},
+            recounts=(("post_engagement", lambda docs: _distinct_str(docs, "post_id")),),
+        )
+        await self._purge(job, "post_likes", "likes", {"user_id": {"$in": _id_variants([job["target_id"]])}})
+
+    async def _purge_comments(self, job: dict) -> None:
+        """The user's comments and every reply beneath them (same as deleting a comment)."""
+        await self._purge(
+            job, "comments", "comments",
+            {"author_id": job["target_id"]},
+            {"post_id": 1, "parent_comment_id": 1, "ancestor_ids": 1},
+            recounts=(
+                ("post_engagement", lambda docs: _distinct_str(docs, "post_id")),
+                ("comment_replies", lambda docs: sorted({a for d in docs for a in thread_ancestors(d)})),
+            ),
+            delete_filter=lambda docs: {"$or": [
+                {"_id": {"$in": [d["_id"] for d in docs]}},
+                {"ancestor_ids": {"$in": [str(d["_id"]) for d in docs]}},
+                {"parent_comment_id": {"$in": [str(d["_id"]) for d in docs]}},
+            ]},
+        )
+
+    async def _purge_posts(self, job: dict) -> None:
+        await self._purge_posts_matching(job, {"author_id": {"$in": _id_variants([job["target_id"]])}})
+
+    async def _purge_conversations(self, job: dict) -> None:
+        async def delete_messages(docs: List[dict]) -> None:
+            conversation_ids = [str(d["_id"]) for d in docs]
+            await self.db.messages.delete_many({"conversation_id": {"$in": conversation_ids}})
+
+        await self._purge(
+            job, "conversations", "conversations",
+            {"participants": job["target_id"]},
+            before_delete=delete_messages,
+        )
+
+    async def _purge_inbox(self, job: dict) -> None:
+        user_id = job["target_id"]
+        await self._purge(
+            job, "inbox", "inbox",
+            {"$or": [{"owner_id": user_id}, {"other_user.id": user_id}]},
+        )
+        await self._purge(job, "inbox", "inbox_backfills", {"_id": user_id})
+
+    async def _purge_notifications(self, job: dict) -> None:
+        user_id = job["target_id"]
+        await self._purge(
+            job, "notifications", "notifications",
+            {"$or": [{"user_id": user_id}, {"actor_id": user_id}]},
+        )
+
+    async def _purge_blocks(self, job: dict) -> None:
+        user_id = job["target_id"]
+        await self._purge(
+            job, "user_blocks", "user_blocks",
+            {"$or": [{"blocker_id": user_id}, {"blocked_id": user_id}]},
+        )
+
+    def _owned_collection_step(self, collection: str) -> Callable[[dict], Awaitable[None]]:
+        async def step(job: dict) -> None:
+            await self._purge(job, collection, collection, {"user_id": job["target_id"]})
+        return step
+
+    # ============================================
+    # POST REMOVAL
+    # ============================================
+
+    async def _purge_posts_matching(self, job: dict, query: Dict[str, Any]) -> None:
+        """Posts plus likes/comments/saves/notifications, then author posts_count."""
+        await self._purge(
+            job, "posts", "posts", query,
+            {"author_id": 1},
+            recounts=(("author_posts", lambda docs: _distinct_str(docs, "author_id")),),
+            before_delete=lambda docs: delete_post_dependents(self.db, [str(d["_id"]) for d in docs]),
+        )
+        invalidate_post_views()
+
+    async def _purge_requested_posts(self, job: dict) -> None:
+        """post_removal jobs carry the author/username criteria and page through the matches."""
+        params = job["params"]
+        if "post_ids" in params:
+            # Jobs queued before the criteria were stored list every post id
+            post_ids = params["post_ids"]
+            for offset in range(0, len(post_ids), CHUNK_SIZE):
+                await self._purge_posts_matching(
+                    job, {"_id": {"$in": _object_ids(post_ids[offset:offset + CHUNK_SIZE])}}
+                )
+            return
+        await self._purge_posts_matching(
+            job, post_removal_query(params.get("author_id"), params.get("username"))
+        )
+
+    # ============================================
+    # LIFECYCLE
+    # ============================================
+
+    async def start(self):
+        """Start the worker loop (resumes interrupted jobs once their lease expires)"""
+        if self.running:
+            logger.warning("Deletion job runner already running")
+            return
+
+        self.running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("🚀 Deletion job runner started")
+
+    async def stop(self):
+        """Stop the worker loop; an in-flight job is resumed by the next claimer"""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("🛑 Deletion job runner stopped")
+
+    async def _run_loop(self):
+        while self.running:
+            try:
+                self._wake.clear()
+                await self.run_pending()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Deletion job loop error: {e}")
+                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+
+def serialize_job(job: dict) -> Dict[str, Any]:
+    """JSON-safe view of a job document for the API."""
+    def iso(value):
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    params = dict(job.get("params", {}))
+    if "post_ids" in params:
+        params["post_count"] = len(params.pop("post_ids"))
+    steps = job.get("steps", [])
+    completed = job.get("completed_steps", [])
+    progress = job.get("progress", {})
+    return {
+        "id": str(job["_id"]),
+        "kind": job.get("kind"),
+        "target_id": job.get("target_id"),
+        "params": params,
+        "requested_by": job.get("requested_by"),
+        "status": job.get("status"),
+        "current_step": job.get("current_step"),
+        "steps_completed": len(completed),
+        "steps_total": len(steps),
+        "steps": [
+            {"name": name, "done": name in completed, "removed": progress.get(name, 0)}
+            for name in steps
+        ],
+        "documents_removed": sum(progress.values()),
+        "attempts": job.get("attempts", 0),
+        "error": job.get("error"),
+        "created_at": iso(job.get("created_at")),
+        "started_at": iso(job.get("started_at")),
+        "updated_at": iso(job.get("updated_at")),
+        "completed_at": iso(job.get("completed_at")),
+    }
+
+
+# Global runner instance
+_runner: Optional[DeletionJobRunner] = None
+
+
+def get_deletion_job_runner(db) -> DeletionJobRunner:
+    """Get or create the deletion job runner singleton"""
+    global _runner
+    if _runner is None:
+        _runner = DeletionJobRunner(db)
+    return _runner
+
+
+async def start_deletion_job_runner(db):
+    """Start the deletion job worker loop"""
+    runner = get_deletion_job_runner(db)
+    await runner.start()
+
+
+async def stop_deletion_job_runner():
+    """Stop the deletion job worker loop"""
+    global _runner
+    if _runner:
+        await _runner.stop()
+        _runner = None
@@ -1,4983 +0,0 @@
-# Auto-generated exercises seed data from preview environment
-# Total exercises: 174 (includes 20 new videos added 2026-02-17)
-# Format: 3 key cues, 2 common mistakes per exercise
-# Includes: name, aliases, video_url, thumbnail_url, equipment, cues, mistakes
-PREVIEW_EXERCISES = [
-  {
-    "name": "KB Single Arm Swing",
-    "aliases": [
-      "kettlebell single arm swing",
-      "kb swing",
-      "kettlebell swing",
-      "single arm swing",
-      "one arm swing",
-      "one arm kb swing",
-      "single arm kettlebell swing",
-      "kb one arm swing"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764600/exercise_library/kb_single_arm_swing.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_single_arm_swing.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hinge at hips, not squat",
-      "Keep arm relaxed, power from hips",
-      "Snap hips forward at top"
-    ],
-    "mistakes": [
-      "Squatting instead of hinging",
-      "Using arm strength instead of hip drive"
-    ]
-  },
-  {
-    "name": "KB Squat",
-    "aliases": [
-      "kettlebell squat",
-      "kb goblet squat",
-      "goblet squat",
-      "kettlebell goblet squat",
-      "kb front squat",
-      "kettlebell front squat",
-      "kb squats",
-      "squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764602/exercise_library/kb_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold KB at chest level",
-      "Keep elbows tucked",
-      "Drive through heels"
-    ],
-    "mistakes": [
-      "Letting knees cave inward",
-      "Rounding lower back"
-    ]
-  },
-  {
-    "name": "Kettlebell Snatch",
-    "aliases": [
-      "kb snatch",
-      "kettlebell snatch",
-      "single arm snatch",
-      "one arm snatch",
-      "kb one arm snatch",
-      "kettlebell power snatch",
-      "kb overhead snatch",
-      "snatch"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764605/exercise_library/kettlebell_snatch.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kettlebell_snatch.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start with a swing motion",
-      "Pull KB close to body",
-      "Punch through at the top"
-    ],
-    "mistakes": [
-      "Letting KB flip and bang wrist",
-      "Not using hip drive"
-    ]
-  },
-  {
-    "name": "Smith Machine Back Squat",
-    "aliases": [
-      "smith squat",
-      "smith machine squat",
-      "machine squat",
-      "back squat smith",
-      "smith back squat",
-      "guided squat",
-      "barbell squat smith",
-      "back squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764608/exercise_library/smith_machine_back_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/smith_machine_back_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Smith Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Position bar on upper traps",
-      "Feet slightly forward of bar",
-      "Control the descent"
-    ],
-    "mistakes": [
-      "Feet directly under bar",
-      "Locking knees at top"
-    ]
-  },
-  {
-    "name": "Smith Machine RDL",
-    "aliases": [
-      "smith rdl",
-      "smith machine romanian deadlift",
-      "romanian deadlift smith",
-      "rdl smith machine",
-      "smith romanian deadlift",
-      "machine rdl",
-      "guided rdl",
-      "smith stiff leg deadlift",
-      "rdl",
-      "romanian deadlift"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764611/exercise_library/smith_machine_rdl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/smith_machine_rdl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Smith Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Keep slight knee bend",
-      "Push hips back, not down",
-      "Feel stretch in hamstrings"
-    ],
-    "mistakes": [
-      "Rounding lower back",
-      "Bending knees too much"
-    ]
-  },
-  {
-    "name": "KB Double Swing",
-    "aliases": [
-      "kettlebell double swing",
-      "kb double swing",
-      "double swing",
-      "two hand swing",
-      "two arm swing",
-      "double kb swing",
-      "kettlebell two hand swing",
-      "russian swing"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764615/exercise_library/kb_double_swing.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_double_swing.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hinge at hips, not squat",
-      "Keep arms straight and relaxed",
-      "Snap hips forward explosively at top"
-    ],
-    "mistakes": [
-      "Squatting instead of hinging",
-      "Using arm strength instead of hip drive"
-    ]
-  },
-  {
-    "name": "KB Goblet Jump Squat",
-    "aliases": [
-      "kettlebell goblet jump squat",
-      "kb jump squat",
-      "goblet jump squat",
-      "kettlebell jump squat",
-      "explosive goblet squat",
-      "jumping goblet squat",
-      "kb explosive squat",
-      "jump squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764618/exercise_library/kb_goblet_jump_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_goblet_jump_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold KB at chest, elbows tucked",
-      "Squat down with control",
-      "Explode upward through heels"
-    ],
-    "mistakes": [
-      "Landing with straight legs",
-      "Not going deep enough in squat"
-    ]
-  },
-  {
-    "name": "KB Goblet Squat",
-    "aliases": [
-      "kettlebell goblet squat",
-      "kb goblet squat",
-      "goblet squat",
-      "kettlebell squat",
-      "kb front squat",
-      "front squat kettlebell",
-      "goblet",
-      "kb squat hold"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764620/exercise_library/kb_goblet_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_goblet_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold KB close to chest",
-      "Keep elbows tucked inside knees",
-      "Drive through heels to stand"
-    ],
-    "mistakes": [
-      "Letting knees cave inward",
-      "Leaning forward too much"
-    ]
-  },
-  {
-    "name": "KB Hip Swing",
-    "aliases": [
-      "kettlebell hip swing",
-      "kb hip swing",
-      "hip swing",
-      "hip hinge swing",
-      "kettlebell hip hinge",
-      "kb hip drive",
-      "low swing",
-      "hip level swing"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764622/exercise_library/kb_hip_swing.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_hip_swing.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Focus on hip hinge movement",
-      "Keep KB at hip level",
-      "Squeeze glutes at top"
-    ],
-    "mistakes": [
-      "Swinging KB too high",
-      "Not engaging the glutes"
-    ]
-  },
-  {
-    "name": "DB Bulgarian Split Squat",
-    "aliases": [
-      "dumbbell bulgarian split squat",
-      "db split squat",
-      "bulgarian split squat",
-      "rear foot elevated split squat",
-      "rfess",
-      "dumbbell split squat",
-      "db bss",
-      "bulgarian lunge",
-      "split squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764625/exercise_library/db_bulgarian_split_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_bulgarian_split_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Rear foot elevated on bench",
-      "Keep torso upright",
-      "Lower until back knee nearly touches floor"
-    ],
-    "mistakes": [
-      "Leaning too far forward",
-      "Front knee caving inward"
-    ]
-  },
-  {
-    "name": "Glute Bridge",
-    "aliases": [
-      "glute bridge",
-      "hip bridge",
-      "bridge",
-      "floor bridge",
-      "bodyweight glute bridge",
-      "lying hip thrust",
-      "supine bridge",
-      "glute raise"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764628/exercise_library/glute_bridge.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/glute_bridge.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Feet flat, knees bent at 90 degrees",
-      "Drive hips up squeezing glutes",
-      "Hold at top for a count"
-    ],
-    "mistakes": [
-      "Overarching lower back",
-      "Not squeezing glutes at top"
-    ]
-  },
-  {
-    "name": "Hip Abductor",
-    "aliases": [
-      "hip abductor",
-      "hip abduction",
-      "abductor machine",
-      "seated hip abduction",
-      "outer thigh machine",
-      "hip abductor machine",
-      "abduction",
-      "outer hip"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764630/exercise_library/hip_abductor.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/hip_abductor.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Sit with back flat against pad",
-      "Push knees outward with control",
-      "Pause at full extension"
-    ],
-    "mistakes": [
-      "Using momentum to swing legs",
-      "Not controlling the negative"
-    ]
-  },
-  {
-    "name": "KB Clean",
-    "aliases": [
-      "kettlebell clean",
-      "kb clean",
-      "clean",
-      "kettlebell rack clean",
-      "single arm clean",
-      "kb single clean",
-      "kettlebell power clean",
-      "rack position clean"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764632/exercise_library/kb_clean.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_clean.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start with swing motion",
-      "Pull KB close to body",
-      "Rotate wrist to catch in rack position"
-    ],
-    "mistakes": [
-      "Letting KB flip and bang wrist",
-      "Casting KB away from body"
-    ]
-  },
-  {
-    "name": "T-Bar Row Machine",
-    "aliases": [
-      "t-bar row",
-      "t bar row",
-      "tbar row",
-      "t-bar row machine",
-      "landmine row",
-      "chest supported row",
-      "bent over row machine"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769764757/exercise_library/t-bar_row_machine.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/t-bar_row_machine.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "T-Bar Row Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Keep chest on pad for support",
-      "Pull elbows back and squeeze shoulder blades",
-      "Control the negative slowly"
-    ],
-    "mistakes": [
-      "Using momentum to swing weight",
-      "Not fully extending arms at bottom"
-    ]
-  },
-  {
-    "name": "Power Clean",
-    "aliases": [
-      "clean",
-      "olympic clean",
-      "power clean from floor"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365673/exercise_library/power_clean.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/power_clean.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start with feet hip-width apart, barbell over mid-foot",
-      "Keep back flat, chest up as you grip the bar",
-      "Drive through heels, explosively extend hips"
-    ],
-    "mistakes": [
-      "Pulling with arms too early",
-      "Not fully extending hips before the pull"
-    ]
-  },
-  {
-    "name": "Barbell RDL",
-    "aliases": [
-      "romanian deadlift",
-      "rdl",
-      "stiff leg deadlift",
-      "barbell romanian deadlift"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365676/exercise_library/barbell_rdl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_rdl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand tall with barbell at hip level",
-      "Keep slight bend in knees throughout",
-      "Push hips back while lowering the bar"
-    ],
-    "mistakes": [
-      "Rounding the lower back",
-      "Bending knees too much (turning it into a squat)"
-    ]
-  },
-  {
-    "name": "Barbell Good Mornings",
-    "aliases": [
-      "good morning",
-      "good mornings",
-      "barbell good morning"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365678/exercise_library/barbell_good_mornings.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_good_mornings.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Position barbell on upper back like a squat",
-      "Stand with feet shoulder-width apart",
-      "Push hips back and bow forward at the waist"
-    ],
-    "mistakes": [
-      "Using too much weight before mastering form",
-      "Rounding the back during the movement"
-    ]
-  },
-  {
-    "name": "Wide Grip Assisted Pull-Up",
-    "aliases": [
-      "assisted pull-up",
-      "wide grip pull-up",
-      "lat pull-up",
-      "assisted wide pull-up"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365681/exercise_library/wide_grip_assisted_pull_up.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/wide_grip_assisted_pull_up.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "pull-up bar",
-      "resistance band",
-      "assisted pull-up machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip bar wider than shoulder width",
-      "Engage lats by pulling shoulders down",
-      "Pull chest toward the bar"
-    ],
-    "mistakes": [
-      "Using too much momentum/swinging",
-      "Not fully extending arms at the bottom"
-    ]
-  },
-  {
-    "name": "Barbell Back Squat",
-    "aliases": [
-      "back squat",
-      "squat",
-      "barbell squat",
-      "bb squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365685/exercise_library/barbell_back_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_back_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell",
-      "squat rack"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Position bar on upper traps, not neck",
-      "Feet shoulder-width apart, toes slightly out",
-      "Brace core and descend by breaking at hips and knees"
-    ],
-    "mistakes": [
-      "Knees caving inward",
-      "Rising on toes instead of driving through heels"
-    ]
-  },
-  {
-    "name": "Pit Shark RDL",
-    "aliases": [
-      "pit shark romanian deadlift",
-      "pit shark rdl",
-      "pit shark hip hinge",
-      "belt squat rdl"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365688/exercise_library/pit_shark_rdl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/pit_shark_rdl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "pit shark",
-      "belt squat machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Push hips back with flat back",
-      "Feel deep hamstring stretch",
-      "Drive hips forward to stand"
-    ],
-    "mistakes": [
-      "Rounding the lower back",
-      "Bending knees too much"
-    ]
-  },
-  {
-    "name": "Barbell Reverse Lunge",
-    "aliases": [
-      "reverse lunge",
-      "bb reverse lunge",
-      "barbell lunge",
-      "reverse lunges",
-      "back lunge"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365693/exercise_library/barbell_reverse_lunge.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_reverse_lunge.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell",
-      "squat rack"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Step back with control",
-      "Lower until back knee nearly touches floor",
-      "Drive through front heel to return"
-    ],
-    "mistakes": [
-      "Front knee caving inward",
-      "Leaning forward excessively"
-    ]
-  },
-  {
-    "name": "Barbell Split Squat",
-    "aliases": [
-      "split squat",
-      "bb split squat",
-      "static lunge",
-      "barbell static lunge",
-      "split squats"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365700/exercise_library/barbell_split_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_split_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell",
-      "squat rack"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stagger stance, feet hip-width apart",
-      "Lower straight down, not forward",
-      "Keep torso upright throughout"
-    ],
-    "mistakes": [
-      "Stance too narrow side-to-side",
-      "Leaning trunk forward"
-    ]
-  },
-  {
-    "name": "Cable Rope Row",
-    "aliases": [
-      "rope row",
-      "cable row",
-      "seated cable rope row",
-      "rope cable row",
-      "seated row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365708/exercise_library/cable_rope_row.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_rope_row.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "cable machine",
-      "rope attachment"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Pull rope toward lower chest",
-      "Squeeze shoulder blades together",
-      "Control the weight back slowly"
-    ],
-    "mistakes": [
-      "Using momentum to pull",
-      "Rounding the back"
-    ]
-  },
-  {
-    "name": "Barbell Row",
-    "aliases": [
-      "bent over row",
-      "bb row",
-      "barbell bent over row",
-      "pendlay row",
-      "bent row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365716/exercise_library/barbell_row.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_row.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hinge forward with flat back",
-      "Pull bar toward lower chest",
-      "Lead with elbows, squeeze lats"
-    ],
-    "mistakes": [
-      "Using body momentum",
-      "Rounding the lower back"
-    ]
-  },
-  {
-    "name": "Neutral Grip Assisted Pull-Up",
-    "aliases": [
-      "neutral grip pull-up",
-      "assisted pull-up",
-      "hammer grip pull-up",
-      "parallel grip pull-up"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365720/exercise_library/neutral_grip_assisted_pull_up.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/neutral_grip_assisted_pull_up.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "pull-up bar",
-      "resistance band",
-      "assisted pull-up machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip handles with palms facing each other",
-      "Pull chest toward the bar",
-      "Lower with control, fully extend arms"
-    ],
-    "mistakes": [
-      "Using too much momentum",
-      "Not fully extending at the bottom"
-    ]
-  },
-  {
-    "name": "Barbell Pendlay Row",
-    "aliases": [
-      "pendlay row",
-      "dead stop row",
-      "explosive row",
-      "floor row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365725/exercise_library/barbell_pendlay_row.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_pendlay_row.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start each rep from floor, back parallel",
-      "Pull explosively to lower chest",
-      "Lower bar to floor with control"
-    ],
-    "mistakes": [
-      "Not resetting on the floor each rep",
-      "Torso rising during the pull"
-    ]
-  },
-  {
-    "name": "Reverse Hack Squat",
-    "aliases": [
-      "hack squat reverse",
-      "reverse hack",
-      "facing hack squat",
-      "forward hack squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365728/exercise_library/reverse_hack_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/reverse_hack_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "hack squat machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Face the machine, chest against pad",
-      "Lower until thighs parallel or below",
-      "Drive through heels to stand"
-    ],
-    "mistakes": [
-      "Letting knees cave inward",
-      "Not going deep enough"
-    ]
-  },
-  {
-    "name": "Neutral Grip Lat Pulldown",
-    "aliases": [
-      "close grip lat pulldown",
-      "parallel grip pulldown",
-      "hammer grip pulldown",
-      "v-bar pulldown"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365731/exercise_library/neutral_grip_lat_pulldown.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/neutral_grip_lat_pulldown.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "cable machine",
-      "lat pulldown machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip handles with palms facing each other",
-      "Pull to upper chest, squeeze lats",
-      "Control the weight back up"
-    ],
-    "mistakes": [
-      "Leaning back too far",
-      "Using momentum instead of lats"
-    ]
-  },
-  {
-    "name": "Pit Shark Squat",
-    "aliases": [
-      "belt squat",
-      "pit shark",
-      "hip belt squat",
-      "lever squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365740/exercise_library/pit_shark_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/pit_shark_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "pit shark",
-      "belt squat machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Attach belt securely around hips",
-      "Squat down with upright torso",
-      "Drive through full foot to stand"
-    ],
-    "mistakes": [
-      "Leaning forward excessively",
-      "Not hitting full depth"
-    ]
-  },
-  {
-    "name": "Roman Chair Side Bend",
-    "aliases": [
-      "side bend",
-      "oblique side bend",
-      "hyperextension side bend",
-      "lateral bend"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365742/exercise_library/roman_chair_side_bend.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/roman_chair_side_bend.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "roman chair",
-      "back extension bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Position hip on pad, body sideways",
-      "Lower torso toward floor with control",
-      "Contract obliques to return upright"
-    ],
-    "mistakes": [
-      "Rotating torso instead of bending laterally",
-      "Using momentum to swing up"
-    ]
-  },
-  {
-    "name": "DB Suitcase Deadlift",
-    "aliases": [
-      "suitcase deadlift",
-      "single arm deadlift",
-      "dumbbell suitcase deadlift",
-      "one arm deadlift"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365745/exercise_library/db_suitcase_deadlift.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_suitcase_deadlift.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "dumbbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand tall, DB at side like a suitcase",
-      "Hinge at hips, keep core braced",
-      "Drive through heels to stand"
-    ],
-    "mistakes": [
-      "Leaning to the weighted side",
-      "Rounding the lower back"
-    ]
-  },
-  {
-    "name": "Wide Grip T-Bar Chest Supported Row",
-    "aliases": [
-      "wide grip chest supported row",
-      "t-bar row wide grip",
-      "chest supported t-bar",
-      "wide t-bar row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365747/exercise_library/wide_grip_t_bar_chest_supported_row.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/wide_grip_t_bar_chest_supported_row.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "t-bar row machine",
-      "chest supported row machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Chest flat on pad, grip wide",
-      "Pull elbows back and out",
-      "Squeeze shoulder blades at top"
-    ],
-    "mistakes": [
-      "Lifting chest off the pad",
-      "Not pulling elbows wide enough"
-    ]
-  },
-  {
-    "name": "Neutral Grip T-Bar Chest Supported Row",
-    "aliases": [
-      "neutral grip chest supported row",
-      "t-bar row neutral",
-      "chest supported t-bar neutral",
-      "hammer grip t-bar"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365750/exercise_library/neutral_grip_t_bar_chest_supported_row.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/neutral_grip_t_bar_chest_supported_row.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "t-bar row machine",
-      "chest supported row machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Chest on pad, palms facing each other",
-      "Pull handles toward lower chest",
-      "Squeeze lats at the top"
-    ],
-    "mistakes": [
-      "Using momentum to pull",
-      "Not fully extending arms on return"
-    ]
-  },
-  {
-    "name": "DB Renegade Rows",
-    "aliases": [
-      "renegade row",
-      "plank row",
-      "dumbbell renegade row",
-      "plank dumbbell row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365753/exercise_library/db_renegade_rows.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_renegade_rows.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start in plank position on DBs",
-      "Row one DB while bracing core",
-      "Minimize hip rotation"
-    ],
-    "mistakes": [
-      "Hips twisting during the row",
-      "Rushing the movement"
-    ]
-  },
-  {
-    "name": "KB Gorilla Rows",
-    "aliases": [
-      "gorilla row",
-      "kettlebell gorilla row",
-      "double kb row",
-      "alternating kb row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365761/exercise_library/kb_gorilla_rows.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_gorilla_rows.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "kettlebells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hinge forward, hands on KBs",
-      "Row one KB while other stays grounded",
-      "Keep hips square throughout"
-    ],
-    "mistakes": [
-      "Rotating hips during the row",
-      "Standing too upright"
-    ]
-  },
-  {
-    "name": "Rack Pull",
-    "aliases": [
-      "rack pulls",
-      "partial deadlift",
-      "block pull",
-      "elevated deadlift"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365764/exercise_library/rack_pull.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/rack_pull.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "barbell",
-      "squat rack",
-      "power rack"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Set pins at knee height or above",
-      "Grip bar, brace core, flat back",
-      "Drive hips forward to lockout"
-    ],
-    "mistakes": [
-      "Rounding the back",
-      "Hyperextending at the top"
-    ]
-  },
-  {
-    "name": "Roman Chair Weighted Back Extension",
-    "aliases": [
-      "weighted back extension",
-      "weighted hyperextension",
-      "roman chair extension",
-      "weighted hyper"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365767/exercise_library/roman_chair_weighted_back_extension.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/roman_chair_weighted_back_extension.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "roman chair",
-      "back extension bench",
-      "weight plate"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold weight at chest, hips on pad",
-      "Lower torso with control",
-      "Extend back to parallel, squeeze glutes"
-    ],
-    "mistakes": [
-      "Hyperextending past parallel",
-      "Using momentum to swing up"
-    ]
-  },
-  {
-    "name": "Chest Supported DB Row",
-    "aliases": [
-      "incline db row",
-      "chest supported dumbbell row",
-      "prone db row",
-      "seal row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365770/exercise_library/chest_supported_db_row.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/chest_supported_db_row.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "dumbbells",
-      "incline bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie chest down on incline bench",
-      "Pull DBs toward hips, elbows back",
-      "Squeeze shoulder blades at top"
-    ],
-    "mistakes": [
-      "Lifting chest off the bench",
-      "Shrugging shoulders up"
-    ]
-  },
-  {
-    "name": "DB Single Arm Row",
-    "aliases": [
-      "one arm db row",
-      "single arm dumbbell row",
-      "one arm row",
-      "db row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365772/exercise_library/db_single_arm_row.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_single_arm_row.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "dumbbell",
-      "bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "One hand and knee on bench",
-      "Pull DB to hip, elbow close to body",
-      "Lower with control, full stretch"
-    ],
-    "mistakes": [
-      "Rotating torso during the row",
-      "Using momentum to pull"
-    ]
-  },
-  {
-    "name": "DB Gorilla Rows",
-    "aliases": [
-      "dumbbell gorilla row",
-      "db gorilla row",
-      "alternating db row hinged"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365775/exercise_library/db_gorilla_rows.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_gorilla_rows.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hinge forward, hands on DBs",
-      "Row one DB while other stays down",
-      "Keep hips and shoulders square"
-    ],
-    "mistakes": [
-      "Rotating hips during the row",
-      "Standing too upright"
-    ]
-  },
-  {
-    "name": "KB Renegade Rows",
-    "aliases": [
-      "kettlebell renegade row",
-      "kb plank row",
-      "kettlebell plank row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365779/exercise_library/kb_renegade_rows.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_renegade_rows.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "kettlebells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start in plank on KB handles",
-      "Row one KB, brace core tight",
-      "Minimize hip rotation"
-    ],
-    "mistakes": [
-      "Hips twisting during row",
-      "Rushing the movement"
-    ]
-  },
-  {
-    "name": "Roman Chair Back Extension",
-    "aliases": [
-      "back extension",
-      "hyperextension",
-      "roman chair hyper",
-      "bodyweight back extension"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365783/exercise_library/roman_chair_back_extension.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/roman_chair_back_extension.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "roman chair",
-      "back extension bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hips on pad, cross arms at chest",
-      "Lower torso with control",
-      "Extend to parallel, squeeze glutes"
-    ],
-    "mistakes": [
-      "Hyperextending past parallel",
-      "Using momentum to swing"
-    ]
-  },
-  {
-    "name": "KB Suitcase Deadlift",
-    "aliases": [
-      "kettlebell suitcase deadlift",
-      "single arm kb deadlift",
-      "one arm kettlebell deadlift"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365787/exercise_library/kb_suitcase_deadlift.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_suitcase_deadlift.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "KB at side, stand tall",
-      "Hinge at hips, core braced",
-      "Drive through heels to stand"
-    ],
-    "mistakes": [
-      "Leaning to the weighted side",
-      "Rounding lower back"
-    ]
-  },
-  {
-    "name": "Barbell Deadlift",
-    "aliases": [
-      "Deadlift",
-      "BB Deadlift",
-      "Conventional Deadlift"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769962889/exercise_library/barbell_deadlift.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_deadlift.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hinge at hips, grip bar outside knees",
-      "Keep back flat and chest up throughout",
-      "Drive through heels to lockout"
-    ],
-    "mistakes": [
-      "Rounding the lower back",
-      "Letting bar drift away from body"
-    ]
-  },
-  {
-    "name": "Barbell Front Squat",
-    "aliases": [
-      "Front Squat",
-      "BB Front Squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769962599/exercise_library/barbell_front_squat.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_front_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell",
-      "Squat Rack"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Rest bar on front delts, elbows high",
-      "Keep torso upright, descend to parallel",
-      "Drive up through midfoot"
-    ],
-    "mistakes": [
-      "Dropping elbows forward",
-      "Leaning forward excessively"
-    ]
-  },
-  {
-    "name": "Barbell Hip Thrust",
-    "aliases": [
-      "Hip Thrust",
-      "BB Hip Thrust",
-      "Glute Bridge"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769962672/exercise_library/barbell_hip_thrust.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_hip_thrust.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell",
-      "Bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Upper back against bench, bar over hips",
-      "Drive hips up by squeezing glutes",
-      "Hold at top, lower with control"
-    ],
-    "mistakes": [
-      "Overarching lower back",
-      "Not achieving full hip extension"
-    ]
-  },
-  {
-    "name": "Barbell Lunge",
-    "aliases": [
-      "BB Lunge",
-      "Barbell Walking Lunge",
-      "Reverse Lunge"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769963185/exercise_library/barbell_lunge.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_lunge.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Bar on upper back, core braced",
-      "Step back, front knee tracks over toes",
-      "Drive through front heel to stand"
-    ],
-    "mistakes": [
-      "Knee caving inward",
-      "Taking too short a step"
-    ]
-  },
-  {
-    "name": "Barbell Sumo Deadlift",
-    "aliases": [
-      "Sumo Deadlift",
-      "BB Sumo Deadlift",
-      "Wide Stance Deadlift"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769962765/exercise_library/barbell_sumo_deadlift.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_sumo_deadlift.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Wide stance, toes pointed out 45 degrees",
-      "Grip bar inside knees, push knees out",
-      "Drive hips forward to lockout"
-    ],
-    "mistakes": [
-      "Knees caving inward",
-      "Hips shooting up too fast"
-    ]
-  },
-  {
-    "name": "Cable Face Pull",
-    "aliases": [
-      "Face Pull",
-      "Rope Face Pull"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769962801/exercise_library/cable_face_pull.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_face_pull.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine",
-      "Rope Attachment"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Set cable at face height, grip rope",
-      "Pull toward face, spreading rope apart",
-      "Externally rotate shoulders at end"
-    ],
-    "mistakes": [
-      "Using too much weight",
-      "No external rotation at end"
-    ]
-  },
-  {
-    "name": "Cable Glute Kickback",
-    "aliases": [
-      "Glute Kickback",
-      "Cable Kickback",
-      "Donkey Kick"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769962893/exercise_library/cable_glute_kickback.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_glute_kickback.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine",
-      "Ankle Strap"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Attach ankle strap to low cable",
-      "Kick leg straight back, squeeze glute",
-      "Lower with control"
-    ],
-    "mistakes": [
-      "Arching lower back",
-      "Swinging leg instead of controlled motion"
-    ]
-  },
-  {
-    "name": "Cable Lat Pullover",
-    "aliases": [
-      "Lat Pullover",
-      "Straight Arm Pulldown",
-      "Cable Pullover"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769963361/exercise_library/cable_lat_pullover.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_lat_pullover.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine",
-      "Straight Bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand facing high cable, grip bar",
-      "Pull bar down to thighs in arc",
-      "Squeeze lats at bottom"
-    ],
-    "mistakes": [
-      "Bending elbows too much",
-      "Using momentum instead of lats"
-    ]
-  },
-  {
-    "name": "Cable Overhead Tricep Extension",
-    "aliases": [
-      "Overhead Tricep Extension",
-      "Cable Tricep Extension",
-      "Rope Overhead Extension"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769963403/exercise_library/cable_overhead_tricep_extension.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_overhead_tricep_extension.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine",
-      "Rope Attachment"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Face away from low cable, hold rope overhead",
-      "Extend arms forward, keep upper arms still",
-      "Squeeze triceps at full extension"
-    ],
-    "mistakes": [
-      "Moving elbows during extension",
-      "Not achieving full lockout"
-    ]
-  },
-  {
-    "name": "Cable Rope Curl",
-    "aliases": [
-      "Rope Curl",
-      "Cable Bicep Curl",
-      "Hammer Rope Curl"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1769963451/exercise_library/cable_rope_curl.mp4",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_rope_curl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine",
-      "Rope Attachment"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip rope with neutral grip, elbows pinned",
-      "Curl rope up toward shoulders",
-      "Lower with control"
-    ],
-    "mistakes": [
-      "Swinging body for momentum",
-      "Moving elbows forward"
-    ]
-  },
-  {
-    "name": "Cable Rope Tricep Pushdown",
-    "aliases": [
-      "Tricep Pushdown",
-      "Rope Pushdown",
-      "Cable Tricep Extension"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365791/exercise_library/cable_rope_tricep_pushdown.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_rope_tricep_pushdown.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine",
-      "Rope Attachment"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand facing cable, grip rope at chest height",
-      "Push down and spread rope at bottom",
-      "Squeeze triceps, return with control"
-    ],
-    "mistakes": [
-      "Flaring elbows outward",
-      "Using body momentum"
-    ]
-  },
-  {
-    "name": "DB Front Squat",
-    "aliases": [
-      "Dumbbell Front Squat",
-      "Goblet Squat Variation"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365800/exercise_library/db_front_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_front_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold dumbbells at shoulders, elbows high",
-      "Squat down keeping torso upright",
-      "Drive through heels to stand"
-    ],
-    "mistakes": [
-      "Leaning forward excessively",
-      "Letting elbows drop"
-    ]
-  },
-  {
-    "name": "DB RDL",
-    "aliases": [
-      "Dumbbell RDL",
-      "Dumbbell Romanian Deadlift",
-      "DB Romanian Deadlift"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365808/exercise_library/db_rdl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_rdl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold dumbbells in front, soft knee bend",
-      "Hinge at hips, lower weights along legs",
-      "Squeeze glutes to return to standing"
-    ],
-    "mistakes": [
-      "Rounding the lower back",
-      "Bending knees too much"
-    ]
-  },
-  {
-    "name": "DB Side Lunge",
-    "aliases": [
-      "Dumbbell Side Lunge",
-      "Lateral Lunge",
-      "DB Lateral Lunge"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365810/exercise_library/db_side_lunge.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_side_lunge.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold dumbbells at sides, step wide laterally",
-      "Bend stepping leg, keep other leg straight",
-      "Push off to return to center"
-    ],
-    "mistakes": [
-      "Knee extending past toes",
-      "Leaning torso too far forward"
-    ]
-  },
-  {
-    "name": "DB Single Leg RDL",
-    "aliases": [
-      "Single Leg RDL",
-      "Dumbbell Single Leg Deadlift",
-      "One Leg RDL"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365813/exercise_library/db_single_leg_rdl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_single_leg_rdl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand on one leg, hold dumbbell opposite side",
-      "Hinge forward, extend back leg for balance",
-      "Return to standing with control"
-    ],
-    "mistakes": [
-      "Rotating hips open",
-      "Rounding the back"
-    ]
-  },
-  {
-    "name": "KB High Pull",
-    "aliases": [
-      "Kettlebell High Pull",
-      "KB Upright Pull"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365816/exercise_library/kb_high_pull.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_high_pull.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hinge and swing KB between legs",
-      "Drive hips forward, pull KB to chin",
-      "Keep elbows high, lower with control"
-    ],
-    "mistakes": [
-      "Using arms instead of hip drive",
-      "Letting KB pull you forward"
-    ]
-  },
-  {
-    "name": "KB Pull Press",
-    "aliases": [
-      "Kettlebell Pull Press",
-      "KB Clean and Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365818/exercise_library/kb_pull_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kb_pull_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Clean KB to rack position",
-      "Press overhead with tight core",
-      "Lower to rack, then swing back down"
-    ],
-    "mistakes": [
-      "Pressing before full rack position",
-      "Leaning back excessively on press"
-    ]
-  },
-  {
-    "name": "Landmine Hack Squat Jump",
-    "aliases": [
-      "Landmine Jump Squat",
-      "Explosive Hack Squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365828/exercise_library/landmine_hack_squat_jump.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_hack_squat_jump.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold barbell end at chest, feet shoulder width",
-      "Squat down then explode upward",
-      "Land soft, immediately descend into next rep"
-    ],
-    "mistakes": [
-      "Landing with locked knees",
-      "Not reaching full squat depth"
-    ]
-  },
-  {
-    "name": "Landmine Hack Squat",
-    "aliases": [
-      "Landmine Squat",
-      "Barbell Landmine Squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365834/exercise_library/landmine_hack_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_hack_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold barbell end at chest height",
-      "Squat down keeping torso upright",
-      "Drive through heels to stand"
-    ],
-    "mistakes": [
-      "Letting torso fall forward",
-      "Rising on toes during squat"
-    ]
-  },
-  {
-    "name": "Landmine Lateral Lunge",
-    "aliases": [
-      "Landmine Side Lunge",
-      "Barbell Lateral Lunge"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365837/exercise_library/landmine_lateral_lunge.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_lateral_lunge.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold barbell end, step wide to side",
-      "Bend stepping leg, keep other straight",
-      "Push off to return to center"
-    ],
-    "mistakes": [
-      "Knee caving inward on lunge",
-      "Not stepping wide enough"
-    ]
-  },
-  {
-    "name": "Landmine Push Press",
-    "aliases": [
-      "Landmine Shoulder Press",
-      "Single Arm Landmine Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365840/exercise_library/landmine_push_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_push_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold barbell end at shoulder, slight knee bend",
-      "Dip and drive through legs to press",
-      "Lock out overhead, lower with control"
-    ],
-    "mistakes": [
-      "Not using leg drive",
-      "Pressing before the dip"
-    ]
-  },
-  {
-    "name": "Landmine Rotation",
-    "aliases": [
-      "Landmine Twist",
-      "Russian Twist Landmine",
-      "Landmine Core Rotation"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365845/exercise_library/landmine_rotation.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_rotation.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold barbell end with arms extended",
-      "Rotate torso side to side with control",
-      "Keep hips stable, core tight"
-    ],
-    "mistakes": [
-      "Rotating hips instead of torso",
-      "Moving too fast without control"
-    ]
-  },
-  {
-    "name": "Landmine Squat Press",
-    "aliases": [
-      "Landmine Thruster",
-      "Squat to Press Landmine"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365847/exercise_library/landmine_squat_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_squat_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold barbell end at chest, squat down",
-      "Drive up explosively from squat",
-      "Press overhead at top of movement"
-    ],
-    "mistakes": [
-      "Separating squat and press movements",
-      "Not reaching full depth on squat"
-    ]
-  },
-  {
-    "name": "Sled Pull",
-    "aliases": [
-      "Sled Row",
-      "Rope Sled Pull",
-      "Hand Over Hand Sled"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365853/exercise_library/sled_pull.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/sled_pull.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Sled",
-      "Rope"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Sit or stand with rope in hands",
-      "Pull rope hand over hand toward you",
-      "Keep core braced, back straight"
-    ],
-    "mistakes": [
-      "Rounding the back while pulling",
-      "Using momentum instead of controlled pulls"
-    ]
-  },
-  {
-    "name": "Sled Push",
-    "aliases": [
-      "Prowler Push",
-      "Weighted Sled Push"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365857/exercise_library/sled_push.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/sled_push.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Sled"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip handles, lean forward at 45 degrees",
-      "Drive through legs with powerful steps",
-      "Keep core braced, arms extended"
-    ],
-    "mistakes": [
-      "Standing too upright",
-      "Taking short choppy steps"
-    ]
-  },
-  {
-    "name": "Trap Bar Deadlift",
-    "aliases": [
-      "Hex Bar Deadlift",
-      "Trap Bar DL"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365859/exercise_library/trap_bar_deadlift.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/trap_bar_deadlift.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Trap Bar",
-      "Hex Bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand center of bar, grip handles",
-      "Push floor away, keep chest up",
-      "Lock out hips at top"
-    ],
-    "mistakes": [
-      "Rounding the back",
-      "Lifting with arms instead of legs"
-    ]
-  },
-  {
-    "name": "Trap Bar Squat Jump",
-    "aliases": [
-      "Hex Bar Jump",
-      "Trap Bar Jump Squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365862/exercise_library/trap_bar_squat_jump.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/trap_bar_squat_jump.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Trap Bar",
-      "Hex Bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip trap bar handles, squat down",
-      "Explode upward into jump",
-      "Land soft, absorb into next squat"
-    ],
-    "mistakes": [
-      "Landing with stiff legs",
-      "Not reaching full squat depth"
-    ]
-  },
-  {
-    "name": "Chin Ups",
-    "aliases": [
-      "Chin Up",
-      "Underhand Pull Up",
-      "Supinated Pull Up"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365865/exercise_library/chin_ups.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/chin_ups.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Pull Up Bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip bar underhand, shoulder width apart",
-      "Pull chest to bar, squeeze biceps",
-      "Lower with control to full hang"
-    ],
-    "mistakes": [
-      "Not reaching full range of motion",
-      "Kipping or swinging excessively"
-    ]
-  },
-  {
-    "name": "Dip Bar L-Sit",
-    "aliases": [
-      "L-Sit",
-      "Parallel Bar L-Sit",
-      "L-Sit Hold"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365868/exercise_library/dip_bar_l_sit.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dip_bar_l_sit.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dip Bars",
-      "Parallel Bars"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip bars, press body up with straight arms",
-      "Lift legs parallel to floor, toes pointed",
-      "Hold with core tight, shoulders down"
-    ],
-    "mistakes": [
-      "Bending knees to cheat position",
-      "Letting shoulders shrug up"
-    ]
-  },
-  {
-    "name": "Dips",
-    "aliases": [
-      "Parallel Bar Dips",
-      "Tricep Dips",
-      "Chest Dips"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365870/exercise_library/dips.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dips.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dip Bars",
-      "Parallel Bars"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip bars, start with arms locked out",
-      "Lower until upper arms parallel to floor",
-      "Press back up to full lockout"
-    ],
-    "mistakes": [
-      "Going too deep and straining shoulders",
-      "Flaring elbows out wide"
-    ]
-  },
-  {
-    "name": "Hanging Knee Raise",
-    "aliases": [
-      "Knee Raise",
-      "Hanging Knee Tuck",
-      "Knee Ups"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365877/exercise_library/hanging_knee_raise.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/hanging_knee_raise.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Pull Up Bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hang from bar with arms straight",
-      "Raise knees toward chest with control",
-      "Lower slowly, avoid swinging"
-    ],
-    "mistakes": [
-      "Using momentum to swing legs up",
-      "Not engaging core throughout"
-    ]
-  },
-  {
-    "name": "Hanging Toe Touch",
-    "aliases": [
-      "Toes to Bar",
-      "Hanging Leg Raise",
-      "T2B"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365887/exercise_library/hanging_toe_touch.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/hanging_toe_touch.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Pull Up Bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hang from bar, engage lats and core",
-      "Raise straight legs to touch bar",
-      "Lower with control to full hang"
-    ],
-    "mistakes": [
-      "Kipping too much to get up",
-      "Bending knees on the way up"
-    ]
-  },
-  {
-    "name": "Burpee Box Jump",
-    "aliases": [
-      "Burpee to Box Jump",
-      "Box Jump Burpee"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365890/exercise_library/burpee_box_jump.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/burpee_box_jump.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Plyo Box"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Drop into burpee, chest to floor",
-      "Explode up and jump onto box",
-      "Step down, immediately into next rep"
-    ],
-    "mistakes": [
-      "Not fully extending hips on jump",
-      "Landing with stiff legs on box"
-    ]
-  },
-  {
-    "name": "Ab Wheel Standing Rollout",
-    "aliases": [
-      "Standing Ab Rollout",
-      "Ab Wheel Rollout",
-      "Standing Wheel Rollout"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365892/exercise_library/ab_wheel_standing_rollout.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/ab_wheel_standing_rollout.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Ab Wheel"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start standing, hinge and roll wheel out",
-      "Extend fully with tight core",
-      "Pull back to standing using abs"
-    ],
-    "mistakes": [
-      "Letting lower back sag",
-      "Using arms instead of core to pull back"
-    ]
-  },
-  {
-    "name": "Hang Clean",
-    "aliases": [
-      "Barbell Hang Clean",
-      "Power Clean from Hang"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365895/exercise_library/hang_clean.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/hang_clean.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start at hip height, shoulders over bar",
-      "Explode hips, shrug and pull under",
-      "Catch in front rack, stand up"
-    ],
-    "mistakes": [
-      "Pulling with arms too early",
-      "Not getting under the bar fast enough"
-    ]
-  },
-  {
-    "name": "Tire Flip",
-    "aliases": [
-      "Tyre Flip",
-      "Strongman Tire Flip"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365906/exercise_library/tire_flip.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/tire_flip.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Tire"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Squat down, hands under tire edge",
-      "Drive through legs to lift and push",
-      "Flip tire over, reset for next rep"
-    ],
-    "mistakes": [
-      "Rounding back during the lift",
-      "Using only arms instead of legs"
-    ]
-  },
-  {
-    "name": "Hollow Holds",
-    "aliases": [
-      "Hollow Body Hold",
-      "Hollow Rock Position",
-      "Gymnast Hollow"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365932/exercise_library/hollow_holds.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/hollow_holds.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie flat, press lower back into floor",
-      "Lift arms and legs off ground",
-      "Hold position with core engaged"
-    ],
-    "mistakes": [
-      "Lower back lifting off floor",
-      "Holding breath instead of breathing"
-    ]
-  },
-  {
-    "name": "Kneeling Ab Wheel",
-    "aliases": [
-      "Ab Wheel Rollout",
-      "Kneeling Rollout",
-      "Ab Roller"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365934/exercise_library/kneeling_ab_wheel.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/kneeling_ab_wheel.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Ab Wheel"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Kneel with wheel in front, arms straight",
-      "Roll out slowly with tight core",
-      "Pull back using abs, not arms"
-    ],
-    "mistakes": [
-      "Letting hips sag toward floor",
-      "Going too far and losing control"
-    ]
-  },
-  {
-    "name": "Muscle Ups",
-    "aliases": [
-      "Bar Muscle Up",
-      "Pull Up to Dip"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365937/exercise_library/muscle_ups.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/muscle_ups.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Pull Up Bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Pull explosively, chest to bar",
-      "Transition over bar quickly",
-      "Press out to full lockout"
-    ],
-    "mistakes": [
-      "Not pulling high enough",
-      "Slow transition over the bar"
-    ]
-  },
-  {
-    "name": "Parallette L-Sit",
-    "aliases": [
-      "L-Sit on Parallettes",
-      "Floor L-Sit",
-      "Parallette Hold"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365939/exercise_library/parallette_l_sit.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/parallette_l_sit.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Parallettes"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip parallettes, press body up",
-      "Lift legs to parallel, toes pointed",
-      "Keep shoulders down, core tight"
-    ],
-    "mistakes": [
-      "Bending knees to hold position",
-      "Shoulders shrugging up to ears"
-    ]
-  },
-  {
-    "name": "Parallette Pike Press",
-    "aliases": [
-      "Pike Push Up",
-      "Parallette Pike Push Up",
-      "Pike Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365942/exercise_library/parallette_pike_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/parallette_pike_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Parallettes"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Pike position with hands on parallettes",
-      "Lower head between hands",
-      "Press back up to pike position"
-    ],
-    "mistakes": [
-      "Flaring elbows out wide",
-      "Not reaching full depth"
-    ]
-  },
-  {
-    "name": "Parallette Push Ups",
-    "aliases": [
-      "Parallette Pushups",
-      "Deep Push Ups",
-      "Elevated Push Ups"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365944/exercise_library/parallette_push_ups.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/parallette_push_ups.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Parallettes"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip parallettes, body in plank position",
-      "Lower chest below hand level",
-      "Press back up to full lockout"
-    ],
-    "mistakes": [
-      "Not using full range of motion",
-      "Letting hips sag or pike up"
-    ]
-  },
-  {
-    "name": "Pike Jumps",
-    "aliases": [
-      "Pike Jump",
-      "Tuck Jump to Pike",
-      "Explosive Pike"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365947/exercise_library/pike_jumps.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/pike_jumps.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start standing, jump explosively",
-      "Pike legs up, touch toes mid-air",
-      "Land soft with bent knees"
-    ],
-    "mistakes": [
-      "Not reaching full pike position",
-      "Landing with stiff legs"
-    ]
-  },
-  {
-    "name": "Pull Ups",
-    "aliases": [
-      "Pull Up",
-      "Overhand Pull Up",
-      "Pronated Pull Up"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365950/exercise_library/pull_ups.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/pull_ups.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Pull Up Bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip bar overhand, shoulder width",
-      "Pull chin over bar, squeeze lats",
-      "Lower with control to full hang"
-    ],
-    "mistakes": [
-      "Kipping or swinging excessively",
-      "Not reaching full extension at bottom"
-    ]
-  },
-  {
-    "name": "V Ups",
-    "aliases": [
-      "V-Up",
-      "V Sit Up",
-      "Jackknife"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365952/exercise_library/v_ups.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/v_ups.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie flat, arms overhead",
-      "Lift legs and torso simultaneously",
-      "Touch toes at top, lower with control"
-    ],
-    "mistakes": [
-      "Using momentum instead of core",
-      "Bending knees during the movement"
-    ]
-  },
-  {
-    "name": "Barbell Push Press",
-    "aliases": [
-      "BB Push Press",
-      "Push Press",
-      "Overhead Push Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365956/exercise_library/barbell_push_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_push_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start with bar in front rack position",
-      "Dip knees slightly, then explode upward",
-      "Press bar overhead using leg drive"
-    ],
-    "mistakes": [
-      "Not using enough leg drive",
-      "Pressing too early before hip extension"
-    ]
-  },
-  {
-    "name": "Barbell Snatch",
-    "aliases": [
-      "BB Snatch",
-      "Power Snatch",
-      "Olympic Snatch"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365959/exercise_library/barbell_snatch.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_snatch.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Wide grip, shoulders over bar",
-      "Explosive hip extension and pull",
-      "Drop under bar quickly"
-    ],
-    "mistakes": [
-      "Pulling with arms too early",
-      "Not extending hips fully before pulling under"
-    ]
-  },
-  {
-    "name": "Barbell Split Jerk",
-    "aliases": [
-      "BB Split Jerk",
-      "Split Jerk",
-      "Jerk"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365961/exercise_library/barbell_split_jerk.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_split_jerk.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Bar in front rack position",
-      "Dip and drive explosively",
-      "Split feet front and back as you press"
-    ],
-    "mistakes": [
-      "Not dipping straight down",
-      "Pressing before the drive phase"
-    ]
-  },
-  {
-    "name": "Calf Raise",
-    "aliases": [
-      "Standing Calf Raise",
-      "Heel Raise",
-      "Calf Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365963/exercise_library/calf_raise.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/calf_raise.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight",
-      "Dumbbells",
-      "Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand tall on balls of feet",
-      "Rise up as high as possible",
-      "Pause at the top, squeeze calves"
-    ],
-    "mistakes": [
-      "Bouncing at the bottom",
-      "Not achieving full range of motion"
-    ]
-  },
-  {
-    "name": "Dumbbell Hang Clean",
-    "aliases": [
-      "DB Hang Clean",
-      "Dumbbell Clean",
-      "DB Clean from Hang"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365967/exercise_library/dumbbell_hang_clean.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_hang_clean.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start with dumbbells at hip height",
-      "Explode hips and shrug shoulders",
-      "Pull under and catch in front rack"
-    ],
-    "mistakes": [
-      "Using arms to curl the weight",
-      "Not extending hips fully"
-    ]
-  },
-  {
-    "name": "Dumbbell Lateral Raise",
-    "aliases": [
-      "DB Lateral Raise",
-      "Side Raise",
-      "Lateral Delt Raise",
-      "Side Delt Raise"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365968/exercise_library/dumbbell_lateral_raise.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_lateral_raise.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand with dumbbells at sides",
-      "Raise arms out to sides, elbows slightly bent",
-      "Lift to shoulder height, pause briefly"
-    ],
-    "mistakes": [
-      "Using momentum to swing weights up",
-      "Raising arms too high above shoulders"
-    ]
-  },
-  {
-    "name": "Dumbbell Squat Press",
-    "aliases": [
-      "DB Squat Press",
-      "Dumbbell Thruster",
-      "DB Thruster"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365970/exercise_library/dumbbell_squat_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_squat_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold dumbbells at shoulders, squat deep",
-      "Drive up explosively through heels",
-      "Press overhead at the top, lower and repeat"
-    ],
-    "mistakes": [
-      "Pressing before fully standing",
-      "Not squatting deep enough"
-    ]
-  },
-  {
-    "name": "Depth Step Rebound",
-    "aliases": [
-      "Depth Jump",
-      "Drop Jump",
-      "Reactive Jump",
-      "Plyometric Depth Jump"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365976/exercise_library/depth_step_rebound.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/depth_step_rebound.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Plyo Box"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Step off box, land softly on both feet",
-      "Immediately explode upward",
-      "Minimize ground contact time"
-    ],
-    "mistakes": [
-      "Spending too much time on the ground",
-      "Landing with stiff legs"
-    ]
-  },
-  {
-    "name": "Hip Adductor Machine",
-    "aliases": [
-      "Glute Machine Hip Adductor",
-      "Inner Thigh Machine",
-      "Adductor Machine",
-      "Seated Hip Adduction"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365979/exercise_library/hip_adductor_machine.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/hip_adductor_machine.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Sit with back against pad, legs apart",
-      "Squeeze legs together using inner thighs",
-      "Pause at the contracted position"
-    ],
-    "mistakes": [
-      "Using momentum instead of muscle control",
-      "Not going through full range of motion"
-    ]
-  },
-  {
-    "name": "Hack Squat",
-    "aliases": [
-      "Machine Hack Squat",
-      "Hack Squat Machine",
-      "Reverse Hack Squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365981/exercise_library/hack_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/hack_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Position shoulders under pads, feet shoulder-width",
-      "Release safety and lower with control",
-      "Go to parallel or below"
-    ],
-    "mistakes": [
-      "Letting knees cave inward",
-      "Not going deep enough"
-    ]
-  },
-  {
-    "name": "Skater Bounds",
-    "aliases": [
-      "Skater Jumps",
-      "Lateral Bounds",
-      "Side to Side Jumps",
-      "Skaters"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365985/exercise_library/skater_bounds.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/skater_bounds.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Push off one leg, leap laterally",
-      "Land softly on opposite foot",
-      "Swing arms for momentum"
-    ],
-    "mistakes": [
-      "Landing with stiff legs",
-      "Not driving arms for power"
-    ]
-  },
-  {
-    "name": "Slam Ball Chest Pass",
-    "aliases": [
-      "Medicine Ball Chest Pass",
-      "Med Ball Chest Throw",
-      "Wall Ball Chest Pass"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365987/exercise_library/slam_ball_chest_pass.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/slam_ball_chest_pass.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Slam Ball",
-      "Medicine Ball"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold ball at chest level",
-      "Step forward and extend arms explosively",
-      "Push through chest and triceps"
-    ],
-    "mistakes": [
-      "Not using legs for power",
-      "Throwing from too high or low"
-    ]
-  },
-  {
-    "name": "Slam Ball Heave",
-    "aliases": [
-      "Medicine Ball Heave",
-      "Backward Ball Throw",
-      "Ball Heave Toss"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365990/exercise_library/slam_ball_heave.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/slam_ball_heave.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Slam Ball",
-      "Medicine Ball"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold ball low, hinge at hips",
-      "Extend hips and swing ball up",
-      "Release at peak extension"
-    ],
-    "mistakes": [
-      "Using only arms instead of hips",
-      "Releasing too early or late"
-    ]
-  },
-  {
-    "name": "Slam Ball Overhead Toss",
-    "aliases": [
-      "Medicine Ball Overhead Throw",
-      "Overhead Ball Toss",
-      "Backward Overhead Throw"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771365997/exercise_library/slam_ball_overhead_toss.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/slam_ball_overhead_toss.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Slam Ball",
-      "Medicine Ball"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start with ball overhead",
-      "Extend through hips and core",
-      "Release ball behind you"
-    ],
-    "mistakes": [
-      "Not using full hip extension",
-      "Releasing too early"
-    ]
-  },
-  {
-    "name": "Slam Ball Rotational Throw",
-    "aliases": [
-      "Medicine Ball Rotational Throw",
-      "Rotational Ball Toss",
-      "Med Ball Side Throw",
-      "Torso Rotation Throw"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366016/exercise_library/slam_ball_rotational_throw.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/slam_ball_rotational_throw.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Slam Ball",
-      "Medicine Ball"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start with ball at hip, rotate away",
-      "Drive rotation from hips and core",
-      "Release ball explosively toward wall"
-    ],
-    "mistakes": [
-      "Rotating only with arms",
-      "Not pivoting on back foot"
-    ]
-  },
-  {
-    "name": "Slam Ball Slams",
-    "aliases": [
-      "Medicine Ball Slams",
-      "Ball Slams",
-      "Med Ball Slams",
-      "Overhead Slams"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366020/exercise_library/slam_ball_slams.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/slam_ball_slams.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Slam Ball",
-      "Medicine Ball"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Raise ball overhead with extended arms",
-      "Slam ball down with full force",
-      "Engage core and hips on the way down"
-    ],
-    "mistakes": [
-      "Not using full hip extension",
-      "Bending arms too early"
-    ]
-  },
-  {
-    "name": "Slam Ball Squat Press",
-    "aliases": [
-      "Medicine Ball Squat Press",
-      "Ball Thruster",
-      "Med Ball Squat to Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366024/exercise_library/slam_ball_squat_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/slam_ball_squat_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Slam Ball",
-      "Medicine Ball"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold ball at chest, squat down",
-      "Drive up through heels",
-      "Press ball overhead at the top"
-    ],
-    "mistakes": [
-      "Not squatting deep enough",
-      "Pressing before fully standing"
-    ]
-  },
-  {
-    "name": "Sled Drag",
-    "aliases": [
-      "Backward Sled Drag",
-      "Sled Pull",
-      "Reverse Sled Drag"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366025/exercise_library/sled_drag.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/sled_drag.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Sled"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Face the sled, grip handles or straps",
-      "Stay low with bent knees",
-      "Walk backward with controlled steps"
-    ],
-    "mistakes": [
-      "Standing too upright",
-      "Taking steps that are too large"
-    ]
-  },
-  {
-    "name": "Split Squat Jump",
-    "aliases": [
-      "Jumping Lunges",
-      "Lunge Jumps",
-      "Alternating Lunge Jumps",
-      "Plyometric Lunges"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366028/exercise_library/split_squat_jump.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/split_squat_jump.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start in lunge position",
-      "Explode upward, switching legs mid-air",
-      "Land softly in opposite lunge"
-    ],
-    "mistakes": [
-      "Not getting enough height",
-      "Landing with stiff legs"
-    ]
-  },
-  {
-    "name": "Squat Pop Stick",
-    "aliases": [
-      "Squat Jump Stick",
-      "Squat Pop",
-      "Explosive Squat Hold"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366031/exercise_library/squat_pop_stick.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/squat_pop_stick.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start in squat position",
-      "Explode upward with power",
-      "Land and immediately stick the landing"
-    ],
-    "mistakes": [
-      "Not sticking the landing",
-      "Losing balance on landing"
-    ]
-  },
-  {
-    "name": "Landmine Split Jerk",
-    "aliases": [
-      "Landmine Jerk",
-      "Single Arm Landmine Jerk"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366035/exercise_library/landmine_split_jerk.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_split_jerk.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold barbell end at shoulder, dip and drive",
-      "Split feet as you press overhead",
-      "Lock out arm, recover feet together"
-    ],
-    "mistakes": [
-      "Not using leg drive",
-      "Splitting feet too narrow"
-    ]
-  },
-  {
-    "name": "Landmine Triple Extension Heave",
-    "aliases": [
-      "Landmine Heave",
-      "Triple Extension Throw"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366036/exercise_library/landmine_triple_extension_heave.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_triple_extension_heave.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start low, grip barbell end",
-      "Extend ankles, knees, and hips explosively",
-      "Drive bar up and forward with full body"
-    ],
-    "mistakes": [
-      "Using arms before hips extend",
-      "Not achieving full triple extension"
-    ]
-  },
-  {
-    "name": "Dumbbell Incline Press",
-    "aliases": [
-      "DB Incline Press",
-      "Incline Dumbbell Bench Press",
-      "Incline DB Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366039/exercise_library/dumbbell_incline_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_incline_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells",
-      "Incline Bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Set bench to 30-45 degrees, dumbbells at chest",
-      "Press up and slightly inward",
-      "Lower with control, elbows at 45 degrees"
-    ],
-    "mistakes": [
-      "Flaring elbows too wide",
-      "Bouncing weights at the bottom"
-    ]
-  },
-  {
-    "name": "Single Leg Box Jump",
-    "aliases": [
-      "One Leg Box Jump",
-      "Unilateral Box Jump"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366043/exercise_library/single_leg_box_jump.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/single_leg_box_jump.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Plyo Box"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand on one leg facing the box",
-      "Swing arms and explode upward",
-      "Land softly on the box, stabilize"
-    ],
-    "mistakes": [
-      "Not using arm swing for power",
-      "Landing with a stiff leg"
-    ]
-  },
-  {
-    "name": "Landmine Rotation Punch",
-    "aliases": [
-      "Landmine Punch",
-      "Rotational Punch Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366046/exercise_library/landmine_rotation_punch.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_rotation_punch.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start with bar at shoulder, rotate hips away",
-      "Drive rotation from hips as you punch",
-      "Fully extend arm, pivot back foot"
-    ],
-    "mistakes": [
-      "Punching without hip rotation",
-      "Not pivoting on the back foot"
-    ]
-  },
-  {
-    "name": "Landmine Rotational Punch and Bound",
-    "aliases": [
-      "Landmine Punch Bound",
-      "Rotational Punch Jump"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366050/exercise_library/landmine_rotational_punch_and_bound.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/landmine_rotational_punch_and_bound.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Landmine",
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Rotate and punch the bar forward",
-      "Bound laterally as you punch",
-      "Land soft, reset and repeat other side"
-    ],
-    "mistakes": [
-      "Not syncing punch with bound",
-      "Landing with stiff legs"
-    ]
-  },
-  {
-    "name": "Cable Lateral Raise",
-    "aliases": [
-      "Cable Machine Lateral Raise",
-      "Cable Side Raise",
-      "Single Arm Cable Lateral Raise"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366052/exercise_library/cable_lateral_raise.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_lateral_raise.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand sideways to cable, handle in far hand",
-      "Raise arm out to shoulder height",
-      "Lower with control, keep slight elbow bend"
-    ],
-    "mistakes": [
-      "Using momentum to swing the weight",
-      "Shrugging shoulders during the lift"
-    ]
-  },
-  {
-    "name": "Cable Rear Delt Fly",
-    "aliases": [
-      "Cable Machine Rear Delt Fly",
-      "Cable Reverse Fly",
-      "Rear Delt Cable Fly"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366055/exercise_library/cable_rear_delt_fly.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_rear_delt_fly.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Cross cables, grip opposite handles",
-      "Pull arms back and out, squeeze rear delts",
-      "Return slowly with control"
-    ],
-    "mistakes": [
-      "Using too much weight and losing form",
-      "Not squeezing at the contracted position"
-    ]
-  },
-  {
-    "name": "Dumbbell Flat Bench Press",
-    "aliases": [
-      "DB Flat Bench Press",
-      "Dumbbell Bench Press",
-      "DB Bench Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366056/exercise_library/dumbbell_flat_bench_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_flat_bench_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells",
-      "Flat Bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie flat, dumbbells at chest level",
-      "Press up and slightly inward",
-      "Lower with control, elbows at 45 degrees"
-    ],
-    "mistakes": [
-      "Flaring elbows too wide",
-      "Bouncing weights at the bottom"
-    ]
-  },
-  {
-    "name": "Barbell Military Press",
-    "aliases": [
-      "BB Military Press",
-      "Overhead Press",
-      "Strict Press",
-      "Standing Barbell Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366060/exercise_library/barbell_military_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_military_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Bar at shoulder height, grip just outside shoulders",
-      "Press straight up, head through at top",
-      "Lower with control to starting position"
-    ],
-    "mistakes": [
-      "Excessive back arch",
-      "Pressing the bar forward instead of straight up"
-    ]
-  },
-  {
-    "name": "Pec Deck Fly",
-    "aliases": [
-      "Pec Deck",
-      "Machine Chest Fly",
-      "Butterfly Machine"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366064/exercise_library/pec_deck_fly.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/pec_deck_fly.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Sit with back flat, arms on pads",
-      "Squeeze arms together in front of chest",
-      "Return slowly with control"
-    ],
-    "mistakes": [
-      "Using momentum to swing arms",
-      "Not squeezing at the contracted position"
-    ]
-  },
-  {
-    "name": "Cable Machine Fly",
-    "aliases": [
-      "Cable Fly",
-      "Cable Chest Fly",
-      "Standing Cable Fly",
-      "Cable Crossover"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366066/exercise_library/cable_machine_fly.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_machine_fly.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand centered, slight forward lean",
-      "Bring handles together in arc motion",
-      "Squeeze chest at the bottom, return with control"
-    ],
-    "mistakes": [
-      "Bending elbows too much",
-      "Using body momentum to move weight"
-    ]
-  },
-  {
-    "name": "Dumbbell Shoulder Press",
-    "aliases": [
-      "DB Shoulder Press",
-      "Seated DB Press",
-      "Dumbbell Overhead Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366068/exercise_library/dumbbell_shoulder_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_shoulder_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Sit with dumbbells at shoulder height",
-      "Press straight up, bringing weights together",
-      "Lower with control to starting position"
-    ],
-    "mistakes": [
-      "Arching back excessively",
-      "Not fully extending arms at the top"
-    ]
-  },
-  {
-    "name": "Barbell Incline Bench Press",
-    "aliases": [
-      "BB Incline Bench",
-      "Incline Bench Press",
-      "Incline Barbell Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366070/exercise_library/barbell_incline_bench_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_incline_bench_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell",
-      "Incline Bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Set bench to 30-45 degrees, grip slightly wide",
-      "Lower bar to upper chest with control",
-      "Press up to lockout, keeping shoulder blades tight"
-    ],
-    "mistakes": [
-      "Setting bench angle too steep",
-      "Bouncing bar off chest"
-    ]
-  },
-  {
-    "name": "Barbell Flat Bench Press",
-    "aliases": [
-      "BB Flat Bench",
-      "Barbell Bench Press",
-      "Bench Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366072/exercise_library/barbell_flat_bench_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/barbell_flat_bench_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Barbell",
-      "Flat Bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip bar slightly wider than shoulders",
-      "Lower to mid-chest with control",
-      "Press up, locking out at the top"
-    ],
-    "mistakes": [
-      "Bouncing bar off chest",
-      "Flaring elbows too wide"
-    ]
-  },
-  {
-    "name": "Sit Ups",
-    "aliases": [
-      "Situps",
-      "Abdominal Sit Ups",
-      "Ab Sit Ups"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366074/exercise_library/sit_ups.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/sit_ups.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie flat, knees bent, hands behind head",
-      "Curl up bringing chest toward knees",
-      "Lower with control, don't collapse"
-    ],
-    "mistakes": [
-      "Pulling on neck with hands",
-      "Using momentum instead of abs"
-    ]
-  },
-  {
-    "name": "TRX Knee Crunches",
-    "aliases": [
-      "TRX Knee Tucks",
-      "Suspension Knee Crunches",
-      "TRX Ab Tucks"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366076/exercise_library/trx_knee_crunches.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/trx_knee_crunches.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "TRX",
-      "Suspension Trainer"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start in plank, feet in TRX straps",
-      "Drive knees toward chest",
-      "Extend back to plank with control"
-    ],
-    "mistakes": [
-      "Letting hips sag in plank",
-      "Not fully extending legs on return"
-    ]
-  },
-  {
-    "name": "TRX Push Ups",
-    "aliases": [
-      "TRX Pushups",
-      "Suspension Push Ups",
-      "TRX Chest Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366078/exercise_library/trx_push_ups.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/trx_push_ups.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "TRX",
-      "Suspension Trainer"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip handles, lean forward in plank",
-      "Lower chest between hands",
-      "Press back up to starting position"
-    ],
-    "mistakes": [
-      "Letting straps swing uncontrolled",
-      "Sagging hips during the movement"
-    ]
-  },
-  {
-    "name": "TRX Rows",
-    "aliases": [
-      "TRX Row",
-      "Suspension Rows",
-      "Inverted TRX Row"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366080/exercise_library/trx_rows.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/trx_rows.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "TRX",
-      "Suspension Trainer"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lean back holding handles, body straight",
-      "Pull chest to hands, squeeze shoulder blades",
-      "Lower with control to full arm extension"
-    ],
-    "mistakes": [
-      "Letting hips drop during pull",
-      "Not fully extending arms at bottom"
-    ]
-  },
-  {
-    "name": "Walking Lunges",
-    "aliases": [
-      "Lunge Walk",
-      "Forward Walking Lunges",
-      "Traveling Lunges"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366083/exercise_library/walking_lunges.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/walking_lunges.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Step forward into deep lunge",
-      "Drive through front heel to stand",
-      "Step forward with back leg into next lunge"
-    ],
-    "mistakes": [
-      "Front knee extending past toes",
-      "Torso leaning too far forward"
-    ]
-  },
-  {
-    "name": "Plyo Box Jump",
-    "aliases": [
-      "Box Jump",
-      "Plyometric Box Jump",
-      "Jump to Box"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366087/exercise_library/plyo_box_jump.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/plyo_box_jump.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Plyo Box"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand facing box, swing arms back",
-      "Explode up, drive knees high",
-      "Land softly on box, stand tall"
-    ],
-    "mistakes": [
-      "Not using arm swing for power",
-      "Landing too hard on the box"
-    ]
-  },
-  {
-    "name": "Plyo Box Pulse Jumps",
-    "aliases": [
-      "Box Pulse Jumps",
-      "Rapid Box Jumps",
-      "Quick Box Hops"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366090/exercise_library/plyo_box_pulse_jumps.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/plyo_box_pulse_jumps.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Plyo Box"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start on box, drop and immediately rebound",
-      "Minimize ground contact time",
-      "Keep jumps quick and rhythmic"
-    ],
-    "mistakes": [
-      "Spending too long on the ground",
-      "Losing rhythm between reps"
-    ]
-  },
-  {
-    "name": "Plyo Box Step Up Pops",
-    "aliases": [
-      "Box Step Up Pops",
-      "Explosive Step Ups",
-      "Step Up Jumps"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366092/exercise_library/plyo_box_step_up_pops.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/plyo_box_step_up_pops.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Plyo Box"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Place one foot on box, drive up explosively",
-      "Pop off the box at the top",
-      "Land softly and alternate legs"
-    ],
-    "mistakes": [
-      "Not driving through the front heel",
-      "Landing with stiff legs"
-    ]
-  },
-  {
-    "name": "Quad Extension",
-    "aliases": [
-      "Leg Extension",
-      "Seated Leg Extension",
-      "Machine Quad Extension"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366097/exercise_library/quad_extension.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/quad_extension.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Sit with back against pad, ankles under roller",
-      "Extend legs fully, squeeze quads at top",
-      "Lower with control, don't let weight slam"
-    ],
-    "mistakes": [
-      "Using momentum to swing weight",
-      "Not fully extending at the top"
-    ]
-  },
-  {
-    "name": "Side Plank",
-    "aliases": [
-      "Lateral Plank",
-      "Side Bridge",
-      "Oblique Plank"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366099/exercise_library/side_plank.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/side_plank.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stack feet, prop on forearm, hips off ground",
-      "Keep body in straight line from head to feet",
-      "Hold position, engage obliques throughout"
-    ],
-    "mistakes": [
-      "Letting hips sag toward ground",
-      "Not stacking shoulders over elbow"
-    ]
-  },
-  {
-    "name": "Dumbbell Step Ups",
-    "aliases": [
-      "DB Step Ups",
-      "Weighted Step Ups",
-      "Step Ups with Dumbbells"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366100/exercise_library/dumbbell_step_ups.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_step_ups.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells",
-      "Plyo Box"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold dumbbells at sides, step up onto box",
-      "Drive through front heel to stand tall",
-      "Step down with control, alternate legs"
-    ],
-    "mistakes": [
-      "Pushing off back foot instead of driving through front",
-      "Leaning torso too far forward"
-    ]
-  },
-  {
-    "name": "Knee Tuck Crunches",
-    "aliases": [
-      "Knee Tucks",
-      "Tuck Crunches",
-      "Double Crunch"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366102/exercise_library/knee_tuck_crunches.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/knee_tuck_crunches.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie flat, hands behind head, legs extended",
-      "Crunch up while bringing knees to chest",
-      "Lower back down with control"
-    ],
-    "mistakes": [
-      "Pulling on neck with hands",
-      "Using momentum instead of ab contraction"
-    ]
-  },
-  {
-    "name": "Leg Press",
-    "aliases": [
-      "Machine Leg Press",
-      "Seated Leg Press",
-      "45 Degree Leg Press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366105/exercise_library/leg_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/leg_press.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Feet shoulder-width on platform, back flat",
-      "Lower weight until knees at 90 degrees",
-      "Press through heels to full extension"
-    ],
-    "mistakes": [
-      "Letting lower back round off the pad",
-      "Locking knees completely at the top"
-    ]
-  },
-  {
-    "name": "Medicine Ball Russian Twists",
-    "aliases": [
-      "Med Ball Russian Twists",
-      "Weighted Russian Twists",
-      "Russian Twist"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366108/exercise_library/medicine_ball_russian_twists.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/medicine_ball_russian_twists.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Medicine Ball"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Sit with knees bent, lean back slightly, hold ball",
-      "Rotate torso and tap ball side to side",
-      "Keep core tight, feet can be elevated"
-    ],
-    "mistakes": [
-      "Moving only arms instead of rotating torso",
-      "Rounding the lower back"
-    ]
-  },
-  {
-    "name": "Plank",
-    "aliases": [
-      "Front Plank",
-      "Forearm Plank",
-      "Core Plank"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366109/exercise_library/plank.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/plank.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Forearms on ground, body in straight line",
-      "Engage core, squeeze glutes",
-      "Hold position, breathe steadily"
-    ],
-    "mistakes": [
-      "Letting hips sag toward ground",
-      "Piking hips too high"
-    ]
-  },
-  {
-    "name": "Clamshells",
-    "aliases": [
-      "Clamshell Exercise",
-      "Side Lying Clamshells",
-      "Hip Clamshells"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366114/exercise_library/clamshells.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/clamshells.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie on side, knees bent, feet together",
-      "Raise top knee while keeping feet touching",
-      "Lower with control, squeeze glutes at top"
-    ],
-    "mistakes": [
-      "Rolling hips backward during lift",
-      "Not squeezing glutes at the top"
-    ]
-  },
-  {
-    "name": "Crunches",
-    "aliases": [
-      "Ab Crunches",
-      "Abdominal Crunches",
-      "Basic Crunches"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366117/exercise_library/crunches.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/crunches.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie flat, knees bent, hands behind head",
-      "Curl shoulders off ground, squeeze abs",
-      "Lower with control, keep tension on abs"
-    ],
-    "mistakes": [
-      "Pulling on neck with hands",
-      "Using momentum instead of ab contraction"
-    ]
-  },
-  {
-    "name": "Dumbbell Curl",
-    "aliases": [
-      "DB Curl",
-      "Bicep Curl",
-      "Dumbbell Bicep Curl"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366119/exercise_library/dumbbell_curl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_curl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand tall, dumbbells at sides, palms forward",
-      "Curl weights up, squeeze biceps at top",
-      "Lower with control, full extension"
-    ],
-    "mistakes": [
-      "Swinging body to lift weight",
-      "Not fully extending arms at bottom"
-    ]
-  },
-  {
-    "name": "Dumbbell Goblet Squat",
-    "aliases": [
-      "DB Goblet Squat",
-      "Goblet Squat",
-      "Kettlebell Goblet Squat"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366121/exercise_library/dumbbell_goblet_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_goblet_squat.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells",
-      "Kettlebell"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold dumbbell at chest, elbows tucked",
-      "Squat deep, keeping torso upright",
-      "Drive through heels to stand"
-    ],
-    "mistakes": [
-      "Letting torso fall forward",
-      "Knees caving inward"
-    ]
-  },
-  {
-    "name": "Dumbbell Hammer Curl",
-    "aliases": [
-      "DB Hammer Curl",
-      "Hammer Curl",
-      "Neutral Grip Curl"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366124/exercise_library/dumbbell_hammer_curl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/dumbbell_hammer_curl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Dumbbells"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand with dumbbells at sides, palms facing in",
-      "Curl weights up keeping neutral grip",
-      "Lower with control to full extension"
-    ],
-    "mistakes": [
-      "Swinging body for momentum",
-      "Rotating wrists during the curl"
-    ]
-  },
-  {
-    "name": "Battle Rope Slams",
-    "aliases": [
-      "Battle Ropes",
-      "Rope Slams",
-      "Double Wave Slams"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366127/exercise_library/battle_rope_slams.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/battle_rope_slams.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Battle Ropes"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip ropes, slight squat stance",
-      "Raise arms high and slam ropes down hard",
-      "Keep rhythm, engage core throughout"
-    ],
-    "mistakes": [
-      "Standing too upright",
-      "Using only arms instead of whole body"
-    ]
-  },
-  {
-    "name": "Bench Dips",
-    "aliases": [
-      "Tricep Dips",
-      "Chair Dips",
-      "Bodyweight Dips"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366129/exercise_library/bench_dips.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/bench_dips.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Flat Bench"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hands on bench edge, legs extended",
-      "Lower body until elbows at 90 degrees",
-      "Press back up, squeeze triceps at top"
-    ],
-    "mistakes": [
-      "Flaring elbows out too wide",
-      "Not going deep enough"
-    ]
-  },
-  {
-    "name": "Bicycle Crunches",
-    "aliases": [
-      "Bicycle Abs",
-      "Cross Body Crunches",
-      "Cycling Crunches"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366131/exercise_library/bicycle_crunches.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/bicycle_crunches.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie flat, hands behind head, legs raised",
-      "Rotate elbow to opposite knee, extend other leg",
-      "Alternate sides in pedaling motion"
-    ],
-    "mistakes": [
-      "Pulling on neck with hands",
-      "Moving too fast without control"
-    ]
-  },
-  {
-    "name": "Bird Dog",
-    "aliases": [
-      "Quadruped Bird Dog",
-      "Opposite Arm Leg Raise"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366133/exercise_library/bird_dog.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/bird_dog.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Start on all fours, spine neutral",
-      "Extend opposite arm and leg straight out",
-      "Hold briefly, return with control, alternate"
-    ],
-    "mistakes": [
-      "Arching or rounding the lower back",
-      "Rotating hips during the movement"
-    ]
-  },
-  {
-    "name": "Cable Straight Bar Curl",
-    "aliases": [
-      "Cable Machine Straight Bar Curl",
-      "Cable Bicep Curl",
-      "Low Cable Curl"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366135/exercise_library/cable_straight_bar_curl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_straight_bar_curl.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Cable Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Stand facing cable, grip bar underhand",
-      "Curl bar up, squeeze biceps at top",
-      "Lower with control, keep elbows stationary"
-    ],
-    "mistakes": [
-      "Swinging body for momentum",
-      "Moving elbows forward during curl"
-    ]
-  },
-  {
-    "name": "Alternating Toe Touch",
-    "aliases": [
-      "Toe Touches",
-      "Lying Toe Touch",
-      "Ab Toe Touch"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366141/exercise_library/alternating_toe_touch.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/alternating_toe_touch.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Bodyweight"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Lie flat, legs extended up toward ceiling",
-      "Reach up and touch opposite hand to foot",
-      "Alternate sides with controlled motion"
-    ],
-    "mistakes": [
-      "Not keeping legs straight",
-      "Using momentum instead of ab contraction"
-    ]
-  },
-  {
-    "name": "Assisted Dips",
-    "aliases": [
-      "Machine Dips",
-      "Assisted Tricep Dips",
-      "Dip Machine"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366144/exercise_library/assisted_dips.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/assisted_dips.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Machine"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip handles, knees on pad, torso upright",
-      "Lower until elbows at 90 degrees",
-      "Press back up, squeeze triceps at top"
-    ],
-    "mistakes": [
-      "Leaning too far forward",
-      "Not going deep enough"
-    ]
-  },
-  {
-    "name": "Battle Rope Alternating Waves",
-    "aliases": [
-      "Rope Waves",
-      "Alternating Waves",
-      "Single Arm Waves"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366148/exercise_library/battle_rope_alternating_waves.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/battle_rope_alternating_waves.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Battle Ropes"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip ropes, athletic stance, slight squat",
-      "Alternate arms up and down creating waves",
-      "Keep rhythm steady, engage core"
-    ],
-    "mistakes": [
-      "Standing too upright",
-      "Moving arms at same time instead of alternating"
-    ]
-  },
-  {
-    "name": "Battle Rope Lateral Raises",
-    "aliases": [
-      "Rope Lateral Raises",
-      "Battle Rope Side Raises"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366150/exercise_library/battle_rope_lateral_raises.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/battle_rope_lateral_raises.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Battle Ropes"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Hold ropes at sides, slight squat stance",
-      "Raise arms out to sides explosively",
-      "Lower with control, repeat rhythmically"
-    ],
-    "mistakes": [
-      "Using only arms instead of whole body",
-      "Raising arms too high above shoulders"
-    ]
-  },
-  {
-    "name": "Battle Rope Side to Side Slams",
-    "aliases": [
-      "Rope Side Slams",
-      "Lateral Rope Slams",
-      "Side to Side Waves"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771366153/exercise_library/battle_rope_side_to_side_slams.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/battle_rope_side_to_side_slams.jpg",
-    "muscle_group": "",
-    "equipment": [
-      "Battle Ropes"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Grip both ropes together, athletic stance",
-      "Slam ropes side to side with rotation",
-      "Engage core, pivot hips with each slam"
-    ],
-    "mistakes": [
-      "Not rotating through the core",
-      "Using only arms without hip engagement"
-    ]
-  },
-  {
-    "name": "Single knee tuck front lever",
-    "aliases": [],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1770319282/exercise_library/8DA3DEBF-82F9-4F0B-8DA3-ED68283A1BC8.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/8DA3DEBF-82F9-4F0B-8DA3-ED68283A1BC8.jpg",
-    "muscle_group": "Abs",
-    "equipment": [
-      "Pull up bar"
-    ],
-    "description": "",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "",
-    "cues": [
-      "Brace core, lats, hip flexors, chest",
-      "Parallel to the ground is key",
-      "Straight line from shoulders to waist, knees, and toes"
-    ],
-    "mistakes": [
-      "Hinging at the hips",
-      "Swaying"
-    ]
-  },
-  {
-    "name": "BB Snatch",
-    "aliases": [
-      "barbell snatch",
-      "bb snatch",
-      "snatch",
-      "olympic snatch",
-      "power snatch",
-      "barbell power snatch",
-      "full snatch",
-      "squat snatch"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352030/exercise_library/bb_snatch.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/bb_snatch.jpg",
-    "muscle_group": "Full Body",
-    "equipment": ["Barbell"],
-    "description": "An explosive Olympic lift that develops power, speed, and coordination",
-    "difficulty": "advanced",
-    "instructions": [],
-    "tips": [],
-    "category": "Olympic Lifting",
-    "cues": [
-      "Keep bar close to body throughout",
-      "Explode upward from hips",
-      "Lock out arms overhead"
-    ],
-    "mistakes": [
-      "Bar swinging away from body",
-      "Pulling with arms too early"
-    ]
-  },
-  {
-    "name": "Cable Fly High to Low",
-    "aliases": [
-      "cable fly high to low",
-      "high cable fly",
-      "cable crossover high to low",
-      "high to low cable fly",
-      "downward cable fly",
-      "cable chest fly high to low",
-      "high pulley cable fly"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352032/exercise_library/cable_fly_high_to_low.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_fly_high_to_low.jpg",
-    "muscle_group": "Chest",
-    "equipment": ["Cable Machine"],
-    "description": "Targets the lower chest fibers with a downward fly movement",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Set cables at high position",
-      "Slight bend in elbows throughout",
-      "Squeeze chest at bottom"
-    ],
-    "mistakes": [
-      "Using too much weight and bending arms excessively",
-      "Jerking or swinging the weight"
-    ]
-  },
-  {
-    "name": "Cable Fly Low to High",
-    "aliases": [
-      "cable fly low to high",
-      "low cable fly",
-      "cable crossover low to high",
-      "low to high cable fly",
-      "upward cable fly",
-      "cable chest fly low to high",
-      "low pulley cable fly",
-      "incline cable fly"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352034/exercise_library/cable_fly_low_to_high.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_fly_low_to_high.jpg",
-    "muscle_group": "Chest",
-    "equipment": ["Cable Machine"],
-    "description": "Targets the upper chest fibers with an upward fly movement",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Set cables at low position",
-      "Slight bend in elbows throughout",
-      "Focus on upper chest squeeze"
-    ],
-    "mistakes": [
-      "Straightening arms completely",
-      "Using momentum instead of muscle control"
-    ]
-  },
-  {
-    "name": "Cable Pull Through",
-    "aliases": [
-      "cable pull through",
-      "cable pull-through",
-      "hip pull through",
-      "cable hip pull through",
-      "glute pull through",
-      "rope pull through",
-      "cable pull thru"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352036/exercise_library/cable_pull_through.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_pull_through.jpg",
-    "muscle_group": "Glutes",
-    "equipment": ["Cable Machine"],
-    "description": "A hip hinge movement that targets glutes and hamstrings",
-    "difficulty": "beginner",
-    "instructions": [],
-    "tips": [],
-    "category": "Compound",
-    "cues": [
-      "Hinge at hips, pushing them back",
-      "Keep back flat throughout",
-      "Squeeze glutes at the top"
-    ],
-    "mistakes": [
-      "Rounding the lower back",
-      "Squatting instead of hinging"
-    ]
-  },
-  {
-    "name": "Cable Squat",
-    "aliases": [
-      "cable squat",
-      "cable machine squat",
-      "cable front squat",
-      "cable goblet squat",
-      "standing cable squat",
-      "cable squats"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352037/exercise_library/cable_squat.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/cable_squat.jpg",
-    "muscle_group": "Legs",
-    "equipment": ["Cable Machine"],
-    "description": "A squat variation using cable resistance for constant tension",
-    "difficulty": "beginner",
-    "instructions": [],
-    "tips": [],
-    "category": "Compound",
-    "cues": [
-      "Hold cable handle at chest level",
-      "Sit back and down into squat",
-      "Drive through heels to stand"
-    ],
-    "mistakes": [
-      "Letting knees cave inward",
-      "Rounding upper back"
-    ]
-  },
-  {
-    "name": "Close Grip Bench Press",
-    "aliases": [
-      "close grip bench press",
-      "close grip bench",
-      "narrow grip bench press",
-      "tricep bench press",
-      "cgbp",
-      "close grip bp",
-      "narrow bench"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352369/exercise_library/close_grip_bench_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/close_grip_bench_press.jpg",
-    "muscle_group": "Triceps",
-    "equipment": ["Barbell", "Bench"],
-    "description": "A bench press variation that emphasizes tricep development",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Compound",
-    "cues": [
-      "Grip shoulder-width or slightly narrower",
-      "Keep elbows tucked close to body",
-      "Drive through triceps to lockout"
-    ],
-    "mistakes": [
-      "Flaring elbows out wide",
-      "Bouncing bar off chest"
-    ]
-  },
-  {
-    "name": "DB Arnold Curl",
-    "aliases": [
-      "db arnold curl",
-      "dumbbell arnold curl",
-      "arnold curl",
-      "supinating curl",
-      "rotating dumbbell curl",
-      "twist curl",
-      "rotation curl"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352371/exercise_library/db_arnold_curl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_arnold_curl.jpg",
-    "muscle_group": "Biceps",
-    "equipment": ["Dumbbells"],
-    "description": "A curl variation with rotation for complete bicep development",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Start with palms facing body",
-      "Rotate wrists as you curl up",
-      "Keep elbows stationary"
-    ],
-    "mistakes": [
-      "Swinging the weights",
-      "Using momentum instead of muscle control"
-    ]
-  },
-  {
-    "name": "DB Arnold Press",
-    "aliases": [
-      "db arnold press",
-      "dumbbell arnold press",
-      "arnold press",
-      "rotating shoulder press",
-      "arnold shoulder press",
-      "rotating dumbbell press",
-      "arnold dumbbell press"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352375/exercise_library/db_arnold_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_arnold_press.jpg",
-    "muscle_group": "Shoulders",
-    "equipment": ["Dumbbells"],
-    "description": "A shoulder press with rotation hitting all three deltoid heads",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Compound",
-    "cues": [
-      "Start with palms facing you at shoulder height",
-      "Rotate and press in one smooth motion",
-      "Keep core tight throughout"
-    ],
-    "mistakes": [
-      "Arching lower back excessively",
-      "Pressing before rotating"
-    ]
-  },
-  {
-    "name": "DB Fly",
-    "aliases": [
-      "db fly",
-      "dumbbell fly",
-      "dumbbell chest fly",
-      "db chest fly",
-      "flat dumbbell fly",
-      "pec fly",
-      "dumbbell flyes",
-      "db flyes"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352378/exercise_library/db_fly.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_fly.jpg",
-    "muscle_group": "Chest",
-    "equipment": ["Dumbbells", "Bench"],
-    "description": "An isolation exercise for chest development and stretch",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Keep slight bend in elbows throughout",
-      "Feel the stretch in chest at bottom",
-      "Squeeze chest to bring weights together"
-    ],
-    "mistakes": [
-      "Straightening arms at the bottom",
-      "Going too deep and straining shoulders"
-    ]
-  },
-  {
-    "name": "DB Front Raise",
-    "aliases": [
-      "db front raise",
-      "dumbbell front raise",
-      "front delt raise",
-      "front shoulder raise",
-      "anterior delt raise",
-      "front raise",
-      "dumbbell front delt raise"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352380/exercise_library/db_front_raise.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_front_raise.jpg",
-    "muscle_group": "Shoulders",
-    "equipment": ["Dumbbells"],
-    "description": "An isolation exercise targeting the front deltoids",
-    "difficulty": "beginner",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Raise arms straight in front to shoulder height",
-      "Keep slight bend in elbows",
-      "Control the lowering phase"
-    ],
-    "mistakes": [
-      "Swinging weights up with momentum",
-      "Leaning back excessively"
-    ]
-  },
-  {
-    "name": "DB Lat Raise",
-    "aliases": [
-      "db lat raise",
-      "dumbbell lateral raise",
-      "lateral raise",
-      "side raise",
-      "db side raise",
-      "shoulder lateral raise",
-      "dumbbell side raise"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352602/exercise_library/db_lat_raise.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_lat_raise.jpg",
-    "muscle_group": "Shoulders",
-    "equipment": ["Dumbbells"],
-    "description": "An isolation exercise targeting the lateral deltoid",
-    "difficulty": "beginner",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Raise arms out to sides to shoulder height",
-      "Lead with elbows, not hands",
-      "Control the lowering phase"
-    ],
-    "mistakes": [
-      "Swinging weights up",
-      "Raising above shoulder height"
-    ]
-  },
-  {
-    "name": "DB Skull Crusher",
-    "aliases": [
-      "db skull crusher",
-      "dumbbell skull crusher",
-      "lying tricep extension",
-      "db lying extension",
-      "dumbbell lying tricep extension",
-      "skull crushers dumbbell"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352604/exercise_library/db_skull_crusher.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/db_skull_crusher.jpg",
-    "muscle_group": "Triceps",
-    "equipment": ["Dumbbells", "Bench"],
-    "description": "An isolation exercise for tricep development",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Keep upper arms stationary",
-      "Lower weight to sides of head",
-      "Extend through triceps to lockout"
-    ],
-    "mistakes": [
-      "Moving elbows during the movement",
-      "Using momentum to lift"
-    ]
-  },
-  {
-    "name": "Decline Bench Press",
-    "aliases": [
-      "decline bench press",
-      "decline bench",
-      "decline barbell press",
-      "decline press",
-      "lower chest press",
-      "decline bp"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352606/exercise_library/decline_bench_press.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/decline_bench_press.jpg",
-    "muscle_group": "Chest",
-    "equipment": ["Barbell", "Decline Bench"],
-    "description": "A bench press variation emphasizing the lower chest",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Compound",
-    "cues": [
-      "Secure feet under pads",
-      "Lower bar to lower chest",
-      "Press up and slightly back"
-    ],
-    "mistakes": [
-      "Bouncing bar off chest",
-      "Flaring elbows too wide"
-    ]
-  },
-  {
-    "name": "EZ Bar Curl",
-    "aliases": [
-      "ez bar curl",
-      "ez curl",
-      "ez barbell curl",
-      "cambered bar curl",
-      "angled bar curl",
-      "ez bar bicep curl"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352608/exercise_library/ez_bar_curl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/ez_bar_curl.jpg",
-    "muscle_group": "Biceps",
-    "equipment": ["EZ Bar"],
-    "description": "A curl variation with an angled grip for wrist comfort",
-    "difficulty": "beginner",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Grip the angled portions of the bar",
-      "Keep elbows pinned to sides",
-      "Squeeze biceps at the top"
-    ],
-    "mistakes": [
-      "Swinging the weight",
-      "Moving elbows forward"
-    ]
-  },
-  {
-    "name": "EZ Bar Skull Crusher",
-    "aliases": [
-      "ez bar skull crusher",
-      "ez skull crusher",
-      "lying ez bar extension",
-      "ez bar tricep extension",
-      "ez bar lying tricep",
-      "skull crusher ez bar"
-    ],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352611/exercise_library/ez_bar_skull_crusher.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/ez_bar_skull_crusher.jpg",
-    "muscle_group": "Triceps",
-    "equipment": ["EZ Bar", "Bench"],
-    "description": "A tricep isolation using EZ bar for better wrist position",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": [
-      "Keep upper arms vertical",
-      "Lower bar to forehead level",
-      "Extend through triceps only"
-    ],
-    "mistakes": [
-      "Flaring elbows outward",
-      "Using shoulder movement"
-    ]
-  },
-  {
-    "name": "Incline Bench Front Raise",
-    "aliases": ["incline bench front raise", "incline front raise", "prone front raise", "incline dumbbell front raise", "face down front raise"],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352918/exercise_library/incline_bench_front_raise.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/incline_bench_front_raise.jpg",
-    "muscle_group": "Shoulders",
-    "equipment": ["Dumbbells", "Incline Bench"],
-    "description": "A front raise variation performed on an incline bench for isolation",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": ["Lie face down on incline bench", "Raise arms straight in front", "Control the lowering phase"],
-    "mistakes": ["Using momentum to swing", "Raising too high"]
-  },
-  {
-    "name": "Incline Bench Lat T Raise",
-    "aliases": ["incline bench lat raise", "incline t raise", "prone lateral raise", "incline bench t raise", "face down lateral raise", "incline dumbbell lateral raise"],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352921/exercise_library/incline_bench_lat_t_raise.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/incline_bench_lat_t_raise.jpg",
-    "muscle_group": "Shoulders",
-    "equipment": ["Dumbbells", "Incline Bench"],
-    "description": "A lateral raise on incline bench targeting rear and side delts",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": ["Lie face down on incline bench", "Raise arms out to form a T", "Squeeze shoulder blades together"],
-    "mistakes": ["Shrugging shoulders up", "Using too heavy weight"]
-  },
-  {
-    "name": "Incline DB Curl",
-    "aliases": ["incline db curl", "incline dumbbell curl", "incline curl", "incline bicep curl", "seated incline curl", "incline dumbbell bicep curl"],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352927/exercise_library/incline_db_curl.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/incline_db_curl.jpg",
-    "muscle_group": "Biceps",
-    "equipment": ["Dumbbells", "Incline Bench"],
-    "description": "A bicep curl on incline bench for a deeper stretch",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": ["Let arms hang straight down", "Curl without moving upper arms", "Squeeze biceps at the top"],
-    "mistakes": ["Swinging the weights", "Moving elbows forward"]
-  },
-  {
-    "name": "Incline DB Fly",
-    "aliases": ["incline db fly", "incline dumbbell fly", "incline fly", "incline chest fly", "incline pec fly", "incline dumbbell chest fly"],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352933/exercise_library/incline_db_fly.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/incline_db_fly.jpg",
-    "muscle_group": "Chest",
-    "equipment": ["Dumbbells", "Incline Bench"],
-    "description": "A fly variation targeting the upper chest",
-    "difficulty": "intermediate",
-    "instructions": [],
-    "tips": [],
-    "category": "Isolation",
-    "cues": ["Keep slight bend in elbows", "Lower in wide arc to chest level", "Squeeze upper chest together"],
-    "mistakes": ["Going too deep at bottom", "Straightening arms completely"]
-  },
-  {
-    "name": "Seated Cable Row",
-    "aliases": ["seated cable row", "cable row", "seated row", "low cable row", "cable seated row", "machine row"],
-    "video_url": "https://res.cloudinary.com/dfsygar5c/video/upload/v1771352935/exercise_library/seated_cable_row.mov",
-    "thumbnail_url": "https://res.cloudinary.com/dfsygar5c/video/upload/so_1.0,w_720,c_fill,q_auto,f_jpg/exercise_library/seated_cable_row.jpg",
-    "muscle_group": "Back",
-    "equipment": ["Cable Machine"],
-    "description": "A compound back exercise for lats and rhomboids",
-    "difficulty": "beginner",
-    "instructions": [],
-    "tips": [],
-    "category": "Compound",
-    "cues": ["Sit tall with slight lean forward", "Pull handle to lower chest", "Squeeze shoulder blades together"],
-    "mistakes": ["Rounding the back", "Using too much body momentum"]
-  }
-]
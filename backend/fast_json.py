@@ -0,0 +1,74 @@
+"""
+Fast JSON Responses
+orjson rendering for API responses:
+- MoodJSONResponse is the app's default_response_class, so every endpoint is
+  rendered by orjson instead of json.dumps
+- Endpoints wrapped in @fast_json (and cached analytics results) also skip
+  FastAPI's jsonable_encoder pass: datetimes are serialized natively, and
+  ObjectIds and Pydantic models are converted only when orjson reaches them
+- Hot paths build response models with model_construct() from trusted DB
+  documents, so models are not re-validated before they are dumped
+
+Usage:
+    @api_router.get("/posts")
+    @fast_json
+    async def get_posts(...):
+        ...
+"""
+import functools
+from decimal import Decimal
+from typing import Any, Awaitable, Callable
+import orjson
+from bson import ObjectId
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+# Non-string dict keys (e.g. int buckets in analytics) become strings like jsonable_encoder does
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    """Types orjson does not handle natively."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class MoodJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_response(content: Any, status_code: int = 200) -> MoodJSONResponse:
+    """Wrap already-trusted content in a response, bypassing jsonable_encoder."""
+    return MoodJSONResponse(content, status_code=status_code)
+
+
+def fast_json(func: Callable[..., Awaitable[Any]]):
+    """
+    Return the endpoint's result as a MoodJSONResponse so FastAPI skips
+    jsonable_encoder. Responses the endpoint builds itself pass through.
+    The wrapper keeps the endpoint signature so FastAPI sees the same params.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        result = await func(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        return fast_response(result)
+
+    return wrapper
@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+Synthetic large-scale dataset generator
+Extends seed_test_data.py from a handful of accounts to production volume so
+analytics, feed and notification paths can be measured on realistic data:
+- users with growth-weighted signup dates, churn and a few internal accounts
+- user_events drawn from EVENT_TYPES with session structure, workout funnels
+  and heavy-tailed per-user activity (stamped with is_internal/audience)
+- daily_activity rollups matching the generated events
+- power-law follow graph, posts, post_likes, comments and notifications
+
+Deterministic: the same --seed and scale produce identical documents,
+including _ids, relative to the anchor date stored on the first run. That
+makes runs resumable - finished chunks are recorded in
+synthetic_progress, and a chunk interrupted mid-write is regenerated with
+duplicate-key errors ignored.
+
+Usage:
+    python generate_synthetic_data.py --users 100000 --events 50000000
+    python generate_synthetic_data.py --users 2000 --events 200000 --reset
+    python index_registry.py   # build indexes after loading (faster than before)
+"""
+import argparse
+import bisect
+import hashlib
+import itertools
+import os
+import random
+import struct
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Tuple
+
+import bcrypt
+from bson import ObjectId
+from dotenv import load_dotenv
+from pymongo import MongoClient
+from pymongo.errors import BulkWriteError
+
+from user_analytics import EVENT_TYPES, AUDIENCE_USER, AUDIENCE_GUEST, AUDIENCE_INTERNAL, event_meta
+from seed_test_data import COMMENTS, SAMPLE_POSTS
+
+load_dotenv()
+
+MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/")
+DEFAULT_DB_NAME = os.getenv("SYNTHETIC_DB_NAME", "mood_synthetic")
+
+# One bcrypt hash of "password123" for everyone (fixed salt keeps runs identical);
+# hashing per user would dominate runtime
+PASSWORD_HASH = bcrypt.hashpw(b"password123", b"$2b$10$syntheticdatageneratoe").decode()
+
+# Chunk sizes (units per progress checkpoint)
+USERS_PER_CHUNK = 1000
+EVENT_USERS_PER_CHUNK = 200
+
+# Shape of the population
+INTERNAL_USER_RATE = 0.001
+RETAINED_USER_RATE = 0.2
+MEAN_LIFETIME_DAYS = 45
+ACTIVITY_PARETO_ALPHA = 1.3
+FOLLOW_PARETO_ALPHA = 1.6
+MAX_FOLLOWS_PER_USER = 2000
+POST_RATE = 0.02            # posts per event
+LIKES_PER_POST_MEAN = 6
+COMMENTS_PER_POST_MEAN = 1.5
+REPLY_RATE = 0.3
+NOTIFICATION_READ_RATE = 0.7
+GUEST_EVENT_RATE = 0.03     # share of events from guests
+
+# ObjectId "kind" byte keeps ids unique across generated collections
+(KIND_USER, KIND_EVENT, KIND_POST, KIND_FOLLOW, KIND_LIKE, KIND_COMMENT,
+ KIND_LIKE_NOTIFICATION, KIND_COMMENT_NOTIFICATION, KIND_GUEST) = range(1, 10)
+
+MOODS = ["Sweat / Burn Fat", "Muscle Gainer", "Build Explosion", "Get Outside", "Calisthenics", "Lazy Day"]
+SCREENS = ["Home", "Explore", "Profile", "Workout", "Feed", "Notifications", "Settings", "WorkoutDetail", "Search"]
+DIFFICULTIES = ["beginner", "intermediate", "advanced"]
+EQUIPMENT = ["bodyweight", "dumbbells", "barbell", "kettlebell", "bands", "machines"]
+TABS = ["home", "explore", "feed", "profile"]
+
+# Relative frequency of in-session events (session start/end and the workout
+# funnel are generated structurally, not drawn from this table)
+SESSION_EVENT_WEIGHTS = {
+    "screen_viewed": 30,
+    "tab_switched": 12,
+    "mood_selected": 8,
+    "post_liked": 8,
+    "profile_viewed": 6,
+    "equipment_selected": 5,
+    "difficulty_selected": 5,
+    "search_performed": 3,
+    "filter_applied": 3,
+    "post_commented": 2,
+    "notification_clicked": 2,
+    "try_workout_clicked": 1.5,
+    "user_followed": 1.2,
+    "workout_saved": 1,
+    "workout_skipped": 1,
+    "post_created": 0.8,
+    "user_unfollowed": 0.2,
+}
+WORKOUT_SESSION_RATE = 0.35
+WORKOUT_COMPLETION_RATE = 0.62
+
+DAILY_ACTIVITY_FIELDS = {
+    "workout_completed": "workouts_completed",
+    "post_created": "posts_created",
+    "post_commented": "comments_made",
+    "post_liked": "likes_given",
+    "profile_viewed": "profiles_viewed",
+}
+
+
+def make_oid(kind: int, index: int, ts: datetime) -> ObjectId:
+    """Deterministic ObjectId: 4-byte timestamp, 1-byte kind, 7-byte index."""
+    return ObjectId(struct.pack(">I", int(ts.timestamp())) + bytes([kind]) + index.to_bytes(7, "big"))
+
+
+def chunk_rng(seed: int, phase: str, chunk: int) -> random.Random:
+    digest = hashlib.sha256(f"{seed}:{phase}:{chunk}".encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+class Population:
+    """Per-user attributes every phase needs, derived from the seed alone"""
+
+    def __init__(self, seed: int, user_count: int, days: int, now: datetime):
+        rng = chunk_rng(seed, "population", 0)
+        self.count = user_count
+        self.now = now
+        self.start = now - timedelta(days=days)
+        span = (now - self.start).total_seconds()
+
+        self.created_at: List[datetime] = []
+        self.active_until: List[datetime] = []
+        self.activity: List[float] = []
+        self.internal: List[bool] = []
+        for _ in range(user_count):
+            # sqrt skews signups toward the recent end (growing app)
+            created = self.start + timedelta(seconds=span * (rng.random() ** 0.5))
+            if rng.random() < RETAINED_USER_RATE:
+                until = now
+            else:
+                until = min(now, created + timedelta(days=rng.expovariate(1 / MEAN_LIFETIME_DAYS)))
+            self.created_at.append(created)
+            self.active_until.append(until)
+            self.activity.append(rng.paretovariate(ACTIVITY_PARETO_ALPHA))
+            self.internal.append(rng.random() < INTERNAL_USER_RATE)
+
+        # Popularity (who gets followed / liked) is independent of activity
+        popularity = [rng.paretovariate(FOLLOW_PARETO_ALPHA) for _ in range(user_count)]
+        self.popularity_cum = list(itertools.accumulate(popularity))
+        self.activity_total = sum(self.activity)
+        self.ids = [make_oid(KIND_USER, i, self.created_at[i]) for i in range(user_count)]
+        self.id_strs = [str(oid) for oid in self.ids]
+
+    def pick_popular(self, rng: random.Random) -> int:
+        target = rng.random() * self.popularity_cum[-1]
+        return min(bisect.bisect_left(self.popularity_cum, target), self.count - 1)
+
+    def events_for(self, index: int, total_events: int) -> int:
+        return max(1, round(self.activity[index] / self.activity_total * total_events))
+
+    def random_time(self, rng: random.Random, index: int) -> datetime:
+        start, end = self.created_at[index], self.active_until[index]
+        return start + timedelta(seconds=rng.random() * max((end - start).total_seconds(), 1))
+
+
+class Generator:
+    def __init__(self, db, seed: int, users: int, events: int, days: int, batch_size: int):
+        self.db = db
+        self.seed = seed
+        self.events = events
+        self.batch_size = batch_size
+        # Anchor "now" to the day so a resumed run regenerates the same documents
+        params = {"seed": seed, "users": users, "events": events, "days": days}
+        existing = db.synthetic_progress.find_one({"_id": "params"})
+        if existing:
+            if {k: existing.get(k) for k in params} != params:
+                sys.exit(f"❌ {db.name} was generated with {existing}; use --reset to start over")
+            now = existing["now"].replace(tzinfo=timezone.utc)
+        else:
+            now = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            db.synthetic_progress.insert_one({"_id": "params", **params, "now": now})
+        self.pop = Population(seed, users, days, now)
+
+    # ============================================
+    # CHUNK BOOKKEEPING
+    # ============================================
+
+    def _done_chunks(self, phase: str) -> set:
+        doc = self.db.synthetic_progress.find_one({"_id": phase}) or {}
+        return set(doc.get("chunks", []))
+
+    def _insert(self, collection: str, docs: List[dict]) -> None:
+        for i in range(0, len(docs), self.batch_size):
+            try:
+                self.db[collection].insert_many(docs[i:i + self.batch_size], ordered=False)
+            except BulkWriteError as e:
+                # Duplicates are expected when re-running an interrupted chunk
+                others = [err for err in e.details.get("writeErrors", []) if err.get("code") != 11000]
+                if others:
+                    raise
+
+    def run_phase(self, phase: str, chunks: int, build: Callable[[random.Random, int], Dict[str, List[dict]]]) -> None:
+        done = self._done_chunks(phase)
+        started = time.time()
+        written = 0
+        for chunk in range(chunks):
+            if chunk in done:
+                continue
+            for collection, docs in build(chunk_rng(self.seed, phase, chunk), chunk).items():
+                self._insert(collection, docs)
+                written += len(docs)
+            self.db.synthetic_progress.update_one({"_id": phase}, {"$addToSet": {"chunks": chunk}}, upsert=True)
+            if chunk % 10 == 0 or chunk == chunks - 1:
+                rate = written / max(time.time() - started, 0.001)
+                print(f"  {phase}: chunk {chunk + 1}/{chunks} ({written:,} docs, {rate:,.0f}/s)")
+        print(f"  ✓ {phase} complete")
+
+    # ============================================
+    # PHASES
+    # ============================================
+
+    def build_users(self, rng: random.Random, chunk: int) -> Dict[str, List[dict]]:
+        docs = []
+        for i in range(chunk * USERS_PER_CHUNK, min((chunk + 1) * USERS_PER_CHUNK, self.pop.count)):
+            created = self.pop.created_at[i]
+            docs.append({
+                "_id": self.pop.ids[i],
+                "user_id": f"user_{i:012x}",
+                "username": f"synthetic_{i}",
+                "email": f"synthetic_{i}@example.com",
+                "password": PASSWORD_HASH,
+                "name": f"Synthetic User {i}",
+                "bio": "",
+                "avatar": "",
+                "followers_count": 0,
+                "following_count": 0,
+                "workouts_count": 0,
+                "current_streak": rng.randint(0, 30),
+                "longest_streak": rng.randint(0, 60),
+                "total_workouts": 0,
+                "created_at": created,
+                "last_active": self.pop.active_until[i],
+                "is_internal": self.pop.internal[i],
+            })
+        return {"users": docs}
+
+    def _event(self, rng, index: int, user_id: str, event_type: str, ts: datetime, session_id: str, internal: bool) -> dict:
+        metadata: dict = {}
+        if event_type == "screen_viewed":
+            metadata = {"screen_name": rng.choice(SCREENS)}
+        elif event_type == "tab_switched":
+            metadata = {"tab": rng.choice(TABS)}
+        elif event_type == "mood_selected":
+            metadata = {"mood_category": rng.choice(MOODS), "mood": rng.choice(MOODS)}
+        elif event_type == "difficulty_selected":
+            metadata = {"difficulty": rng.choice(DIFFICULTIES)}
+        elif event_type == "equipment_selected":
+            metadata = {"equipment": rng.choice(EQUIPMENT)}
+        elif event_type.startswith("workout_") or event_type == "exercise_completed":
+            metadata = {
+                "mood_category": rng.choice(MOODS),
+                "difficulty": rng.choice(DIFFICULTIES),
+                "equipment": rng.choice(EQUIPMENT),
+            }
+            if event_type == "workout_completed":
+                metadata["duration_seconds"] = int(rng.lognormvariate(7.3, 0.4))
+            elif event_type == "exercise_completed":
+                metadata["exercise_name"] = f"Exercise {rng.randint(1, 300)}"
+        return {
+            "_id": make_oid(KIND_EVENT, index, ts),
+            "user_id": user_id,
+            "event_type": event_type,
+            "meta": event_meta(user_id, event_type),
+            "event_category": EVENT_TYPES.get(event_type, "other"),
+            "metadata": metadata,
+            "timestamp": ts,
+            "session_id": session_id,
+            "is_internal": internal,
+            "audience": AUDIENCE_INTERNAL if internal else AUDIENCE_USER,
+        }
+
+    def _session_types(self, rng: random.Random) -> List[str]:
+        types = ["app_session_start", "app_opened"]
+        fillers = rng.choices(
+            list(SESSION_EVENT_WEIGHTS),
+            weights=list(SESSION_EVENT_WEIGHTS.values()),
+            k=max(1, int(rng.expovariate(1 / 6))),
+        )
+        types.extend(fillers)
+        if rng.random() < WORKOUT_SESSION_RATE:
+            types.append("workout_started")
+            types.extend(["exercise_completed"] * rng.randint(2, 8))
+            if rng.random() < WORKOUT_COMPLETION_RATE:
+                types.extend(["workout_completed", "workout_session_completed"])
+            else:
+                types.append("workout_abandoned")
+        types.append("app_backgrounded")
+        return types
+
+    def build_events(self, rng: random.Random, chunk: int) -> Dict[str, List[dict]]:
+        events: List[dict] = []
+        daily: Dict[Tuple[str, datetime], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        first_user = chunk * EVENT_USERS_PER_CHUNK
+        # Event ids are unique per user: user index in the high bits
+        for i in range(first_user, min(first_user + EVENT_USERS_PER_CHUNK, self.pop.count)):
+            user_id = self.pop.id_strs[i]
+            internal = self.pop.internal[i]
+            seq = i << 24
+            registered = self.pop.created_at[i]
+            events.append(self._event(rng, seq, user_id, "user_registered", registered, f"reg_{i}", internal))
+            seq += 1
+
+            target = self.pop.events_for(i, self.events)
+            produced = 0
+            session_no = 0
+            while produced < target:
+                ts = self.pop.random_time(rng, i)
+                session_id = f"s_{i}_{session_no}"
+                for event_type in self._session_types(rng):
+                    ts = min(ts + timedelta(seconds=rng.uniform(2, 90)), self.pop.now)
+                    events.append(self._event(rng, seq, user_id, event_type, ts, session_id, internal))
+                    day = ts.replace(hour=0, minute=0, second=0, microsecond=0)
+                    counters = daily[(user_id, day)]
+                    counters["events_count"] += 1
+                    if event_type in DAILY_ACTIVITY_FIELDS:
+                        counters[DAILY_ACTIVITY_FIELDS[event_type]] += 1
+                    seq += 1
+                    produced += 1
+                session_no += 1
+
+        guest_events = []
+        for g in range(int(len(events) * GUEST_EVENT_RATE)):
+            ts = self.pop.start + (self.pop.now - self.pop.start) * rng.random()
+            device = f"device_{chunk}_{rng.randint(0, 5000)}"
+            event_type = rng.choice(["app_opened", "screen_viewed", "mood_selected", "workout_started"])
+            guest_events.append({
+                "_id": make_oid(KIND_GUEST, (chunk << 32) + g, ts),
+                "device_id": device,
+                "event_type": event_type,
+                "meta": event_meta(None, event_type),
+                "event_category": EVENT_TYPES.get(event_type, "other"),
+                "metadata": {"screen_name": rng.choice(SCREENS)} if event_type == "screen_viewed" else {},
+                "timestamp": ts,
+                "is_guest": True,
+                "is_internal": False,
+                "audience": AUDIENCE_GUEST,
+            })
+
+        daily_docs = [
+            {
+                "_id": ObjectId(hashlib.md5(f"{user_id}:{day.isoformat()}".encode()).digest()[:12]),
+                "user_id": user_id,
+                "date": day,
+                "created_at": day,
+                **counters,
+            }
+            for (user_id, day), counters in daily.items()
+        ]
+        return {"user_events": events + guest_events, "daily_activity": daily_docs}
+
+    def build_follows(self, rng: random.Random, chunk: int) -> Dict[str, List[dict]]:
+        docs = []
+        for i in range(chunk * USERS_PER_CHUNK, min((chunk + 1) * USERS_PER_CHUNK, self.pop.count)):
+            wanted = min(int(rng.paretovariate(FOLLOW_PARETO_ALPHA) * 5), MAX_FOLLOWS_PER_USER, self.pop.count - 1)
+            targets = set()
+            for _ in range(wanted * 2):
+                if len(targets) >= wanted:
+                    break
+                j = self.pop.pick_popular(rng)
+                if j != i:
+                    targets.add(j)
+            for n, j in enumerate(sorted(targets)):
+                ts = max(self.pop.created_at[i], self.pop.created_at[j]) + timedelta(hours=rng.uniform(0, 72))
+                ts = min(ts, self.pop.now)
+                docs.append({
+                    "_id": make_oid(KIND_FOLLOW, (i << 16) + n, ts),
+                    "follower_id": self.pop.ids[i],
+                    "following_id": self.pop.ids[j],
+                    "created_at": ts,
+                })
+        return {"follows": docs}
+
+    def build_posts(self, rng: random.Random, chunk: int) -> Dict[str, List[dict]]:
+        posts, likes, comments, notifications = [], [], [], []
+        for i in range(chunk * USERS_PER_CHUNK, min((chunk + 1) * USERS_PER_CHUNK, self.pop.count)):
+            post_count = int(self.pop.events_for(i, self.events) * POST_RATE * rng.uniform(0.5, 1.5))
+            author_str = self.pop.id_strs[i]
+            for p in range(post_count):
+                created = self.pop.random_time(rng, i)
+                post_id = make_oid(KIND_POST, (i << 20) + p, created)
+                sample = rng.choice(SAMPLE_POSTS)
+                # Popular authors draw more engagement
+                reach = self.pop.popularity_cum[i] - (self.pop.popularity_cum[i - 1] if i else 0)
+                like_count = int(rng.expovariate(1 / LIKES_PER_POST_MEAN) * min(reach, 20))
+                comment_count = int(rng.expovariate(1 / COMMENTS_PER_POST_MEAN) * min(reach, 10))
+
+                likers = {self.pop.pick_popular(rng) for _ in range(like_count)} - {i}
+                for n, j in enumerate(sorted(likers)):
+                    ts = min(created + timedelta(minutes=rng.expovariate(1 / 600)), self.pop.now)
+                    likes.append({
+                        "_id": make_oid(KIND_LIKE, (i << 36) + (p << 16) + n, ts),
+                        "post_id": post_id,
+                        "user_id": self.pop.ids[j],
+                        "created_at": ts,
+                    })
+                    notifications.append(self._notification(
+                        rng, KIND_LIKE_NOTIFICATION, author_str, j, "like", str(post_id), ts, (i << 36) + (p << 16) + n
+                    ))
+
+                top_level: List[str] = []
+                for n in range(comment_count):
+                    j = self.pop.pick_popular(rng)
+                    ts = min(created + timedelta(minutes=rng.expovariate(1 / 900)), self.pop.now)
+                    comment_id = make_oid(KIND_COMMENT, (i << 36) + (p << 16) + n, ts)
+                    parent = rng.choice(top_level) if top_level and rng.random() < REPLY_RATE else None
+                    comments.append({
+                        "_id": comment_id,
+                        "post_id": str(post_id),
+                        "text": rng.choice(COMMENTS),
+                        "author_id": self.pop.id_strs[j],
+                        "created_at": ts,
+                        "parent_comment_id": parent,
+                        "root_id": parent or str(comment_id),
+                        "ancestor_ids": [parent] if parent else [],
+                        "mentioned_user_ids": [],
+                        "replies_count": 0,
+                        "likes_count": 0,
+                    })
+                    if parent is None:
+                        top_level.append(str(comment_id))
+                    if j != i:
+                        notifications.append(self._notification(
+                            rng, KIND_COMMENT_NOTIFICATION, author_str, j, "comment", str(post_id), ts, (i << 36) + (p << 16) + n
+                        ))
+
+                posts.append({
+                    "_id": post_id,
+                    "caption": sample["caption"],
+                    "media_urls": sample["media_urls"],
+                    "hashtags": [],
+                    "author_id": self.pop.ids[i],
+                    "likes_count": len(likers),
+                    "comments_count": comment_count,
+                    "created_at": created,
+                    "workout_data": None,
+                    "attached_workout": None,
+                })
+        return {"posts": posts, "post_likes": likes, "comments": comments, "notifications": notifications}
+
+    def _notification(self, rng, id_kind: int, recipient: str, actor: int, kind: str, post_id: str, ts: datetime, index: int) -> dict:
+        return {
+            "_id": make_oid(id_kind, index, ts),
+            "user_id": recipient,
+            "type": kind,
+            "title": "New like" if kind == "like" else "New comment",
+            "body": f"synthetic_{actor} {'liked' if kind == 'like' else 'commented on'} your post",
+            "actor_id": self.pop.id_strs[actor],
+            "entity_id": post_id,
+            "entity_type": "post",
+            "image_url": None,
+            "deep_link": f"mood://post/{post_id}",
+            "metadata": {},
+            "group_key": None,
+            "created_at": ts,
+            "read_at": ts + timedelta(hours=rng.uniform(0, 48)) if rng.random() < NOTIFICATION_READ_RATE else None,
+            "delivered_push_at": None,
+        }
+
+    def finalize_counters(self) -> None:
+        """Denormalized counters, computed server-side from the generated data."""
+        if self.db.synthetic_progress.find_one({"_id": "counters", "done": True}):
+            return
+        print("  Updating user counters...")
+        for collection, key, field in (
+            ("follows", "$follower_id", "following_count"),
+            ("follows", "$following_id", "followers_count"),
+        ):
+            self.db[collection].aggregate([
+                {"$group": {"_id": key, field: {"$sum": 1}}},
+                {"$merge": {"into": "users", "on": "_id", "whenMatched": "merge", "whenNotMatched": "discard"}},
+            ], allowDiskUse=True)
+        self.db.user_events.aggregate([
+            {"$match": {"event_type": "workout_completed", "is_guest": {"$ne": True}}},
+            {"$group": {"_id": {"$toObjectId": "$user_id"}, "total_workouts": {"$sum": 1}}},
+            {"$set": {"workouts_count": "$total_workouts"}},
+            {"$merge": {"into": "users", "on": "_id", "whenMatched": "merge", "whenNotMatched": "discard"}},
+        ], allowDiskUse=True)
+        self.db.synthetic_progress.update_one({"_id": "counters"}, {"$set": {"done": True}}, upsert=True)
+        print("  ✓ counters complete")
+
+    def run(self) -> None:
+        user_chunks = (self.pop.count + USERS_PER_CHUNK - 1) // USERS_PER_CHUNK
+        event_chunks = (self.pop.count + EVENT_USERS_PER_CHUNK - 1) // EVENT_USERS_PER_CHUNK
+        self.run_phase("users", user_chunks, self.build_users)
+        self.run_phase("follows", user_chunks, self.build_follows)
+        self.run_phase("posts", user_chunks, self.build_posts)
+        self.run_phase("user_events", event_chunks, self.build_events)
+        self.finalize_counters()
+
+
+GENERATED_COLLECTIONS = [
+    "users", "user_events", "daily_activity", "follows", "posts",
+    "post_likes", "comments", "notifications", "synthetic_progress",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a deterministic production-scale dataset")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--events", type=int, default=2_000_000, help="approximate registered-user events")
+    parser.add_argument("--days", type=int, default=180, help="history length")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5000, help="documents per insert_many")
+    parser.add_argument("--db", default=DEFAULT_DB_NAME, help="target database (never the app database)")
+    parser.add_argument("--reset", action="store_true", help="drop generated collections first")
+    parser.add_argument("--force", action="store_true", help="allow writing into DB_NAME")
+    args = parser.parse_args()
+
+    if args.db == os.getenv("DB_NAME") and not args.force:
+        sys.exit(f"❌ Refusing to write synthetic data into the app database '{args.db}' (use --force)")
+
+    client = MongoClient(MONGO_URL)
+    db = client[args.db]
+
+    print("=" * 50)
+    print(f"Synthetic data → {args.db}: {args.users:,} users, ~{args.events:,} events, seed {args.seed}")
+    print("=" * 50)
+
+    if args.reset:
+        for name in GENERATED_COLLECTIONS:
+            db.drop_collection(name)
+        print("  Dropped generated collections")
+
+    started = time.time()
+    Generator(db, args.seed, args.users, args.events, args.days, args.batch_size).run()
+    print(f"\n✅ Done in {time.time() - started:,.0f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Direct Message Inbox Projection
+Maintains a per-user inbox (one document per owner + conversation) holding:
+- Last message preview and timestamp
+- A display snapshot of the other participant
+- An unread counter for the owner
+
+send_message increments the recipient's counter, get_messages resets it,
+and both keep the owner's total in unread_counters in step, so the
+conversations list and the unread badge are single indexed reads.
+
+Users whose conversations predate the projection are rebuilt once, on their
+first inbox or badge read; inbox_backfills ({_id: owner_id}) records that
+the rebuild has run, since record_message may already have created entries
+for their newer conversations.
+"""
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from bson import ObjectId
+from unread_counters import adjust_unread, adjust_unread_many, set_unread, get_unread, MESSAGES
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Max characters stored as the last-message preview
+PREVIEW_LENGTH = 100
+
+
+def build_user_snapshot(user: Optional[dict]) -> Optional[dict]:
+    """Build the display snapshot stored for the other participant."""
+    if not user:
+        return None
+    return {
+        "id": str(user["_id"]),
+        "username": user.get("username", ""),
+        "name": user.get("name", ""),
+        "avatar": user.get("avatar", ""),
+    }
+
+
+async def _load_snapshots(db: AsyncIOMotorDatabase, user_ids: List[str]) -> Dict[str, dict]:
+    """Fetch display snapshots for a set of users in one query."""
+    object_ids = []
+    for uid in set(user_ids):
+        try:
+            object_ids.append(ObjectId(uid))
+        except Exception:
+            continue
+    if not object_ids:
+        return {}
+    users = await db.users.find(
+        {"_id": {"$in": object_ids}},
+        {"username": 1, "name": 1, "avatar": 1}
+    ).to_list(len(object_ids))
+    return {str(u["_id"]): build_user_snapshot(u) for u in users}
+
+
+async def record_conversation(
+    db: AsyncIOMotorDatabase,
+    conversation_id: str,
+    participants: List[str],
+    created_at: datetime,
+    last_message: str = ""
+) -> None:
+    """
+    Create inbox entries for every participant of a new conversation.
+    Existing entries are left untouched.
+    """
+    try:
+        snapshots = await _load_snapshots(db, participants)
+        operations = []
+        for owner_id in participants:
+            other_id = next((p for p in participants if p != owner_id), None)
+            operations.append(UpdateOne(
+                {"owner_id": owner_id, "conversation_id": conversation_id},
+                {"$setOnInsert": {
+                    "owner_id": owner_id,
+                    "conversation_id": conversation_id,
+                    "other_user": snapshots.get(other_id),
+                    "last_message": last_message[:PREVIEW_LENGTH],
+                    "last_sender_id": None,
+                    "unread_count": 0,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }},
+                upsert=True
+            ))
+        if operations:
+            await db.inbox.bulk_write(operations, ordered=False)
+    except Exception as e:
+        logger.error(f"Error recording inbox conversation {conversation_id}: {e}")
+
+
+async def record_message(
+    db: AsyncIOMotorDatabase,
+    conversation_id: str,
+    participants: List[str],
+    sender_id: str,
+    content: str,
+    sent_at: datetime
+) -> None:
+    """
+    Fan a new message out to every participant's inbox entry in one bulk write.
+    The sender's entry gets the preview; every other entry also gets +1 unread.
+    Snapshots are refreshed from the same batched user lookup.
+    """
+    try:
+        snapshots = await _load_snapshots(db, participants)
+        preview = content[:PREVIEW_LENGTH]
+        operations = []
+        for owner_id in participants:
+            other_id = next((p for p in participants if p != owner_id), None)
+            update = {
+                "$set": {
+                    "last_message": preview,
+                    "last_sender_id": sender_id,
+                    "updated_at": sent_at,
+                },
+                "$setOnInsert": {
+                    "owner_id": owner_id,
+                    "conversation_id": conversation_id,
+                    "created_at": sent_at,
+                },
+                "$inc": {"unread_count": 0 if owner_id == sender_id else 1},
+            }
+            if snapshots.get(other_id):
+                update["$set"]["other_user"] = snapshots[other_id]
+            operations.append(UpdateOne(
+                {"owner_id": owner_id, "conversation_id": conversation_id},
+                update,
+                upsert=True
+            ))
+        if operations:
+            await db.inbox.bulk_write(operations, ordered=False)
+            await adjust_unread_many(db, MESSAGES, {p: 1 for p in participants if p != sender_id})
+    except Exception as e:
+        logger.error(f"Error recording inbox message for conversation {conversation_id}: {e}")
+
+
+async def mark_conversation_read(
+    db: AsyncIOMotorDatabase,
+    owner_id: str,
+    conversation_id: str
+) -> None:
+    """Reset the owner's unread counter for a conversation (and take it off their total)."""
+    try:
+        before = await db.inbox.find_one_and_update(
+            {"owner_id": owner_id, "conversation_id": conversation_id, "unread_count": {"$ne": 0}},
+            {"$set": {"unread_count": 0}},
+            projection={"unread_count": 1}
+        )
+        if before:
+            await adjust_unread(db, owner_id, MESSAGES, -before.get("unread_count", 0))
+    except Exception as e:
+        logger.error(f"Error resetting inbox unread count for {owner_id}: {e}")
+
+
+async def refresh_user_snapshot(db: AsyncIOMotorDatabase, user_id: str) -> None:
+    """Propagate a profile change to every inbox entry that displays this user."""
+    try:
+        snapshots = await _load_snapshots(db, [user_id])
+        if user_id not in snapshots:
+            return
+        await db.inbox.update_many(
+            {"other_user.id": user_id},
+            {"$set": {"other_user": snapshots[user_id]}}
+        )
+    except Exception as e:
+        logger.error(f"Error refreshing inbox snapshot for {user_id}: {e}")
+
+
+async def remove_user_from_inboxes(db: AsyncIOMotorDatabase, user_id: str) -> int:
+    """Drop the user's own inbox and every entry that points at them."""
+    try:
+        result = await db.inbox.delete_many(
+            {"$or": [{"owner_id": user_id}, {"other_user.id": user_id}]}
+        )
+        return result.deleted_count
+    except Exception as e:
+        logger.error(f"Error removing inbox entries for {user_id}: {e}")
+        return 0
+
+
+async def rebuild_inbox(db: AsyncIOMotorDatabase, owner_id: str, limit: int = 100) -> int:
+    """
+    Rebuild a user's inbox from conversations/messages.
+    Used to backfill users whose conversations predate the inbox projection.
+    Unread counts come from one grouped aggregation instead of a count per conversation.
+    """
+    conversations = await db.conversations.find(
+        {"participants": owner_id}
+    ).sort("updated_at", -1).to_list(limit)
+    if not conversations:
+        return 0
+
+    conv_ids = [str(c["_id"]) for c in conversations]
+    unread_pipeline = [
+        {"$match": {
+            "conversation_id": {"$in": conv_ids},
+            "sender_id": {"$ne": owner_id},
+            "read": False
+        }},
+        {"$group": {"_id": "$conversation_id", "count": {"$sum": 1}}}
+    ]
+    unread_by_conv = {
+        row["_id"]: row["count"]
+        async for row in db.messages.aggregate(unread_pipeline)
+    }
+
+    other_ids = []
+    for conv in conversations:
+        other_ids.extend(p for p in conv["participants"] if p != owner_id)
+    snapshots = await _load_snapshots(db, other_ids)
+
+    operations = []
+    for conv in conversations:
+        conv_id = str(conv["_id"])
+        other_id = next((p for p in conv["participants"] if p != owner_id), None)
+        created_at = conv.get("created_at")
+        operations.append(UpdateOne(
+            {"owner_id": owner_id, "conversation_id": conv_id},
+            {"$set": {
+                "owner_id": owner_id,
+                "conversation_id": conv_id,
+                "other_user": snapshots.get(other_id),
+                "last_message": (conv.get("last_message") or "")[:PREVIEW_LENGTH],
+                "unread_count": unread_by_conv.get(conv_id, 0),
+                "created_at": created_at,
+                "updated_at": conv.get("updated_at") or created_at,
+            }},
+            upsert=True
+        ))
+    await db.inbox.bulk_write(operations, ordered=False)
+    await set_unread(db, owner_id, MESSAGES, sum(unread_by_conv.values()))
+    logger.info(f"Rebuilt inbox for user {owner_id} ({len(operations)} conversations)")
+    return len(operations)
+
+
+async def _backfill_if_missing(db: AsyncIOMotorDatabase, owner_id: str) -> bool:
+    """Rebuild the inbox once per user, the first time it is read."""
+    if await db.inbox_backfills.find_one({"_id": owner_id}, {"_id": 1}):
+        return False
+    rebuilt = await rebuild_inbox(db, owner_id) > 0
+    await db.inbox_backfills.update_one(
+        {"_id": owner_id},
+        {"$setOnInsert": {"backfilled_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    return rebuilt
+
+
+async def get_inbox(db: AsyncIOMotorDatabase, owner_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+    """
+    Get the user's conversations list, newest first, in the /conversations response shape.
+    Backfills the projection the first time a user with legacy conversations asks.
+    """
+    await _backfill_if_missing(db, owner_id)
+    query = {"owner_id": owner_id, "other_user": {"$ne": None}}
+    entries = await db.inbox.find(query).sort("updated_at", -1).to_list(limit)
+
+    result = []
+    for entry in entries:
+        updated_at = entry.get("updated_at") or entry.get("created_at")
+        result.append({
+            "id": entry["conversation_id"],
+            "other_user": entry["other_user"],
+            "last_message": entry.get("last_message", ""),
+            "last_message_time": updated_at.isoformat() if updated_at else None,
+            "unread_count": entry.get("unread_count", 0),
+        })
+    return result
+
+
+async def get_inbox_unread_total(db: AsyncIOMotorDatabase, owner_id: str) -> int:
+    """The user's unread message total: one unread_counters lookup."""
+    counters = await db.unread_counters.find_one({"_id": owner_id}, {MESSAGES: 1})
+    if counters and MESSAGES in counters:
+        return counters[MESSAGES]
+    # First read: make sure legacy conversations are projected before counting
+    await _backfill_if_missing(db, owner_id)
+    return await get_unread(db, owner_id, MESSAGES)
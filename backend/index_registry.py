@@ -0,0 +1,355 @@
+"""
+MongoDB Index Registry
+Single declaration of every index the app relies on:
+- INDEXES maps collection -> IndexModel list (uniqueness and TTL included)
+- sync_indexes() creates anything missing and reports drift; safe to run on
+  every deploy because existing indexes with matching options are skipped
+- HOT_QUERIES + explain_hot_queries() run explain() on the queries behind the
+  feed, inbox, notifications and analytics paths and flag collection scans
+
+CLI:
+    python index_registry.py            # sync indexes
+    python index_registry.py --check    # sync, then explain hot queries;
+                                        # exits 1 if any of them COLLSCANs
+"""
+import asyncio
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel, ASCENDING, DESCENDING
+
+logger = logging.getLogger(__name__)
+
+# Soft-deleted accounts are purged by Mongo once expires_at passes
+DELETED_USER_TTL_SECONDS = 0
+
+# Realtime fan-out events are removed by Mongo after this long
+REALTIME_EVENT_TTL_SECONDS = 300
+
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    # Analytics
+    # Time-series once migrated (see user_events_migration); these secondary
+    # indexes on top-level fields are valid on either collection type
+    "user_events": [
+        IndexModel([("timestamp", DESCENDING)]),
+        IndexModel([("user_id", ASCENDING), ("timestamp", DESCENDING)]),
+        IndexModel([("event_type", ASCENDING), ("timestamp", DESCENDING)]),
+        IndexModel([("event_type", ASCENDING), ("user_id", ASCENDING)]),
+        # Internal-exclusion indexes lead with the ingestion-time stamp
+        IndexModel([("is_internal", ASCENDING), ("event_type", ASCENDING), ("timestamp", DESCENDING)]),
+        IndexModel([("is_internal", ASCENDING), ("timestamp", DESCENDING)]),
+        # Guest funnels (distinct device_id)
+        IndexModel([("device_id", ASCENDING), ("timestamp", DESCENDING)]),
+    ],
+    "users": [
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("username", ASCENDING)]),
+        IndexModel([("email", ASCENDING)]),
+        IndexModel([("user_id", ASCENDING)]),
+        IndexModel([("is_internal", ASCENDING)]),
+    ],
+    "daily_activity": [
+        IndexModel([("date", DESCENDING)]),
+        IndexModel([("user_id", ASCENDING), ("date", DESCENDING)]),
+    ],
+    "login_events": [
+        IndexModel([("user_id", ASCENDING), ("timestamp", DESCENDING)]),
+        IndexModel([("timestamp", DESCENDING)]),
+    ],
+    "admin_audit_logs": [
+        IndexModel([("timestamp_utc", DESCENDING)]),
+        IndexModel([("admin_user_id", ASCENDING), ("timestamp_utc", DESCENDING)]),
+        IndexModel([("action", ASCENDING), ("timestamp_utc", DESCENDING)]),
+    ],
+    "deleted_users": [
+        IndexModel([("original_id", ASCENDING)]),
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=DELETED_USER_TTL_SECONDS),
+    ],
+
+    # Social graph and feed
+    "posts": [
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("author_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "follows": [
+        IndexModel([("follower_id", ASCENDING), ("following_id", ASCENDING)], unique=True),
+        IndexModel([("following_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "post_likes": [
+        IndexModel([("post_id", ASCENDING), ("user_id", ASCENDING)], unique=True),
+        IndexModel([("user_id", ASCENDING)]),
+    ],
+    "comments": [
+        IndexModel([("post_id", ASCENDING), ("parent_comment_id", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("parent_comment_id", ASCENDING), ("created_at", ASCENDING)]),
+        IndexModel([("author_id", ASCENDING)]),
+        # Materialized thread paths: whole post tree, subtree of a comment
+        IndexModel([("post_id", ASCENDING), ("created_at", ASCENDING)]),
+        IndexModel([("ancestor_ids", ASCENDING), ("created_at", ASCENDING)]),
+        IndexModel([("root_id", ASCENDING), ("created_at", ASCENDING)]),
+    ],
+    "saved_posts": [
+        IndexModel([("user_id", ASCENDING), ("post_id", ASCENDING)], unique=True),
+        IndexModel([("user_id", ASCENDING), ("saved_at", DESCENDING)]),
+        IndexModel([("post_id", ASCENDING)]),
+    ],
+    "user_blocks": [
+        IndexModel([("blocker_id", ASCENDING), ("blocked_id", ASCENDING)], unique=True),
+        IndexModel([("blocked_id", ASCENDING)]),
+    ],
+
+    # Messaging
+    "conversations": [
+        IndexModel([("participants", ASCENDING), ("updated_at", DESCENDING)]),
+    ],
+    "messages": [
+        IndexModel([("conversation_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "inbox": [
+        IndexModel([("owner_id", ASCENDING), ("conversation_id", ASCENDING)], unique=True),
+        IndexModel([("owner_id", ASCENDING), ("updated_at", DESCENDING)]),
+        IndexModel([("other_user.id", ASCENDING)]),
+    ],
+
+    # Notifications and presence
+    "notifications": [
+        IndexModel([("user_id", ASCENDING), ("read_at", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("actor_id", ASCENDING)]),
+        IndexModel([("entity_id", ASCENDING)]),
+        # Unread totals per user for the unread counter reconciler
+        IndexModel([("read_at", ASCENDING), ("user_id", ASCENDING)]),
+    ],
+    "device_tokens": [
+        IndexModel([("user_id", ASCENDING), ("token", ASCENDING)], unique=True),
+        IndexModel([("token", ASCENDING)]),
+    ],
+    "notification_settings": [
+        IndexModel([("user_id", ASCENDING)], unique=True),
+        IndexModel([("digest_time", ASCENDING)]),
+        IndexModel([("quiet_hours_end", ASCENDING)]),
+    ],
+    "user_heartbeats": [
+        IndexModel([("user_id", ASCENDING)], unique=True),
+        IndexModel([("last_heartbeat", DESCENDING)]),
+    ],
+    # Cross-replica realtime fan-out (REALTIME_BACKEND=mongo); events are only
+    # needed while in flight
+    "realtime_events": [
+        IndexModel([("created_at", ASCENDING)], expireAfterSeconds=REALTIME_EVENT_TTL_SECONDS),
+    ],
+
+    # Background jobs
+    "deletion_jobs": [
+        IndexModel([("status", ASCENDING), ("retry_at", ASCENDING), ("created_at", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("lease_expires_at", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+    ],
+}
+
+
+# Options that make two indexes on the same key different
+_COMPARED_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+
+def _key_signature(key: Any) -> Tuple[Tuple[str, Any], ...]:
+    """Normalize an index key (SON/dict/list of pairs) for comparison."""
+    items = key.items() if hasattr(key, "items") else key
+    return tuple(
+        (field, int(direction) if isinstance(direction, (int, float)) else direction)
+        for field, direction in items
+    )
+
+
+def _option_drift(declared: dict, existing: dict) -> Dict[str, Tuple[Any, Any]]:
+    """Options whose declared value differs from the live index."""
+    drift = {}
+    for option in _COMPARED_OPTIONS:
+        want = declared.get(option)
+        have = existing.get(option)
+        if option in ("unique", "sparse"):
+            want, have = bool(want), bool(have)
+        elif option == "expireAfterSeconds" and have is not None:
+            have = int(have)
+        if want != have:
+            drift[option] = (want, have)
+    return drift
+
+
+async def sync_indexes(
+    db: AsyncIOMotorDatabase,
+    registry: Optional[Dict[str, List[IndexModel]]] = None
+) -> Dict[str, List[str]]:
+    """
+    Create every declared index that does not exist yet.
+    Indexes are matched by key pattern, so ones created earlier by hand or
+    under another name are not duplicated. Option drift (e.g. an index that
+    should be unique but is not) is reported, never dropped automatically.
+    A failure on one index (typically duplicates blocking a unique build)
+    does not stop the rest.
+    """
+    registry = registry or INDEXES
+    report: Dict[str, List[str]] = {"created": [], "existing": [], "drift": [], "failed": []}
+
+    for collection, models in registry.items():
+        try:
+            live = await db[collection].index_information()
+        except Exception as e:
+            report["failed"].extend(f"{collection}.{m.document['name']}: {e}" for m in models)
+            continue
+        live_by_key = {_key_signature(info["key"]): (name, info) for name, info in live.items()}
+
+        for model in models:
+            spec = model.document
+            label = f"{collection}.{spec['name']}"
+            match = live_by_key.get(_key_signature(spec["key"]))
+
+            if match:
+                live_name, info = match
+                drift = _option_drift(spec, info)
+                if drift:
+                    report["drift"].append(f"{collection}.{live_name}: {drift}")
+                else:
+                    report["existing"].append(label)
+                continue
+
+            try:
+                await db[collection].create_indexes([model])
+                report["created"].append(label)
+            except Exception as e:
+                report["failed"].append(f"{label}: {e}")
+
+    for line in report["drift"]:
+        logger.warning(f"⚠️ Index drift (declared, live): {line}")
+    for line in report["failed"]:
+        logger.error(f"❌ Index build failed: {line}")
+    logger.info(
+        f"✅ Index sync: {len(report['created'])} created, {len(report['existing'])} existing, "
+        f"{len(report['drift'])} drifted, {len(report['failed'])} failed"
+    )
+    return report
+
+
+# ============================================
+# HOT QUERY PLAN CHECK
+# ============================================
+
+_SAMPLE_ID = ObjectId()
+_SAMPLE_STR = str(_SAMPLE_ID)
+
+# (name, collection, filter, sort) - shapes mirror the live handlers
+HOT_QUERIES: List[Tuple[str, str, dict, Optional[List[Tuple[str, int]]]]] = [
+    ("feed_recent", "posts", {}, [("created_at", DESCENDING)]),
+    ("feed_following", "posts", {"author_id": {"$in": [_SAMPLE_ID]}}, [("created_at", DESCENDING)]),
+    ("user_posts", "posts", {"author_id": _SAMPLE_ID}, [("created_at", DESCENDING)]),
+    ("following_list", "follows", {"follower_id": _SAMPLE_ID}, None),
+    ("followers_list", "follows", {"following_id": _SAMPLE_ID}, [("created_at", DESCENDING)]),
+    ("is_following", "follows", {"follower_id": _SAMPLE_ID, "following_id": _SAMPLE_ID}, None),
+    ("post_liked", "post_likes", {"post_id": _SAMPLE_ID, "user_id": _SAMPLE_ID}, None),
+    ("post_comments", "comments", {"post_id": _SAMPLE_STR, "parent_comment_id": None}, [("created_at", DESCENDING)]),
+    ("comment_replies", "comments", {"parent_comment_id": _SAMPLE_STR}, [("created_at", ASCENDING)]),
+    ("thread_replies", "comments", {"root_id": {"$in": [_SAMPLE_STR]}}, [("created_at", ASCENDING)]),
+    ("comment_subtree", "comments", {"ancestor_ids": _SAMPLE_STR}, [("created_at", ASCENDING)]),
+    ("saved_posts", "saved_posts", {"user_id": _SAMPLE_STR}, [("saved_at", DESCENDING)]),
+    ("blocked_users", "user_blocks", {"blocker_id": _SAMPLE_STR}, None),
+    ("conversation_lookup", "conversations", {"participants": {"$all": [_SAMPLE_STR, _SAMPLE_STR]}}, None),
+    ("conversation_messages", "messages", {"conversation_id": _SAMPLE_STR}, [("created_at", DESCENDING)]),
+    ("inbox", "inbox", {"owner_id": _SAMPLE_STR}, [("updated_at", DESCENDING)]),
+    ("notifications", "notifications", {"user_id": _SAMPLE_STR}, [("created_at", DESCENDING)]),
+    ("unread_notifications", "notifications", {"user_id": _SAMPLE_STR, "read_at": None}, None),
+    ("device_tokens", "device_tokens", {"user_id": _SAMPLE_STR, "is_valid": True}, None),
+    ("invalidate_token", "device_tokens", {"token": "sample"}, None),
+    ("notification_settings", "notification_settings", {"user_id": _SAMPLE_STR}, None),
+    ("digest_due", "notification_settings", {
+        "notifications_enabled": True,
+        "following_digest_enabled": True,
+        "digest_time": "09:00",
+        "following_digest_frequency": {"$ne": "off"},
+    }, None),
+    ("realtime_active", "user_heartbeats", {"last_heartbeat": {"$gte": _SAMPLE_ID.generation_time}}, [("last_heartbeat", DESCENDING)]),
+    ("user_timeline", "user_events", {"user_id": _SAMPLE_STR}, [("timestamp", DESCENDING)]),
+    ("event_window", "user_events", {
+        "is_internal": False,
+        "event_type": "workout_completed",
+        "timestamp": {"$gte": _SAMPLE_ID.generation_time},
+    }, None),
+    ("guest_device", "user_events", {"device_id": "sample", "is_guest": True}, None),
+]
+
+
+def _plan_stages(plan: dict) -> List[str]:
+    """Flatten the stage names of a winning plan (classic or SBE explain format)."""
+    if "queryPlan" in plan:
+        plan = plan["queryPlan"]
+    stages = [plan.get("stage", "")]
+    if "inputStage" in plan:
+        stages.extend(_plan_stages(plan["inputStage"]))
+    for child in plan.get("inputStages", []):
+        stages.extend(_plan_stages(child))
+    return stages
+
+
+async def explain_hot_queries(db: AsyncIOMotorDatabase) -> List[Dict[str, Any]]:
+    """
+    Run explain() (queryPlanner verbosity, nothing executes) for each hot query.
+    Each result has the winning plan's stages and whether it is a collection scan.
+    Collections that do not exist yet report EOF and are not flagged.
+    """
+    results = []
+    for name, collection, query, sort in HOT_QUERIES:
+        command = {"find": collection, "filter": query}
+        if sort:
+            command["sort"] = dict(sort)
+        try:
+            explained = await db.command("explain", command, verbosity="queryPlanner")
+            if "queryPlanner" not in explained:
+                # Time-series collections (user_events) explain as an aggregation over their buckets
+                explained = explained["stages"][0]["$cursor"]
+            stages = _plan_stages(explained["queryPlanner"]["winningPlan"])
+            results.append({
+                "name": name,
+                "collection": collection,
+                "stages": stages,
+                "collscan": "COLLSCAN" in stages,
+            })
+        except Exception as e:
+            results.append({
+                "name": name,
+                "collection": collection,
+                "stages": [],
+                "collscan": False,
+                "error": str(e),
+            })
+    return results
+
+
+async def _main(check: bool) -> int:
+    from dotenv import load_dotenv
+    from pathlib import Path
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ.get('MONGO_URL', 'mongodb://localhost:27017'))
+    db = client[os.environ.get('DB_NAME', 'mood_app')]
+    try:
+        report = await sync_indexes(db)
+        exit_code = 1 if report["failed"] else 0
+        if check:
+            for result in await explain_hot_queries(db):
+                status = "COLLSCAN" if result["collscan"] else ("ERROR" if result.get("error") else "ok")
+                detail = result.get("error") or " <- ".join(result["stages"])
+                print(f"{status:8} {result['collection']:22} {result['name']:24} {detail}")
+                if result["collscan"] or result.get("error"):
+                    exit_code = 1
+        return exit_code
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(_main("--check" in sys.argv[1:])))
@@ -0,0 +1,41 @@
+"""
+System Leases
+Cross-worker mutual exclusion for startup and periodic jobs that every
+worker schedules but only one should run at a time:
+- One document per job in system ({_id: "lease:<name>", owner, expires_at})
+- acquire_lease() claims a free or expired lease (or renews one this worker
+  already holds) in a single atomic update; a crashed holder is taken over
+  once its lease expires
+"""
+import uuid
+from datetime import datetime, timezone, timedelta
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+# Identifies this process as a lease holder
+WORKER_ID = uuid.uuid4().hex
+
+
+async def acquire_lease(db: AsyncIOMotorDatabase, name: str, seconds: int) -> bool:
+    """Claim or renew the named lease for this worker. False if another worker holds it."""
+    now = datetime.now(timezone.utc)
+    try:
+        doc = await db.system.find_one_and_update(
+            {"_id": f"lease:{name}", "$or": [{"expires_at": {"$lt": now}}, {"owner": WORKER_ID}]},
+            {"$set": {"owner": WORKER_ID, "expires_at": now + timedelta(seconds=seconds)}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        # The lease exists and is held elsewhere, so the upsert collided with it
+        return False
+    return doc is not None
+
+
+async def release_lease(db: AsyncIOMotorDatabase, name: str) -> None:
+    """Give the lease up early so another worker doesn't wait for it to expire."""
+    await db.system.update_one(
+        {"_id": f"lease:{name}", "owner": WORKER_ID},
+        {"$set": {"expires_at": datetime.now(timezone.utc)}}
+    )
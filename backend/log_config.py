@@ -0,0 +1,253 @@
+"""
+Logging Pipeline
+Keeps log I/O off the event loop and log volume proportional to its value:
+- Records go through a QueueHandler into a bounded in-memory queue; one
+  QueueListener thread formats and writes them, so a slow stdout never stalls
+  a request. A full queue drops records (counted) instead of blocking
+- Below WARNING, each logger can be sampled (LOG_SAMPLING="user_analytics:0.1")
+  and is rate limited (LOG_RATE_LIMIT per second, per logger overrides in
+  LOG_RATE_LIMITS="server:50"); warnings and errors always pass. The next record
+  that passes carries how many were suppressed before it
+- LOG_FORMAT=json (default) emits one JSON object per line with the request id
+  set by the HTTP middleware; LOG_FORMAT=text keeps the classic format
+
+Usage:
+    configure_logging()             # once, at import of server.py
+    token = bind_request_id(request.headers.get("X-Request-ID"))
+    ...
+    reset_request_id(token)
+"""
+import contextvars
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
+
+# Settings are read when configure_logging() runs, after .env is loaded:
+# LOG_LEVEL (INFO), LOG_FORMAT (json|text), LOG_QUEUE_SIZE (records buffered
+# before dropping, 10000), LOG_RATE_LIMIT (sub-WARNING records/second per
+# logger, 100; 0 = unlimited), LOG_RATE_LIMITS and LOG_SAMPLING (overrides)
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("mood_request_id", default=None)
+
+
+def _parse_overrides(value: str) -> Dict[str, float]:
+    """'server:50,notifications:0.2' -> {'server': 50.0, 'notifications': 0.2}"""
+    overrides: Dict[str, float] = {}
+    for item in value.split(","):
+        name, _, number = item.strip().rpartition(":")
+        if not name:
+            continue
+        try:
+            overrides[name] = float(number)
+        except ValueError:
+            continue
+    return overrides
+
+
+# ============================================
+# REQUEST IDS
+# ============================================
+
+def bind_request_id(request_id: Optional[str] = None) -> contextvars.Token:
+    """Set the request id for everything logged in this context."""
+    return _request_id.set((request_id or "")[:64] or uuid.uuid4().hex[:16])
+
+
+def reset_request_id(token: contextvars.Token) -> None:
+    _request_id.reset(token)
+
+
+def get_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+# ============================================
+# SAMPLING / RATE LIMITS
+# ============================================
+
+class SamplingFilter(logging.Filter):
+    """Per-logger sampling and token-bucket rate limit for records below WARNING"""
+
+    def __init__(self, sampling: Dict[str, float], rate_limits: Dict[str, float], default_rate: float):
+        super().__init__()
+        self.sampling = sampling
+        self.rate_limits = rate_limits
+        self.default_rate = default_rate
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.suppressed_total = 0
+
+    def _lookup(self, overrides: Dict[str, float], name: str, default: float) -> float:
+        # Most specific configured prefix wins: "notifications.push" before "notifications"
+        while name:
+            if name in overrides:
+                return overrides[name]
+            name = name.rpartition(".")[0]
+        return default
+
+    def _allow(self, name: str) -> bool:
+        rate = self._lookup(self.rate_limits, name, self.default_rate)
+        if rate <= 0:
+            return True
+        now = time.monotonic()
+        tokens, last = self._buckets.get(name, (rate, now))
+        tokens = min(rate, tokens + (now - last) * rate)
+        if tokens < 1:
+            self._buckets[name] = (tokens, now)
+            return False
+        self._buckets[name] = (tokens - 1, now)
+        return True
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        name = record.name
+        with self._lock:
+            if record.levelno < logging.WARNING:
+                rate = self._lookup(self.sampling, name, 1.0)
+                if (rate < 1.0 and random.random() >= rate) or not self._allow(name):
+                    self._suppressed[name] = self._suppressed.get(name, 0) + 1
+                    self.suppressed_total += 1
+                    return False
+            suppressed = self._suppressed.pop(name, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+# ============================================
+# HANDLERS / FORMATTERS
+# ============================================
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that captures the request id and never blocks on a full queue"""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve everything that depends on the caller's context or objects now;
+        # the writer thread only serializes plain values
+        record.request_id = _request_id.get()
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        suppressed = getattr(record, "suppressed", None)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Classic format, with request id and suppressed count appended when present"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        request_id = getattr(record, "request_id", None)
+        suppressed = getattr(record, "suppressed", None)
+        if request_id:
+            line += f" [req={request_id}]"
+        if suppressed:
+            line += f" [+{suppressed} suppressed]"
+        return line
+
+
+# ============================================
+# SETUP
+# ============================================
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_sampling_filter: Optional[SamplingFilter] = None
+_settings: Dict[str, Any] = {}
+
+
+def configure_logging() -> None:
+    """Route the root logger through the queue. Safe to call more than once."""
+    global _listener, _queue_handler, _sampling_filter
+    if _listener is not None:
+        return
+
+    _settings.update(
+        level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+        format=os.environ.get("LOG_FORMAT", "json").lower(),
+        queue_size=int(os.environ.get("LOG_QUEUE_SIZE", "10000")),
+        rate_limit=float(os.environ.get("LOG_RATE_LIMIT", "100")),
+    )
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if _settings["format"] == "json" else TextFormatter(TEXT_FORMAT))
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=_settings["queue_size"])
+    _sampling_filter = SamplingFilter(
+        sampling=_parse_overrides(os.environ.get("LOG_SAMPLING", "")),
+        rate_limits=_parse_overrides(os.environ.get("LOG_RATE_LIMITS", "")),
+        default_rate=_settings["rate_limit"],
+    )
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(_sampling_filter)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(_settings["level"])
+
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Drain the queue and stop the writer thread (call at shutdown)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        # Anything logged after this goes straight to stderr
+        root = logging.getLogger()
+        if _queue_handler in root.handlers:
+            root.removeHandler(_queue_handler)
+
+
+def get_logging_status() -> Dict[str, Any]:
+    return {
+        **_settings,
+        "queued": _queue_handler.queue.qsize() if _queue_handler else 0,
+        "dropped": _queue_handler.dropped if _queue_handler else 0,
+        "suppressed": _sampling_filter.suppressed_total if _sampling_filter else 0,
+    }
@@ -0,0 +1,215 @@
+"""
+MOOD Log Writer
+Write-behind buffer for append-only records (login events, admin audit and
+moderation logs):
+- append() is O(1) and does no I/O, so request latency never waits on a log
+- Records are grouped per collection and written with one insert_many when a
+  collection reaches BATCH_SIZE, every FLUSH_INTERVAL_SECONDS, and on shutdown
+- A full buffer drops new records rather than growing without bound; dropped,
+  failed and retried writes are counted for get_status() and /metrics
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Optional, List, Dict, Any, Deque, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Records per collection that trigger an immediate flush
+BATCH_SIZE = 200
+
+# Max wait before buffered records are written
+FLUSH_INTERVAL_SECONDS = 1
+
+# Records held across all collections before new ones are dropped
+MAX_BUFFERED = 10000
+
+# Flush attempts for a batch that fails as a whole (e.g. network error)
+MAX_FLUSH_ATTEMPTS = 3
+
+# Write error code for a record an earlier, partially failed attempt already inserted
+DUPLICATE_KEY = 11000
+
+
+class LogWriter:
+    """Per-collection append buffers with size/interval/shutdown flush"""
+
+    def __init__(self, db):
+        self.db = db
+        self.running = False
+        self._task = None
+        self._wake = asyncio.Event()
+        self._buffers: Dict[str, Deque[Tuple[dict, int]]] = {}
+        self.buffered = 0
+        self.written: Dict[str, int] = {}
+        self.dropped: Dict[str, int] = {}
+        self.failed: Dict[str, int] = {}
+        self.retried = 0
+        self.flush_count = 0
+
+    # ============================================
+    # WRITE PATH
+    # ============================================
+
+    def append(self, collection: str, record: dict) -> bool:
+        """Queue a record for insertion. O(1), no I/O. False if it was dropped."""
+        if self.buffered >= MAX_BUFFERED:
+            dropped = self.dropped.get(collection, 0)
+            if not dropped % 1000:
+                logger.warning(f"⚠️ Log buffer full, dropping {collection} records")
+            self.dropped[collection] = dropped + 1
+            return False
+
+        buffer = self._buffers.setdefault(collection, deque())
+        buffer.append((record, 0))
+        self.buffered += 1
+        if len(buffer) >= BATCH_SIZE:
+            self._wake.set()
+        return True
+
+    async def _flush_collection(self, collection: str) -> int:
+        buffer = self._buffers.get(collection)
+        if not buffer:
+            return 0
+
+        batch = [buffer.popleft() for _ in range(min(len(buffer), BATCH_SIZE))]
+        self.buffered -= len(batch)
+        try:
+            result = await self.db[collection].insert_many([r for r, _ in batch], ordered=False)
+            written = len(result.inserted_ids)
+        except Exception as e:
+            details = getattr(e, "details", None)
+            if details is None:
+                # Nothing is known to have been written: retry the whole batch
+                retry = [(r, attempts + 1) for r, attempts in batch if attempts + 1 < MAX_FLUSH_ATTEMPTS]
+                buffer.extendleft(reversed(retry))
+                self.buffered += len(retry)
+                self.retried += len(retry)
+                if len(retry) < len(batch):
+                    self.failed[collection] = self.failed.get(collection, 0) + len(batch) - len(retry)
+                logger.error(f"Log flush failed for {collection} ({len(batch)} records): {e}")
+                return 0
+            # Partial write: individual records were rejected, don't retry them
+            errors = [err for err in details.get("writeErrors", []) if err.get("code") != DUPLICATE_KEY]
+            written = details.get("nInserted", 0)
+            if errors:
+                self.failed[collection] = self.failed.get(collection, 0) + len(errors)
+                logger.error(f"Log flush for {collection}: {len(errors)} records rejected ({errors[0].get('errmsg')})")
+
+        self.written[collection] = self.written.get(collection, 0) + written
+        return written
+
+    async def flush(self) -> int:
+        """Write everything buffered, one insert_many per collection per batch."""
+        total = 0
+        for collection in list(self._buffers):
+            while self._buffers.get(collection):
+                pending = len(self._buffers[collection])
+                total += await self._flush_collection(collection)
+                if len(self._buffers[collection]) >= pending:
+                    break  # batch was requeued for retry; try again next interval
+        if total:
+            self.flush_count += 1
+        return total
+
+    def get_status(self) -> Dict[str, Any]:
+        """Writer stats for ops endpoints."""
+        return {
+            "running": self.running,
+            "buffered": {c: len(b) for c, b in self._buffers.items() if b},
+            "written": dict(self.written),
+            "dropped": dict(self.dropped),
+            "failed": dict(self.failed),
+            "retried": self.retried,
+            "flush_count": self.flush_count,
+            "batch_size": BATCH_SIZE,
+            "flush_interval_seconds": FLUSH_INTERVAL_SECONDS,
+            "max_buffered": MAX_BUFFERED,
+        }
+
+    def render_prometheus(self) -> str:
+        """Writer counters in Prometheus text format, appended to /metrics."""
+        out: List[str] = []
+        collections = sorted(set(self.written) | set(self.dropped) | set(self.failed))
+        for name, help_text, counts in (
+            ("mood_log_records_written_total", "Buffered log records inserted", self.written),
+            ("mood_log_records_dropped_total", "Log records dropped because the buffer was full", self.dropped),
+            ("mood_log_records_failed_total", "Log records that could not be inserted", self.failed),
+        ):
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} counter")
+            for collection in collections:
+                out.append(f'{name}{{collection="{collection}"}} {counts.get(collection, 0)}')
+        out.append("# HELP mood_log_records_buffered Log records waiting to be written")
+        out.append("# TYPE mood_log_records_buffered gauge")
+        out.append(f"mood_log_records_buffered {self.buffered}")
+        return "\n".join(out) + "\n"
+
+    # ============================================
+    # LIFECYCLE
+    # ============================================
+
+    async def start(self):
+        """Start the periodic flush loop"""
+        if self.running:
+            logger.warning("Log writer already running")
+            return
+
+        self.running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("🚀 Log writer started")
+
+    async def stop(self):
+        """Stop the flush loop and write out anything pending"""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        if self.buffered:
+            logger.error(f"Log writer stopped with {self.buffered} unwritten records")
+        logger.info("🛑 Log writer stopped")
+
+    async def _run_loop(self):
+        while self.running:
+            try:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=FLUSH_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Log writer loop error: {e}")
+
+
+# Global writer instance
+_writer: Optional[LogWriter] = None
+
+
+def get_log_writer(db) -> LogWriter:
+    """Get or create the log writer singleton"""
+    global _writer
+    if _writer is None:
+        _writer = LogWriter(db)
+    return _writer
+
+
+async def start_log_writer(db):
+    """Start the log writer flush loop"""
+    writer = get_log_writer(db)
+    await writer.start()
+
+
+async def stop_log_writer():
+    """Flush and stop the log writer"""
+    global _writer
+    if _writer:
+        await _writer.stop()
+        _writer = None
@@ -20,6 +20,9 @@ from enum import Enum
 
 # Import standardized push copy
 from push_copy import build_push_content, get_engagement_action
+from block_cache import get_blocked_user_ids, blocked_nin
+from unread_counters import get_unread, adjust_unread, NOTIFICATIONS
+from realtime import publish_event, EVENT_NOTIFICATION
 
 logger = logging.getLogger(__name__)
 
@@ -271,6 +274,11 @@ class NotificationService:
         """
         now = datetime.now(timezone.utc)
         
+        # Never notify across a block (either direction)
+        if actor_id and actor_id in await get_blocked_user_ids(self.db, user_id):
+            logger.debug(f"Skipping {notification_type.value} from blocked user")
+            return None
+        
         # Check user settings
         settings = await self.get_user_settings(user_id)
         
@@ -332,10 +340,12 @@ class NotificationService:
             "delivered_push_at": None,
         }
         
-        logger.info(f"🔔 Inserting notification into DB: {self.db.name}")
+        logger.debug(f"🔔 Inserting notification into DB: {self.db.name}")
         result = await self.db.notifications.insert_one(notification_doc)
         notification_id = str(result.inserted_id)
-        logger.info(f"🔔 Insert result acknowledged: {result.acknowledged}, id: {notification_id}")
+        logger.debug(f"🔔 Insert result acknowledged: {result.acknowledged}, id: {notification_id}")
+        await adjust_unread(self.db, user_id, NOTIFICATIONS, 1)
+        await self._publish_notification(notification_id, notification_doc)
         
         logger.info(f"🔔 Created notification {notification_type.value} for user {user_id[:8]}...")
         
@@ -360,6 +370,16 @@ class NotificationService:
         
         return notification_id
     
+    async def _publish_notification(self, notification_id: str, doc: dict) -> None:
+        """Push a new/updated notification to the user's open apps (same shape as the list)."""
+        await publish_event([doc["user_id"]], EVENT_NOTIFICATION, {
+            "id": notification_id,
+            **{k: doc.get(k) for k in (
+                "type", "title", "body", "image_url", "deep_link", "entity_id",
+                "entity_type", "created_at", "read_at", "metadata", "actor_id"
+            )},
+        })
+    
     def _generate_deep_link(
         self,
         notification_type: NotificationType,
@@ -508,6 +528,11 @@ class NotificationService:
         """Get notifications for a user with pagination"""
         query = {"user_id": user_id}
         
+        # Hide activity from blocked users that predates the block
+        blocked = await get_blocked_user_ids(self.db, user_id)
+        if blocked:
+            query["actor_id"] = blocked_nin(blocked)
+        
         if unread_only:
             query["read_at"] = None
         
@@ -557,11 +582,8 @@ class NotificationService:
         return notifications
     
     async def get_unread_count(self, user_id: str) -> int:
-        """Get count of unread notifications"""
-        return await self.db.notifications.count_documents({
-            "user_id": user_id,
-            "read_at": None
-        })
+        """Get count of unread notifications (counter lookup, see unread_counters)"""
+        return await get_unread(self.db, user_id, NOTIFICATIONS)
     
     async def mark_as_read(self, user_id: str, notification_ids: List[str]) -> int:
         """Mark notifications as read"""
@@ -577,6 +599,7 @@ class NotificationService:
             },
             {"$set": {"read_at": now}}
         )
+        await adjust_unread(self.db, user_id, NOTIFICATIONS, -result.modified_count)
         
         return result.modified_count
     
@@ -588,16 +611,19 @@ class NotificationService:
             {"user_id": user_id, "read_at": None},
             {"$set": {"read_at": now}}
         )
+        await adjust_unread(self.db, user_id, NOTIFICATIONS, -result.modified_count)
         
         return result.modified_count
     
     async def delete_notification(self, user_id: str, notification_id: str) -> bool:
         """Delete a notification"""
-        result = await self.db.notifications.delete_one({
-            "_id": ObjectId(notification_id),
-            "user_id": user_id
-        })
-        return result.deleted_count > 0
+        deleted = await self.db.notifications.find_one_and_delete(
+            {"_id": ObjectId(notification_id), "user_id": user_id},
+            projection={"read_at": 1}
+        )
+        if deleted and deleted.get("read_at") is None:
+            await adjust_unread(self.db, user_id, NOTIFICATIONS, -1)
+        return deleted is not None
     
     # ----------------------------------------
     # EVENT TRIGGERS (for social actions)
@@ -815,8 +841,8 @@ class NotificationService:
         BUNDLED ONLY - no single-like spam.
         If >3 likes in 10 min, bundle into one notification.
         """
-        # Don't notify yourself
-        if liker_id == post_author_id:
+        # Don't notify yourself, or across a block (bundles bypass create_notification)
+        if liker_id == post_author_id or liker_id in await get_blocked_user_ids(self.db, post_author_id):
             return None
         
         now = datetime.now(timezone.utc)
@@ -862,19 +888,32 @@ class NotificationService:
             if existing_bundle:
                 # Update the bundled notification count
                 like_count = existing_bundle.get("metadata", {}).get("like_count", 3) + 1
+                if existing_bundle.get("read_at") is not None:
+                    await adjust_unread(self.db, post_author_id, NOTIFICATIONS, 1)
+                bundle_update = {
+                    "body": f"{liker_name} and {like_count - 1} others liked your post.",
+                    "metadata.like_count": like_count,
+                    "metadata.last_liker": liker_name,
+                    "metadata.post_thumbnail": post_thumbnail,
+                    "created_at": now,  # Bump to top
+                    "read_at": None  # Mark as unread again
+                }
                 await self.db.notifications.update_one(
                     {"_id": existing_bundle["_id"]},
-                    {
-                        "$set": {
-                            "body": f"{liker_name} and {like_count - 1} others liked your post.",
-                            "metadata.like_count": like_count,
-                            "metadata.last_liker": liker_name,
-                            "metadata.post_thumbnail": post_thumbnail,
-                            "created_at": now,  # Bump to top
-                            "read_at": None  # Mark as unread again
-                        }
-                    }
+                    {"$set": bundle_update}
                 )
+                await self._publish_notification(str(existing_bundle["_id"]), {
+                    **existing_bundle,
+                    "body": bundle_update["body"],
+                    "metadata": {
+                        **existing_bundle.get("metadata", {}),
+                        "like_count": like_count,
+                        "last_liker": liker_name,
+                        "post_thumbnail": post_thumbnail,
+                    },
+                    "created_at": now,
+                    "read_at": None,
+                })
                 return str(existing_bundle["_id"])
             else:
                 # Create new bundled notification - IG-style copy
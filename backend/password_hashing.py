@@ -0,0 +1,197 @@
+"""
+Password Hashing
+bcrypt off the event loop:
+- hashpw/checkpw run in a dedicated thread pool (bcrypt releases the GIL), so
+  a login burst costs worker threads instead of stalling every coroutine
+- At most PASSWORD_HASH_WORKERS hashes run at once; once
+  PASSWORD_HASH_MAX_PENDING calls are queued or running, new ones fail fast
+  with PasswordHashingBusy (surfaced as 503) instead of piling up
+- Queue wait and hash time are recorded as histograms for /metrics
+- needs_rehash() compares a stored hash's cost with BCRYPT_ROUNDS so login can
+  upgrade hashes transparently after the cost factor changes
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+import bcrypt
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from request_metrics import Histogram, histogram_lines
+
+logger = logging.getLogger(__name__)
+
+# Settings are read when the hasher is created, after .env is loaded:
+# BCRYPT_ROUNDS (cost factor for new hashes, 12 like bcrypt.gensalt()),
+# PASSWORD_HASH_WORKERS (hashes computed concurrently, min(4, CPUs)),
+# PASSWORD_HASH_MAX_PENDING (calls queued or running before new ones are
+# rejected, 16 per worker)
+
+# Queue wait / hash duration buckets (seconds)
+HASH_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PasswordHashingBusy(Exception):
+    """Too many hashes already queued on this worker"""
+
+
+def _to_bytes(value: Union[str, bytes]) -> bytes:
+    return value if isinstance(value, bytes) else value.encode("utf-8")
+
+
+def hash_rounds(stored_hash: Union[str, bytes, None]) -> Optional[int]:
+    """Cost factor encoded in a $2a$/$2b$/$2y$ hash, None if unparseable."""
+    if not stored_hash:
+        return None
+    parts = _to_bytes(stored_hash).split(b"$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(stored_hash: Union[str, bytes, None]) -> bool:
+    """True when a valid hash was made with a cost other than BCRYPT_ROUNDS."""
+    rounds = hash_rounds(stored_hash)
+    return rounds is not None and rounds != get_password_hasher().rounds
+
+
+class PasswordHasher:
+    """Bounded bcrypt executor with queue-time metrics"""
+
+    def __init__(
+        self,
+        rounds: Optional[int] = None,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None
+    ):
+        self.rounds = rounds or int(os.environ.get("BCRYPT_ROUNDS", "12"))
+        self.workers = workers or int(os.environ.get("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.max_pending = max_pending or int(
+            os.environ.get("PASSWORD_HASH_MAX_PENDING", str(self.workers * 16))
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.queue_wait = {"hash": Histogram(HASH_BUCKETS), "verify": Histogram(HASH_BUCKETS)}
+        self.duration = {"hash": Histogram(HASH_BUCKETS), "verify": Histogram(HASH_BUCKETS)}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHashingBusy(f"{self.pending} password hashes pending")
+
+        submitted = time.monotonic()
+
+        def timed():
+            started = time.monotonic()
+            try:
+                return func(*args)
+            finally:
+                finished = time.monotonic()
+                with self._lock:
+                    self.queue_wait[operation].observe(started - submitted)
+                    self.duration[operation].observe(finished - started)
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), timed)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """bcrypt hash of password at BCRYPT_ROUNDS, as str."""
+        hashed = await self._run(
+            "hash", lambda: bcrypt.hashpw(_to_bytes(password), bcrypt.gensalt(rounds=self.rounds))
+        )
+        return hashed.decode("utf-8")
+
+    async def verify(self, password: str, stored_hash: Union[str, bytes]) -> bool:
+        """Check password against a stored hash (str or bytes)."""
+        return await self._run("verify", bcrypt.checkpw, _to_bytes(password), _to_bytes(stored_hash))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "rounds": self.rounds,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+        }
+
+    def render_prometheus(self) -> str:
+        """Hashing metrics in Prometheus text format, appended to /metrics."""
+        out: List[str] = []
+        for name, help_text, histograms in (
+            ("mood_password_hash_queue_seconds", "Time bcrypt calls waited for a worker", self.queue_wait),
+            ("mood_password_hash_seconds", "Time spent inside bcrypt", self.duration),
+        ):
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} histogram")
+            with self._lock:
+                for operation, histogram in histograms.items():
+                    out.extend(histogram_lines(name, {"operation": operation}, histogram))
+        for name, help_text, kind, value in (
+            ("mood_password_hash_pending", "bcrypt calls queued or running", "gauge", self.pending),
+            ("mood_password_hash_rejected_total", "bcrypt calls rejected because the queue was full", "counter", self.rejected),
+            ("mood_password_rehashed_total", "Stored hashes upgraded to the configured cost on login", "counter", self.rehashed),
+        ):
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+            out.append(f"{name} {value}")
+        return "\n".join(out) + "\n"
+
+
+# Global hasher instance
+_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get or create the password hasher singleton"""
+    global _hasher
+    if _hasher is None:
+        _hasher = PasswordHasher()
+    return _hasher
+
+
+async def hash_password(password: str) -> str:
+    return await get_password_hasher().hash(password)
+
+
+async def verify_password(password: str, stored_hash: Union[str, bytes]) -> bool:
+    return await get_password_hasher().verify(password, stored_hash)
+
+
+async def rehash_if_needed(db: AsyncIOMotorDatabase, user: dict, password: str) -> bool:
+    """
+    After a successful login, re-hash at the configured cost if the stored hash
+    uses another one. The update only applies if the stored hash is unchanged,
+    so a concurrent password change always wins.
+    """
+    fields = [f for f in ("password", "password_hash") if user.get(f)]
+    if not fields or not needs_rehash(user[fields[0]]):
+        return False
+    new_hash = await hash_password(password)
+    result = await db.users.update_one(
+        {"_id": user["_id"], fields[0]: user[fields[0]]},
+        {"$set": {f: new_hash for f in fields}}
+    )
+    if result.modified_count:
+        get_password_hasher().rehashed += 1
+        logger.info(f"🔐 Rehashed password for user {user['_id']} at cost {get_password_hasher().rounds}")
+    return bool(result.modified_count)
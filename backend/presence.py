@@ -0,0 +1,278 @@
+"""
+MOOD Presence Registry
+In-process tracking of "who has the app open right now":
+- Heartbeats update an in-memory last-seen map bucketed by minute
+- Dirty users are flushed to user_heartbeats in one bulk write per interval
+- Realtime-active queries merge flushed (all replicas) and local state and
+  hydrate profiles with a single batched users lookup
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Optional, List, Dict, Set, Any
+from pymongo import UpdateOne
+from bson import ObjectId
+
+logger = logging.getLogger(__name__)
+
+# How often dirty heartbeats are written to Mongo
+FLUSH_INTERVAL_SECONDS = 30
+
+# Buckets older than this are pruned from memory (must exceed any query window)
+RETENTION_MINUTES = 60
+
+# Upper bound on users returned by the realtime list
+MAX_ACTIVE_USERS = 1000
+
+
+def _minute_bucket(ts: datetime) -> int:
+    return int(ts.timestamp()) // 60
+
+
+class PresenceRegistry:
+    """Minute-bucketed last-seen registry with periodic bulk flush"""
+
+    def __init__(self, db):
+        self.db = db
+        self.running = False
+        self._task = None
+        self._last_seen: Dict[str, datetime] = {}
+        self._bucket_of: Dict[str, int] = {}
+        self._buckets: Dict[int, Set[str]] = {}
+        self._dirty: Set[str] = set()
+        self.flush_count = 0
+        self.flushed_users = 0
+        self.failed_flushes = 0
+
+    # ============================================
+    # WRITE PATH
+    # ============================================
+
+    def touch(self, user_id: str, now: Optional[datetime] = None) -> None:
+        """Record a heartbeat. O(1), no I/O."""
+        now = now or datetime.now(timezone.utc)
+        bucket = _minute_bucket(now)
+
+        previous = self._bucket_of.get(user_id)
+        if previous != bucket:
+            if previous is not None:
+                members = self._buckets.get(previous)
+                if members is not None:
+                    members.discard(user_id)
+                    if not members:
+                        del self._buckets[previous]
+            self._buckets.setdefault(bucket, set()).add(user_id)
+            self._bucket_of[user_id] = bucket
+
+        self._last_seen[user_id] = now
+        self._dirty.add(user_id)
+
+    def _prune(self, now: datetime) -> None:
+        """Forget users whose bucket has aged out of the retention window."""
+        oldest = _minute_bucket(now - timedelta(minutes=RETENTION_MINUTES))
+        for bucket in [b for b in self._buckets if b < oldest]:
+            for user_id in self._buckets.pop(bucket):
+                self._bucket_of.pop(user_id, None)
+                self._last_seen.pop(user_id, None)
+                self._dirty.discard(user_id)
+
+    async def flush(self) -> int:
+        """Write all dirty heartbeats to user_heartbeats in one bulk write."""
+        if not self._dirty:
+            return 0
+
+        dirty, self._dirty = self._dirty, set()
+        operations = [
+            UpdateOne(
+                {"user_id": user_id},
+                {"$set": {
+                    "user_id": user_id,
+                    "last_heartbeat": self._last_seen[user_id],
+                    "is_online": True
+                }},
+                upsert=True
+            )
+            for user_id in dirty if user_id in self._last_seen
+        ]
+        try:
+            if operations:
+                await self.db.user_heartbeats.bulk_write(operations, ordered=False)
+            self.flush_count += 1
+            self.flushed_users += len(operations)
+            return len(operations)
+        except Exception as e:
+            # Put them back so the next flush retries
+            self._dirty |= dirty
+            self.failed_flushes += 1
+            logger.error(f"Presence flush failed ({len(operations)} users): {e}")
+            return 0
+
+    # ============================================
+    # READ PATH
+    # ============================================
+
+    def local_active(self, cutoff: datetime) -> Dict[str, datetime]:
+        """Users seen by this process since cutoff, from buckets at or after it."""
+        first_bucket = _minute_bucket(cutoff)
+        active = {}
+        for bucket, members in self._buckets.items():
+            if bucket < first_bucket:
+                continue
+            for user_id in members:
+                seen = self._last_seen.get(user_id)
+                if seen and seen >= cutoff:
+                    active[user_id] = seen
+        return active
+
+    async def get_active(self, cutoff: datetime, limit: int = MAX_ACTIVE_USERS) -> Dict[str, datetime]:
+        """
+        Active users since cutoff across all replicas.
+        Merges flushed heartbeats (other processes) with local unflushed state.
+        """
+        active: Dict[str, datetime] = {}
+        cursor = self.db.user_heartbeats.find(
+            {"last_heartbeat": {"$gte": cutoff}},
+            {"user_id": 1, "last_heartbeat": 1, "_id": 0}
+        ).sort("last_heartbeat", -1).limit(limit)
+        async for hb in cursor:
+            last = hb.get("last_heartbeat")
+            if last and last.tzinfo is None:
+                last = last.replace(tzinfo=timezone.utc)
+            active[hb["user_id"]] = last
+
+        for user_id, seen in self.local_active(cutoff).items():
+            if user_id not in active or (active[user_id] and seen > active[user_id]):
+                active[user_id] = seen
+        return active
+
+    async def count_active(self, cutoff: datetime) -> int:
+        """
+        Number of users active since cutoff (uncapped, unlike get_active).
+        Counts flushed heartbeats, plus local users whose heartbeat isn't flushed yet.
+        """
+        query = {"last_heartbeat": {"$gte": cutoff}}
+        count = await self.db.user_heartbeats.count_documents(query)
+        local = list(self.local_active(cutoff))
+        if local:
+            flushed = await self.db.user_heartbeats.count_documents({**query, "user_id": {"$in": local}})
+            count += len(local) - flushed
+        return count
+
+    async def get_active_users(self, cutoff: datetime, limit: int = MAX_ACTIVE_USERS) -> List[Dict[str, Any]]:
+        """Active users with profile fields, hydrated in a single users query."""
+        active = await self.get_active(cutoff, limit)
+        if not active:
+            return []
+
+        object_ids = []
+        for user_id in active:
+            try:
+                object_ids.append(ObjectId(user_id))
+            except Exception:
+                continue
+        users = await self.db.users.find(
+            {"$or": [
+                {"user_id": {"$in": list(active.keys())}},
+                {"_id": {"$in": object_ids}}
+            ]},
+            {"username": 1, "avatar": 1, "avatar_url": 1, "user_id": 1}
+        ).to_list(len(active) * 2)
+
+        # Custom user_id matches take precedence over ObjectId matches
+        by_id = {}
+        for user in users:
+            by_id.setdefault(str(user["_id"]), user)
+        for user in users:
+            if user.get("user_id") in active:
+                by_id[user["user_id"]] = user
+
+        result = []
+        for user_id, last_seen in sorted(active.items(), key=lambda kv: kv[1], reverse=True):
+            user = by_id.get(user_id)
+            if not user:
+                continue
+            result.append({
+                "user_id": user_id,
+                "username": user.get("username", "Unknown"),
+                "avatar_url": user.get("avatar_url") or user.get("avatar", ""),
+                "avatar": user.get("avatar") or user.get("avatar_url", ""),
+                "last_active": last_seen.isoformat() if last_seen else None
+            })
+        return result
+
+    def get_status(self) -> Dict[str, Any]:
+        """Registry stats for ops endpoints."""
+        return {
+            "running": self.running,
+            "tracked_users": len(self._last_seen),
+            "pending_flush": len(self._dirty),
+            "buckets": len(self._buckets),
+            "flush_count": self.flush_count,
+            "flushed_users": self.flushed_users,
+            "failed_flushes": self.failed_flushes,
+            "flush_interval_seconds": FLUSH_INTERVAL_SECONDS,
+        }
+
+    # ============================================
+    # LIFECYCLE
+    # ============================================
+
+    async def start(self):
+        """Start the periodic flush loop"""
+        if self.running:
+            logger.warning("Presence registry already running")
+            return
+
+        self.running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("🚀 Presence registry started")
+
+    async def stop(self):
+        """Stop the flush loop and write out anything pending"""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        logger.info("🛑 Presence registry stopped")
+
+    async def _run_loop(self):
+        while self.running:
+            try:
+                await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+                await self.flush()
+                self._prune(datetime.now(timezone.utc))
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Presence loop error: {e}")
+
+
+# Global registry instance
+_registry: Optional[PresenceRegistry] = None
+
+
+def get_presence_registry(db) -> PresenceRegistry:
+    """Get or create the presence registry singleton"""
+    global _registry
+    if _registry is None:
+        _registry = PresenceRegistry(db)
+    return _registry
+
+
+async def start_presence_registry(db):
+    """Start the presence registry flush loop"""
+    registry = get_presence_registry(db)
+    await registry.start()
+
+
+async def stop_presence_registry():
+    """Flush and stop the presence registry"""
+    global _registry
+    if _registry:
+        await _registry.stop()
+        _registry = None
@@ -0,0 +1,145 @@
+"""
+Query Batching for Multi-Metric Endpoints
+Collects independent count/distinct/aggregate calls and runs them together:
+- Same-collection counts are folded into a single $facet aggregation
+- Everything else is gathered concurrently under a shared bounded semaphore
+
+Usage:
+    batch = QueryBatch(db)
+    batch.count("total_users", "users", {})
+    batch.count("posts", "user_events", {"event_type": "post_created", ...})
+    batch.distinct("active_ids", "user_events", "user_id", {...})
+    batch.aggregate("top_moods", "user_events", pipeline)
+    batch.add("realtime", lambda: registry.count_active(cutoff))
+    results = await batch.run()
+"""
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+# Max queries in flight across ALL batches in this process, so a few
+# dashboards refreshing at once cannot drain the Motor connection pool
+QUERY_BATCH_MAX_CONCURRENCY = int(os.environ.get("QUERY_BATCH_MAX_CONCURRENCY", "8"))
+
+# Upper bound on counts folded into one $facet (keeps each aggregation small)
+MAX_FACET_COUNTS = 24
+
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(QUERY_BATCH_MAX_CONCURRENCY)
+    return _semaphore
+
+
+class QueryBatch:
+    """Named set of independent queries resolved concurrently by run()"""
+
+    def __init__(self, db: AsyncIOMotorDatabase, fold_counts: bool = True):
+        self.db = db
+        self.fold_counts = fold_counts
+        self._counts: Dict[str, Dict[str, dict]] = {}
+        self._queries: Dict[str, Callable[[], Awaitable[Any]]] = {}
+
+    def _check_name(self, name: str) -> None:
+        if name in self._queries or any(name in c for c in self._counts.values()):
+            raise ValueError(f"Duplicate query name in batch: {name}")
+
+    def count(self, name: str, collection: str, query: dict) -> "QueryBatch":
+        """Queue count_documents(query); may be folded with other counts on the collection."""
+        self._check_name(name)
+        self._counts.setdefault(collection, {})[name] = query
+        return self
+
+    def distinct(self, name: str, collection: str, key: str, query: dict) -> "QueryBatch":
+        """Queue distinct(key, query)."""
+        self._check_name(name)
+        self._queries[name] = lambda: self.db[collection].distinct(key, query)
+        return self
+
+    def aggregate(self, name: str, collection: str, pipeline: List[dict], length: Optional[int] = None) -> "QueryBatch":
+        """Queue aggregate(pipeline).to_list(length)."""
+        self._check_name(name)
+        self._queries[name] = lambda: self.db[collection].aggregate(pipeline).to_list(length)
+        return self
+
+    def add(self, name: str, factory: Callable[[], Awaitable[Any]]) -> "QueryBatch":
+        """Queue an arbitrary coroutine factory (called once, inside the semaphore)."""
+        self._check_name(name)
+        self._queries[name] = factory
+        return self
+
+    def _plan_counts(self) -> Dict[str, Callable[[], Awaitable[Any]]]:
+        """
+        Turn queued counts into callables.
+        Counts with an empty filter run alone (they can use collection metadata);
+        the rest are folded per collection into $facet aggregations whose leading
+        $match is the $or of all filters, so each branch can still use an index.
+        """
+        planned: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        for collection, counts in self._counts.items():
+            foldable = {}
+            for name, query in counts.items():
+                if query and self.fold_counts:
+                    foldable[name] = query
+                else:
+                    planned[name] = self._single_count(collection, query)
+
+            names = list(foldable)
+            if len(names) == 1:
+                planned[names[0]] = self._single_count(collection, foldable[names[0]])
+                continue
+            for i in range(0, len(names), MAX_FACET_COUNTS):
+                group = {n: foldable[n] for n in names[i:i + MAX_FACET_COUNTS]}
+                planned[f"__facet__{collection}__{i}"] = self._facet_counts(collection, group)
+        return planned
+
+    def _single_count(self, collection: str, query: dict) -> Callable[[], Awaitable[int]]:
+        return lambda: self.db[collection].count_documents(query)
+
+    def _facet_counts(self, collection: str, group: Dict[str, dict]) -> Callable[[], Awaitable[Dict[str, int]]]:
+        # $facet field names cannot contain '.' or start with '$'
+        keys = {name: f"c{idx}" for idx, name in enumerate(group)}
+        pipeline = [
+            {"$match": {"$or": list(group.values())}},
+            {"$facet": {
+                keys[name]: [{"$match": query}, {"$count": "n"}]
+                for name, query in group.items()
+            }},
+        ]
+
+        async def run_facet() -> Dict[str, int]:
+            rows = await self.db[collection].aggregate(pipeline, allowDiskUse=True).to_list(1)
+            facet = rows[0] if rows else {}
+            return {
+                name: (facet.get(key) or [{"n": 0}])[0]["n"]
+                for name, key in keys.items()
+            }
+
+        return run_facet
+
+    async def run(self) -> Dict[str, Any]:
+        """Execute every queued query concurrently and return results by name."""
+        planned = {**self._plan_counts(), **self._queries}
+        semaphore = _get_semaphore()
+
+        async def guarded(factory: Callable[[], Awaitable[Any]]) -> Any:
+            async with semaphore:
+                return await factory()
+
+        names = list(planned)
+        values = await asyncio.gather(*(guarded(planned[n]) for n in names))
+
+        results: Dict[str, Any] = {}
+        for name, value in zip(names, values):
+            if name.startswith("__facet__"):
+                results.update(value)
+            else:
+                results[name] = value
+        return results
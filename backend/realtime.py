@@ -0,0 +1,376 @@
+"""
+MOOD Realtime Gateway
+Push channel for new messages, notifications and unread badges, so an open
+app no longer polls /conversations/{id}/messages, /notifications and the
+unread-count endpoints:
+- Clients hold one WebSocket (/api/realtime/ws) or SSE stream
+  (/api/realtime/events). Each connection has a bounded queue; a consumer
+  that falls CONNECTION_QUEUE_SIZE events behind is disconnected (it
+  resyncs from the hello snapshot on reconnect) instead of buffering forever
+- publish_event() encodes an event once, delivers it to this process's
+  connections and hands it to the cross-replica backend (REALTIME_BACKEND):
+  "local" for a single replica, "mongo" to fan out through a change stream
+  on realtime_events (requires a replica set; events expire via TTL index)
+- The hub pings every HEARTBEAT_INTERVAL_SECONDS and sweeps connections not
+  heard from (WebSocket: any client frame; SSE: a completed write) within
+  HEARTBEAT_TIMEOUT_SECONDS
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional, Dict, Set, Any, Iterable, List, Callable
+
+from fast_json import dumps
+
+logger = logging.getLogger(__name__)
+
+# Server ping interval; clients should answer (any frame) on WebSockets
+HEARTBEAT_INTERVAL_SECONDS = 25
+
+# Connections silent for longer than this are closed by the sweeper
+HEARTBEAT_TIMEOUT_SECONDS = 75
+
+# Undelivered events held per connection before it is dropped as too slow
+CONNECTION_QUEUE_SIZE = 100
+
+# Backoff before re-opening a failed change stream
+WATCH_RETRY_SECONDS = 5
+
+EVENT_MESSAGE = "message"
+EVENT_NOTIFICATION = "notification"
+EVENT_BADGE = "badge"
+EVENT_HELLO = "hello"
+EVENT_PING = "ping"
+
+Deliver = Callable[[Iterable[str], str], int]
+
+
+def encode_event(event_type: str, data: Optional[Dict[str, Any]] = None) -> str:
+    """Serialize an event once; the same text goes to every subscriber."""
+    return dumps({
+        "type": event_type,
+        "data": data or {},
+        "ts": datetime.now(timezone.utc).isoformat(),
+    }).decode("utf-8")
+
+
+# ============================================
+# CONNECTIONS
+# ============================================
+
+class Connection:
+    """One client socket/stream with its outbound queue"""
+
+    def __init__(self, user_id: str, transport: str):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.transport = transport
+        self.connected_at = time.monotonic()
+        self.last_seen = self.connected_at
+        self.closed = False
+        self._queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=CONNECTION_QUEUE_SIZE)
+
+    def touch(self) -> None:
+        self.last_seen = time.monotonic()
+
+    def offer(self, payload: str) -> bool:
+        """Queue a payload without waiting. A full queue closes the connection."""
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            self.close()
+            return False
+
+    def close(self) -> None:
+        """Wake the sender with an end-of-stream marker; pending events are discarded."""
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def next_payload(self) -> Optional[str]:
+        """Next event to send, or None once the connection is closed."""
+        if self.closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+
+# ============================================
+# CROSS-REPLICA BACKENDS
+# ============================================
+
+class LocalBackend:
+    """Single replica: every subscriber is in this process"""
+
+    name = "local"
+
+    async def start(self, deliver: Deliver) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def publish(self, user_ids: List[str], payload: str) -> None:
+        pass
+
+    def get_status(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+
+class MongoChangeStreamBackend:
+    """
+    Fan-out through realtime_events: each publish is one insert, and every
+    replica watches inserts from other replicas and delivers to its own
+    connections. The driver resumes transient stream errors itself; after a
+    fatal one the watch is re-opened from the current point in time.
+    """
+
+    name = "mongo"
+
+    def __init__(self, db, instance_id: str):
+        self.db = db
+        self.instance_id = instance_id
+        self.running = False
+        self._task = None
+        self.published = 0
+        self.received = 0
+        self.errors = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        self.running = True
+        self._task = asyncio.create_task(self._watch(deliver))
+
+    async def stop(self) -> None:
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def publish(self, user_ids: List[str], payload: str) -> None:
+        try:
+            await self.db.realtime_events.insert_one({
+                "origin": self.instance_id,
+                "user_ids": user_ids,
+                "payload": payload,
+                "created_at": datetime.now(timezone.utc),
+            })
+            self.published += 1
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Realtime publish to realtime_events failed: {e}")
+
+    async def _watch(self, deliver: Deliver) -> None:
+        pipeline = [{"$match": {
+            "operationType": "insert",
+            "fullDocument.origin": {"$ne": self.instance_id},
+        }}]
+        while self.running:
+            try:
+                async with self.db.realtime_events.watch(pipeline) as stream:
+                    async for change in stream:
+                        doc = change["fullDocument"]
+                        self.received += 1
+                        deliver(doc.get("user_ids", []), doc["payload"])
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Realtime change stream error: {e}")
+                await asyncio.sleep(WATCH_RETRY_SECONDS)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "instance_id": self.instance_id,
+            "published": self.published,
+            "received": self.received,
+            "errors": self.errors,
+        }
+
+
+def _make_backend(db):
+    kind = os.environ.get("REALTIME_BACKEND", "local").lower()
+    if kind == "mongo":
+        return MongoChangeStreamBackend(db, uuid.uuid4().hex)
+    if kind != "local":
+        logger.warning(f"Unknown REALTIME_BACKEND '{kind}', using local")
+    return LocalBackend()
+
+
+# ============================================
+# HUB
+# ============================================
+
+class RealtimeHub:
+    """In-process user -> connections registry with heartbeat sweeping"""
+
+    def __init__(self, db, backend=None):
+        self.db = db
+        self.backend = backend or _make_backend(db)
+        self.running = False
+        self._task = None
+        self._connections: Dict[str, Set[Connection]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.swept = 0
+
+    def register(self, user_id: str, transport: str) -> Connection:
+        connection = Connection(user_id, transport)
+        self._connections.setdefault(user_id, set()).add(connection)
+        return connection
+
+    def unregister(self, connection: Connection) -> None:
+        connection.close()
+        connections = self._connections.get(connection.user_id)
+        if connections is not None:
+            connections.discard(connection)
+            if not connections:
+                del self._connections[connection.user_id]
+
+    def is_connected(self, user_id: str) -> bool:
+        return user_id in self._connections
+
+    def deliver_local(self, user_ids: Iterable[str], payload: str) -> int:
+        """Queue a payload on every local connection of the given users."""
+        delivered = 0
+        for user_id in user_ids:
+            for connection in list(self._connections.get(user_id, ())):
+                if connection.offer(payload):
+                    delivered += 1
+                else:
+                    self.dropped += 1
+                    self.unregister(connection)
+                    logger.warning(f"⚠️ Dropped slow realtime {connection.transport} connection for {user_id[:8]}...")
+        self.delivered += delivered
+        return delivered
+
+    async def publish(self, user_ids: Iterable[str], event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
+        user_ids = [u for u in dict.fromkeys(user_ids) if u]
+        if self.backend.name == "local":
+            user_ids = [u for u in user_ids if u in self._connections]
+        if not user_ids:
+            return
+        payload = encode_event(event_type, data)
+        self.published += 1
+        self.deliver_local(user_ids, payload)
+        await self.backend.publish(user_ids, payload)
+
+    def _heartbeat(self) -> None:
+        """Ping every connection and close the ones that went silent."""
+        cutoff = time.monotonic() - HEARTBEAT_TIMEOUT_SECONDS
+        ping = encode_event(EVENT_PING)
+        for connections in list(self._connections.values()):
+            for connection in list(connections):
+                if connection.last_seen < cutoff:
+                    self.swept += 1
+                    self.unregister(connection)
+                elif not connection.offer(ping):
+                    self.dropped += 1
+                    self.unregister(connection)
+
+    def get_status(self) -> Dict[str, Any]:
+        connections = [c for conns in self._connections.values() for c in conns]
+        return {
+            "running": self.running,
+            "users": len(self._connections),
+            "connections": len(connections),
+            "websocket": sum(1 for c in connections if c.transport == "websocket"),
+            "sse": sum(1 for c in connections if c.transport == "sse"),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "swept": self.swept,
+            **self.backend.get_status(),
+        }
+
+    async def start(self):
+        """Start the heartbeat loop and the cross-replica backend"""
+        if self.running:
+            logger.warning("Realtime hub already running")
+            return
+
+        self.running = True
+        await self.backend.start(self.deliver_local)
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(f"🚀 Realtime hub started ({self.backend.name} backend)")
+
+    async def stop(self):
+        """Close every connection and stop the heartbeat loop"""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for connections in list(self._connections.values()):
+            for connection in list(connections):
+                self.unregister(connection)
+        await self.backend.stop()
+        logger.info("🛑 Realtime hub stopped")
+
+    async def _run_loop(self):
+        while self.running:
+            try:
+                await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+                self._heartbeat()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Realtime heartbeat error: {e}")
+
+
+# Global hub instance
+_hub: Optional[RealtimeHub] = None
+
+
+def get_realtime_hub(db) -> RealtimeHub:
+    """Get or create the realtime hub singleton"""
+    global _hub
+    if _hub is None:
+        _hub = RealtimeHub(db)
+    return _hub
+
+
+async def start_realtime_hub(db):
+    """Start the realtime hub"""
+    hub = get_realtime_hub(db)
+    await hub.start()
+
+
+async def stop_realtime_hub():
+    """Disconnect clients and stop the realtime hub"""
+    global _hub
+    if _hub:
+        await _hub.stop()
+        _hub = None
+
+
+def wants_events(user_id: str) -> bool:
+    """Whether an event for this user could reach anyone (skip building it if not)."""
+    if _hub is None or not _hub.running:
+        return False
+    return _hub.backend.name != "local" or _hub.is_connected(user_id)
+
+
+async def publish_event(user_ids: Iterable[str], event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
+    """Push an event to users' open apps. No-op outside a running server (scripts, workers)."""
+    if _hub is None or not _hub.running:
+        return
+    try:
+        await _hub.publish(user_ids, event_type, data)
+    except Exception as e:
+        logger.error(f"Realtime publish of {event_type} failed: {e}")
@@ -0,0 +1,258 @@
+"""
+Request Metrics
+Per-route latency and database attribution, exported in Prometheus text format:
+- A PyMongo CommandListener adds each command's duration and returned documents
+  to the accumulator of the request that issued it (found via a contextvar,
+  which Motor copies into its executor threads)
+- The HTTP middleware opens the accumulator, and when the request finishes it
+  records latency and DB totals under the route template (/posts/{post_id}),
+  never the raw path
+- render_prometheus() produces the /metrics payload
+
+Commands issued outside a request (workers, startup) are attributed to the
+"background" route.
+"""
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from pymongo import monitoring
+
+# Request latency buckets (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# DB commands per request buckets - a route drifting right is an N+1
+DB_COMMAND_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+BACKGROUND_ROUTE = "background"
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestDbStats:
+    """DB work done on behalf of one request (written from Motor executor threads)"""
+
+    __slots__ = ("commands", "db_seconds", "documents", "_lock")
+
+    def __init__(self):
+        self.commands = 0
+        self.db_seconds = 0.0
+        self.documents = 0
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float, documents: int) -> None:
+        with self._lock:
+            self.commands += 1
+            self.db_seconds += seconds
+            self.documents += documents
+
+
+_current_request: contextvars.ContextVar[Optional[RequestDbStats]] = contextvars.ContextVar(
+    "mood_request_db_stats", default=None
+)
+
+
+class Histogram:
+    """Cumulative-bucket histogram matching Prometheus semantics"""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        running = 0
+        rows = []
+        for bound, n in zip(self.bounds, self.counts):
+            running += n
+            rows.append((_format_number(bound), running))
+        rows.append(("+Inf", running + self.counts[-1]))
+        return rows
+
+
+class RouteMetrics:
+    """Everything tracked for one (method, route) pair"""
+
+    __slots__ = ("latency", "db_commands_per_request", "statuses", "db_commands", "db_seconds", "db_documents")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.db_commands_per_request = Histogram(DB_COMMAND_BUCKETS)
+        self.statuses: Dict[str, int] = {}
+        self.db_commands = 0
+        self.db_seconds = 0.0
+        self.db_documents = 0
+
+
+class MetricsRegistry:
+    """In-process metric store; one per worker process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.background = RequestDbStats()
+        self.started_at = time.time()
+
+    def _route(self, method: str, route: str) -> RouteMetrics:
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        return metrics
+
+    def record_request(self, method: str, route: str, status_code: int, seconds: float, db: RequestDbStats) -> None:
+        status = f"{status_code // 100}xx"
+        with self._lock:
+            metrics = self._route(method, route)
+            metrics.latency.observe(seconds)
+            metrics.db_commands_per_request.observe(db.commands)
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.db_commands += db.commands
+            metrics.db_seconds += db.db_seconds
+            metrics.db_documents += db.documents
+
+    def snapshot(self) -> List[Tuple[Tuple[str, str], RouteMetrics]]:
+        with self._lock:
+            return sorted(self.routes.items())
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
+
+
+# ============================================
+# PYMONGO COMMAND MONITORING
+# ============================================
+
+def _documents_in_reply(reply: dict) -> int:
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        batch = cursor.get("firstBatch", cursor.get("nextBatch"))
+        if batch is not None:
+            return len(batch)
+    values = reply.get("values")  # distinct
+    if isinstance(values, list):
+        return len(values)
+    return 0
+
+
+class DbCommandListener(monitoring.CommandListener):
+    """Attributes every successful/failed command to the active request"""
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        stats = _current_request.get() or _registry.background
+        stats.add(event.duration_micros / 1_000_000, _documents_in_reply(event.reply))
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        stats = _current_request.get() or _registry.background
+        stats.add(event.duration_micros / 1_000_000, 0)
+
+
+db_command_listener = DbCommandListener()
+
+
+# ============================================
+# REQUEST HOOKS (called from the HTTP middleware)
+# ============================================
+
+def begin_request() -> Tuple[RequestDbStats, contextvars.Token]:
+    stats = RequestDbStats()
+    return stats, _current_request.set(stats)
+
+
+def end_request(request, status_code: int, seconds: float, stats: RequestDbStats, token: contextvars.Token) -> None:
+    _current_request.reset(token)
+    route = request.scope.get("route")
+    route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+    _registry.record_request(request.method, route_path, status_code, seconds, stats)
+
+
+@contextmanager
+def measure_db() -> Iterator[RequestDbStats]:
+    """Collect DB stats for a block of code outside a request (benchmarks, scripts)."""
+    stats = RequestDbStats()
+    token = _current_request.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_request.reset(token)
+
+
+# ============================================
+# PROMETHEUS EXPOSITION
+# ============================================
+
+def _format_number(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def histogram_lines(name: str, labels: Dict[str, str], histogram: Histogram) -> List[str]:
+    lines = [
+        f"{name}_bucket{_labels(**labels, le=le)} {count}"
+        for le, count in histogram.cumulative()
+    ]
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.total}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def render_prometheus() -> str:
+    """Render all metrics in Prometheus text exposition format (v0.0.4)."""
+    routes = _registry.snapshot()
+    out: List[str] = []
+
+    out.append("# HELP mood_http_request_duration_seconds Request latency by route template")
+    out.append("# TYPE mood_http_request_duration_seconds histogram")
+    for (method, route), m in routes:
+        out.extend(histogram_lines("mood_http_request_duration_seconds", {"method": method, "route": route}, m.latency))
+
+    out.append("# HELP mood_http_requests_total Requests by route template and status class")
+    out.append("# TYPE mood_http_requests_total counter")
+    for (method, route), m in routes:
+        for status, n in sorted(m.statuses.items()):
+            out.append(f"mood_http_requests_total{_labels(method=method, route=route, status=status)} {n}")
+
+    out.append("# HELP mood_db_commands_per_request MongoDB commands issued per request")
+    out.append("# TYPE mood_db_commands_per_request histogram")
+    for (method, route), m in routes:
+        out.extend(histogram_lines("mood_db_commands_per_request", {"method": method, "route": route}, m.db_commands_per_request))
+
+    background = _registry.background
+    for name, help_text, route_attr, background_attr in (
+        ("mood_db_commands_total", "MongoDB commands attributed to route", "db_commands", "commands"),
+        ("mood_db_seconds_total", "MongoDB command time attributed to route", "db_seconds", "db_seconds"),
+        ("mood_db_documents_returned_total", "Documents returned by MongoDB to route", "db_documents", "documents"),
+    ):
+        out.append(f"# HELP {name} {help_text}")
+        out.append(f"# TYPE {name} counter")
+        for (method, route), m in routes:
+            out.append(f"{name}{_labels(method=method, route=route)} {getattr(m, route_attr)}")
+        out.append(f"{name}{_labels(method='', route=BACKGROUND_ROUTE)} {getattr(background, background_attr)}")
+
+    out.append("# HELP mood_process_start_time_seconds Unix time the metrics registry was created")
+    out.append("# TYPE mood_process_start_time_seconds gauge")
+    out.append(f"mood_process_start_time_seconds {_registry.started_at}")
+    return "\n".join(out) + "\n"
@@ -0,0 +1,278 @@
+"""
+On-Demand Request Profiler
+Admin-controlled stack sampling for production slow paths:
+- Enabled for a limited time with a sample rate and/or a single route
+  (template like /api/posts/{post_id} or an exact path)
+- A daemon thread samples the event-loop thread's stack every interval_ms
+  while at least one sampled request is in flight
+- The last N profiles are kept in memory with route/duration metadata and
+  can be exported as speedscope JSON or collapsed stacks (flamegraph.pl,
+  inferno, speedscope all accept the latter)
+
+All coroutines share the event-loop thread, so a profile also contains
+samples from requests that ran concurrently with the sampled one;
+concurrent_requests on each profile says how noisy it is. Stacks ending in
+the selector (select/epoll) are the loop waiting on I/O, mostly MongoDB.
+"""
+import itertools
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque, Counter
+from datetime import datetime, timezone, timedelta
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sampling bounds
+DEFAULT_INTERVAL_MS = 5
+MIN_INTERVAL_MS = 1
+MAX_STACK_DEPTH = 128
+
+# Retention
+DEFAULT_MAX_PROFILES = 20
+MAX_PROFILES_LIMIT = 200
+
+# Profiling switches itself off after this long unless re-enabled
+DEFAULT_DURATION_MINUTES = 15
+
+Frame = Tuple[str, str, int]  # (function, file, first line)
+
+
+def _route_pattern(route: str) -> "re.Pattern":
+    """Compile a route template (/api/posts/{post_id}) into a path regex."""
+    parts = re.split(r"(\{[^}]+\})", route)
+    regex = "".join("[^/]+" if p.startswith("{") else re.escape(p) for p in parts)
+    return re.compile(f"^{regex}/?$")
+
+
+class ProfileSession:
+    """Samples collected for one in-flight request"""
+
+    __slots__ = ("id", "method", "path", "started_at", "stacks", "sample_count", "max_concurrent")
+
+    def __init__(self, profile_id: int, method: str, path: str):
+        self.id = profile_id
+        self.method = method
+        self.path = path
+        self.started_at = datetime.now(timezone.utc)
+        self.stacks: Counter = Counter()
+        self.sample_count = 0
+        self.max_concurrent = 1
+
+
+class RequestProfiler:
+    """Sampling profiler toggled by admins, one per worker process"""
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 0.0
+        self.route: Optional[str] = None
+        self._route_re: Optional["re.Pattern"] = None
+        self.interval_ms = DEFAULT_INTERVAL_MS
+        self.expires_at: Optional[datetime] = None
+        self.profiles: Deque[Dict[str, Any]] = deque(maxlen=DEFAULT_MAX_PROFILES)
+
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._active: Dict[int, ProfileSession] = {}
+        self._loop_thread_id: Optional[int] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+
+    # ============================================
+    # CONFIGURATION
+    # ============================================
+
+    def configure(
+        self,
+        sample_rate: float = 0.0,
+        route: Optional[str] = None,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        max_profiles: int = DEFAULT_MAX_PROFILES,
+        duration_minutes: float = DEFAULT_DURATION_MINUTES,
+    ) -> None:
+        """Enable profiling. route alone samples every matching request."""
+        if not route and sample_rate <= 0:
+            raise ValueError("Set a sample_rate > 0 or a route to profile")
+        self.sample_rate = min(sample_rate, 1.0) if sample_rate > 0 else 1.0
+        self.route = route
+        self._route_re = _route_pattern(route) if route else None
+        self.interval_ms = max(int(interval_ms), MIN_INTERVAL_MS)
+        max_profiles = min(max(int(max_profiles), 1), MAX_PROFILES_LIMIT)
+        if max_profiles != self.profiles.maxlen:
+            self.profiles = deque(self.profiles, maxlen=max_profiles)
+        self.expires_at = datetime.now(timezone.utc) + timedelta(minutes=duration_minutes)
+        self.enabled = True
+        logger.info(
+            f"🔬 Request profiler enabled: rate={self.sample_rate} route={route} "
+            f"interval={self.interval_ms}ms until {self.expires_at.isoformat()}"
+        )
+
+    def disable(self) -> None:
+        self.enabled = False
+        logger.info("🔬 Request profiler disabled")
+
+    # ============================================
+    # REQUEST HOOKS (called from the HTTP middleware)
+    # ============================================
+
+    def should_sample(self, path: str) -> bool:
+        if not self.enabled:
+            return False
+        if self.expires_at and datetime.now(timezone.utc) >= self.expires_at:
+            self.disable()
+            return False
+        if self._route_re and not self._route_re.match(path):
+            return False
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def start(self, method: str, path: str) -> ProfileSession:
+        session = ProfileSession(next(self._ids), method, path)
+        with self._lock:
+            self._loop_thread_id = threading.get_ident()
+            self._active[session.id] = session
+            concurrent = len(self._active)
+            for active in self._active.values():
+                active.max_concurrent = max(active.max_concurrent, concurrent)
+        self._ensure_sampler()
+        self._wake.set()
+        return session
+
+    def finish(self, session: ProfileSession, route: str, status_code: int, duration_ms: float) -> None:
+        with self._lock:
+            self._active.pop(session.id, None)
+        self.profiles.append({
+            "id": session.id,
+            "method": session.method,
+            "path": session.path,
+            "route": route,
+            "status_code": status_code,
+            "duration_ms": round(duration_ms, 2),
+            "started_at": session.started_at.isoformat(),
+            "interval_ms": self.interval_ms,
+            "sample_count": session.sample_count,
+            "concurrent_requests": session.max_concurrent,
+            "stacks": session.stacks,
+        })
+
+    # ============================================
+    # SAMPLER THREAD
+    # ============================================
+
+    def _ensure_sampler(self) -> None:
+        if self._sampler and self._sampler.is_alive():
+            return
+        self._sampler = threading.Thread(target=self._sample_loop, name="request-profiler", daemon=True)
+        self._sampler.start()
+
+    def _sample_loop(self) -> None:
+        while True:
+            self._wake.clear()
+            if not self._active:
+                self._wake.wait()
+                continue
+            time.sleep(self.interval_ms / 1000)
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = self._walk(frame)
+            with self._lock:
+                for session in self._active.values():
+                    session.stacks[stack] += 1
+                    session.sample_count += 1
+
+    @staticmethod
+    def _walk(frame) -> Tuple[Frame, ...]:
+        """Root-first stack of (function, file, line) for a frame."""
+        stack: List[Frame] = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+    # ============================================
+    # READ / EXPORT
+    # ============================================
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "route": self.route,
+            "interval_ms": self.interval_ms,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "max_profiles": self.profiles.maxlen,
+            "in_flight": len(self._active),
+            "profiles": [
+                {k: v for k, v in p.items() if k != "stacks"}
+                for p in reversed(self.profiles)
+            ],
+        }
+
+    def get_profile(self, profile_id: int) -> Optional[Dict[str, Any]]:
+        return next((p for p in self.profiles if p["id"] == profile_id), None)
+
+
+def _frame_label(frame: Frame) -> str:
+    name, filename, line = frame
+    return f"{name} ({filename}:{line})"
+
+
+def to_collapsed(profile: Dict[str, Any]) -> str:
+    """Brendan Gregg collapsed-stack format: 'root;child;leaf count' per line."""
+    return "\n".join(
+        f"{';'.join(_frame_label(f) for f in stack)} {count}"
+        for stack, count in profile["stacks"].most_common()
+    ) + "\n"
+
+
+def to_speedscope(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """speedscope file format (sampled profile, weights in milliseconds)."""
+    frame_index: Dict[Frame, int] = {}
+    frames: List[Dict[str, Any]] = []
+    samples: List[List[int]] = []
+    weights: List[float] = []
+
+    for stack, count in profile["stacks"].most_common():
+        indexes = []
+        for frame in stack:
+            if frame not in frame_index:
+                frame_index[frame] = len(frames)
+                frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+            indexes.append(frame_index[frame])
+        samples.append(indexes)
+        weights.append(count * profile["interval_ms"])
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": f"{profile['method']} {profile['route']} ({profile['duration_ms']}ms)",
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+        "name": f"{profile['method']} {profile['path']}",
+        "exporter": "mood-request-profiler",
+    }
+
+
+# Global profiler instance
+_profiler: Optional[RequestProfiler] = None
+
+
+def get_request_profiler() -> RequestProfiler:
+    """Get or create the profiler singleton"""
+    global _profiler
+    if _profiler is None:
+        _profiler = RequestProfiler()
+    return _profiler
@@ -0,0 +1,208 @@
+"""
+Analytics Result Cache
+Short-TTL, single-flight cache for expensive admin dashboard endpoints:
+- Identical concurrent requests share one in-flight computation
+- Results are held for a per-endpoint TTL (env ANALYTICS_CACHE_TTL_<NAME>);
+  results carrying an "error" key are not stored
+- The endpoint body is skipped on a hit, so per-request work (headers, audit)
+  belongs in dependencies
+- Every cached response carries cache_meta (computed_at, age, ttl) so the
+  dashboard can show staleness next to /analytics/admin/data-freshness
+- Hits are rendered straight to orjson (fast_json), skipping jsonable_encoder
+
+Usage:
+    @api_router.get("/analytics/admin/insights")
+    @cached_analytics("insights")
+    async def get_automated_insights(include_internal: bool = False, current_user_id: str = Depends(require_admin)):
+        ...
+"""
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from fast_json import fast_response
+
+logger = logging.getLogger(__name__)
+
+# Default TTLs (seconds) per cached endpoint
+DEFAULT_TTLS = {
+    "comprehensive_stats": 30,
+    "time_series": 60,
+    "insights": 120,
+    "retention": 300,
+}
+FALLBACK_TTL_SECONDS = 30
+
+# Max distinct keys held (oldest evicted first)
+MAX_ENTRIES = 256
+
+# Arguments that identify the caller rather than the query
+_IGNORED_PARAMS = {"current_user_id", "response", "request"}
+
+
+def get_ttl(name: str) -> float:
+    env = os.environ.get(f"ANALYTICS_CACHE_TTL_{name.upper()}")
+    if env is not None:
+        try:
+            return float(env)
+        except ValueError:
+            logger.warning(f"Invalid ANALYTICS_CACHE_TTL_{name.upper()}={env!r}, using default")
+    return DEFAULT_TTLS.get(name, FALLBACK_TTL_SECONDS)
+
+
+class CacheEntry:
+    __slots__ = ("value", "computed_at", "stored_at", "ttl")
+
+    def __init__(self, value: Any, ttl: float):
+        self.value = value
+        self.computed_at = datetime.now(timezone.utc)
+        self.stored_at = time.monotonic()
+        self.ttl = ttl
+
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+    def is_fresh(self) -> bool:
+        return self.age() < self.ttl
+
+
+class ResultCache:
+    """Keyed TTL cache with single-flight computation"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _meta(self, entry: CacheEntry, cached: bool, coalesced: bool = False) -> Dict[str, Any]:
+        age = entry.age()
+        return {
+            "cached": cached,
+            "coalesced": coalesced,
+            "computed_at": entry.computed_at.isoformat(),
+            "age_seconds": round(age, 2),
+            "ttl_seconds": entry.ttl,
+            "expires_in_seconds": round(max(entry.ttl - age, 0), 2),
+        }
+
+    async def get_or_compute(
+        self,
+        key: str,
+        ttl: float,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Return (value, cache_meta). Errors (raised or {"error": ...}) are never cached."""
+        entry = self._entries.get(key)
+        if entry and entry.is_fresh():
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry.value, self._meta(entry, cached=True)
+
+        # Single flight: the computation runs in its own task, so a client
+        # disconnecting (cancelling its request) does not cancel it for others
+        inflight = self._inflight.get(key)
+        coalesced = inflight is not None
+        if coalesced:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            inflight = asyncio.ensure_future(self._compute(key, ttl, compute))
+            self._inflight[key] = inflight
+        entry = await asyncio.shield(inflight)
+        return entry.value, self._meta(entry, cached=coalesced, coalesced=coalesced)
+
+    async def _compute(self, key: str, ttl: float, compute: Callable[[], Awaitable[Any]]) -> CacheEntry:
+        try:
+            entry = CacheEntry(await compute(), ttl)
+            # Endpoints that catch their own failures return {"error": ...}; don't serve it for the TTL
+            failed = isinstance(entry.value, dict) and "error" in entry.value
+            if ttl > 0 and not failed:
+                self._store(key, entry)
+            return entry
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Drop entries whose key starts with prefix (all entries by default)."""
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "entries": [
+                {"key": key, **self._meta(entry, cached=True), "fresh": entry.is_fresh()}
+                for key, entry in reversed(self._entries.items())
+            ],
+            "in_flight": list(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "ttls": {name: get_ttl(name) for name in DEFAULT_TTLS},
+        }
+
+
+# Global cache instance
+_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Get or create the result cache singleton"""
+    global _cache
+    if _cache is None:
+        _cache = ResultCache()
+    return _cache
+
+
+def cached_analytics(name: str):
+    """
+    Cache a FastAPI endpoint's dict result under name + its query arguments.
+    Auth dependencies still run on every request; only the body is shared.
+    Headers set on the injected Response (by dependencies, since the body may
+    not run) are copied onto the rendered response.
+    The wrapper keeps the endpoint signature so FastAPI sees the same params.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind_partial(*args, **kwargs)
+            bound.apply_defaults()
+            key_parts = sorted(
+                (k, v) for k, v in bound.arguments.items() if k not in _IGNORED_PARAMS
+            )
+            key = f"{name}:" + "&".join(f"{k}={v!r}" for k, v in key_parts)
+
+            value, meta = await get_result_cache().get_or_compute(
+                key, get_ttl(name), lambda: func(*args, **kwargs)
+            )
+            # Cached results are already plain data; render without jsonable_encoder
+            if isinstance(value, dict):
+                rendered = fast_response({**value, "cache_meta": meta})
+                # FastAPI only merges the injected Response into results it renders itself
+                injected = bound.arguments.get("response")
+                if injected is not None:
+                    rendered.headers.raw.extend(injected.headers.raw)
+                    if injected.status_code:
+                        rendered.status_code = injected.status_code
+                return rendered
+            return value
+
+        return wrapper
+    return decorator
@@ -0,0 +1,176 @@
+"""
+Seed Catalogs
+Exercise library and featured workouts shipped with the app:
+- The catalogs live in seed_catalog.json and are parsed on first use, not at
+  import time, so importing server.py stays cheap
+- sync_seed_catalogs() upserts each catalog by its stable key (exercise name,
+  workout title) and records a content hash in system.seed_catalogs; a boot
+  whose catalog hash matches the recorded one does one read and no writes
+- Nothing is ever deleted: exercises added through the admin panel survive a
+  reseed, and featured_config only points at the catalog's workouts
+
+CLI (one-shot step for deploy pipelines, with STARTUP_TASKS=off on pods):
+    python seed_catalog.py            # seed catalogs whose content changed
+    python seed_catalog.py --force    # upsert every catalog regardless of hash
+"""
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = Path(__file__).parent / "seed_catalog.json"
+
+# system collection document holding the applied hash per catalog
+SEED_STATE_ID = "seed_catalogs"
+
+
+@functools.lru_cache(maxsize=1)
+def load_catalog() -> Dict[str, List[Dict[str, Any]]]:
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def get_exercises() -> List[Dict[str, Any]]:
+    return load_catalog()["exercises"]
+
+
+def get_featured_workouts() -> List[Dict[str, Any]]:
+    return load_catalog()["featured_workouts"]
+
+
+@functools.lru_cache(maxsize=None)
+def catalog_hash(name: str) -> str:
+    """Content hash of one catalog, independent of key order and formatting."""
+    canonical = json.dumps(load_catalog()[name], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ============================================
+# SEEDING
+# ============================================
+
+async def seed_exercises(db: AsyncIOMotorDatabase) -> int:
+    """Upsert every catalog exercise by name in one bulk write; returns docs changed."""
+    now = datetime.now(timezone.utc)
+    operations = [
+        UpdateOne(
+            {"name": ex["name"]},
+            {"$set": {**ex, "updated_at": now}, "$setOnInsert": {"created_at": now}},
+            upsert=True
+        )
+        for ex in get_exercises() if ex.get("name")
+    ]
+    result = await db.exercises.bulk_write(operations, ordered=False)
+    return result.upserted_count + result.modified_count
+
+
+async def seed_featured_workouts(db: AsyncIOMotorDatabase) -> List[str]:
+    """Upsert featured workouts by title and point featured_config at them, in catalog order."""
+    now = datetime.now(timezone.utc)
+    workouts = [w for w in get_featured_workouts() if w.get("title")]
+    operations = []
+    for workout in workouts:
+        workout_data = {k: v for k, v in workout.items() if k != "_id"}
+        operations.append(UpdateOne(
+            {"title": workout["title"]},
+            {"$set": {**workout_data, "updated_at": now}, "$setOnInsert": {"created_at": now}},
+            upsert=True
+        ))
+    await db.featured_workouts.bulk_write(operations, ordered=False)
+
+    titles = [w["title"] for w in workouts]
+    stored = await db.featured_workouts.find({"title": {"$in": titles}}, {"title": 1}).to_list(len(titles) * 2)
+    id_by_title = {w["title"]: str(w["_id"]) for w in stored}
+    workout_ids = [id_by_title[t] for t in titles if t in id_by_title]
+
+    await db.featured_config.update_one(
+        {"_id": "main"},
+        {"$set": {
+            "schemaVersion": 1,
+            "featuredWorkoutIds": workout_ids,
+            "ttlHours": 12,
+            "updatedAt": now.isoformat()
+        }},
+        upsert=True
+    )
+    return workout_ids
+
+
+SEEDERS = {
+    "exercises": seed_exercises,
+    "featured_workouts": seed_featured_workouts,
+}
+
+
+async def _sync_catalog(db: AsyncIOMotorDatabase, name: str, applied_hash: str, force: bool) -> Dict[str, Any]:
+    current_hash = catalog_hash(name)
+    # Re-seed an emptied collection even if the hash matches (e.g. a wiped staging DB)
+    if not force and applied_hash == current_hash and await db[name].count_documents({}, limit=1):
+        return {"seeded": False, "hash": current_hash}
+
+    result = await SEEDERS[name](db)
+    await db.system.update_one(
+        {"_id": SEED_STATE_ID},
+        {"$set": {
+            f"catalogs.{name}.hash": current_hash,
+            f"catalogs.{name}.applied_at": datetime.now(timezone.utc).isoformat(),
+        }},
+        upsert=True
+    )
+    count = result if isinstance(result, int) else len(result)
+    logger.info(f"🌱 Seeded {name}: {count} upserted/updated (hash {current_hash[:12]})")
+    return {"seeded": True, "hash": current_hash, "count": count}
+
+
+async def sync_seed_catalogs(db: AsyncIOMotorDatabase, force: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Seed every catalog whose content hash differs from the applied one, concurrently."""
+    state = await db.system.find_one({"_id": SEED_STATE_ID}) or {}
+    applied = state.get("catalogs", {})
+    names = list(SEEDERS)
+    results = await asyncio.gather(
+        *(_sync_catalog(db, name, applied.get(name, {}).get("hash"), force) for name in names),
+        return_exceptions=True
+    )
+
+    report: Dict[str, Dict[str, Any]] = {}
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.error(f"❌ Seeding {name} failed: {result}")
+            report[name] = {"seeded": False, "error": str(result)}
+        else:
+            report[name] = result
+    skipped = [name for name, r in report.items() if r.get("seeded") is False and "error" not in r]
+    if skipped:
+        logger.info(f"✅ Seed catalogs unchanged: {', '.join(skipped)}")
+    return report
+
+
+async def _main(force: bool) -> int:
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ.get('MONGO_URL', 'mongodb://localhost:27017'))
+    db = client[os.environ.get('DB_NAME', 'mood_app')]
+    try:
+        report = await sync_seed_catalogs(db, force=force)
+        for name, result in report.items():
+            print(f"{name:20} {result}")
+        return 1 if any("error" in r for r in report.values()) else 0
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(_main("--force" in sys.argv[1:])))
@@ -1,6 +1,6 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, Request, Response, Header
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, Request, Response, Header, WebSocket, WebSocketDisconnect
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
@@ -14,13 +14,13 @@ import uuid
 from datetime import datetime, timezone, timedelta
 from bson import ObjectId
 import jwt
-import bcrypt
+import asyncio
 import base64
 import aiofiles
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
 import re
+import csv
+import io
+import json
 from auth import (
     exchange_session_id_for_token,
     create_or_update_user,
@@ -43,6 +43,10 @@ from auth_tracking import (
 )
 from user_analytics import (
     track_user_event,
+    stamp_event_audience,
+    audience_filter,
+    backfill_event_audience,
+    sync_event_audience,
     get_user_activity_summary,
     get_feature_usage_stats,
     get_workout_analytics,
@@ -67,6 +71,9 @@ from admin_analytics import (
     get_user_timeline,
     get_comparison_stats,
     get_engagement_metrics,
+    iter_user_export_rows,
+    USER_EXPORT_FIELDS,
+    USER_EXPORT_JSON_LIMIT,
 )
 from content_moderation import (
     check_content,
@@ -87,17 +94,108 @@ from notification_worker import (
     start_notification_worker,
     stop_notification_worker,
 )
-from seed_data import PREVIEW_FEATURED_WORKOUTS, FEATURED_WORKOUT_IDS
-from exercises_seed_data import PREVIEW_EXERCISES
+from query_batch import QueryBatch
+from index_registry import sync_indexes
+from request_metrics import (
+    db_command_listener,
+    begin_request,
+    end_request,
+    render_prometheus,
+)
+from password_hashing import (
+    get_password_hasher,
+    hash_password,
+    verify_password,
+    rehash_if_needed,
+    PasswordHashingBusy,
+)
+from request_profiler import get_request_profiler, to_speedscope, to_collapsed
+from result_cache import cached_analytics, get_result_cache
+from fast_json import MoodJSONResponse, fast_json
+from block_cache import get_block_cache, get_blocked_user_ids, blocked_nin, id_variants
+from comment_threads import (
+    build_thread_fields,
+    record_reply,
+    delete_comment_subtree,
+    hydrate_comments,
+    get_post_thread,
+    get_comment_subtree,
+    backfill_comment_paths,
+    sync_comment_paths,
+)
+from deletion_jobs import (
+    get_deletion_job_runner,
+    start_deletion_job_runner,
+    stop_deletion_job_runner,
+    JOB_ACCOUNT_DELETION,
+    JOB_POST_REMOVAL,
+    POST_REMOVAL_INLINE_LIMIT,
+    post_removal_query,
+    sync_author_post_counts,
+    remove_posts,
+    recount_followers,
+    recount_following,
+)
+from log_writer import (
+    get_log_writer,
+    start_log_writer,
+    stop_log_writer,
+)
+from realtime import (
+    get_realtime_hub,
+    start_realtime_hub,
+    stop_realtime_hub,
+    publish_event,
+    encode_event,
+    EVENT_MESSAGE,
+    EVENT_HELLO,
+)
+from unread_counters import (
+    NOTIFICATIONS,
+    MESSAGES,
+    get_unread,
+    get_unread_reconciler,
+    start_unread_reconciler,
+    stop_unread_reconciler,
+)
+from presence import (
+    get_presence_registry,
+    start_presence_registry,
+    stop_presence_registry,
+)
+from inbox import (
+    get_inbox,
+    get_inbox_unread_total,
+    record_conversation,
+    record_message,
+    mark_conversation_read,
+    refresh_user_snapshot,
+)
+from log_config import (
+    configure_logging,
+    stop_logging,
+    bind_request_id,
+    reset_request_id,
+    get_logging_status,
+    get_request_id,
+)
+from seed_catalog import get_exercises, get_featured_workouts, sync_seed_catalogs
+from analytics_db import get_analytics_db, close_analytics_client, get_analytics_db_status
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Queue-backed, sampled logging (see log_config); configured before anything logs
+configure_logging()
+
 # MongoDB connection
 mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, event_listeners=[db_command_listener])
 db = client[os.environ.get('DB_NAME', 'mood_app')]
 
+# Analytics reads (dashboards, stats, exports) use their own pool on secondaries
+analytics_db = get_analytics_db(event_listeners=[db_command_listener])
+
 # JWT Configuration
 JWT_SECRET = os.environ.get('JWT_SECRET', 'mood-app-secret-key-2025')
 JWT_ALGORITHM = 'HS256'
@@ -254,6 +352,7 @@ async def send_welcome_message(new_user_id: str):
             }
             result = await db.conversations.insert_one(conversation)
             conversation_id = str(result.inserted_id)
+            await record_conversation(db, conversation_id, conversation["participants"], conversation["created_at"])
         
         # Create the welcome message
         message = {
@@ -276,74 +375,16 @@ async def send_welcome_message(new_user_id: str):
                 }
             }
         )
+        await record_message(
+            db, conversation_id, [admin_id, new_user_id], admin_id,
+            WELCOME_MESSAGE_TEXT[:50] + "...", message["created_at"]
+        )
         
         logger.info(f"Welcome message sent to new user {new_user_id}")
         
     except Exception as e:
         logger.error(f"Failed to send welcome message to user {new_user_id}: {e}")
 
-async def auto_seed_featured_workouts():
-    """
-    Auto-seed featured workouts on startup.
-    FORCE REPLACES if the existing workouts don't match preview data.
-    Called on startup to ensure correct data.
-    """
-    try:
-        existing_count = await db.featured_workouts.count_documents({})
-        
-        # Check if we have the correct workouts by checking titles
-        expected_titles = {w["title"] for w in PREVIEW_FEATURED_WORKOUTS}
-        existing_workouts = await db.featured_workouts.find({}).to_list(100)
-        existing_titles = {w.get("title") for w in existing_workouts}
-        
-        # If titles don't match, we need to force replace
-        needs_replacement = not expected_titles.issubset(existing_titles)
-        
-        if existing_count < len(PREVIEW_FEATURED_WORKOUTS) or needs_replacement:
-            logger.info(f"🌱 Auto-seeding featured workouts (found {existing_count}, titles match: {not needs_replacement})")
-            
-            # Delete old workouts if we're replacing
-            if needs_replacement:
-                await db.featured_workouts.delete_many({})
-                logger.info(f"🗑️ Deleted old featured workouts for replacement")
-            
-            inserted_ids = []
-            for workout in PREVIEW_FEATURED_WORKOUTS:
-                workout_data = {**workout, "created_at": datetime.now(timezone.utc)}
-                # Remove _id from data to insert
-                workout_data.pop("_id", None)
-                
-                # Check if workout with same title exists
-                existing = await db.featured_workouts.find_one({"title": workout["title"]})
-                if not existing:
-                    result = await db.featured_workouts.insert_one(workout_data)
-                    inserted_ids.append(str(result.inserted_id))
-                else:
-                    inserted_ids.append(str(existing["_id"]))
-            
-            # Update featured config with the workout IDs
-            await db.featured_config.update_one(
-                {"_id": "main"},
-                {
-                    "$set": {
-                        "schemaVersion": 1,
-                        "featuredWorkoutIds": inserted_ids,
-                        "ttlHours": 12,
-                        "updatedAt": datetime.now(timezone.utc).isoformat()
-                    }
-                },
-                upsert=True
-            )
-            
-            logger.info(f"✅ Auto-seeded {len(inserted_ids)} featured workouts")
-            return {"seeded": True, "count": len(inserted_ids)}
-        else:
-            logger.info(f"✅ Featured workouts already seeded ({existing_count} found, correct titles)")
-            return {"seeded": False, "count": existing_count}
-    except Exception as e:
-        logger.error(f"❌ Failed to auto-seed featured workouts: {e}")
-        return {"seeded": False, "error": str(e)}
-
 async def auto_grant_admin_for_staging(user_id: str, username: str):
     """
     Auto-grant admin access in staging environments for designated users.
@@ -356,85 +397,85 @@ async def auto_grant_admin_for_staging(user_id: str, username: str):
         return False
     
     try:
-        user = await db.users.find_one({"_id": ObjectId(user_id)})
-        if user and not user.get("is_admin"):
-            await db.users.update_one(
-                {"_id": ObjectId(user_id)},
-                {"$set": {"is_admin": True}}
-            )
+        result = await db.users.update_one(
+            {"_id": ObjectId(user_id), "is_admin": {"$ne": True}},
+            {"$set": {"is_admin": True}}
+        )
+        if result.modified_count:
             logger.info(f"🔑 Auto-granted admin access to {username} (staging mode)")
             return True
-        return user.get("is_admin", False) if user else False
+        return result.matched_count == 0 and await db.users.count_documents({"_id": ObjectId(user_id)}, limit=1) > 0
     except Exception as e:
         logger.error(f"❌ Failed to auto-grant admin: {e}")
         return False
 
-async def auto_seed_exercises():
-    """
-    Auto-seed exercises if collection is empty or has fewer than expected.
-    Uses the exact exercise data from the preview environment.
-    """
-    try:
-        existing_count = await db.exercises.count_documents({})
-        
-        # If we have significantly fewer exercises than preview, seed them
-        if existing_count < len(PREVIEW_EXERCISES) * 0.9:  # Allow 10% variance
-            logger.info(f"🌱 Auto-seeding exercises (found {existing_count}, need {len(PREVIEW_EXERCISES)})")
-            
-            # Delete existing and insert preview exercises
-            await db.exercises.delete_many({})
-            
-            exercises_to_insert = []
-            for ex in PREVIEW_EXERCISES:
-                ex_data = {**ex, "created_at": datetime.now(timezone.utc)}
-                exercises_to_insert.append(ex_data)
-            
-            await db.exercises.insert_many(exercises_to_insert)
-            logger.info(f"✅ Auto-seeded {len(exercises_to_insert)} exercises")
-            return {"seeded": True, "count": len(exercises_to_insert)}
-        else:
-            logger.info(f"✅ Exercises already seeded ({existing_count} found)")
-            return {"seeded": False, "count": existing_count}
-    except Exception as e:
-        logger.error(f"❌ Failed to auto-seed exercises: {e}")
-        return {"seeded": False, "error": str(e)}
-
 # Terms of Service Version - Update this when terms change to force re-acceptance
 # Format: YYYY-MM-DD
 CURRENT_TERMS_VERSION = "2025-01-19"
 
-# Cloudinary Configuration
-cloudinary.config(
-    cloud_name=os.environ.get('CLOUDINARY_CLOUD_NAME'),
-    api_key=os.environ.get('CLOUDINARY_API_KEY'),
-    api_secret=os.environ.get('CLOUDINARY_API_SECRET'),
-    secure=True
-)
+# Cloudinary Configuration (SDK imported on first upload, not at boot)
+_cloudinary = None
+
+def get_cloudinary():
+    """The configured cloudinary module (with uploader and api loaded)"""
+    global _cloudinary
+    if _cloudinary is None:
+        import cloudinary
+        import cloudinary.uploader
+        import cloudinary.api
+        cloudinary.config(
+            cloud_name=os.environ.get('CLOUDINARY_CLOUD_NAME'),
+            api_key=os.environ.get('CLOUDINARY_API_KEY'),
+            api_secret=os.environ.get('CLOUDINARY_API_SECRET'),
+            secure=True
+        )
+        _cloudinary = cloudinary
+        logger.info(f"✅ Cloudinary configured with cloud: {os.environ.get('CLOUDINARY_CLOUD_NAME')}")
+    return _cloudinary
 
 logger = logging.getLogger(__name__)
-logger.info(f"✅ Cloudinary configured with cloud: {os.environ.get('CLOUDINARY_CLOUD_NAME')}")
 
 import time
 
 # Create the main app
-app = FastAPI()
+app = FastAPI(default_response_class=MoodJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # Response time logging middleware
 @app.middleware("http")
 async def log_response_time(request: Request, call_next):
     start_time = time.time()
-    response = await call_next(request)
-    process_time = (time.time() - start_time) * 1000  # Convert to ms
-    
-    # Log slow requests (> 500ms)
-    if process_time > 500:
-        logger.warning(f"SLOW REQUEST: {request.method} {request.url.path} took {process_time:.2f}ms")
-    elif process_time > 200:
-        logger.info(f"Request: {request.method} {request.url.path} took {process_time:.2f}ms")
-    
-    response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
-    return response
+    # Request id tags every log line of this request and is echoed back to the client
+    request_id_token = bind_request_id(request.headers.get("X-Request-ID"))
+    try:
+        db_stats, metrics_token = begin_request()
+        profiler = get_request_profiler()
+        profile = profiler.start(request.method, request.url.path) if profiler.should_sample(request.url.path) else None
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            elapsed = time.time() - start_time
+            end_request(request, status_code, elapsed, db_stats, metrics_token)
+            if profile:
+                route = getattr(request.scope.get("route"), "path", request.url.path)
+                profiler.finish(profile, route, status_code, elapsed * 1000)
+        process_time = elapsed * 1000  # Convert to ms
+        db_summary = f"db: {db_stats.commands} cmds, {db_stats.db_seconds * 1000:.2f}ms, {db_stats.documents} docs"
+        
+        # Log slow requests (> 500ms)
+        if process_time > 500:
+            logger.warning(f"SLOW REQUEST: {request.method} {request.url.path} took {process_time:.2f}ms ({db_summary})")
+        elif process_time > 200:
+            logger.info(f"Request: {request.method} {request.url.path} took {process_time:.2f}ms ({db_summary})")
+        
+        response.headers["X-Request-ID"] = get_request_id()
+        response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
+        response.headers["X-DB-Time"] = f"{db_stats.db_seconds * 1000:.2f}ms"
+        return response
+    finally:
+        reset_request_id(request_id_token)
 
 # Root-level health check for Kubernetes deployment
 @app.get("/health")
@@ -447,6 +488,21 @@ async def root_health_check():
     except Exception as e:
         return {"status": "healthy", "database": "disconnected", "error": str(e)}
 
+# Prometheus scrape endpoint (per-route latency + DB attribution)
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+@app.get("/metrics")
+async def prometheus_metrics(authorization: Optional[str] = Header(None)):
+    """Per-route latency histograms and DB time in Prometheus text format"""
+    if METRICS_TOKEN and authorization != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    payload = (
+        render_prometheus()
+        + get_password_hasher().render_prometheus()
+        + get_log_writer(db).render_prometheus()
+    )
+    return PlainTextResponse(payload, media_type="text/plain; version=0.0.4")
+
 # Security
 security = HTTPBearer()
 
@@ -462,7 +518,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     try:
         payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         user_id = payload.get('user_id')
-        logger.info(f"🔐 Auth: Decoded user_id from token: {user_id}")
+        logger.debug(f"🔐 Auth: Decoded user_id from token: {user_id}")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
         
@@ -471,22 +527,22 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         
         # First try to find by custom user_id field
         user = await db.users.find_one({"user_id": user_id})
-        logger.info(f"🔐 Auth: Found by user_id field: {user is not None}")
+        logger.debug(f"🔐 Auth: Found by user_id field: {user is not None}")
         
         # If not found, try ObjectId (for legacy users)
         if not user:
             try:
                 user = await db.users.find_one({"_id": ObjectId(user_id)})
-                logger.info(f"🔐 Auth: Found by ObjectId: {user is not None}")
+                logger.debug(f"🔐 Auth: Found by ObjectId: {user is not None}")
             except Exception as e:
-                logger.info(f"🔐 Auth: ObjectId lookup error: {e}")
+                logger.debug(f"🔐 Auth: ObjectId lookup error: {e}")
                 pass  # Invalid ObjectId format, skip
         
         if not user:
             logger.warning(f"🔐 Auth: User not found for id: {user_id}")
             raise HTTPException(status_code=401, detail="User not found")
         
-        logger.info(f"🔐 Auth: Authenticated user: {user.get('username')}")
+        logger.debug(f"🔐 Auth: Authenticated user: {user.get('username')}")
         # ALWAYS return the MongoDB ObjectId for consistency across all operations
         return str(user["_id"])
     except jwt.InvalidTokenError:
@@ -544,10 +600,22 @@ async def require_admin(current_user_id: str = Depends(get_current_user)) -> str
     return current_user_id
 
 
+async def require_admin_header(response: Response, current_user_id: str = Depends(require_admin)) -> str:
+    """
+    require_admin that also sets X-Admin-Effective. Runs per request, so the
+    header is present even when a cached endpoint body is skipped.
+    """
+    response.headers["X-Admin-Effective"] = "true"
+    return current_user_id
+
+
 # ============================================
 # ADMIN AUDIT LOGGING
 # ============================================
 
+# admin_user_id -> username (admins are few; saves a users read per audited call)
+_admin_usernames: Dict[str, str] = {}
+
 async def log_admin_action(
     admin_user_id: str,
     action: str,
@@ -566,8 +634,11 @@ async def log_admin_action(
     """
     try:
         # Get admin username
-        admin_user = await db.users.find_one({"_id": ObjectId(admin_user_id)})
-        admin_username = admin_user.get("username", "unknown") if admin_user else "unknown"
+        admin_username = _admin_usernames.get(admin_user_id)
+        if admin_username is None:
+            admin_user = await db.users.find_one({"_id": ObjectId(admin_user_id)}, {"username": 1})
+            admin_username = admin_user.get("username", "unknown") if admin_user else "unknown"
+            _admin_usernames[admin_user_id] = admin_username
         
         audit_log = {
             "timestamp_utc": datetime.now(timezone.utc),
@@ -584,7 +655,7 @@ async def log_admin_action(
             "user_agent": user_agent,
         }
         
-        await db.admin_audit_logs.insert_one(audit_log)
+        get_log_writer(db).append("admin_audit_logs", audit_log)
         logger.info(f"📋 Admin audit: {admin_username} - {action} - {result_summary}")
     except Exception as e:
         logger.error(f"Failed to log admin action: {e}")
@@ -812,8 +883,11 @@ async def register(user_data: UserCreate):
     if existing_user:
         raise HTTPException(status_code=400, detail="Username or email already exists")
     
-    # Hash password
-    hashed_password = bcrypt.hashpw(user_data.password.encode(), bcrypt.gensalt()).decode()
+    # Hash password (off the event loop)
+    try:
+        hashed_password = await hash_password(user_data.password)
+    except PasswordHashingBusy:
+        raise HTTPException(status_code=503, detail="Server busy, please try again")
     
     # Create user with generated user_id (kept for backwards compatibility)
     custom_user_id = f"user_{uuid.uuid4().hex[:12]}"
@@ -845,7 +919,7 @@ async def register(user_data: UserCreate):
     mongodb_id = str(result.inserted_id)
     
     # Track user signup event
-    await db.user_events.insert_one({
+    signup_event = {
         "user_id": mongodb_id,
         "event_type": "user_registered",
         "timestamp": datetime.now(timezone.utc),
@@ -854,7 +928,9 @@ async def register(user_data: UserCreate):
             "email": user_data.email,
             "registration_method": "email_password"
         }
-    })
+    }
+    await stamp_event_audience(db, signup_event)
+    await db.user_events.insert_one(signup_event)
     logger.info(f"New user registered: {user_data.username} ({user_data.email})")
     
     # Send welcome message from officialmoodapp
@@ -908,10 +984,7 @@ async def login(login_data: UserLogin, request: Request):
             if not stored_password:
                 raise HTTPException(status_code=401, detail="Invalid credentials")
             
-            if isinstance(stored_password, bytes):
-                password_match = bcrypt.checkpw(login_data.password.encode(), stored_password)
-            else:
-                password_match = bcrypt.checkpw(login_data.password.encode(), stored_password.encode())
+            password_match = await verify_password(login_data.password, stored_password)
             
             logger.info(f"Password match result: {password_match}")
             if not password_match:
@@ -924,6 +997,8 @@ async def login(login_data: UserLogin, request: Request):
                 raise HTTPException(status_code=401, detail="Invalid credentials")
         except HTTPException:
             raise
+        except PasswordHashingBusy:
+            raise HTTPException(status_code=503, detail="Server busy, please try again")
         except Exception as e:
             logger.error(f"Password verification error: {e}")
             await track_login_event(
@@ -932,6 +1007,12 @@ async def login(login_data: UserLogin, request: Request):
             )
             raise HTTPException(status_code=401, detail="Invalid credentials")
         
+        # Upgrade the stored hash if BCRYPT_ROUNDS changed since it was made
+        try:
+            await rehash_if_needed(db, user, login_data.password)
+        except Exception as e:
+            logger.warning(f"Password rehash skipped for {user_id}: {e}")
+        
         # Generate JWT token
         token = create_jwt_token(str(user["_id"]))
         
@@ -1159,7 +1240,7 @@ async def apple_sign_in(
         await track_login_event(db, mongodb_id, "apple", True, get_client_ip(request), get_user_agent(request))
         
         # Create session record
-        await create_session_record(db, mongodb_id, session_token, get_client_ip(request), get_user_agent(request))
+        await create_session_record(db, mongodb_id, session_token, "apple", get_client_ip(request), get_user_agent(request))
         
         # Set cookie
         response.set_cookie(
@@ -1369,6 +1450,7 @@ async def track_guest_event(request: GuestTrackEventRequest):
             "merged_to_user_id": None,  # Will be set when guest signs up
             "timestamp": datetime.now(timezone.utc),
         }
+        await stamp_event_audience(db, guest_event)
         
         await db.user_events.insert_one(guest_event)
         logger.info(f"📊 Guest event tracked: {request.event_type} for device {request.device_id[:8]}...")
@@ -1423,7 +1505,7 @@ async def get_activity_summary(
     """
     Get user activity summary for the past N days
     """
-    summary = await get_user_activity_summary(db, current_user_id, days)
+    summary = await get_user_activity_summary(analytics_db, current_user_id, days)
     return summary
 
 
@@ -1435,7 +1517,7 @@ async def get_feature_usage(
     """
     Get feature usage statistics
     """
-    stats = await get_feature_usage_stats(db, current_user_id, days)
+    stats = await get_feature_usage_stats(analytics_db, current_user_id, days)
     return stats
 
 
@@ -1447,7 +1529,7 @@ async def get_workout_stats(
     """
     Get workout analytics
     """
-    analytics = await get_workout_analytics(db, current_user_id, days)
+    analytics = await get_workout_analytics(analytics_db, current_user_id, days)
     return analytics
 
 
@@ -1459,7 +1541,7 @@ async def get_social_stats(
     """
     Get social engagement statistics
     """
-    stats = await get_social_engagement_stats(db, current_user_id, days)
+    stats = await get_social_engagement_stats(analytics_db, current_user_id, days)
     return stats
 
 
@@ -1471,7 +1553,7 @@ async def get_journey(
     """
     Get user activity timeline/journey
     """
-    journey = await get_user_journey(db, current_user_id, limit)
+    journey = await get_user_journey(analytics_db, current_user_id, limit)
     return {"journey": journey, "total": len(journey)}
 
 
@@ -1495,7 +1577,7 @@ async def get_platform_stats(
     if not is_admin:
         raise HTTPException(status_code=403, detail=f"Admin access required - not in allowlist (checked: {matched_by})")
     
-    stats = await get_admin_analytics(db, days, include_internal)
+    stats = await get_admin_analytics(analytics_db, days, include_internal)
     return stats
 
 
@@ -1504,13 +1586,14 @@ async def get_platform_stats(
 # ============================================
 
 @api_router.get("/analytics/admin/time-series/{metric_type}")
+@cached_analytics("time_series")
 async def get_time_series_analytics(
     metric_type: str,
     response: Response,
     period: str = "day",  # day, week, month
     limit: int = 30,
     include_internal: bool = False,
-    current_user_id: str = Depends(require_admin)
+    current_user_id: str = Depends(require_admin_header)
 ):
     """
     Get time-series data for various metrics.
@@ -1531,20 +1614,9 @@ async def get_time_series_analytics(
     - limit: Number of data points (default: 30)
     - include_internal: Include internal/staff users (default: false)
     """
-    # Admin check
-    is_admin, matched_by = await is_admin_effective(current_user_id)
-    response.headers["X-Admin-Effective"] = str(is_admin).lower()
-    if not is_admin:
-        raise HTTPException(status_code=403, detail=f"Admin access required - not in allowlist (checked: {matched_by})")
-    
     from collections import defaultdict
     from admin_analytics import get_internal_user_ids
     
-    # Get internal user IDs to exclude
-    excluded_user_ids = set()
-    if not include_internal:
-        excluded_user_ids = await get_internal_user_ids(db)
-    
     # Determine time grouping
     if period == "month":
         days_back = 365
@@ -1558,17 +1630,15 @@ async def get_time_series_analytics(
     
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
     
-    # Build base query filter for exclusion
-    base_filter = {"timestamp": {"$gte": cutoff}}
-    if excluded_user_ids:
-        base_filter["user_id"] = {"$nin": list(excluded_user_ids)}
+    # Build base query filter for exclusion (ingestion-time is_internal stamp)
+    base_filter = {**audience_filter(include_internal), "timestamp": {"$gte": cutoff}}
     
     try:
         data_by_period = defaultdict(lambda: {"count": 0, "value": 0})
         
         if metric_type == "active_users":
             # Count unique users per period
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 base_filter,
                 {"user_id": 1, "timestamp": 1}
             ).to_list(100000)
@@ -1584,7 +1654,7 @@ async def get_time_series_analytics(
                 
         elif metric_type == "app_sessions":
             query = {**base_filter, "event_type": "app_session_start"}
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 query,
                 {"timestamp": 1}
             ).to_list(100000)
@@ -1596,7 +1666,7 @@ async def get_time_series_analytics(
                     
         elif metric_type == "screen_views":
             query = {**base_filter, "event_type": {"$in": ["screen_viewed", "screen_entered"]}}
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 query,
                 {"timestamp": 1}
             ).to_list(100000)
@@ -1608,7 +1678,7 @@ async def get_time_series_analytics(
                     
         elif metric_type == "screen_time":
             query = {**base_filter, "event_type": "screen_time_spent"}
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 query,
                 {"timestamp": 1, "metadata": 1}
             ).to_list(100000)
@@ -1622,7 +1692,7 @@ async def get_time_series_analytics(
                     
         elif metric_type == "workouts_started":
             query = {**base_filter, "event_type": "workout_started"}
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 query,
                 {"timestamp": 1}
             ).to_list(100000)
@@ -1634,7 +1704,7 @@ async def get_time_series_analytics(
                     
         elif metric_type == "workouts_completed":
             query = {**base_filter, "event_type": "workout_completed"}
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 query,
                 {"timestamp": 1}
             ).to_list(100000)
@@ -1646,7 +1716,7 @@ async def get_time_series_analytics(
                     
         elif metric_type == "mood_selections":
             query = {**base_filter, "event_type": "mood_selected"}
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 query,
                 {"timestamp": 1, "metadata": 1}
             ).to_list(100000)
@@ -1659,9 +1729,10 @@ async def get_time_series_analytics(
         elif metric_type == "posts_created":
             # For posts, we need to filter by author_id
             posts_filter = {"created_at": {"$gte": cutoff}}
+            excluded_user_ids = set() if include_internal else await get_internal_user_ids(analytics_db)
             if excluded_user_ids:
                 posts_filter["author_id"] = {"$nin": [ObjectId(uid) for uid in excluded_user_ids if len(uid) == 24]}
-            posts = await db.posts.find(
+            posts = await analytics_db.posts.find(
                 posts_filter,
                 {"created_at": 1}
             ).to_list(100000)
@@ -1674,7 +1745,7 @@ async def get_time_series_analytics(
         elif metric_type == "social_interactions":
             # Likes, comments, follows
             query = {**base_filter, "event_type": {"$in": ["post_liked", "post_commented", "user_followed"]}}
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 query,
                 {"timestamp": 1, "event_type": 1}
             ).to_list(100000)
@@ -1689,7 +1760,7 @@ async def get_time_series_analytics(
             users_filter = {"created_at": {"$gte": cutoff}}
             if not include_internal:
                 users_filter["is_internal"] = {"$ne": True}
-            users = await db.users.find(
+            users = await analytics_db.users.find(
                 users_filter,
                 {"created_at": 1}
             ).to_list(100000)
@@ -1777,7 +1848,7 @@ async def get_metric_breakdown(
     
     try:
         if metric_type == "screen_views":
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 {"timestamp": {"$gte": cutoff}, "event_type": {"$in": ["screen_viewed", "screen_entered"]}},
                 {"metadata": 1}
             ).to_list(100000)
@@ -1791,7 +1862,7 @@ async def get_metric_breakdown(
             return {"metric_type": metric_type, "items": items, "total": sum(breakdown.values())}
             
         elif metric_type == "mood_selections":
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 {"timestamp": {"$gte": cutoff}, "event_type": "mood_selected"},
                 {"metadata": 1}
             ).to_list(100000)
@@ -1813,7 +1884,7 @@ async def get_metric_breakdown(
             return {"metric_type": metric_type, "items": items, "total": sum(breakdown.values())}
             
         elif metric_type == "social_interactions":
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 {"timestamp": {"$gte": cutoff}, "event_type": {"$in": ["post_liked", "post_commented", "user_followed", "user_unfollowed"]}},
                 {"event_type": 1}
             ).to_list(100000)
@@ -1852,7 +1923,7 @@ async def get_users_detail_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get all users with activity summary"""
-    return await get_all_users_detail(db, days, limit, skip)
+    return await get_all_users_detail(analytics_db, days, limit, skip)
 
 
 @api_router.get("/analytics/admin/users/new")
@@ -1862,7 +1933,7 @@ async def get_new_users_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get new users who joined in the period"""
-    return await get_new_users_detail(db, days, limit)
+    return await get_new_users_detail(analytics_db, days, limit)
 
 
 @api_router.get("/analytics/admin/users/signup-trend")
@@ -1887,7 +1958,7 @@ async def get_signup_trend_endpoint(
         cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
         
         # Get all users created after cutoff
-        users = await db.users.find(
+        users = await analytics_db.users.find(
             {"created_at": {"$gte": cutoff}},
             {"created_at": 1}
         ).to_list(10000)
@@ -1964,7 +2035,7 @@ async def get_active_users_endpoint(
     logger.info(f"Fetching active users for last {days} days")
     
     # Find unique user IDs from user_events in the period
-    active_user_ids = await db.user_events.distinct(
+    active_user_ids = await analytics_db.user_events.distinct(
         "user_id",
         {"timestamp": {"$gte": cutoff}}
     )
@@ -1976,11 +2047,11 @@ async def get_active_users_endpoint(
     for user_id in active_user_ids[:limit]:
         try:
             logger.info(f"Looking up user: {user_id}")
-            user = await db.users.find_one({"_id": ObjectId(user_id)})
+            user = await analytics_db.users.find_one({"_id": ObjectId(user_id)})
             if user:
                 logger.info(f"Found user: {user.get('username')}")
                 # Get activity counts for this user
-                event_count = await db.user_events.count_documents({
+                event_count = await analytics_db.user_events.count_documents({
                     "user_id": user_id,
                     "timestamp": {"$gte": cutoff}
                 })
@@ -2022,7 +2093,7 @@ async def get_daily_active_users_endpoint(
     logger.info(f"Fetching daily active users (last 24 hours)")
     
     # Find unique user IDs from user_events in the last 24 hours
-    daily_active_user_ids = await db.user_events.distinct(
+    daily_active_user_ids = await analytics_db.user_events.distinct(
         "user_id",
         {"timestamp": {"$gte": cutoff}}
     )
@@ -2034,11 +2105,11 @@ async def get_daily_active_users_endpoint(
     for user_id in daily_active_user_ids[:limit]:
         try:
             logger.info(f"Looking up user: {user_id}")
-            user = await db.users.find_one({"_id": ObjectId(user_id)})
+            user = await analytics_db.users.find_one({"_id": ObjectId(user_id)})
             if user:
                 logger.info(f"Found user: {user.get('username')}")
                 # Get latest activity
-                latest_event = await db.user_events.find_one(
+                latest_event = await analytics_db.user_events.find_one(
                     {"user_id": user_id},
                     sort=[("timestamp", -1)]
                 )
@@ -2072,7 +2143,7 @@ async def get_screens_breakdown_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get breakdown of screen views"""
-    return await get_screen_views_breakdown(db, days)
+    return await get_screen_views_breakdown(analytics_db, days)
 
 
 @api_router.get("/analytics/admin/moods")
@@ -2081,7 +2152,7 @@ async def get_moods_breakdown_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get breakdown of mood selections"""
-    return await get_mood_selections_breakdown(db, days)
+    return await get_mood_selections_breakdown(analytics_db, days)
 
 
 @api_router.get("/analytics/admin/equipment")
@@ -2090,7 +2161,7 @@ async def get_equipment_breakdown_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get breakdown of equipment selections with mood paths"""
-    return await get_equipment_selections_breakdown(db, days)
+    return await get_equipment_selections_breakdown(analytics_db, days)
 
 
 @api_router.get("/analytics/admin/difficulties")
@@ -2099,7 +2170,7 @@ async def get_difficulties_breakdown_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get breakdown of difficulty selections"""
-    return await get_difficulty_selections_breakdown(db, days)
+    return await get_difficulty_selections_breakdown(analytics_db, days)
 
 
 @api_router.get("/analytics/admin/try-workout-stats")
@@ -2119,7 +2190,7 @@ async def get_try_workout_stats(
             base_query["timestamp"] = {"$gte": cutoff_date}
         
         # Total clicks
-        total_clicks = await db.user_events.count_documents(base_query)
+        total_clicks = await analytics_db.user_events.count_documents(base_query)
         
         # Unique users
         unique_users_pipeline = [
@@ -2127,16 +2198,16 @@ async def get_try_workout_stats(
             {"$group": {"_id": "$user_id"}},
             {"$count": "count"}
         ]
-        unique_result = await db.user_events.aggregate(unique_users_pipeline).to_list(1)
+        unique_result = await analytics_db.user_events.aggregate(unique_users_pipeline).to_list(1)
         unique_users = unique_result[0]["count"] if unique_result else 0
         
         # Today's clicks
         today_query = {**base_query, "timestamp": {"$gte": today_start}}
-        today_clicks = await db.user_events.count_documents(today_query)
+        today_clicks = await analytics_db.user_events.count_documents(today_query)
         
         # This week's clicks
         week_query = {**base_query, "timestamp": {"$gte": week_start}}
-        this_week_clicks = await db.user_events.count_documents(week_query)
+        this_week_clicks = await analytics_db.user_events.count_documents(week_query)
         
         # By source breakdown
         by_source_pipeline = [
@@ -2147,7 +2218,7 @@ async def get_try_workout_stats(
             }},
             {"$sort": {"clicks": -1}}
         ]
-        by_source_result = await db.user_events.aggregate(by_source_pipeline).to_list(10)
+        by_source_result = await analytics_db.user_events.aggregate(by_source_pipeline).to_list(10)
         by_source = [{"source": item["_id"] or "unknown", "clicks": item["clicks"]} for item in by_source_result]
         
         return {
@@ -2179,7 +2250,7 @@ async def get_session_completion_stats(
             base_query["timestamp"] = {"$gte": cutoff_date}
         
         # Total completions
-        total_completions = await db.user_events.count_documents(base_query)
+        total_completions = await analytics_db.user_events.count_documents(base_query)
         
         # Unique users
         unique_users_pipeline = [
@@ -2187,16 +2258,16 @@ async def get_session_completion_stats(
             {"$group": {"_id": "$user_id"}},
             {"$count": "count"}
         ]
-        unique_result = await db.user_events.aggregate(unique_users_pipeline).to_list(1)
+        unique_result = await analytics_db.user_events.aggregate(unique_users_pipeline).to_list(1)
         unique_users = unique_result[0]["count"] if unique_result else 0
         
         # Today's completions
         today_query = {**base_query, "timestamp": {"$gte": today_start}}
-        today_completions = await db.user_events.count_documents(today_query)
+        today_completions = await analytics_db.user_events.count_documents(today_query)
         
         # This week's completions
         week_query = {**base_query, "timestamp": {"$gte": week_start}}
-        this_week_completions = await db.user_events.count_documents(week_query)
+        this_week_completions = await analytics_db.user_events.count_documents(week_query)
         
         # Average duration
         avg_duration_pipeline = [
@@ -2206,7 +2277,7 @@ async def get_session_completion_stats(
                 "avg_duration": {"$avg": "$metadata.duration_seconds"}
             }}
         ]
-        avg_result = await db.user_events.aggregate(avg_duration_pipeline).to_list(1)
+        avg_result = await analytics_db.user_events.aggregate(avg_duration_pipeline).to_list(1)
         avg_duration_seconds = avg_result[0]["avg_duration"] if avg_result and avg_result[0]["avg_duration"] else 0
         
         # By difficulty breakdown
@@ -2218,7 +2289,7 @@ async def get_session_completion_stats(
             }},
             {"$sort": {"completions": -1}}
         ]
-        by_difficulty_result = await db.user_events.aggregate(by_difficulty_pipeline).to_list(10)
+        by_difficulty_result = await analytics_db.user_events.aggregate(by_difficulty_pipeline).to_list(10)
         by_difficulty = [{"difficulty": item["_id"] or "unknown", "completions": item["completions"]} for item in by_difficulty_result]
         
         return {
@@ -2246,7 +2317,7 @@ async def get_engagement_metrics_endpoint(
     Query params:
     - include_internal: Include internal users (default: false)
     """
-    return await get_engagement_metrics(db, include_internal)
+    return await get_engagement_metrics(analytics_db, include_internal)
 
 
 @api_router.get("/analytics/admin/data-freshness")
@@ -2286,6 +2357,12 @@ async def get_data_freshness(
             "git_sha": GIT_SHA,
             "deployed_at": DEPLOYED_AT,
             "environment": APP_ENV,
+            "result_cache": get_result_cache().get_status(),
+            "log_writer": get_log_writer(db).get_status(),
+            "unread_counters": get_unread_reconciler(db).get_status(),
+            "realtime": get_realtime_hub(db).get_status(),
+            "analytics_db": get_analytics_db_status(),
+            "logging": get_logging_status(),
         }
     except Exception as e:
         logger.error(f"Error getting data freshness: {e}")
@@ -2297,6 +2374,20 @@ async def get_data_freshness(
         }
 
 
+@api_router.delete("/analytics/admin/cache")
+async def clear_analytics_cache(
+    prefix: str = "",
+    current_user_id: str = Depends(require_admin)
+):
+    """
+    Drop cached analytics results so the next request recomputes.
+    prefix limits it to one endpoint, e.g. comprehensive_stats or time_series.
+    """
+    cleared = get_result_cache().invalidate(prefix)
+    logger.info(f"Analytics cache cleared by admin {current_user_id} (prefix={prefix!r}, {cleared} entries)")
+    return {"success": True, "cleared": cleared}
+
+
 @api_router.get("/analytics/admin/workout-engagement-chart")
 async def get_workout_engagement_chart(
     period: str = "day",
@@ -2342,7 +2433,7 @@ async def get_workout_engagement_chart(
             }},
             {"$sort": {"_id": 1}}
         ]
-        try_workout_result = await db.user_events.aggregate(try_workout_pipeline).to_list(100)
+        try_workout_result = await analytics_db.user_events.aggregate(try_workout_pipeline).to_list(100)
         
         # Get workout_session_completed data grouped by date
         session_completed_pipeline = [
@@ -2362,7 +2453,7 @@ async def get_workout_engagement_chart(
             }},
             {"$sort": {"_id": 1}}
         ]
-        session_completed_result = await db.user_events.aggregate(session_completed_pipeline).to_list(100)
+        session_completed_result = await analytics_db.user_events.aggregate(session_completed_pipeline).to_list(100)
         
         # Combine the data
         all_dates = set()
@@ -2533,7 +2624,7 @@ async def get_exercises_breakdown_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get breakdown of exercises completed"""
-    return await get_exercises_breakdown(db, days)
+    return await get_exercises_breakdown(analytics_db, days)
 
 
 @api_router.get("/analytics/admin/social")
@@ -2542,7 +2633,7 @@ async def get_social_breakdown_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get breakdown of social activity"""
-    return await get_social_activity_breakdown(db, days)
+    return await get_social_activity_breakdown(analytics_db, days)
 
 
 @api_router.get("/analytics/admin/workout-funnel")
@@ -2551,7 +2642,7 @@ async def get_workout_funnel_endpoint(
     current_user_id: str = Depends(require_admin)
 ):
     """Get detailed workout funnel data"""
-    return await get_workout_funnel_detail(db, days)
+    return await get_workout_funnel_detail(analytics_db, days)
 
 
 # ============================================
@@ -2566,6 +2657,8 @@ async def get_funnel_endpoint(
     include_users: bool = False,
     limit_users: int = 100,
     include_internal: bool = False,
+    ordered: bool = True,
+    window_hours: Optional[float] = None,
     current_user_id: str = Depends(require_admin)
 ):
     """
@@ -2578,8 +2671,10 @@ async def get_funnel_endpoint(
     - include_users: Include user IDs for each step
     - limit_users: Max users to return per step
     - include_internal: Include internal/staff users (default: false)
+    - ordered: Require steps in order per user (default: true); false = per-step unique users
+    - window_hours: Max hours from a user's first step to each later step (ordered only)
     
-    Example: /analytics/admin/funnel?start=2025-01-01&end=2025-01-31&steps=app_session_start,workout_started,workout_completed
+    Example: /analytics/admin/funnel?start=2025-01-01&end=2025-01-31&steps=app_session_start,workout_started,workout_completed&window_hours=24
     """
     try:
         # Parse dates
@@ -2598,8 +2693,11 @@ async def get_funnel_endpoint(
         if steps:
             step_list = [s.strip() for s in steps.split(",") if s.strip()]
         
+        window = timedelta(hours=window_hours) if window_hours else None
+        
         return await get_funnel_analysis(
-            db, start_date, end_date, step_list, include_users, limit_users, include_internal
+            analytics_db, start_date, end_date, step_list, include_users, limit_users, include_internal,
+            ordered=ordered, window=window
         )
     except Exception as e:
         logger.error(f"Funnel endpoint error: {e}")
@@ -2607,6 +2705,7 @@ async def get_funnel_endpoint(
 
 
 @api_router.get("/analytics/admin/retention")
+@cached_analytics("retention")
 async def get_retention_endpoint(
     start: Optional[str] = None,
     end: Optional[str] = None,
@@ -2639,7 +2738,7 @@ async def get_retention_endpoint(
         else:
             start_date = end_date - timedelta(days=90)
         
-        return await get_retention_cohorts(db, start_date, end_date, cohort, window, include_internal)
+        return await get_retention_cohorts(analytics_db, start_date, end_date, cohort, window, include_internal)
     except Exception as e:
         logger.error(f"Retention endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2665,10 +2764,11 @@ async def search_users_endpoint(
     if len(q) < 2:
         raise HTTPException(status_code=400, detail="Query must be at least 2 characters")
     
-    return await search_users(db, q, limit, skip)
+    return await search_users(analytics_db, q, limit, skip)
 
 
 @api_router.get("/analytics/admin/users/{user_id}/timeline")
+@fast_json
 async def get_user_timeline_endpoint(
     user_id: str,
     start: Optional[str] = None,
@@ -2704,7 +2804,7 @@ async def get_user_timeline_endpoint(
         if event_types:
             event_type_list = [e.strip() for e in event_types.split(",") if e.strip()]
         
-        return await get_user_timeline(db, user_id, start_date, end_date, limit, event_type_list)
+        return await get_user_timeline(analytics_db, user_id, start_date, end_date, limit, event_type_list)
     except Exception as e:
         logger.error(f"User timeline endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2731,12 +2831,12 @@ async def get_user_lifecycle_endpoint(
         # Find user
         user = None
         try:
-            user = await db.users.find_one({"_id": ObjectId(user_id)})
+            user = await analytics_db.users.find_one({"_id": ObjectId(user_id)})
         except:
             pass
         
         if not user:
-            user = await db.users.find_one({"user_id": user_id})
+            user = await analytics_db.users.find_one({"user_id": user_id})
         
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
@@ -2758,31 +2858,31 @@ async def get_user_lifecycle_endpoint(
         
         # Get activity data
         # First app session
-        first_session = await db.user_events.find_one(
+        first_session = await analytics_db.user_events.find_one(
             {"user_id": uid, "event_type": "app_session_start"},
             sort=[("timestamp", 1)]
         )
         
         # Last app session
-        last_session = await db.user_events.find_one(
+        last_session = await analytics_db.user_events.find_one(
             {"user_id": uid, "event_type": "app_session_start"},
             sort=[("timestamp", -1)]
         )
         
         # First workout
-        first_workout = await db.user_events.find_one(
+        first_workout = await analytics_db.user_events.find_one(
             {"user_id": uid, "event_type": "workout_started"},
             sort=[("timestamp", 1)]
         )
         
         # Last workout
-        last_workout = await db.user_events.find_one(
+        last_workout = await analytics_db.user_events.find_one(
             {"user_id": uid, "event_type": "workout_started"},
             sort=[("timestamp", -1)]
         )
         
         # First completed workout
-        first_completed = await db.user_events.find_one(
+        first_completed = await analytics_db.user_events.find_one(
             {"user_id": uid, "event_type": "workout_completed"},
             sort=[("timestamp", 1)]
         )
@@ -2808,27 +2908,27 @@ async def get_user_lifecycle_endpoint(
         
         activity_trends = {}
         for period_name, cutoff in periods.items():
-            sessions = await db.user_events.count_documents({
+            sessions = await analytics_db.user_events.count_documents({
                 "user_id": uid,
                 "event_type": "app_session_start",
                 "timestamp": {"$gte": cutoff}
             })
-            workouts_started = await db.user_events.count_documents({
+            workouts_started = await analytics_db.user_events.count_documents({
                 "user_id": uid,
                 "event_type": "workout_started",
                 "timestamp": {"$gte": cutoff}
             })
-            workouts_completed = await db.user_events.count_documents({
+            workouts_completed = await analytics_db.user_events.count_documents({
                 "user_id": uid,
                 "event_type": "workout_completed",
                 "timestamp": {"$gte": cutoff}
             })
-            posts = await db.user_events.count_documents({
+            posts = await analytics_db.user_events.count_documents({
                 "user_id": uid,
                 "event_type": "post_created",
                 "timestamp": {"$gte": cutoff}
             })
-            social_actions = await db.user_events.count_documents({
+            social_actions = await analytics_db.user_events.count_documents({
                 "user_id": uid,
                 "event_type": {"$in": ["post_liked", "post_commented", "user_followed"]},
                 "timestamp": {"$gte": cutoff}
@@ -2843,15 +2943,15 @@ async def get_user_lifecycle_endpoint(
             }
         
         # Total lifetime stats
-        total_sessions = await db.user_events.count_documents({
+        total_sessions = await analytics_db.user_events.count_documents({
             "user_id": uid,
             "event_type": "app_session_start"
         })
-        total_workouts_started = await db.user_events.count_documents({
+        total_workouts_started = await analytics_db.user_events.count_documents({
             "user_id": uid,
             "event_type": "workout_started"
         })
-        total_workouts_completed = await db.user_events.count_documents({
+        total_workouts_completed = await analytics_db.user_events.count_documents({
             "user_id": uid,
             "event_type": "workout_completed"
         })
@@ -2900,7 +3000,7 @@ async def get_user_lifecycle_endpoint(
                 churn_factors.append({"factor": "low_engagement", "impact": 10, "detail": f"Avg {sessions_per_week:.1f} sessions/week"})
         
         # Factor 5: No social connections (0-10 points)
-        follows = await db.user_events.count_documents({
+        follows = await analytics_db.user_events.count_documents({
             "user_id": uid,
             "event_type": "user_followed"
         })
@@ -3012,15 +3112,6 @@ async def get_drilldown_users(
         start_date = datetime.fromisoformat(start.replace('Z', '+00:00'))
         end_date = datetime.fromisoformat(end.replace('Z', '+00:00'))
         
-        # Get internal user IDs to exclude
-        excluded_user_ids = set()
-        if not include_internal:
-            internal_users = await db.users.find(
-                {"is_internal": True},
-                {"_id": 1}
-            ).to_list(1000)
-            excluded_user_ids = {str(u["_id"]) for u in internal_users}
-        
         users_data = []
         
         # Define event type mappings
@@ -3041,8 +3132,8 @@ async def get_drilldown_users(
             if not include_internal:
                 query["is_internal"] = {"$ne": True}
             
-            users = await db.users.find(query).skip(skip).limit(limit).sort("created_at", -1).to_list(limit)
-            total = await db.users.count_documents(query)
+            users = await analytics_db.users.find(query).skip(skip).limit(limit).sort("created_at", -1).to_list(limit)
+            total = await analytics_db.users.count_documents(query)
             
             for user in users:
                 users_data.append({
@@ -3062,16 +3153,13 @@ async def get_drilldown_users(
             pipeline = [
                 {
                     "$match": {
+                        **audience_filter(include_internal),
                         "timestamp": {"$gte": start_date, "$lte": end_date},
                         "event_type": {"$in": event_types},
                     }
                 },
             ]
             
-            # Add internal user exclusion
-            if excluded_user_ids:
-                pipeline[0]["$match"]["user_id"] = {"$nin": list(excluded_user_ids)}
-            
             # Add value filter if provided (e.g., specific mood category)
             if value:
                 if metric == "mood_selections":
@@ -3094,12 +3182,13 @@ async def get_drilldown_users(
                 {"$limit": limit},
             ])
             
-            aggregated = await db.user_events.aggregate(pipeline).to_list(limit)
+            aggregated = await analytics_db.user_events.aggregate(pipeline).to_list(limit)
             
             # Count total unique users
             count_pipeline = [
                 {
                     "$match": {
+                        **audience_filter(include_internal),
                         "timestamp": {"$gte": start_date, "$lte": end_date},
                         "event_type": {"$in": event_types},
                     }
@@ -3107,19 +3196,17 @@ async def get_drilldown_users(
                 {"$group": {"_id": "$user_id"}},
                 {"$count": "total"},
             ]
-            if excluded_user_ids:
-                count_pipeline[0]["$match"]["user_id"] = {"$nin": list(excluded_user_ids)}
             
-            count_result = await db.user_events.aggregate(count_pipeline).to_list(1)
+            count_result = await analytics_db.user_events.aggregate(count_pipeline).to_list(1)
             total = count_result[0]["total"] if count_result else 0
             
             # Enrich with user data
             for item in aggregated:
                 user_id = item["_id"]
                 try:
-                    user = await db.users.find_one({"_id": ObjectId(user_id)})
+                    user = await analytics_db.users.find_one({"_id": ObjectId(user_id)})
                 except:
-                    user = await db.users.find_one({"user_id": user_id})
+                    user = await analytics_db.users.find_one({"user_id": user_id})
                 
                 if user:
                     users_data.append({
@@ -3183,15 +3270,6 @@ async def get_drilldown_events(
         start_date = datetime.fromisoformat(start.replace('Z', '+00:00'))
         end_date = datetime.fromisoformat(end.replace('Z', '+00:00'))
         
-        # Get internal user IDs to exclude
-        excluded_user_ids = set()
-        if not include_internal:
-            internal_users = await db.users.find(
-                {"is_internal": True},
-                {"_id": 1}
-            ).to_list(1000)
-            excluded_user_ids = {str(u["_id"]) for u in internal_users}
-        
         # Define event type mappings
         event_mappings = {
             "active_users": ["app_session_start"],
@@ -3214,8 +3292,8 @@ async def get_drilldown_events(
         
         if user_id:
             query["user_id"] = user_id
-        elif excluded_user_ids:
-            query["user_id"] = {"$nin": list(excluded_user_ids)}
+        else:
+            query.update(audience_filter(include_internal))
         
         if value:
             if metric == "mood_selections":
@@ -3224,8 +3302,8 @@ async def get_drilldown_events(
                 query["metadata.screen_name"] = value
         
         # Get events
-        events = await db.user_events.find(query).sort("timestamp", -1).skip(skip).limit(limit).to_list(limit)
-        total = await db.user_events.count_documents(query)
+        events = await analytics_db.user_events.find(query).sort("timestamp", -1).skip(skip).limit(limit).to_list(limit)
+        total = await analytics_db.user_events.count_documents(query)
         
         # Format events
         formatted_events = []
@@ -3233,7 +3311,7 @@ async def get_drilldown_events(
             # Get username for the event
             username = "Unknown"
             try:
-                user = await db.users.find_one({"_id": ObjectId(event.get("user_id"))})
+                user = await analytics_db.users.find_one({"_id": ObjectId(event.get("user_id"))})
                 if user:
                     username = user.get("username", "Unknown")
             except:
@@ -3524,7 +3602,7 @@ async def get_activation_metrics(
         if not include_internal:
             user_query["is_internal"] = {"$ne": True}
         
-        users = await db.users.find(user_query, {"_id": 1, "created_at": 1}).to_list(10000)
+        users = await analytics_db.users.find(user_query, {"_id": 1, "created_at": 1}).to_list(10000)
         user_ids = [str(u["_id"]) for u in users]
         user_created_map = {str(u["_id"]): u["created_at"] for u in users}
         
@@ -3557,7 +3635,7 @@ async def get_activation_metrics(
             }
         ]
         
-        first_workouts = await db.user_events.aggregate(first_workout_pipeline).to_list(10000)
+        first_workouts = await analytics_db.user_events.aggregate(first_workout_pipeline).to_list(10000)
         first_workout_map = {fw["_id"]: fw["first_workout"] for fw in first_workouts}
         
         # Calculate time to first workout
@@ -3608,7 +3686,7 @@ async def get_activation_metrics(
         funnel_data = [{"step": "signup", "users": total_new_users, "rate": 100}]
         
         for event_type in funnel_events:
-            event_users = await db.user_events.distinct(
+            event_users = await analytics_db.user_events.distinct(
                 "user_id",
                 {
                     "event_type": event_type,
@@ -3662,16 +3740,8 @@ async def get_workout_quality_metrics(
     try:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         
-        # Get internal user IDs to exclude
-        excluded_user_ids = set()
-        if not include_internal:
-            internal_users = await db.users.find({"is_internal": True}, {"_id": 1}).to_list(1000)
-            excluded_user_ids = {str(u["_id"]) for u in internal_users}
-        
         # Build match stage
-        match_stage = {"timestamp": {"$gte": cutoff}}
-        if excluded_user_ids:
-            match_stage["user_id"] = {"$nin": list(excluded_user_ids)}
+        match_stage = {**audience_filter(include_internal), "timestamp": {"$gte": cutoff}}
         
         # Get workouts started with metadata
         started_pipeline = [
@@ -3689,7 +3759,7 @@ async def get_workout_quality_metrics(
             }
         ]
         
-        started_results = await db.user_events.aggregate(started_pipeline).to_list(1000)
+        started_results = await analytics_db.user_events.aggregate(started_pipeline).to_list(1000)
         
         # Get workouts completed
         completed_pipeline = [
@@ -3706,7 +3776,7 @@ async def get_workout_quality_metrics(
             }
         ]
         
-        completed_results = await db.user_events.aggregate(completed_pipeline).to_list(1000)
+        completed_results = await analytics_db.user_events.aggregate(completed_pipeline).to_list(1000)
         completed_map = {
             (r["_id"].get("mood"), r["_id"].get("difficulty"), r["_id"].get("equipment")): r["completed_count"]
             for r in completed_results
@@ -3834,16 +3904,8 @@ async def get_social_loop_metrics(
     try:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         
-        # Get internal user IDs to exclude
-        excluded_user_ids = set()
-        if not include_internal:
-            internal_users = await db.users.find({"is_internal": True}, {"_id": 1}).to_list(1000)
-            excluded_user_ids = {str(u["_id"]) for u in internal_users}
-        
         # Build match stage
-        match_stage = {"timestamp": {"$gte": cutoff}}
-        if excluded_user_ids:
-            match_stage["user_id"] = {"$nin": list(excluded_user_ids)}
+        match_stage = {**audience_filter(include_internal), "timestamp": {"$gte": cutoff}}
         
         # Get social events
         social_events = ["post_created", "post_liked", "post_commented", "user_followed"]
@@ -3859,7 +3921,7 @@ async def get_social_loop_metrics(
             }
         ]
         
-        social_results = await db.user_events.aggregate(social_pipeline).to_list(100)
+        social_results = await analytics_db.user_events.aggregate(social_pipeline).to_list(100)
         
         # Build event counts
         event_counts = {e: {"count": 0, "unique_users": 0} for e in social_events}
@@ -3877,11 +3939,11 @@ async def get_social_loop_metrics(
                 all_social_users.update(item["unique_users"])
         
         # Get total active users in period
-        active_users = await db.user_events.distinct(
+        active_users = await analytics_db.user_events.distinct(
             "user_id",
             {**match_stage, "event_type": "app_session_start"}
         )
-        total_active_users = len(active_users) if not excluded_user_ids else len([u for u in active_users if u not in excluded_user_ids])
+        total_active_users = len(active_users)
         
         # Calculate engagement rates
         social_participation_rate = round((len(all_social_users) / total_active_users) * 100, 1) if total_active_users > 0 else 0
@@ -3905,15 +3967,19 @@ async def get_social_loop_metrics(
             }
         ]
         
-        follow_stats = await db.user_events.aggregate(follow_stats_pipeline).to_list(1)
+        follow_stats = await analytics_db.user_events.aggregate(follow_stats_pipeline).to_list(1)
         avg_following = round(follow_stats[0]["avg_following"], 1) if follow_stats else 0
         
-        # Get content creation stats
+        # Get content creation stats (posts are not stamped; exclude by author)
         posts_query = {"created_at": {"$gte": cutoff}}
+        excluded_user_ids = set()
+        if not include_internal:
+            internal_users = await analytics_db.users.find({"is_internal": True}, {"_id": 1}).to_list(1000)
+            excluded_user_ids = {str(u["_id"]) for u in internal_users}
         if excluded_user_ids:
             posts_query["author_id"] = {"$nin": [ObjectId(uid) for uid in excluded_user_ids if len(uid) == 24]}
         
-        total_posts = await db.posts.count_documents(posts_query)
+        total_posts = await analytics_db.posts.count_documents(posts_query)
         
         # Get engagement per post (likes + comments)
         engagement_pipeline = [
@@ -3950,7 +4016,7 @@ async def get_social_loop_metrics(
             }
         ]
         
-        engagement_stats = await db.posts.aggregate(engagement_pipeline).to_list(1)
+        engagement_stats = await analytics_db.posts.aggregate(engagement_pipeline).to_list(1)
         
         avg_engagement_per_post = round(engagement_stats[0]["avg_engagement"], 1) if engagement_stats else 0
         posts_with_engagement = engagement_stats[0]["posts_with_engagement"] if engagement_stats else 0
@@ -3990,6 +4056,7 @@ async def get_social_loop_metrics(
 # ==================== INSIGHT SURFACING ====================
 
 @api_router.get("/analytics/admin/insights")
+@cached_analytics("insights")
 async def get_automated_insights(
     include_internal: bool = False,
     current_user_id: str = Depends(require_admin)
@@ -4004,12 +4071,6 @@ async def get_automated_insights(
     try:
         now = datetime.now(timezone.utc)
         
-        # Get internal user IDs
-        excluded_user_ids = set()
-        if not include_internal:
-            internal_users = await db.users.find({"is_internal": True}, {"_id": 1}).to_list(1000)
-            excluded_user_ids = {str(u["_id"]) for u in internal_users}
-        
         insights = []
         
         # Helper to add insight
@@ -4034,25 +4095,69 @@ async def get_automated_insights(
         
         # Build base query
         def get_match(start, end=None):
-            match = {"timestamp": {"$gte": start}}
+            match = {**audience_filter(include_internal), "timestamp": {"$gte": start}}
             if end:
                 match["timestamp"]["$lt"] = end
-            if excluded_user_ids:
-                match["user_id"] = {"$nin": list(excluded_user_ids)}
             return match
         
+        social_events = ["post_liked", "post_commented", "user_followed"]
+        
+        # All metric queries are independent: run them concurrently up front
+        batch = QueryBatch(analytics_db)
+        batch.distinct("current_dau_users", "user_events", "user_id",
+                       {**get_match(current_7d_start), "event_type": "app_session_start"})
+        batch.distinct("previous_dau_users", "user_events", "user_id",
+                       {**get_match(previous_7d_start, previous_7d_end), "event_type": "app_session_start"})
+        
+        user_query_current = {"created_at": {"$gte": current_7d_start}}
+        user_query_previous = {"created_at": {"$gte": previous_7d_start, "$lt": previous_7d_end}}
+        if not include_internal:
+            user_query_current["is_internal"] = {"$ne": True}
+            user_query_previous["is_internal"] = {"$ne": True}
+        batch.count("current_signups", "users", user_query_current)
+        batch.count("previous_signups", "users", user_query_previous)
+        
+        for prefix, match in [
+            ("current", get_match(current_7d_start)),
+            ("previous", get_match(previous_7d_start, previous_7d_end)),
+        ]:
+            batch.count(f"{prefix}_started", "user_events", {**match, "event_type": "workout_started"})
+            batch.count(f"{prefix}_completed", "user_events", {**match, "event_type": "workout_completed"})
+            batch.count(f"{prefix}_social", "user_events", {**match, "event_type": {"$in": social_events}})
+            batch.count(f"{prefix}_posts", "user_events", {**match, "event_type": "post_created"})
+        
+        # Users who were active 14-21 days ago but not in last 7 days
+        batch.distinct("active_14_21d", "user_events", "user_id", {
+            **get_match(now - timedelta(days=21), now - timedelta(days=14)),
+            "event_type": "app_session_start"
+        })
+        batch.distinct("active_7d", "user_events", "user_id", {
+            "timestamp": {"$gte": now - timedelta(days=7)},
+            "event_type": "app_session_start"
+        })
+        
+        # Users with 3+ workouts in last 7 days
+        power_user_pipeline = [
+            {
+                "$match": {
+                    **get_match(current_7d_start),
+                    "event_type": "workout_completed",
+                }
+            },
+            {"$group": {"_id": "$user_id", "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gte": 3}}},
+            {"$count": "total"}
+        ]
+        batch.aggregate("power_users_result", "user_events", power_user_pipeline, 1)
+        
+        r = await batch.run()
+        
         # ===== 1. Daily Active Users Analysis =====
-        current_dau_users = await db.user_events.distinct(
-            "user_id",
-            {**get_match(current_7d_start), "event_type": "app_session_start"}
-        )
-        previous_dau_users = await db.user_events.distinct(
-            "user_id",
-            {**get_match(previous_7d_start, previous_7d_end), "event_type": "app_session_start"}
-        )
+        current_dau_users = r["current_dau_users"]
+        previous_dau_users = r["previous_dau_users"]
         
-        current_dau = len([u for u in current_dau_users if u not in excluded_user_ids])
-        previous_dau = len([u for u in previous_dau_users if u not in excluded_user_ids])
+        current_dau = len(current_dau_users)
+        previous_dau = len(previous_dau_users)
         
         if previous_dau > 0:
             dau_change = round(((current_dau - previous_dau) / previous_dau) * 100, 1)
@@ -4102,14 +4207,8 @@ async def get_automated_insights(
                     )
         
         # ===== 2. New User Signups =====
-        user_query_current = {"created_at": {"$gte": current_7d_start}}
-        user_query_previous = {"created_at": {"$gte": previous_7d_start, "$lt": previous_7d_end}}
-        if not include_internal:
-            user_query_current["is_internal"] = {"$ne": True}
-            user_query_previous["is_internal"] = {"$ne": True}
-        
-        current_signups = await db.users.count_documents(user_query_current)
-        previous_signups = await db.users.count_documents(user_query_previous)
+        current_signups = r["current_signups"]
+        previous_signups = r["previous_signups"]
         
         if previous_signups > 0:
             signup_change = round(((current_signups - previous_signups) / previous_signups) * 100, 1)
@@ -4138,23 +4237,10 @@ async def get_automated_insights(
                     )
         
         # ===== 3. Workout Completion Rate =====
-        current_started = await db.user_events.count_documents({
-            **get_match(current_7d_start),
-            "event_type": "workout_started"
-        })
-        current_completed = await db.user_events.count_documents({
-            **get_match(current_7d_start),
-            "event_type": "workout_completed"
-        })
-        
-        previous_started = await db.user_events.count_documents({
-            **get_match(previous_7d_start, previous_7d_end),
-            "event_type": "workout_started"
-        })
-        previous_completed = await db.user_events.count_documents({
-            **get_match(previous_7d_start, previous_7d_end),
-            "event_type": "workout_completed"
-        })
+        current_started = r["current_started"]
+        current_completed = r["current_completed"]
+        previous_started = r["previous_started"]
+        previous_completed = r["previous_completed"]
         
         current_completion_rate = round((current_completed / max(1, current_started)) * 100, 1)
         previous_completion_rate = round((previous_completed / max(1, previous_started)) * 100, 1)
@@ -4186,15 +4272,8 @@ async def get_automated_insights(
                     )
         
         # ===== 4. Social Engagement =====
-        social_events = ["post_liked", "post_commented", "user_followed"]
-        current_social = await db.user_events.count_documents({
-            **get_match(current_7d_start),
-            "event_type": {"$in": social_events}
-        })
-        previous_social = await db.user_events.count_documents({
-            **get_match(previous_7d_start, previous_7d_end),
-            "event_type": {"$in": social_events}
-        })
+        current_social = r["current_social"]
+        previous_social = r["previous_social"]
         
         if previous_social > 0:
             social_change = round(((current_social - previous_social) / previous_social) * 100, 1)
@@ -4233,14 +4312,8 @@ async def get_automated_insights(
                     )
         
         # ===== 5. Content Creation =====
-        current_posts = await db.user_events.count_documents({
-            **get_match(current_7d_start),
-            "event_type": "post_created"
-        })
-        previous_posts = await db.user_events.count_documents({
-            **get_match(previous_7d_start, previous_7d_end),
-            "event_type": "post_created"
-        })
+        current_posts = r["current_posts"]
+        previous_posts = r["previous_posts"]
         
         if previous_posts > 0:
             posts_change = round(((current_posts - previous_posts) / previous_posts) * 100, 1)
@@ -4269,22 +4342,10 @@ async def get_automated_insights(
         
         # ===== 6. At-Risk Users Detection =====
         # Users who were active 14-21 days ago but not in last 7 days
-        active_14_21d = await db.user_events.distinct(
-            "user_id",
-            {
-                "timestamp": {"$gte": now - timedelta(days=21), "$lt": now - timedelta(days=14)},
-                "event_type": "app_session_start"
-            }
-        )
-        active_7d = await db.user_events.distinct(
-            "user_id",
-            {
-                "timestamp": {"$gte": now - timedelta(days=7)},
-                "event_type": "app_session_start"
-            }
-        )
+        active_14_21d = r["active_14_21d"]
+        active_7d = r["active_7d"]
         
-        at_risk_users = set(active_14_21d) - set(active_7d) - excluded_user_ids
+        at_risk_users = set(active_14_21d) - set(active_7d)
         at_risk_count = len(at_risk_users)
         
         if at_risk_count >= 5:
@@ -4301,21 +4362,7 @@ async def get_automated_insights(
         
         # ===== 7. Power User Growth =====
         # Users with 3+ workouts in last 7 days
-        power_user_pipeline = [
-            {
-                "$match": {
-                    "timestamp": {"$gte": current_7d_start},
-                    "event_type": "workout_completed",
-                }
-            },
-            {"$group": {"_id": "$user_id", "count": {"$sum": 1}}},
-            {"$match": {"count": {"$gte": 3}}},
-            {"$count": "total"}
-        ]
-        if excluded_user_ids:
-            power_user_pipeline[0]["$match"]["user_id"] = {"$nin": list(excluded_user_ids)}
-        
-        power_users_result = await db.user_events.aggregate(power_user_pipeline).to_list(1)
+        power_users_result = r["power_users_result"]
         current_power_users = power_users_result[0]["total"] if power_users_result else 0
         
         if current_power_users >= 3:
@@ -4386,7 +4433,7 @@ async def get_comparison_endpoint(
         previous_start = previous_end - period_length
         
         return await get_comparison_stats(
-            db, current_start, current_end, previous_start, previous_end, include_internal
+            analytics_db, current_start, current_end, previous_start, previous_end, include_internal
         )
     except Exception as e:
         logger.error(f"Comparison endpoint error: {e}")
@@ -4423,19 +4470,11 @@ async def record_heartbeat(
     """
     Record user heartbeat for real-time active user tracking.
     Called every 30-60 seconds while app is open.
+    Heartbeats land in the in-process presence registry and are flushed
+    to user_heartbeats in bulk.
     """
     try:
-        await db.user_heartbeats.update_one(
-            {"user_id": current_user_id},
-            {
-                "$set": {
-                    "user_id": current_user_id,
-                    "last_heartbeat": datetime.now(timezone.utc),
-                    "is_online": True
-                }
-            },
-            upsert=True
-        )
+        get_presence_registry(db).touch(current_user_id)
         return {"status": "ok"}
     except Exception as e:
         logger.error(f"Heartbeat error: {e}")
@@ -4453,30 +4492,8 @@ async def get_realtime_active_users(
     """
     cutoff = datetime.now(timezone.utc) - timedelta(minutes=timeout_minutes)
     
-    # Find users with recent heartbeats
-    active_heartbeats = await db.user_heartbeats.find({
-        "last_heartbeat": {"$gte": cutoff}
-    }).to_list(1000)
-    
-    active_users = []
-    for hb in active_heartbeats:
-        user_id = hb.get("user_id")
-        try:
-            # Try to find user by custom user_id first
-            user = await db.users.find_one({"user_id": user_id})
-            if not user:
-                user = await db.users.find_one({"_id": ObjectId(user_id)})
-            
-            if user:
-                active_users.append({
-                    "user_id": user_id,
-                    "username": user.get("username", "Unknown"),
-                    "avatar_url": user.get("avatar_url") or user.get("avatar", ""),
-                    "avatar": user.get("avatar") or user.get("avatar_url", ""),
-                    "last_active": hb.get("last_heartbeat").isoformat() if hb.get("last_heartbeat") else None
-                })
-        except:
-            continue
+    # Recent heartbeats (flushed + this process) with one batched profile lookup
+    active_users = await get_presence_registry(db).get_active_users(cutoff)
     
     return {
         "active_count": len(active_users),
@@ -4486,6 +4503,7 @@ async def get_realtime_active_users(
 
 
 @api_router.get("/analytics/admin/comprehensive-stats")
+@cached_analytics("comprehensive_stats")
 async def get_comprehensive_stats(
     days: int = 1,
     user_type: str = "all",  # "all", "users", "guests"
@@ -4522,85 +4540,47 @@ async def get_comprehensive_stats(
     user_type_filter = get_user_type_filter()
     
     try:
+        # All metric queries are independent: queue them and run concurrently
+        # (same-collection counts are folded into $facet aggregations)
+        batch = QueryBatch(analytics_db)
+        
         # === USER METRICS (Accurate) ===
-        total_users = await db.users.count_documents({})
+        batch.count("total_users", "users", {})
         
         # New users in period (for "all time", this equals total users)
-        if is_all_time:
-            new_users = total_users
-        else:
-            new_users = await db.users.count_documents({
-                "created_at": {"$gte": start_date}
-            })
+        if not is_all_time:
+            batch.count("new_users", "users", {"created_at": {"$gte": start_date}})
         
         # Really active users (with heartbeat in last 5 mins) - registered users only
-        realtime_active_users = await db.user_heartbeats.count_documents({
-            "last_heartbeat": {"$gte": realtime_cutoff}
-        })
+        batch.add("realtime_active_users", lambda: get_presence_registry(db).count_active(realtime_cutoff))
         
         # Active guests (with recent guest events)
-        realtime_active_guests = await db.user_events.distinct(
-            "device_id",
-            {
-                "is_guest": True,
-                "timestamp": {"$gte": realtime_cutoff}
-            }
-        )
-        realtime_active_guest_count = len(realtime_active_guests) if realtime_active_guests else 0
-        
-        # Combined realtime active based on filter
-        if user_type == "users":
-            realtime_active = realtime_active_users
-        elif user_type == "guests":
-            realtime_active = realtime_active_guest_count
-        else:
-            realtime_active = realtime_active_users + realtime_active_guest_count
+        batch.distinct("realtime_active_guests", "user_events", "device_id", {
+            "is_guest": True,
+            "timestamp": {"$gte": realtime_cutoff}
+        })
         
         # Users with any activity in period
-        active_user_ids = await db.user_events.distinct(
-            "user_id",
-            {"timestamp": {"$gte": start_date}, "is_guest": {"$ne": True}}
-        )
-        active_guest_devices = await db.user_events.distinct(
-            "device_id",
-            {"timestamp": {"$gte": start_date}, "is_guest": True}
-        )
-        
-        if user_type == "users":
-            users_with_activity = len(active_user_ids) if active_user_ids else 0
-        elif user_type == "guests":
-            users_with_activity = len(active_guest_devices) if active_guest_devices else 0
-        else:
-            users_with_activity = (len(active_user_ids) if active_user_ids else 0) + (len(active_guest_devices) if active_guest_devices else 0)
+        batch.distinct("active_user_ids", "user_events", "user_id",
+                       {"timestamp": {"$gte": start_date}, "is_guest": {"$ne": True}})
+        batch.distinct("active_guest_devices", "user_events", "device_id",
+                       {"timestamp": {"$gte": start_date}, "is_guest": True})
         
         # === SESSION METRICS (Combined) ===
         session_filter = {"timestamp": {"$gte": start_date}, **user_type_filter}
         
         # Count actual app_opened events (most reliable session indicator)
-        app_opens = await db.user_events.count_documents({
-            "event_type": "app_opened",
-            **session_filter
-        })
+        batch.count("app_opens", "user_events", {"event_type": "app_opened", **session_filter})
         
         # Count app_session_start as fallback
-        app_sessions = await db.user_events.count_documents({
-            "event_type": "app_session_start",
-            **session_filter
-        })
+        batch.count("app_sessions", "user_events", {"event_type": "app_session_start", **session_filter})
         
         # Count guest_session_started for guests
-        guest_sessions = await db.user_events.count_documents({
+        batch.count("guest_sessions", "user_events", {
             "event_type": "guest_session_started",
             "timestamp": {"$gte": start_date}
         })
         
-        if user_type == "guests":
-            total_sessions = guest_sessions
-        elif user_type == "users":
-            total_sessions = max(app_opens, app_sessions) if app_opens > 0 or app_sessions > 0 else 0
-        else:
-            total_sessions = max(app_opens, app_sessions) + guest_sessions
-        
         # === PAGE/SCREEN VIEWS ===
         # Use $toLower to normalize screen names and merge duplicates
         screen_views_pipeline = [
@@ -4626,16 +4606,106 @@ async def get_comprehensive_stats(
             {"$sort": {"count": -1}},
             {"$limit": 10}
         ]
+        batch.aggregate("top_pages", "user_events", screen_views_pipeline, 20)
         
-        # Page name normalization map
-        page_name_map = {
-            "profile": "Profile",
-            "explore": "Explore", 
-            "index": "Home",
-            "home": "Home",
-            "cart": "Workout Cart",
-            "workout-session": "Workout Session",
-            "create-post": "Create Post",
+        # === MOOD CARD SELECTIONS ===
+        mood_pipeline = [
+            {
+                "$match": {
+                    "event_type": "mood_selected",
+                    "timestamp": {"$gte": start_date},
+                    **user_type_filter
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$metadata.mood_category",
+                    "count": {"$sum": 1},
+                    "unique_users": {"$addToSet": {"$ifNull": ["$user_id", "$device_id"]}}
+                }
+            },
+            {"$sort": {"count": -1}},
+            {"$limit": 10}
+        ]
+        batch.aggregate("top_moods", "user_events", mood_pipeline, 10)
+        
+        # === WORKOUT + SOCIAL METRICS ===
+        for name, event_type in [
+            ("workouts_started", "workout_started"),
+            ("workouts_completed", "workout_completed"),
+            ("workouts_added", "cart_item_added"),  # Workouts added to cart
+            ("total_posts", "post_created"),
+            ("total_likes", "post_liked"),
+            ("total_comments", "post_commented"),
+            ("total_follows", "user_followed"),
+        ]:
+            batch.count(name, "user_events", {"event_type": event_type, "timestamp": {"$gte": start_date}})
+        
+        # === GUEST METRICS ===
+        # Count guest sessions started
+        batch.count("guest_signins", "user_events", {
+            "event_type": "guest_session_started",
+            "is_guest": True,
+            "timestamp": {"$gte": start_date}
+        })
+        
+        # Count unique guest devices
+        batch.distinct("guest_devices", "user_events", "device_id", {
+            "event_type": "guest_session_started",
+            "is_guest": True,
+            "timestamp": {"$gte": start_date}
+        })
+        
+        # Count guests who converted (unique devices that merged to a user)
+        batch.distinct("converted_devices", "user_events", "device_id", {
+            "is_guest": True,
+            "merged_to_user_id": {"$ne": None},
+            "timestamp": {"$gte": start_date}
+        })
+        
+        r = await batch.run()
+        
+        total_users = r["total_users"]
+        new_users = total_users if is_all_time else r["new_users"]
+        realtime_active_users = r["realtime_active_users"]
+        realtime_active_guest_count = len(r["realtime_active_guests"] or [])
+        
+        # Combined realtime active based on filter
+        if user_type == "users":
+            realtime_active = realtime_active_users
+        elif user_type == "guests":
+            realtime_active = realtime_active_guest_count
+        else:
+            realtime_active = realtime_active_users + realtime_active_guest_count
+        
+        active_user_ids = r["active_user_ids"]
+        active_guest_devices = r["active_guest_devices"]
+        if user_type == "users":
+            users_with_activity = len(active_user_ids) if active_user_ids else 0
+        elif user_type == "guests":
+            users_with_activity = len(active_guest_devices) if active_guest_devices else 0
+        else:
+            users_with_activity = (len(active_user_ids) if active_user_ids else 0) + (len(active_guest_devices) if active_guest_devices else 0)
+        
+        app_opens = r["app_opens"]
+        app_sessions = r["app_sessions"]
+        guest_sessions = r["guest_sessions"]
+        if user_type == "guests":
+            total_sessions = guest_sessions
+        elif user_type == "users":
+            total_sessions = max(app_opens, app_sessions) if app_opens > 0 or app_sessions > 0 else 0
+        else:
+            total_sessions = max(app_opens, app_sessions) + guest_sessions
+        
+        # Page name normalization map
+        page_name_map = {
+            "profile": "Profile",
+            "explore": "Explore", 
+            "index": "Home",
+            "home": "Home",
+            "cart": "Workout Cart",
+            "workout-session": "Workout Session",
+            "create-post": "Create Post",
             "admin-dashboard": "Admin Dashboard",
             "featured-workout-detail": "Featured Workout",
             "user-profile": "User Profile",
@@ -4648,11 +4718,9 @@ async def get_comprehensive_stats(
             "privacy-policy": "Privacy Policy",
         }
         
-        top_pages = await db.user_events.aggregate(screen_views_pipeline).to_list(20)
-        
         # Merge duplicates after normalization
         merged_pages = {}
-        for page in top_pages:
+        for page in r["top_pages"]:
             if page["_id"]:
                 normalized = page["_id"].lower().strip()
                 display_name = page_name_map.get(normalized, normalized.replace('-', ' ').title())
@@ -4678,26 +4746,6 @@ async def get_comprehensive_stats(
                 "unique_users": len(page_data["unique_users"])
             })
         
-        # === MOOD CARD SELECTIONS ===
-        mood_pipeline = [
-            {
-                "$match": {
-                    "event_type": "mood_selected",
-                    "timestamp": {"$gte": start_date},
-                    **user_type_filter
-                }
-            },
-            {
-                "$group": {
-                    "_id": "$metadata.mood_category",
-                    "count": {"$sum": 1},
-                    "unique_users": {"$addToSet": {"$ifNull": ["$user_id", "$device_id"]}}
-                }
-            },
-            {"$sort": {"count": -1}},
-            {"$limit": 10}
-        ]
-        
         mood_display_names = {
             "sweat": "I Want to Sweat",
             "muscle": "Muscle Gainer",
@@ -4707,10 +4755,9 @@ async def get_comprehensive_stats(
             "explosive": "Get Explosive"
         }
         
-        top_moods = await db.user_events.aggregate(mood_pipeline).to_list(10)
         top_moods_formatted = []
         total_mood_selections = 0
-        for mood in top_moods:
+        for mood in r["top_moods"]:
             if mood["_id"]:
                 count = mood["count"]
                 total_mood_selections += count
@@ -4722,75 +4769,19 @@ async def get_comprehensive_stats(
                     "unique_users": len(mood["unique_users"]) if mood["unique_users"] else 0
                 })
         
-        # === WORKOUT METRICS ===
-        workouts_started = await db.user_events.count_documents({
-            "event_type": "workout_started",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        workouts_completed = await db.user_events.count_documents({
-            "event_type": "workout_completed",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        # Workouts added to cart (cart_item_added events)
-        workouts_added = await db.user_events.count_documents({
-            "event_type": "cart_item_added",
-            "timestamp": {"$gte": start_date}
-        })
-        
+        workouts_started = r["workouts_started"]
+        workouts_completed = r["workouts_completed"]
+        workouts_added = r["workouts_added"]
         completion_rate = round((workouts_completed / workouts_started * 100), 1) if workouts_started > 0 else 0
         
-        # === SOCIAL METRICS ===
-        total_posts = await db.user_events.count_documents({
-            "event_type": "post_created",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        total_likes = await db.user_events.count_documents({
-            "event_type": "post_liked",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        total_comments = await db.user_events.count_documents({
-            "event_type": "post_commented",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        total_follows = await db.user_events.count_documents({
-            "event_type": "user_followed",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        # === GUEST METRICS ===
-        # Count guest sessions started
-        guest_signins = await db.user_events.count_documents({
-            "event_type": "guest_session_started",
-            "is_guest": True,
-            "timestamp": {"$gte": start_date}
-        })
-        
-        # Count unique guest devices
-        guest_devices = await db.user_events.distinct(
-            "device_id",
-            {
-                "event_type": "guest_session_started",
-                "is_guest": True,
-                "timestamp": {"$gte": start_date}
-            }
-        )
-        unique_guest_devices = len(guest_devices) if guest_devices else 0
+        total_posts = r["total_posts"]
+        total_likes = r["total_likes"]
+        total_comments = r["total_comments"]
+        total_follows = r["total_follows"]
         
-        # Count guests who converted (unique devices that merged to a user)
-        converted_devices = await db.user_events.distinct(
-            "device_id",
-            {
-                "is_guest": True,
-                "merged_to_user_id": {"$ne": None},
-                "timestamp": {"$gte": start_date}
-            }
-        )
-        guest_conversions = len(converted_devices) if converted_devices else 0
+        guest_signins = r["guest_signins"]
+        unique_guest_devices = len(r["guest_devices"] or [])
+        guest_conversions = len(r["converted_devices"] or [])
         
         return {
             "period_days": days,
@@ -4864,34 +4855,34 @@ async def get_users_list(
     sort_direction = -1 if sort_order == "desc" else 1
     
     # Get users
-    users_cursor = db.users.find(query).sort(sort_by, sort_direction).skip(skip).limit(limit)
+    users_cursor = analytics_db.users.find(query).sort(sort_by, sort_direction).skip(skip).limit(limit)
     users = await users_cursor.to_list(limit)
-    total_count = await db.users.count_documents(query)
+    total_count = await analytics_db.users.count_documents(query)
     
     user_details = []
     for user in users:
         user_id = str(user["_id"])
         
         # Get activity metrics
-        events_count = await db.user_events.count_documents({
+        events_count = await analytics_db.user_events.count_documents({
             "user_id": user_id,
             "timestamp": {"$gte": start_date}
         })
         
-        workouts_count = await db.user_events.count_documents({
+        workouts_count = await analytics_db.user_events.count_documents({
             "user_id": user_id,
             "event_type": "workout_completed",
             "timestamp": {"$gte": start_date}
         })
         
-        posts_count = await db.user_events.count_documents({
+        posts_count = await analytics_db.user_events.count_documents({
             "user_id": user_id,
             "event_type": "post_created",
             "timestamp": {"$gte": start_date}
         })
         
         # Get last activity
-        last_event = await db.user_events.find_one(
+        last_event = await analytics_db.user_events.find_one(
             {"user_id": user_id},
             sort=[("timestamp", -1)]
         )
@@ -4948,7 +4939,7 @@ async def get_user_detail_report(
     
     try:
         # Find the user
-        target_user = await db.users.find_one({"_id": ObjectId(user_id)})
+        target_user = await analytics_db.users.find_one({"_id": ObjectId(user_id)})
         if not target_user:
             raise HTTPException(status_code=404, detail="User not found")
         
@@ -4964,26 +4955,29 @@ async def get_user_detail_report(
             "following_count": target_user.get("following_count", 0),
         }
         
-        # Workouts added to cart
-        workouts_added_to_cart = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "workout_added_to_cart",
-            "timestamp": date_filter
-        })
-        
-        # Workouts completed
-        workouts_completed = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "workout_completed",
-            "timestamp": date_filter
-        })
+        # All metric queries are independent: run them concurrently
+        batch = QueryBatch(analytics_db)
+        event_counts = [
+            ("workouts_added_to_cart", "workout_added_to_cart"),
+            ("workouts_completed", "workout_completed"),
+            ("workouts_started", "workout_started"),
+            # App sessions (app_opened or app_session_start events)
+            ("app_sessions", {"$in": ["app_opened", "app_session_start"]}),
+            ("posts_created", "post_created"),
+            ("likes_given", "post_liked"),
+            ("comments_made", "post_commented"),
+            ("mood_selections", "mood_selected"),
+            ("follows_given", "user_followed"),
+        ]
+        for name, event_type in event_counts:
+            batch.count(name, "user_events", {
+                "user_id": user_id,
+                "event_type": event_type,
+                "timestamp": date_filter
+            })
         
-        # Workouts started
-        workouts_started = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "workout_started",
-            "timestamp": date_filter
-        })
+        # Also count from posts collection
+        batch.count("posts_in_db", "posts", {"author_id": user_id})
         
         # Screen views (unique screens and total views)
         screen_views_pipeline = [
@@ -5001,7 +4995,46 @@ async def get_user_detail_report(
                 }
             }
         ]
-        screen_views_result = await db.user_events.aggregate(screen_views_pipeline).to_list(100)
+        batch.aggregate("screen_views_result", "user_events", screen_views_pipeline, 100)
+        
+        # Time spent in app (sum of screen_time_spent events)
+        time_spent_pipeline = [
+            {
+                "$match": {
+                    "user_id": user_id,
+                    "event_type": "screen_time_spent",
+                    "timestamp": date_filter
+                }
+            },
+            {
+                "$group": {
+                    "_id": None,
+                    "total_seconds": {"$sum": "$metadata.duration_seconds"}
+                }
+            }
+        ]
+        batch.aggregate("time_spent_result", "user_events", time_spent_pipeline, 1)
+        
+        # Get last activity
+        batch.add("last_event", lambda: analytics_db.user_events.find_one(
+            {"user_id": user_id},
+            sort=[("timestamp", -1)]
+        ))
+        
+        r = await batch.run()
+        workouts_added_to_cart = r["workouts_added_to_cart"]
+        workouts_completed = r["workouts_completed"]
+        workouts_started = r["workouts_started"]
+        app_sessions = r["app_sessions"]
+        posts_created = r["posts_created"]
+        posts_in_db = r["posts_in_db"]
+        likes_given = r["likes_given"]
+        comments_made = r["comments_made"]
+        mood_selections = r["mood_selections"]
+        follows_given = r["follows_given"]
+        last_event = r["last_event"]
+        
+        screen_views_result = r["screen_views_result"]
         total_screen_views = sum(s["count"] for s in screen_views_result)
         unique_screens_viewed = len([s for s in screen_views_result if s["_id"]])
         
@@ -5053,56 +5086,7 @@ async def get_user_detail_report(
             for screen in top_screens:
                 screen["percentage"] = round((screen["views"] / total_screen_views) * 100, 1)
         
-        # App sessions (app_opened or app_session_start events)
-        app_sessions = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": {"$in": ["app_opened", "app_session_start"]},
-            "timestamp": date_filter
-        })
-        
-        # Posts created
-        posts_created = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "post_created",
-            "timestamp": date_filter
-        })
-        
-        # Also count from posts collection
-        posts_in_db = await db.posts.count_documents({
-            "author_id": user_id
-        })
-        
-        # Likes given
-        likes_given = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "post_liked",
-            "timestamp": date_filter
-        })
-        
-        # Comments made
-        comments_made = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "post_commented",
-            "timestamp": date_filter
-        })
-        
-        # Time spent in app (sum of screen_time_spent events)
-        time_spent_pipeline = [
-            {
-                "$match": {
-                    "user_id": user_id,
-                    "event_type": "screen_time_spent",
-                    "timestamp": date_filter
-                }
-            },
-            {
-                "$group": {
-                    "_id": None,
-                    "total_seconds": {"$sum": "$metadata.duration_seconds"}
-                }
-            }
-        ]
-        time_spent_result = await db.user_events.aggregate(time_spent_pipeline).to_list(1)
+        time_spent_result = r["time_spent_result"]
         total_time_seconds = time_spent_result[0]["total_seconds"] if time_spent_result else 0
         
         # Format time spent
@@ -5110,26 +5094,6 @@ async def get_user_detail_report(
         minutes = (total_time_seconds % 3600) // 60
         time_spent_formatted = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
         
-        # Get last activity
-        last_event = await db.user_events.find_one(
-            {"user_id": user_id},
-            sort=[("timestamp", -1)]
-        )
-        
-        # Mood selections
-        mood_selections = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "mood_selected",
-            "timestamp": date_filter
-        })
-        
-        # Follows given
-        follows_given = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "user_followed",
-            "timestamp": date_filter
-        })
-        
         return {
             "user": user_info,
             "period_days": days,
@@ -5173,44 +5137,84 @@ async def get_user_detail_report(
 @api_router.get("/analytics/admin/export/users")
 async def export_users_csv(
     days: int = 30,
+    format: str = "json",
     current_user_id: str = Depends(require_admin)
 ):
     """
-    Export all users data as CSV format (returns JSON for frontend to convert).
+    Export all users with follower counts and event counts.
+    
+    format:
+    - json: legacy payload ({data, count, period_days}) for the in-app dashboard
+    - csv: streamed CSV download
+    - ndjson: streamed newline-delimited JSON download
+    
+    Rows are produced in batches with one grouped aggregation per batch,
+    so csv/ndjson exports cover the whole user base with flat memory.
+    json is built in memory and stops at USER_EXPORT_JSON_LIMIT users
+    ("truncated": true); use csv or ndjson for the full export.
     """
+    if format not in ("json", "csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be one of: json, csv, ndjson")
+    
     start_date = datetime.now(timezone.utc) - timedelta(days=days)
+    rows = iter_user_export_rows(analytics_db, start_date)
+    
+    if format == "json":
+        export_data = []
+        truncated = False
+        async for row in rows:
+            if len(export_data) >= USER_EXPORT_JSON_LIMIT:
+                truncated = True
+                break
+            export_data.append(row)
+        await rows.aclose()
+        result = {
+            "data": export_data,
+            "count": len(export_data),
+            "period_days": days,
+            "truncated": truncated,
+        }
+        if truncated:
+            result["message"] = (
+                f"Showing the first {USER_EXPORT_JSON_LIMIT} users; "
+                "use format=csv or format=ndjson to export all of them"
+            )
+        return result
     
-    users = await db.users.find({}).to_list(10000)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d")
     
-    export_data = []
-    for user in users:
-        user_id = str(user["_id"])
-        
-        events_count = await db.user_events.count_documents({
-            "user_id": user_id,
-            "timestamp": {"$gte": start_date}
-        })
-        
-        workouts_count = await db.user_events.count_documents({
-            "user_id": user_id,
-            "event_type": "workout_completed"
-        })
+    if format == "ndjson":
+        async def ndjson_stream():
+            async for row in rows:
+                yield json.dumps(row) + "\n"
         
-        export_data.append({
-            "username": user.get("username", ""),
-            "email": user.get("email", ""),
-            "created_at": user.get("created_at").isoformat() if user.get("created_at") else "",
-            "followers": user.get("followers_count", 0),
-            "following": user.get("following_count", 0),
-            "total_workouts": workouts_count,
-            "events_in_period": events_count,
-        })
+        return StreamingResponse(
+            ndjson_stream(),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": f'attachment; filename="users_{stamp}.ndjson"'}
+        )
     
-    return {
-        "data": export_data,
-        "count": len(export_data),
-        "period_days": days
-    }
+    async def csv_stream():
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=USER_EXPORT_FIELDS)
+        writer.writeheader()
+        pending = 0
+        async for row in rows:
+            writer.writerow(row)
+            pending += 1
+            # Flush every 500 rows to keep chunks reasonably sized
+            if pending >= 500:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                pending = 0
+        yield buffer.getvalue()
+    
+    return StreamingResponse(
+        csv_stream(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="users_{stamp}.csv"'}
+    )
 
 
 @api_router.get("/analytics/admin/deleted-users")
@@ -5248,6 +5252,7 @@ async def get_deleted_users(
                 "posts_count": user.get("posts_count", 0),
                 "followers_count": user.get("followers_count", 0),
                 "login_provider": user.get("login_provider", "email"),
+                "deletion_job_id": user.get("deletion_job_id"),
             })
         
         # Get total count for the period
@@ -5327,39 +5332,216 @@ async def soft_delete_user(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@api_router.get("/analytics/admin/deleted-users")
-async def get_deleted_users(
+@api_router.get("/analytics/admin/deleted-users")
+async def get_deleted_users(
+    current_user_id: str = Depends(require_admin)
+):
+    """
+    Get list of soft-deleted users that can be recovered.
+    """
+    # Check admin allowlist
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
+    
+    now = datetime.now(timezone.utc)
+    
+    # Get deleted users that haven't expired
+    deleted_users = await db.deleted_users.find({
+        "expires_at": {"$gt": now}
+    }).sort("deleted_at", -1).to_list(100)
+    
+    result = []
+    for user in deleted_users:
+        result.append({
+            "original_id": user.get("original_id"),
+            "username": user.get("username"),
+            "email": user.get("email"),
+            "deleted_at": user.get("deleted_at").isoformat() if user.get("deleted_at") else None,
+            "expires_at": user.get("expires_at").isoformat() if user.get("expires_at") else None,
+            "days_remaining": (user.get("expires_at") - now).days if user.get("expires_at") else 0
+        })
+    
+    return {
+        "deleted_users": result,
+        "count": len(result)
+    }
+
+
+@api_router.get("/analytics/admin/deletion-jobs")
+async def list_deletion_jobs(
+    status: Optional[str] = None,
+    kind: Optional[str] = None,
+    limit: int = 50,
+    current_user_id: str = Depends(require_admin)
+):
+    """
+    Background deletion jobs (account purges), newest first, with per-step progress.
+    """
+    # Check admin allowlist
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
+    
+    runner = get_deletion_job_runner(db)
+    return {
+        "jobs": await runner.list_jobs(status=status, kind=kind, limit=min(limit, 200)),
+        "runner": runner.get_status()
+    }
+
+
+@api_router.get("/analytics/admin/deletion-jobs/{job_id}")
+async def get_deletion_job(
+    job_id: str,
+    current_user_id: str = Depends(require_admin)
+):
+    """Progress of a single deletion job."""
+    # Check admin allowlist
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
+    
+    if not ObjectId.is_valid(job_id):
+        raise HTTPException(status_code=400, detail="Invalid job id")
+    job = await get_deletion_job_runner(db).get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Deletion job not found")
+    return job
+
+
+@api_router.post("/analytics/admin/deletion-jobs/{job_id}/retry")
+async def retry_deletion_job(
+    job_id: str,
+    current_user_id: str = Depends(require_admin)
+):
+    """Re-queue a failed deletion job; completed steps are not repeated."""
+    # Check admin allowlist
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
+    
+    if not ObjectId.is_valid(job_id):
+        raise HTTPException(status_code=400, detail="Invalid job id")
+    if not await get_deletion_job_runner(db).retry(job_id):
+        raise HTTPException(status_code=400, detail="Only failed jobs can be retried")
+    
+    logger.info(f"Deletion job {job_id} re-queued by admin {current_user_id}")
+    return {"message": "Deletion job re-queued", "job_id": job_id}
+
+
+class ProfilerConfig(BaseModel):
+    sample_rate: float = 0.0
+    route: Optional[str] = None
+    interval_ms: int = 5
+    max_profiles: int = 20
+    duration_minutes: float = 15
+
+
+@api_router.get("/analytics/admin/profiler")
+async def get_profiler_status(current_user_id: str = Depends(require_admin)):
+    """Profiler settings and metadata of the captured profiles (this worker only)."""
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
+    return get_request_profiler().get_status()
+
+
+@api_router.post("/analytics/admin/profiler")
+async def enable_profiler(
+    config: ProfilerConfig,
+    current_user_id: str = Depends(require_admin)
+):
+    """
+    Start sampling requests.
+    
+    Body:
+    - sample_rate: Fraction of requests to profile (0-1)
+    - route: Route template or path to profile, e.g. /api/posts/following
+      (all matching requests when sample_rate is 0)
+    - interval_ms: Stack sampling interval
+    - max_profiles: How many recent profiles to keep
+    - duration_minutes: Profiling switches off after this long
+    """
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
+    
+    try:
+        get_request_profiler().configure(**config.dict())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    logger.info(f"Request profiler enabled by admin {current_user_id}: {config.dict()}")
+    return get_request_profiler().get_status()
+
+
+@api_router.delete("/analytics/admin/profiler")
+async def disable_profiler(current_user_id: str = Depends(require_admin)):
+    """Stop sampling; captured profiles stay downloadable."""
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
+    get_request_profiler().disable()
+    return {"success": True}
+
+
+@api_router.get("/analytics/admin/profiler/profiles/{profile_id}")
+async def download_profile(
+    profile_id: int,
+    format: str = "speedscope",
     current_user_id: str = Depends(require_admin)
 ):
     """
-    Get list of soft-deleted users that can be recovered.
+    Download a captured profile.
+    
+    Query params:
+    - format: speedscope (JSON, open at speedscope.app) or collapsed (flamegraph.pl / inferno)
     """
-    # Check admin allowlist
     if not await is_admin_allowed(current_user_id):
         raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
+    if format not in ("speedscope", "collapsed"):
+        raise HTTPException(status_code=400, detail="format must be speedscope or collapsed")
     
-    now = datetime.now(timezone.utc)
+    profile = get_request_profiler().get_profile(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found (evicted or captured by another worker)")
     
-    # Get deleted users that haven't expired
-    deleted_users = await db.deleted_users.find({
-        "expires_at": {"$gt": now}
-    }).sort("deleted_at", -1).to_list(100)
+    if format == "collapsed":
+        return PlainTextResponse(
+            to_collapsed(profile),
+            headers={"Content-Disposition": f"attachment; filename=profile_{profile_id}.folded"}
+        )
+    return Response(
+        content=json.dumps(to_speedscope(profile)),
+        media_type="application/json",
+        headers={"Content-Disposition": f"attachment; filename=profile_{profile_id}.speedscope.json"}
+    )
+
+
+@api_router.post("/analytics/admin/backfill-event-audience")
+async def run_event_audience_backfill(
+    max_batches: Optional[int] = None,
+    current_user_id: str = Depends(require_admin)
+):
+    """
+    Stamp is_internal/audience on existing user_events.
+    Runs automatically at startup and when the internal user set changes
+    (see sync_event_audience); this forces a pass, and max_batches can bound it.
+    """
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
     
-    result = []
-    for user in deleted_users:
-        result.append({
-            "original_id": user.get("original_id"),
-            "username": user.get("username"),
-            "email": user.get("email"),
-            "deleted_at": user.get("deleted_at").isoformat() if user.get("deleted_at") else None,
-            "expires_at": user.get("expires_at").isoformat() if user.get("expires_at") else None,
-            "days_remaining": (user.get("expires_at") - now).days if user.get("expires_at") else 0
-        })
+    stats = await backfill_event_audience(db, max_batches=max_batches)
+    return {"success": True, "updated": stats}
+
+
+@api_router.post("/analytics/admin/backfill-comment-paths")
+async def run_comment_path_backfill(
+    max_batches: Optional[int] = None,
+    current_user_id: str = Depends(require_admin)
+):
+    """
+    Stamp root_id/ancestor_ids on comments created before threads stored
+    their path. Runs automatically at startup (see sync_comment_paths);
+    this forces a pass, and max_batches can bound it.
+    """
+    if not await is_admin_allowed(current_user_id):
+        raise HTTPException(status_code=403, detail="Admin access required - not in allowlist")
     
-    return {
-        "deleted_users": result,
-        "count": len(result)
-    }
+    stats = await backfill_comment_paths(db, max_batches=max_batches)
+    return {"success": True, "updated": stats}
 
 
 @api_router.post("/analytics/admin/users/{user_id}/restore")
@@ -5417,6 +5599,7 @@ async def restore_deleted_user(
 
 
 @api_router.get("/analytics/admin/chart-data/{chart_type}")
+@fast_json
 async def get_chart_data(
     chart_type: str,
     period: str = "day",  # day, week, month
@@ -5489,7 +5672,7 @@ async def get_chart_data(
     
     try:
         if chart_type == "user_growth":
-            users = await db.users.find(
+            users = await analytics_db.users.find(
                 {"created_at": {"$gte": cutoff}},
                 {"created_at": 1}
             ).to_list(100000)
@@ -5521,7 +5704,7 @@ async def get_chart_data(
             }
             
         elif chart_type == "session_trend":
-            events = await db.user_events.find(
+            events = await analytics_db.user_events.find(
                 {"event_type": {"$in": ["app_opened", "app_session_start"]}, "timestamp": {"$gte": cutoff}},
                 {"timestamp": 1}
             ).to_list(100000)
@@ -5559,7 +5742,7 @@ async def get_chart_data(
                 "explosive": "Get Explosive"
             }
             
-            moods = await db.user_events.aggregate(mood_pipeline).to_list(20)
+            moods = await analytics_db.user_events.aggregate(mood_pipeline).to_list(20)
             
             return {
                 "chart_type": chart_type,
@@ -5577,7 +5760,7 @@ async def get_chart_data(
                 {"$limit": 10}
             ]
             
-            pages = await db.user_events.aggregate(page_pipeline).to_list(10)
+            pages = await analytics_db.user_events.aggregate(page_pipeline).to_list(10)
             
             return {
                 "chart_type": chart_type,
@@ -5600,8 +5783,8 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            started = await db.user_events.aggregate(started_pipeline).to_list(100)
-            completed = await db.user_events.aggregate(completed_pipeline).to_list(100)
+            started = await analytics_db.user_events.aggregate(started_pipeline).to_list(100)
+            completed = await analytics_db.user_events.aggregate(completed_pipeline).to_list(100)
             
             # Merge datasets
             all_dates = sorted(set([s["_id"] for s in started] + [c["_id"] for c in completed]))
@@ -5620,17 +5803,17 @@ async def get_chart_data(
             }
             
         elif chart_type == "engagement_trend":
-            like_events = await db.user_events.find(
+            like_events = await analytics_db.user_events.find(
                 {"event_type": "post_liked", "timestamp": {"$gte": cutoff}},
                 {"timestamp": 1}
             ).to_list(100000)
             
-            comment_events = await db.user_events.find(
+            comment_events = await analytics_db.user_events.find(
                 {"event_type": "post_commented", "timestamp": {"$gte": cutoff}},
                 {"timestamp": 1}
             ).to_list(100000)
             
-            follow_events = await db.user_events.find(
+            follow_events = await analytics_db.user_events.find(
                 {"event_type": "user_followed", "timestamp": {"$gte": cutoff}},
                 {"timestamp": 1}
             ).to_list(100000)
@@ -5677,7 +5860,7 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            results = await db.user_events.aggregate(pipeline).to_list(100)
+            results = await analytics_db.user_events.aggregate(pipeline).to_list(100)
             labels = [format_label(r["_id"], period) for r in results]
             
             return {
@@ -5693,7 +5876,7 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            results = await db.user_events.aggregate(pipeline).to_list(100)
+            results = await analytics_db.user_events.aggregate(pipeline).to_list(100)
             labels = [format_label(r["_id"], period) for r in results]
             
             return {
@@ -5709,7 +5892,7 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            results = await db.user_events.aggregate(pipeline).to_list(100)
+            results = await analytics_db.user_events.aggregate(pipeline).to_list(100)
             labels = [format_label(r["_id"], period) for r in results]
             
             return {
@@ -5725,7 +5908,7 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            results = await db.user_events.aggregate(pipeline).to_list(100)
+            results = await analytics_db.user_events.aggregate(pipeline).to_list(100)
             labels = [format_label(r["_id"], period) for r in results]
             
             return {
@@ -5741,7 +5924,7 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            results = await db.user_events.aggregate(pipeline).to_list(100)
+            results = await analytics_db.user_events.aggregate(pipeline).to_list(100)
             labels = [format_label(r["_id"], period) for r in results]
             
             return {
@@ -5757,7 +5940,7 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            results = await db.user_events.aggregate(pipeline).to_list(100)
+            results = await analytics_db.user_events.aggregate(pipeline).to_list(100)
             labels = [format_label(r["_id"], period) for r in results]
             
             return {
@@ -5783,7 +5966,7 @@ async def get_chart_data(
                 {"$match": {"event_type": "workout_completed", "timestamp": {"$gte": cutoff}}},
                 {"$group": {"_id": "$metadata.mood_category"}},
             ]
-            moods = await db.user_events.aggregate(mood_pipeline).to_list(20)
+            moods = await analytics_db.user_events.aggregate(mood_pipeline).to_list(20)
             mood_list = [m["_id"] for m in moods if m["_id"]]
             
             # Get completions by date for each mood
@@ -5796,7 +5979,7 @@ async def get_chart_data(
                     {"$group": {"_id": {"$dateToString": {"format": date_format, "date": "$timestamp"}}, "count": {"$sum": 1}}},
                     {"$sort": {"_id": 1}}
                 ]
-                results = await db.user_events.aggregate(pipeline).to_list(100)
+                results = await analytics_db.user_events.aggregate(pipeline).to_list(100)
                 mood_data[mood] = {r["_id"]: r["count"] for r in results}
                 all_dates.update(mood_data[mood].keys())
             
@@ -5827,7 +6010,7 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            results = await db.choose_for_me_usage.aggregate(pipeline).to_list(100)
+            results = await analytics_db.choose_for_me_usage.aggregate(pipeline).to_list(100)
             labels = [format_label(r["_id"], period) for r in results]
             
             return {
@@ -5861,7 +6044,7 @@ async def get_chart_data(
                 {"$group": {"_id": "$mood_card", "count": {"$sum": 1}}},
                 {"$sort": {"count": -1}}
             ]
-            results = await db.choose_for_me_usage.aggregate(mood_pipeline).to_list(20)
+            results = await analytics_db.choose_for_me_usage.aggregate(mood_pipeline).to_list(20)
             
             labels = []
             data = []
@@ -5885,7 +6068,7 @@ async def get_chart_data(
                 {"$sort": {"_id": 1}}
             ]
             
-            results = await db.user_events.aggregate(pipeline).to_list(100)
+            results = await analytics_db.user_events.aggregate(pipeline).to_list(100)
             labels = [format_label(r["_id"], period) for r in results]
             
             return {
@@ -6120,6 +6303,8 @@ async def update_profile(
         user = await db.users.find_one({"_id": ObjectId(current_user_id)})
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
+    elif update_fields.keys() & {"username", "name", "avatar"}:
+        await refresh_user_snapshot(db, current_user_id)
     
     return {"message": "Profile updated successfully"}
 
@@ -6141,10 +6326,11 @@ async def update_credentials(
             raise HTTPException(status_code=400, detail="Cannot change credentials for OAuth accounts")
         
         # Check if password matches
-        if isinstance(stored_password, str):
-            stored_password = stored_password.encode('utf-8')
-        
-        if not bcrypt.checkpw(credentials.current_password.encode('utf-8'), stored_password):
+        try:
+            password_match = await verify_password(credentials.current_password, stored_password)
+        except PasswordHashingBusy:
+            raise HTTPException(status_code=503, detail="Server busy, please try again")
+        if not password_match:
             raise HTTPException(status_code=401, detail="Current password is incorrect")
         
         update_fields = {}
@@ -6183,7 +6369,10 @@ async def update_credentials(
                 raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
             
             # Hash the new password
-            new_hash = bcrypt.hashpw(credentials.new_password.encode('utf-8'), bcrypt.gensalt())
+            try:
+                new_hash = await hash_password(credentials.new_password)
+            except PasswordHashingBusy:
+                raise HTTPException(status_code=503, detail="Server busy, please try again")
             update_fields["password_hash"] = new_hash
             update_fields["password"] = new_hash  # Update both fields for compatibility
         
@@ -6279,51 +6468,27 @@ async def delete_user_account(current_user_id: str = Depends(get_current_user)):
         await db.deleted_users.insert_one(deletion_record)
         logger.info(f"📊 Tracked deletion for user: {username}")
         
-        # Delete user's posts
-        posts_result = await db.posts.delete_many({"author_id": current_user_id})
-        logger.info(f"Deleted {posts_result.deleted_count} posts")
-        
-        # Delete user's comments
-        comments_result = await db.comments.delete_many({"author_id": current_user_id})
-        logger.info(f"Deleted {comments_result.deleted_count} comments")
-        
-        # Delete user's saved workouts
-        saved_result = await db.saved_workouts.delete_many({"user_id": current_user_id})
-        logger.info(f"Deleted {saved_result.deleted_count} saved workouts")
-        
-        # Delete user's workout cards
-        cards_result = await db.workout_cards.delete_many({"user_id": current_user_id})
-        logger.info(f"Deleted {cards_result.deleted_count} workout cards")
-        
-        # Delete user's analytics events
-        events_result = await db.user_events.delete_many({"user_id": current_user_id})
-        logger.info(f"Deleted {events_result.deleted_count} analytics events")
-        
-        # Delete user's sessions
-        sessions_result = await db.user_sessions.delete_many({"user_id": current_user_id})
-        logger.info(f"Deleted {sessions_result.deleted_count} sessions")
-        
-        # Remove user from followers/following lists
-        await db.users.update_many(
-            {"followers": current_user_id},
-            {"$pull": {"followers": current_user_id}, "$inc": {"followers_count": -1}}
-        )
-        await db.users.update_many(
-            {"following": current_user_id},
-            {"$pull": {"following": current_user_id}, "$inc": {"following_count": -1}}
-        )
-        
-        # Delete likes on user's posts
-        await db.likes.delete_many({"author_id": current_user_id})
-        
-        # Delete the user
+        # Remove the account itself right away - logins and profile lookups stop here
         delete_result = await db.users.delete_one({"_id": ObjectId(current_user_id)})
         
         if delete_result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="User not found")
         
-        logger.info(f"✅ Successfully deleted account for user: {username}")
-        return {"message": "Account deleted successfully"}
+        # Posts, social graph, messages, notifications and counters on other
+        # users are purged in chunks by the background deletion job
+        job_id = await get_deletion_job_runner(db).enqueue(
+            JOB_ACCOUNT_DELETION,
+            current_user_id,
+            params={"username": username},
+            requested_by=current_user_id
+        )
+        await db.deleted_users.update_one(
+            {"_id": deletion_record["_id"]},
+            {"$set": {"deletion_job_id": job_id}}
+        )
+        
+        logger.info(f"✅ Deleted account for user: {username}, purge job {job_id} queued")
+        return {"message": "Account deleted successfully", "deletion_job_id": job_id}
         
     except HTTPException:
         raise
@@ -6362,7 +6527,7 @@ async def upload_profile_picture(
         # Upload to Cloudinary with avatar-specific transformations
         public_id = f"mood_app/avatars/{current_user_id}"
         
-        result = cloudinary.uploader.upload(
+        result = get_cloudinary().uploader.upload(
             file_content,
             public_id=public_id,
             resource_type="image",
@@ -6382,6 +6547,7 @@ async def upload_profile_picture(
             {"_id": ObjectId(current_user_id)},
             {"$set": {"avatar": secure_url}}
         )
+        await refresh_user_snapshot(db, current_user_id)
         
         logger.info(f"✅ Profile picture uploaded to Cloudinary: {secure_url}")
         return {
@@ -6389,7 +6555,7 @@ async def upload_profile_picture(
             "url": secure_url
         }
     
-    except cloudinary.exceptions.Error as e:
+    except get_cloudinary().exceptions.Error as e:
         logger.error(f"Cloudinary avatar upload error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Cloud upload failed: {str(e)}")
     except HTTPException:
@@ -6416,7 +6582,7 @@ async def upload_profile_picture_base64(
         # Upload to Cloudinary (it handles base64 data URLs directly)
         public_id = f"mood_app/avatars/{current_user_id}"
         
-        result = cloudinary.uploader.upload(
+        result = get_cloudinary().uploader.upload(
             image_data,
             public_id=public_id,
             resource_type="image",
@@ -6436,6 +6602,7 @@ async def upload_profile_picture_base64(
             {"_id": ObjectId(current_user_id)},
             {"$set": {"avatar": secure_url}}
         )
+        await refresh_user_snapshot(db, current_user_id)
         
         logger.info(f"✅ Profile picture uploaded to Cloudinary (base64): {secure_url}")
         return {
@@ -6443,7 +6610,7 @@ async def upload_profile_picture_base64(
             "url": secure_url
         }
     
-    except cloudinary.exceptions.Error as e:
+    except get_cloudinary().exceptions.Error as e:
         logger.error(f"Cloudinary avatar upload error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Cloud upload failed: {str(e)}")
     except Exception as e:
@@ -6621,6 +6788,9 @@ async def search_users_general(
                 {"name": {"$regex": search_query, "$options": "i"}}
             ]
         }
+        blocked = await get_blocked_user_ids(db, current_user_id)
+        if blocked:
+            query["_id"] = blocked_nin(blocked)
         
         users = await db.users.find(query).limit(limit).to_list(length=limit)
         
@@ -6659,6 +6829,7 @@ async def search_users_general(
 
 
 @api_router.get("/users/{user_id}/posts")
+@fast_json
 async def get_user_posts(
     user_id: str,
     current_user_id: str = Depends(get_current_user),
@@ -6732,7 +6903,7 @@ async def get_user_posts(
         result = []
         for post in posts:
             # Convert ObjectIds to strings
-            author_data = UserResponse(
+            author_data = UserResponse.model_construct(
                 id=str(post["author"]["_id"]),
                 username=post["author"]["username"],
                 email=post["author"]["email"],
@@ -6749,7 +6920,7 @@ async def get_user_posts(
             workout_data = None
             if post.get("workout") and len(post["workout"]) > 0:
                 workout = post["workout"][0]
-                workout_data = WorkoutResponse(
+                workout_data = WorkoutResponse.model_construct(
                     id=str(workout["_id"]),
                     title=workout["title"],
                     mood_category=workout["mood_category"],
@@ -6776,7 +6947,7 @@ async def get_user_posts(
                 except Exception as e:
                     print(f"Error parsing workout_data: {e}")
             
-            result.append(PostResponse(
+            result.append(PostResponse.model_construct(
                 id=str(post["_id"]),
                 author=author_data,
                 workout=workout_data,
@@ -6983,7 +7154,7 @@ async def upload_file(
             upload_options["eager_async"] = False
         
         # Upload to Cloudinary
-        result = cloudinary.uploader.upload(
+        result = get_cloudinary().uploader.upload(
             file_content,
             **upload_options
         )
@@ -7018,7 +7189,7 @@ async def upload_file(
         
         return response_data
     
-    except cloudinary.exceptions.Error as e:
+    except get_cloudinary().exceptions.Error as e:
         logger.error(f"Cloudinary upload error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Cloud upload failed: {str(e)}")
     except Exception as e:
@@ -7089,7 +7260,7 @@ async def upload_multiple_files(
             
             # Upload to Cloudinary
             logger.info(f"📤 Uploading {resource_type} to Cloudinary: {file.filename}")
-            result = cloudinary.uploader.upload(file_content, **upload_options)
+            result = get_cloudinary().uploader.upload(file_content, **upload_options)
             
             secure_url = result.get("secure_url")
             uploaded_results.append(secure_url)
@@ -7201,7 +7372,7 @@ async def create_post(post_data: PostCreate, current_user_id: str = Depends(get_
     )
     if not content_check["is_clean"]:
         # Log rejected attempt to database for moderation review
-        await db.moderation_logs.insert_one({
+        get_log_writer(db).append("moderation_logs", {
             "user_id": current_user_id,
             "content_type": "post",
             "action": "rejected",
@@ -7296,10 +7467,12 @@ async def create_post(post_data: PostCreate, current_user_id: str = Depends(get_
     }
     
     result = await db.posts.insert_one(post_doc)
+    await db.users.update_one({"_id": ObjectId(current_user_id)}, {"$inc": {"posts_count": 1}})
     logger.info(f"✅ Post created: {result.inserted_id}, has_attached_workout: {attached_workout is not None}")
     return {"message": "Post created successfully", "id": str(result.inserted_id)}
 
 @api_router.get("/posts/following")
+@fast_json
 async def get_following_posts(
     current_user_id: str = Depends(get_current_user),
     limit: int = 20,
@@ -7311,7 +7484,8 @@ async def get_following_posts(
         
         # Get list of users current user is following
         following = await db.follows.find({"follower_id": user_object_id}).to_list(length=None)
-        following_ids = [f["following_id"] for f in following]
+        blocked = await get_blocked_user_ids(db, current_user_id)
+        following_ids = [f["following_id"] for f in following if str(f["following_id"]) not in blocked]
         
         if not following_ids:
             # If not following anyone, return empty list
@@ -7360,7 +7534,7 @@ async def get_following_posts(
         result = []
         for post in posts:
             # Convert ObjectIds to strings
-            author_data = UserResponse(
+            author_data = UserResponse.model_construct(
                 id=str(post["author"]["_id"]),
                 username=post["author"]["username"],
                 email=post["author"]["email"],
@@ -7377,7 +7551,7 @@ async def get_following_posts(
             workout_data = None
             if post.get("workout") and len(post["workout"]) > 0:
                 workout = post["workout"][0]
-                workout_data = WorkoutResponse(
+                workout_data = WorkoutResponse.model_construct(
                     id=str(workout["_id"]),
                     title=workout["title"],
                     mood_category=workout["mood_category"],
@@ -7404,7 +7578,7 @@ async def get_following_posts(
                 except Exception as e:
                     print(f"Error parsing workout_data: {e}")
             
-            result.append(PostResponse(
+            result.append(PostResponse.model_construct(
                 id=str(post["_id"]),
                 author=author_data,
                 workout=workout_data,
@@ -7424,8 +7598,16 @@ async def get_following_posts(
         return []
 
 @api_router.get("/posts/public")
-async def get_public_posts(limit: int = 20, skip: int = 0):
+@fast_json
+async def get_public_posts(
+    limit: int = 20,
+    skip: int = 0,
+    current_user_id: Optional[str] = Depends(get_optional_current_user)
+):
     """Get public feed posts without authentication (for guest users)"""
+    # Signed-in callers still get their blocks applied
+    blocked = await get_blocked_user_ids(db, current_user_id)
+    
     # Get posts with author and workout details
     pipeline = [
         {"$sort": {"created_at": -1}},
@@ -7441,13 +7623,15 @@ async def get_public_posts(limit: int = 20, skip: int = 0):
         },
         {"$unwind": "$author"}
     ]
+    if blocked:
+        pipeline.insert(0, {"$match": {"author_id": blocked_nin(blocked)}})
     
     posts = await db.posts.aggregate(pipeline).to_list(length=limit)
     
     result = []
     for post in posts:
         # Convert ObjectIds to strings
-        author_data = UserResponse(
+        author_data = UserResponse.model_construct(
             id=str(post["author"]["_id"]),
             username=post["author"]["username"],
             email=post["author"]["email"],
@@ -7476,7 +7660,7 @@ async def get_public_posts(limit: int = 20, skip: int = 0):
             except Exception as e:
                 print(f"Error parsing workout_data: {e}")
         
-        result.append(PostResponse(
+        result.append(PostResponse.model_construct(
             id=str(post["_id"]),
             author=author_data,
             workout=None,  # Skip workout details for public feed
@@ -7495,8 +7679,12 @@ async def get_public_posts(limit: int = 20, skip: int = 0):
     return result
 
 @api_router.get("/posts")
+@fast_json
 async def get_posts(current_user_id: str = Depends(get_current_user), limit: int = 20, skip: int = 0):
     """Get feed posts with user and workout information"""
+    # Blocked users (either direction) are excluded before the page is cut
+    blocked = await get_blocked_user_ids(db, current_user_id)
+    
     # Get posts with author and workout details
     pipeline = [
         {"$sort": {"created_at": -1}},
@@ -7551,6 +7739,7 @@ async def get_posts(current_user_id: str = Depends(get_current_user), limit: int
                 "let": {"post_id": {"$toString": "$_id"}},
                 "pipeline": [
                     {"$match": {"$expr": {"$eq": ["$post_id", "$$post_id"]}}},
+                    {"$match": {"author_id": blocked_nin(blocked)}},
                     {"$sort": {"created_at": 1}},
                     {"$limit": 1},
                     {
@@ -7569,13 +7758,15 @@ async def get_posts(current_user_id: str = Depends(get_current_user), limit: int
             }
         }
     ]
+    if blocked:
+        pipeline.insert(0, {"$match": {"author_id": blocked_nin(blocked)}})
     
     posts = await db.posts.aggregate(pipeline).to_list(length=limit)
     
     result = []
     for post in posts:
         # Convert ObjectIds to strings
-        author_data = UserResponse(
+        author_data = UserResponse.model_construct(
             id=str(post["author"]["_id"]),
             username=post["author"]["username"],
             email=post["author"]["email"],
@@ -7592,7 +7783,7 @@ async def get_posts(current_user_id: str = Depends(get_current_user), limit: int
         workout_data = None
         if post.get("workout") and len(post["workout"]) > 0:
             workout = post["workout"][0]
-            workout_data = WorkoutResponse(
+            workout_data = WorkoutResponse.model_construct(
                 id=str(workout["_id"]),
                 title=workout["title"],
                 mood_category=workout["mood_category"],
@@ -7816,7 +8007,7 @@ async def create_comment(comment_data: CommentCreate, current_user_id: str = Dep
         )
         if not content_check["is_clean"]:
             # Log rejected attempt to database for moderation review
-            await db.moderation_logs.insert_one({
+            get_log_writer(db).append("moderation_logs", {
                 "user_id": current_user_id,
                 "content_type": "comment",
                 "action": "rejected",
@@ -7833,13 +8024,21 @@ async def create_comment(comment_data: CommentCreate, current_user_id: str = Dep
                 detail="This content violates our community guidelines."
             )
         
+        # Thread path comes from the parent (root first, direct parent last)
+        comment_object_id = ObjectId()
+        thread_fields, parent_comment = await build_thread_fields(
+            db, comment_object_id, comment_data.parent_comment_id
+        )
+        
         # Build comment document
         comment_doc = {
+            "_id": comment_object_id,
             "post_id": comment_data.post_id,
             "text": comment_data.text,
             "author_id": current_user_id,
             "created_at": datetime.now(timezone.utc),
             "parent_comment_id": comment_data.parent_comment_id,  # None for top-level comments
+            **thread_fields,
             "mentioned_user_ids": comment_data.mentioned_user_ids or [],
             "replies_count": 0,
             "likes_count": 0
@@ -7848,32 +8047,10 @@ async def create_comment(comment_data: CommentCreate, current_user_id: str = Dep
         result = await db.comments.insert_one(comment_doc)
         comment_id = str(result.inserted_id)
         
-        # If this is a reply, increment reply counts up the chain to the root comment
+        # If this is a reply, bump the parent's replies_count and every higher
+        # ancestor's total_thread_replies in one bulk write
         if comment_data.parent_comment_id:
-            # Increment the direct parent's reply count
-            await db.comments.update_one(
-                {"_id": ObjectId(comment_data.parent_comment_id)},
-                {"$inc": {"replies_count": 1}}
-            )
-            
-            # Also increment all ancestor comments' total_thread_replies count
-            # This allows the root comment to show total replies in the thread
-            current_parent_id = comment_data.parent_comment_id
-            visited = set()  # Prevent infinite loops
-            while current_parent_id and current_parent_id not in visited:
-                visited.add(current_parent_id)
-                parent_comment = await db.comments.find_one({"_id": ObjectId(current_parent_id)})
-                if parent_comment and parent_comment.get("parent_comment_id"):
-                    # This parent has a grandparent - increment grandparent's total_thread_replies
-                    grandparent_id = parent_comment["parent_comment_id"]
-                    await db.comments.update_one(
-                        {"_id": ObjectId(grandparent_id)},
-                        {"$inc": {"total_thread_replies": 1}}
-                    )
-                    current_parent_id = grandparent_id
-                else:
-                    # Reached the root comment
-                    break
+            await record_reply(db, thread_fields["ancestor_ids"])
         
         # Update post comment count
         await db.posts.update_one(
@@ -7911,7 +8088,6 @@ async def create_comment(comment_data: CommentCreate, current_user_id: str = Dep
         # If this is a reply, notify the parent comment author
         if comment_data.parent_comment_id:
             try:
-                parent_comment = await db.comments.find_one({"_id": ObjectId(comment_data.parent_comment_id)})
                 if parent_comment and str(parent_comment.get("author_id")) != current_user_id:
                     notification_service = get_notification_service(db)
                     await notification_service.trigger_reply_notification(
@@ -7930,9 +8106,26 @@ async def create_comment(comment_data: CommentCreate, current_user_id: str = Dep
         raise HTTPException(status_code=404, detail="Post not found")
 
 @api_router.get("/posts/{post_id}/comments")
-async def get_post_comments(post_id: str, limit: int = 50, parent_id: Optional[str] = None):
-    """Get comments for a post, optionally filtered by parent (for replies)"""
+async def get_post_comments(
+    post_id: str,
+    limit: int = 50,
+    parent_id: Optional[str] = None,
+    threaded: bool = False,
+    current_user_id: Optional[str] = Depends(get_optional_current_user)
+):
+    """
+    Get comments for a post, optionally filtered by parent (for replies).
+    threaded=true returns top-level comments with their whole reply tree
+    nested under "replies" (roots, then their replies by root_id, then one users query).
+    """
     try:
+        blocked = await get_blocked_user_ids(db, current_user_id)
+        
+        if threaded and not parent_id:
+            comments = await get_post_thread(db, post_id, limit, blocked=blocked)
+            logger.info(f"Retrieved {len(comments)} comment threads for post {post_id}")
+            return comments
+        
         # Build match condition
         match_condition = {"post_id": post_id}
         if parent_id:
@@ -7941,49 +8134,12 @@ async def get_post_comments(post_id: str, limit: int = 50, parent_id: Optional[s
         else:
             # Get top-level comments only (no parent)
             match_condition["parent_comment_id"] = None
+        if blocked:
+            match_condition["author_id"] = blocked_nin(blocked)
         
-        # Get comments with author information
-        pipeline = [
-            {"$match": match_condition},
-            {"$sort": {"created_at": -1}},
-            {"$limit": limit},
-            {
-                "$addFields": {
-                    "author_id_obj": {"$toObjectId": "$author_id"}
-                }
-            },
-            {
-                "$lookup": {
-                    "from": "users",
-                    "localField": "author_id_obj",
-                    "foreignField": "_id",
-                    "as": "author"
-                }
-            },
-            {"$unwind": "$author"},
-            {
-                "$project": {
-                    "id": {"$toString": "$_id"},
-                    "text": 1,
-                    "created_at": 1,
-                    "parent_comment_id": 1,
-                    "mentioned_user_ids": {"$ifNull": ["$mentioned_user_ids", []]},
-                    "replies_count": {"$ifNull": ["$replies_count", 0]},
-                    "total_thread_replies": {"$ifNull": ["$total_thread_replies", 0]},
-                    "likes_count": {"$ifNull": ["$likes_count", 0]},
-                    "author": {
-                        "id": {"$toString": "$author._id"},
-                        "username": "$author.username",
-                        "avatar": {
-                            "$ifNull": ["$author.avatar_url", "$author.avatar"]
-                        }
-                    },
-                    "_id": 0
-                }
-            }
-        ]
-        
-        comments = await db.comments.aggregate(pipeline).to_list(length=limit)
+        # Get comments, then their authors in one batch
+        docs = await db.comments.find(match_condition).sort("created_at", -1).limit(limit).to_list(limit)
+        comments = await hydrate_comments(db, docs)
         logger.info(f"Retrieved {len(comments)} comments for post {post_id}")
         return comments
     except Exception as e:
@@ -7991,50 +8147,24 @@ async def get_post_comments(post_id: str, limit: int = 50, parent_id: Optional[s
         raise HTTPException(status_code=404, detail="Post not found")
 
 @api_router.get("/comments/{comment_id}/replies")
-async def get_comment_replies(comment_id: str, limit: int = 20):
-    """Get replies to a specific comment"""
+async def get_comment_replies(
+    comment_id: str,
+    limit: int = 20,
+    nested: bool = False,
+    current_user_id: Optional[str] = Depends(get_optional_current_user)
+):
+    """Get replies to a specific comment (nested=true: every level beneath it)"""
     try:
-        pipeline = [
-            {"$match": {"parent_comment_id": comment_id}},
-            {"$sort": {"created_at": 1}},  # Oldest first for replies
-            {"$limit": limit},
-            {
-                "$addFields": {
-                    "author_id_obj": {"$toObjectId": "$author_id"}
-                }
-            },
-            {
-                "$lookup": {
-                    "from": "users",
-                    "localField": "author_id_obj",
-                    "foreignField": "_id",
-                    "as": "author"
-                }
-            },
-            {"$unwind": "$author"},
-            {
-                "$project": {
-                    "id": {"$toString": "$_id"},
-                    "text": 1,
-                    "created_at": 1,
-                    "parent_comment_id": 1,
-                    "mentioned_user_ids": {"$ifNull": ["$mentioned_user_ids", []]},
-                    "replies_count": {"$ifNull": ["$replies_count", 0]},
-                    "likes_count": {"$ifNull": ["$likes_count", 0]},
-                    "author": {
-                        "id": {"$toString": "$author._id"},
-                        "username": "$author.username",
-                        "avatar": {
-                            "$ifNull": ["$author.avatar_url", "$author.avatar"]
-                        }
-                    },
-                    "_id": 0
-                }
-            }
-        ]
-        
-        replies = await db.comments.aggregate(pipeline).to_list(length=limit)
-        return replies
+        blocked = await get_blocked_user_ids(db, current_user_id)
+        if nested:
+            return await get_comment_subtree(db, comment_id, limit, blocked=blocked)
+        
+        # Oldest first for replies
+        query = {"parent_comment_id": comment_id}
+        if blocked:
+            query["author_id"] = blocked_nin(blocked)
+        docs = await db.comments.find(query).sort("created_at", 1).limit(limit).to_list(limit)
+        return await hydrate_comments(db, docs)
     except Exception as e:
         logger.error(f"Error fetching replies for comment {comment_id}: {str(e)}")
         raise HTTPException(status_code=404, detail="Comment not found")
@@ -8054,32 +8184,22 @@ async def delete_comment(comment_id: str, current_user_id: str = Depends(get_cur
         
         # Get the post_id to update comment count
         post_id = comment.get("post_id")
-        parent_comment_id = comment.get("parent_comment_id")
-        
-        # Delete the comment
-        await db.comments.delete_one({"_id": ObjectId(comment_id)})
         
-        # Delete all replies to this comment
-        replies_deleted = await db.comments.delete_many({"parent_comment_id": comment_id})
+        # Delete the comment and every reply beneath it; ancestor counters
+        # are adjusted in the same call
+        total_deleted = await delete_comment_subtree(db, comment)
+        replies_deleted = max(total_deleted - 1, 0)
         
         # Update the post's comment count
-        if post_id:
-            total_deleted = 1 + replies_deleted.deleted_count
+        if post_id and total_deleted:
             await db.posts.update_one(
                 {"_id": ObjectId(post_id)},
                 {"$inc": {"comments_count": -total_deleted}}
             )
         
-        # If this was a reply, decrement the parent comment's replies_count
-        if parent_comment_id:
-            await db.comments.update_one(
-                {"_id": ObjectId(parent_comment_id)},
-                {"$inc": {"replies_count": -1}}
-            )
-        
-        logger.info(f"User {current_user_id} deleted comment {comment_id} (and {replies_deleted.deleted_count} replies)")
+        logger.info(f"User {current_user_id} deleted comment {comment_id} (and {replies_deleted} replies)")
         
-        return {"message": "Comment deleted successfully", "replies_deleted": replies_deleted.deleted_count}
+        return {"message": "Comment deleted successfully", "replies_deleted": replies_deleted}
     except HTTPException:
         raise
     except Exception as e:
@@ -8095,13 +8215,15 @@ async def search_users_for_mention(q: str, limit: int = 10, current_user_id: str
     try:
         # Search by username OR name (case-insensitive, contains match for better UX)
         search_regex = {"$regex": re.escape(q), "$options": "i"}
+        blocked = await get_blocked_user_ids(db, current_user_id)
         pipeline = [
             {
                 "$match": {
                     "$or": [
                         {"username": search_regex},
                         {"name": search_regex}
-                    ]
+                    ],
+                    "_id": blocked_nin(blocked)
                 }
             },
             {"$limit": limit},
@@ -8484,17 +8606,12 @@ async def delete_post(
         if str(post.get("author_id")) != current_user_id and not is_admin:
             raise HTTPException(status_code=403, detail="You can only delete your own posts")
         
-        # Delete the post
-        result = await db.posts.delete_one({"_id": ObjectId(post_id)})
+        # Delete the post with its likes, comments, saves and notifications
+        deleted_count = await remove_posts(db, [post_id])
         
-        if result.deleted_count == 0:
+        if deleted_count == 0:
             raise HTTPException(status_code=500, detail="Failed to delete post")
         
-        # Also delete related data
-        await db.likes.delete_many({"post_id": post_id})
-        await db.comments.delete_many({"post_id": post_id})
-        await db.saved_posts.delete_many({"post_id": post_id})
-        
         if is_admin and str(post.get("author_id")) != current_user_id:
             logger.info(f"Post {post_id} deleted by ADMIN {current_user_id}")
         else:
@@ -8527,32 +8644,24 @@ async def admin_bulk_delete_posts(
         if not username and not user_id:
             raise HTTPException(status_code=400, detail="Must provide username or user_id")
         
-        # Build query
-        query = {}
         target_user = None
-        
         if user_id:
-            query["author_id"] = user_id
             target_user = await db.users.find_one({"_id": ObjectId(user_id)})
         elif username:
             # Find user by username (case-insensitive)
             target_user = await db.users.find_one({
                 "username": {"$regex": f"^{username}$", "$options": "i"}
             })
-            if target_user:
-                query["author_id"] = str(target_user["_id"])
-            else:
-                # Also check by display_name or username in posts directly
-                query["$or"] = [
-                    {"username": {"$regex": f"^{username}$", "$options": "i"}},
-                    {"author_username": {"$regex": f"^{username}$", "$options": "i"}}
-                ]
         
-        # Get posts to delete
-        posts_to_delete = await db.posts.find(query).to_list(1000)
-        post_ids = [str(post["_id"]) for post in posts_to_delete]
+        resolved_username = username or (target_user.get("username") if target_user else None)
+        resolved_user_id = user_id or (str(target_user["_id"]) if target_user else None)
         
-        if not posts_to_delete:
+        # By author when known (author_id may be an ObjectId or the string),
+        # otherwise by the username stored on the posts
+        query = post_removal_query(resolved_user_id, username)
+        post_count = await db.posts.count_documents(query)
+        
+        if not post_count:
             return {
                 "message": "No posts found matching criteria",
                 "deleted_count": 0,
@@ -8560,22 +8669,40 @@ async def admin_bulk_delete_posts(
                 "user_id": user_id
             }
         
-        # Delete posts
-        result = await db.posts.delete_many(query)
+        # Large cleanups run as a tracked background job that pages through the query
+        if post_count > POST_REMOVAL_INLINE_LIMIT:
+            job_id = await get_deletion_job_runner(db).enqueue(
+                JOB_POST_REMOVAL,
+                resolved_user_id or resolved_username,
+                params={
+                    "author_id": resolved_user_id,
+                    "username": resolved_username,
+                    "post_count": post_count,
+                },
+                requested_by=current_user_id
+            )
+            logger.info(f"ADMIN bulk delete: {post_count} posts queued as job {job_id} for username={username}, user_id={user_id}")
+            return {
+                "message": f"Deleting {post_count} posts in the background",
+                "queued_count": post_count,
+                "deletion_job_id": job_id,
+                "username": resolved_username,
+                "user_id": resolved_user_id,
+            }
+        
+        posts_to_delete = await db.posts.find(query, {"_id": 1}).to_list(None)
+        post_ids = [str(post["_id"]) for post in posts_to_delete]
         
-        # Delete related data for each post
-        for post_id in post_ids:
-            await db.likes.delete_many({"post_id": post_id})
-            await db.comments.delete_many({"post_id": post_id})
-            await db.saved_posts.delete_many({"post_id": post_id})
+        # Delete posts and all related data with one $in delete per collection
+        deleted_count = await remove_posts(db, post_ids)
         
-        logger.info(f"ADMIN bulk delete: {result.deleted_count} posts deleted for username={username}, user_id={user_id}")
+        logger.info(f"ADMIN bulk delete: {deleted_count} posts deleted for username={username}, user_id={user_id}")
         
         return {
-            "message": f"Successfully deleted {result.deleted_count} posts",
-            "deleted_count": result.deleted_count,
-            "username": username or (target_user.get("username") if target_user else None),
-            "user_id": user_id or (str(target_user["_id"]) if target_user else None),
+            "message": f"Successfully deleted {deleted_count} posts",
+            "deleted_count": deleted_count,
+            "username": resolved_username,
+            "user_id": resolved_user_id,
             "post_ids_deleted": post_ids
         }
         
@@ -8764,39 +8891,8 @@ async def submit_feedback(
 async def get_conversations(
     current_user_id: str = Depends(get_current_user)
 ):
-    """Get all conversations for the current user"""
-    conversations = await db.conversations.find({
-        "participants": current_user_id
-    }).sort("updated_at", -1).to_list(50)
-    
-    result = []
-    for conv in conversations:
-        # Get the other participant
-        other_user_id = [p for p in conv["participants"] if p != current_user_id][0]
-        other_user = await db.users.find_one({"_id": ObjectId(other_user_id)})
-        
-        # Get unread count
-        unread_count = await db.messages.count_documents({
-            "conversation_id": str(conv["_id"]),
-            "sender_id": {"$ne": current_user_id},
-            "read": False
-        })
-        
-        if other_user:
-            result.append({
-                "id": str(conv["_id"]),
-                "other_user": {
-                    "id": str(other_user["_id"]),
-                    "username": other_user.get("username", ""),
-                    "name": other_user.get("name", ""),
-                    "avatar": other_user.get("avatar", "")
-                },
-                "last_message": conv.get("last_message", ""),
-                "last_message_time": conv.get("updated_at", conv.get("created_at")).isoformat() if conv.get("updated_at") or conv.get("created_at") else None,
-                "unread_count": unread_count
-            })
-    
-    return result
+    """Get all conversations for the current user (served from the inbox projection)"""
+    return await get_inbox(db, current_user_id, limit=50)
 
 @api_router.post("/conversations")
 async def create_or_get_conversation(
@@ -8826,6 +8922,7 @@ async def create_or_get_conversation(
     }
     
     result = await db.conversations.insert_one(conversation)
+    await record_conversation(db, str(result.inserted_id), conversation["participants"], conversation["created_at"])
     
     return {"id": str(result.inserted_id), "exists": False}
 
@@ -8851,6 +8948,7 @@ async def get_messages(
         },
         {"$set": {"read": True}}
     )
+    await mark_conversation_read(db, current_user_id, conversation_id)
     
     # Get messages
     messages = await db.messages.find(
@@ -8903,10 +9001,23 @@ async def send_message(
         {
             "$set": {
                 "last_message": content[:100],
-                "updated_at": datetime.utcnow()
+                "updated_at": message["created_at"]
             }
         }
     )
+    await record_message(
+        db, conversation_id, conversation["participants"], current_user_id,
+        content, message["created_at"]
+    )
+    
+    await publish_event(conversation["participants"], EVENT_MESSAGE, {
+        "conversation_id": conversation_id,
+        "id": str(result.inserted_id),
+        "sender_id": current_user_id,
+        "content": content,
+        "created_at": message["created_at"].isoformat(),
+        "read": False
+    })
     
     # Trigger message notification
     try:
@@ -8937,20 +9048,104 @@ async def get_unread_count(
     current_user_id: str = Depends(get_current_user)
 ):
     """Get total unread message count"""
-    # Get all user's conversations
-    conversations = await db.conversations.find({
-        "participants": current_user_id
-    }).to_list(100)
-    
-    conv_ids = [str(conv["_id"]) for conv in conversations]
+    count = await get_inbox_unread_total(db, current_user_id)
     
-    count = await db.messages.count_documents({
-        "conversation_id": {"$in": conv_ids},
-        "sender_id": {"$ne": current_user_id},
-        "read": False
+    return {"unread_count": count}
+
+# ============================================
+# REALTIME (WebSocket / SSE push channel)
+# ============================================
+
+async def _realtime_user(authorization: Optional[str], token: Optional[str]) -> Optional[str]:
+    """Bearer header, or ?token= for clients that can't set headers (browser WebSocket/EventSource)."""
+    return await get_optional_current_user(authorization or (f"Bearer {token}" if token else None))
+
+async def _realtime_hello(user_id: str) -> str:
+    """First event on every connection: current badges, so clients resync after a reconnect."""
+    return encode_event(EVENT_HELLO, {
+        NOTIFICATIONS: await get_unread(db, user_id, NOTIFICATIONS),
+        MESSAGES: await get_inbox_unread_total(db, user_id),
     })
+
+@api_router.websocket("/realtime/ws")
+async def realtime_websocket(websocket: WebSocket, token: Optional[str] = None):
+    """
+    Push channel: message, notification and badge events as JSON text frames.
+    Any client frame (e.g. a reply to "ping") counts as a heartbeat.
+    """
+    user_id = await _realtime_user(websocket.headers.get("authorization"), token)
+    if not user_id:
+        await websocket.close(code=4401)
+        return
+    await websocket.accept()
     
-    return {"unread_count": count}
+    hub = get_realtime_hub(db)
+    connection = hub.register(user_id, "websocket")
+    
+    async def receive_heartbeats():
+        try:
+            while True:
+                await websocket.receive_text()
+                connection.touch()
+                get_presence_registry(db).touch(user_id)
+        except Exception:
+            pass
+        finally:
+            # Client went away: wake the sender so the connection is released now
+            connection.close()
+    
+    receiver = asyncio.create_task(receive_heartbeats())
+    try:
+        await websocket.send_text(await _realtime_hello(user_id))
+        while True:
+            payload = await connection.next_payload()
+            if payload is None:
+                break
+            await websocket.send_text(payload)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.debug(f"Realtime websocket for {user_id[:8]}... ended: {e}")
+    finally:
+        receiver.cancel()
+        hub.unregister(connection)
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+@api_router.get("/realtime/events")
+async def realtime_events(
+    token: Optional[str] = None,
+    authorization: Optional[str] = Header(None)
+):
+    """Server-Sent Events variant of the push channel (one event per `data:` line)."""
+    user_id = await _realtime_user(authorization, token)
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    
+    hub = get_realtime_hub(db)
+    connection = hub.register(user_id, "sse")
+    hello = await _realtime_hello(user_id)
+    
+    async def stream():
+        try:
+            yield f"data: {hello}\n\n"
+            while True:
+                # Resuming here means the previous write went out
+                connection.touch()
+                payload = await connection.next_payload()
+                if payload is None:
+                    break
+                yield f"data: {payload}\n\n"
+        finally:
+            hub.unregister(connection)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 # ============================================
 # USER NOTIFICATIONS ENDPOINTS
@@ -9128,6 +9323,7 @@ async def block_user(
     }
     
     await db.user_blocks.insert_one(block)
+    get_block_cache().invalidate(current_user_id, blocked_user_id)
     
     # Also create an admin notification/report for the block
     admin_notification = {
@@ -9141,30 +9337,16 @@ async def block_user(
     }
     await db.admin_notifications.insert_one(admin_notification)
     
-    # Remove any follow relationships
+    # Remove any follow relationships (follows store ObjectIds; older ones strings)
+    both_users = id_variants([current_user_id, blocked_user_id])
     await db.follows.delete_many({
-        "$or": [
-            {"follower_id": current_user_id, "following_id": blocked_user_id},
-            {"follower_id": blocked_user_id, "following_id": current_user_id}
-        ]
+        "follower_id": {"$in": both_users},
+        "following_id": {"$in": both_users}
     })
     
-    # Update follower/following counts for both users
-    current_user = await db.users.find_one({"_id": ObjectId(current_user_id)})
-    if current_user:
-        following_count = await db.follows.count_documents({"follower_id": current_user_id})
-        followers_count = await db.follows.count_documents({"following_id": current_user_id})
-        await db.users.update_one(
-            {"_id": ObjectId(current_user_id)},
-            {"$set": {"following_count": following_count, "followers_count": followers_count}}
-        )
-    
-    blocked_following_count = await db.follows.count_documents({"follower_id": blocked_user_id})
-    blocked_followers_count = await db.follows.count_documents({"following_id": blocked_user_id})
-    await db.users.update_one(
-        {"_id": ObjectId(blocked_user_id)},
-        {"$set": {"following_count": blocked_following_count, "followers_count": blocked_followers_count}}
-    )
+    # Recount follower/following counts for both users from the follows collection
+    await recount_followers(db, [current_user_id, blocked_user_id])
+    await recount_following(db, [current_user_id, blocked_user_id])
     
     logger.info(f"User {current_user_id} blocked user {blocked_user_id}")
     
@@ -9188,6 +9370,7 @@ async def unblock_user(
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Block not found")
     
+    get_block_cache().invalidate(current_user_id, blocked_user_id)
     logger.info(f"User {current_user_id} unblocked user {blocked_user_id}")
     
     return {
@@ -9241,25 +9424,6 @@ async def check_if_blocked(
         "blocked_by_them": block is not None and block.get("blocker_id") == user_id
     }
 
-# Helper function to get blocked user IDs for feed filtering
-async def get_blocked_user_ids(user_id: str) -> set:
-    """Get all user IDs that should be filtered from a user's feed (mutual blocks)"""
-    blocks = await db.user_blocks.find({
-        "$or": [
-            {"blocker_id": user_id},
-            {"blocked_id": user_id}
-        ]
-    }).to_list(1000)
-    
-    blocked_ids = set()
-    for block in blocks:
-        if block["blocker_id"] == user_id:
-            blocked_ids.add(block["blocked_id"])
-        else:
-            blocked_ids.add(block["blocker_id"])
-    
-    return blocked_ids
-
 # ============================================
 # ADMIN MODERATION ENDPOINTS
 # ============================================
@@ -9660,7 +9824,7 @@ async def bootstrap_staging(
     
     # Step 2: UPSERT all exercises by name (stable key)
     upserted_count = 0
-    for ex in PREVIEW_EXERCISES:
+    for ex in get_exercises():
         ex_data = {**ex, "updated_at": datetime.now(timezone.utc)}
         # Use name as stable key for upsert
         stable_key = ex.get("name")
@@ -9691,7 +9855,7 @@ async def bootstrap_staging(
     
     # Step 3: UPSERT featured workouts by title (stable key)
     featured_workout_ids = []
-    for workout in PREVIEW_FEATURED_WORKOUTS:
+    for workout in get_featured_workouts():
         workout_data = {**workout, "updated_at": datetime.now(timezone.utc)}
         workout_data.pop("_id", None)  # Remove source _id
         stable_key = workout.get("title")
@@ -9710,7 +9874,7 @@ async def bootstrap_staging(
                 if existing:
                     featured_workout_ids.append(str(existing["_id"]))
     
-    logger.info(f"🌱 Bootstrap: Upserted {len(PREVIEW_FEATURED_WORKOUTS)} featured workouts")
+    logger.info(f"🌱 Bootstrap: Upserted {len(get_featured_workouts())} featured workouts")
     
     # Get the Cardio Based workout details for verification
     cardio_workout = await db.featured_workouts.find_one({"title": "Cardio Based"})
@@ -9760,7 +9924,7 @@ async def bootstrap_staging(
     
     return {
         "success": True,
-        "message": f"Bootstrap complete - {upserted_count} exercises upserted, {len(PREVIEW_FEATURED_WORKOUTS)} featured workouts upserted",
+        "message": f"Bootstrap complete - {upserted_count} exercises upserted, {len(get_featured_workouts())} featured workouts upserted",
         "results": results
     }
 
@@ -9786,7 +9950,7 @@ async def upload_exercise_video(
         public_id = f"exercise_library/{clean_name}"
         
         # Upload to Cloudinary with eager thumbnail generation (synchronous)
-        result = cloudinary.uploader.upload(
+        result = get_cloudinary().uploader.upload(
             content,
             public_id=public_id,
             resource_type="video",
@@ -10706,7 +10870,7 @@ async def get_build_for_me_stats(
     
     try:
         # Total generations
-        total_generations = await db.choose_for_me_usage.count_documents(
+        total_generations = await analytics_db.choose_for_me_usage.count_documents(
             {"created_at": {"$gte": cutoff}} if days > 0 else {}
         )
         
@@ -10716,7 +10880,7 @@ async def get_build_for_me_stats(
             {"$group": {"_id": "$user_id"}},
             {"$count": "count"}
         ]
-        unique_users_result = await db.choose_for_me_usage.aggregate(unique_users_pipeline).to_list(1)
+        unique_users_result = await analytics_db.choose_for_me_usage.aggregate(unique_users_pipeline).to_list(1)
         unique_users = unique_users_result[0]["count"] if unique_users_result else 0
         
         # Generations by mood card
@@ -10726,7 +10890,7 @@ async def get_build_for_me_stats(
             {"$project": {"_id": 1, "count": 1, "unique_users": {"$size": "$unique_users"}}},
             {"$sort": {"count": -1}}
         ]
-        mood_results = await db.choose_for_me_usage.aggregate(mood_pipeline).to_list(20)
+        mood_results = await analytics_db.choose_for_me_usage.aggregate(mood_pipeline).to_list(20)
         
         mood_display_names = {
             "Sweat / burn fat": "Sweat",
@@ -10762,12 +10926,12 @@ async def get_build_for_me_stats(
             {"$group": {"_id": "$intensity", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}}
         ]
-        intensity_results = await db.choose_for_me_usage.aggregate(intensity_pipeline).to_list(10)
+        intensity_results = await analytics_db.choose_for_me_usage.aggregate(intensity_pipeline).to_list(10)
         by_intensity = [{"intensity": r["_id"] or "Unknown", "count": r["count"]} for r in intensity_results]
         
         # Today's generations
         today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        today_generations = await db.choose_for_me_usage.count_documents({"created_at": {"$gte": today_start}})
+        today_generations = await analytics_db.choose_for_me_usage.count_documents({"created_at": {"$gte": today_start}})
         
         return {
             "period_days": days,
@@ -10802,7 +10966,7 @@ async def get_custom_workouts_stats(
     
     try:
         # Total custom workouts added
-        total_custom = await db.user_events.count_documents({
+        total_custom = await analytics_db.user_events.count_documents({
             "event_type": "cart_item_added",
             "timestamp": {"$gte": cutoff} if days > 0 else {"$exists": True},
             "metadata.source": {"$ne": "build_for_me"}
@@ -10818,7 +10982,7 @@ async def get_custom_workouts_stats(
             {"$group": {"_id": "$metadata.moodCard", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}}
         ]
-        mood_results = await db.user_events.aggregate(mood_pipeline).to_list(20)
+        mood_results = await analytics_db.user_events.aggregate(mood_pipeline).to_list(20)
         by_mood = [{"mood": r["_id"] or "Unknown", "count": r["count"]} for r in mood_results]
         
         # Unique users
@@ -10831,7 +10995,7 @@ async def get_custom_workouts_stats(
             {"$group": {"_id": "$user_id"}},
             {"$count": "count"}
         ]
-        users_result = await db.user_events.aggregate(users_pipeline).to_list(1)
+        users_result = await analytics_db.user_events.aggregate(users_pipeline).to_list(1)
         unique_users = users_result[0]["count"] if users_result else 0
         
         return {
@@ -11023,8 +11187,7 @@ async def get_notifications_unread_count(
     """Get count of unread notifications"""
     notification_service = get_notification_service(db)
     count = await notification_service.get_unread_count(current_user_id)
-    print(f"🔔 UNREAD-COUNT API: User {current_user_id} has {count} unread notifications")
-    logger.info(f"unread-count: User {current_user_id} has {count} unread notifications")
+    logger.debug(f"unread-count: User {current_user_id} has {count} unread notifications")
     return {"unread_count": count}
 
 @api_router.post("/notifications/mark-read")
@@ -11043,16 +11206,9 @@ async def mark_all_notifications_read(
 ):
     """Mark all notifications as read"""
     notification_service = get_notification_service(db)
-    
-    # Log before
-    before_count = await notification_service.get_unread_count(current_user_id)
-    logger.info(f"mark-all-read: User {current_user_id} has {before_count} unread before marking")
-    
     count = await notification_service.mark_all_as_read(current_user_id)
-    
-    # Log after
     after_count = await notification_service.get_unread_count(current_user_id)
-    logger.info(f"mark-all-read: Marked {count}, now {after_count} unread")
+    logger.debug(f"mark-all-read: User {current_user_id} marked {count}, now {after_count} unread")
     
     return {"marked_count": count, "unread_after": after_count}
 
@@ -11228,48 +11384,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Index sync + seed catalogs: "background" (default) runs them after the app is
+# serving, "blocking" before, "off" when a one-shot deploy step runs
+# index_registry.py and seed_catalog.py instead
+STARTUP_TASKS = os.environ.get("STARTUP_TASKS", "background").lower()
+_startup_task: Optional[asyncio.Task] = None
+
+async def run_startup_tasks():
+    """Sync indexes, seed catalogs and one-time backfills concurrently; all are idempotent."""
+    results = await asyncio.gather(
+        sync_indexes(db), sync_seed_catalogs(db), sync_event_audience(db), sync_comment_paths(db),
+        sync_author_post_counts(db),
+        return_exceptions=True
+    )
+    names = ("index sync", "seed catalogs", "event audience", "comment paths", "author posts_count")
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.error(f"⚠️ Startup: {name} failed: {result}")
+
 @app.on_event("startup")
 async def startup_db_client():
     """Start background services on app startup"""
     # Log environment info
     logger.info(f"🌍 Environment: APP_ENV={APP_ENV}, IS_STAGING={IS_STAGING}")
     
-    # Create/verify MongoDB indexes for analytics performance
-    try:
-        # user_events indexes
-        await db.user_events.create_index([("timestamp", -1)])
-        await db.user_events.create_index([("user_id", 1), ("timestamp", -1)])
-        await db.user_events.create_index([("event_type", 1), ("timestamp", -1)])
-        await db.user_events.create_index([("event_type", 1), ("user_id", 1)])
-        
-        # users indexes
-        await db.users.create_index([("created_at", -1)])
-        await db.users.create_index([("username", 1)])
-        await db.users.create_index([("email", 1)])
-        
-        # daily_activity indexes
-        await db.daily_activity.create_index([("date", -1)])
-        await db.daily_activity.create_index([("user_id", 1), ("date", -1)])
-        
-        # login_events indexes
-        await db.login_events.create_index([("user_id", 1), ("timestamp", -1)])
-        await db.login_events.create_index([("timestamp", -1)])
-        
-        # admin_audit_logs indexes
-        await db.admin_audit_logs.create_index([("timestamp_utc", -1)])
-        await db.admin_audit_logs.create_index([("admin_user_id", 1), ("timestamp_utc", -1)])
-        await db.admin_audit_logs.create_index([("action", 1), ("timestamp_utc", -1)])
-        
-        logger.info("✅ MongoDB indexes verified/created for analytics")
-    except Exception as e:
-        logger.error(f"⚠️ Failed to create some indexes: {e}")
+    # Index sync and catalog seeding (see run_startup_tasks)
+    global _startup_task
+    if STARTUP_TASKS == "blocking":
+        await run_startup_tasks()
+    elif STARTUP_TASKS != "off":
+        _startup_task = asyncio.create_task(run_startup_tasks())
     
     # Start notification background worker
     try:
@@ -11278,26 +11424,35 @@ async def startup_db_client():
     except Exception as e:
         logger.error(f"Failed to start notification worker: {e}")
     
-    # Auto-seed featured workouts in staging or if empty
-    # This runs on EVERY deployment to ensure featured workouts exist
+    # Start log writer (batches login/audit/moderation records)
     try:
-        seed_result = await auto_seed_featured_workouts()
-        if seed_result.get("seeded"):
-            logger.info(f"🌱 Startup: Auto-seeded {seed_result.get('count')} featured workouts")
-        else:
-            logger.info(f"✅ Startup: Featured workouts OK ({seed_result.get('count')} found)")
+        await start_log_writer(db)
     except Exception as e:
-        logger.error(f"❌ Startup: Failed to auto-seed featured workouts: {e}")
+        logger.error(f"Failed to start log writer: {e}")
     
-    # Auto-seed exercises in staging or if empty
+    # Start presence registry (bulk-flushes heartbeats)
     try:
-        exercises_result = await auto_seed_exercises()
-        if exercises_result.get("seeded"):
-            logger.info(f"🌱 Startup: Auto-seeded {exercises_result.get('count')} exercises")
-        else:
-            logger.info(f"✅ Startup: Exercises OK ({exercises_result.get('count')} found)")
+        await start_presence_registry(db)
+    except Exception as e:
+        logger.error(f"Failed to start presence registry: {e}")
+    
+    # Start deletion job runner (resumes interrupted account/post purges)
+    try:
+        await start_deletion_job_runner(db)
     except Exception as e:
-        logger.error(f"❌ Startup: Failed to auto-seed exercises: {e}")
+        logger.error(f"Failed to start deletion job runner: {e}")
+    
+    # Start realtime hub (push channel for messages, notifications, badges)
+    try:
+        await start_realtime_hub(db)
+    except Exception as e:
+        logger.error(f"Failed to start realtime hub: {e}")
+    
+    # Start unread counter reconciler (repairs badge counter drift)
+    try:
+        await start_unread_reconciler(db)
+    except Exception as e:
+        logger.error(f"Failed to start unread counter reconciler: {e}")
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
@@ -11309,5 +11464,45 @@ async def shutdown_db_client():
     except Exception as e:
         logger.error(f"Error stopping notification worker: {e}")
     
-    # Close database connection
-    client.close()
\ No newline at end of file
+    # Flush pending heartbeats
+    try:
+        await stop_presence_registry()
+    except Exception as e:
+        logger.error(f"Error stopping presence registry: {e}")
+    
+    # Stop deletion jobs (an in-flight job resumes on next start)
+    try:
+        await stop_deletion_job_runner()
+    except Exception as e:
+        logger.error(f"Error stopping deletion job runner: {e}")
+    
+    try:
+        await stop_unread_reconciler()
+    except Exception as e:
+        logger.error(f"Error stopping unread counter reconciler: {e}")
+    
+    # Disconnect realtime clients (they reconnect to another replica)
+    try:
+        await stop_realtime_hub()
+    except Exception as e:
+        logger.error(f"Error stopping realtime hub: {e}")
+    
+    # Release bcrypt worker threads
+    get_password_hasher().shutdown()
+    
+    # Write out buffered log records
+    try:
+        await stop_log_writer()
+    except Exception as e:
+        logger.error(f"Error stopping log writer: {e}")
+    
+    # Don't close the client under a still-running index sync / seed
+    if _startup_task and not _startup_task.done():
+        _startup_task.cancel()
+    
+    # Close database connections
+    client.close()
+    close_analytics_client()
+    
+    # Drain queued log records last so shutdown messages are written
+    stop_logging()
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""
+Unread Counters
+One document per user in unread_counters ({_id: user_id, notifications, messages})
+so badge polls are a single _id lookup instead of a count over notifications
+or an aggregation over the inbox:
+- Notification writes (create, mark read, mark all read, delete, re-unread
+  bundles) and inbox writes (send_message fan-out, get_messages reset) adjust
+  the counters with atomic updates; decrements are clamped at zero
+- A counter that has never been initialised is computed from source on first
+  read; adjustments leave it uninitialised until then
+- Every change is pushed to the user's open apps as a realtime badge event
+- UnreadCounterReconciler recomputes every counter from source on an interval
+  and repairs any drift (deletes done by cascades, crashes between writes).
+  One worker per interval runs it (system lease), and each repair only
+  applies if the counter still holds the value read before the recount
+"""
+
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne, ReturnDocument
+from realtime import publish_event, wants_events, EVENT_BADGE
+from leases import acquire_lease
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATIONS = "notifications"
+MESSAGES = "messages"
+
+# How often counters are reconciled against source
+RECONCILE_INTERVAL_SECONDS = 15 * 60
+
+# Held by the reconciling worker for a whole interval, so the others skip it
+RECONCILE_LEASE = "unread_reconciler"
+
+
+def _adjust(field: str, delta: int) -> List[Dict[str, Any]]:
+    """
+    Pipeline update adding delta to a counter without going below zero.
+    A counter that was never initialised stays missing, so its first read
+    computes it from source instead of trusting a partial delta.
+    """
+    return [{"$set": {field: {"$cond": [
+        {"$eq": [{"$type": f"${field}"}, "missing"]},
+        "$$REMOVE",
+        {"$max": [0, {"$add": [f"${field}", delta]}]}
+    ]}}}]
+
+
+def _badge(doc: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    return {field: doc[field] for field in (NOTIFICATIONS, MESSAGES) if doc and field in doc}
+
+
+async def publish_badges(db: AsyncIOMotorDatabase, user_ids: List[str]) -> None:
+    """Push current counters to the users' open apps (one read for all of them)."""
+    user_ids = [u for u in user_ids if wants_events(u)]
+    if not user_ids:
+        return
+    async for doc in db.unread_counters.find({"_id": {"$in": user_ids}}):
+        badge = _badge(doc)
+        if badge:
+            await publish_event([doc["_id"]], EVENT_BADGE, badge)
+
+
+async def adjust_unread(db: AsyncIOMotorDatabase, user_id: str, field: str, delta: int) -> None:
+    """Add delta to one of the user's unread counters."""
+    if not delta or not user_id:
+        return
+    try:
+        doc = await db.unread_counters.find_one_and_update(
+            {"_id": user_id}, _adjust(field, delta),
+            upsert=True, return_document=ReturnDocument.AFTER
+        )
+        badge = _badge(doc)
+        if badge:
+            await publish_event([user_id], EVENT_BADGE, badge)
+    except Exception as e:
+        logger.error(f"Error adjusting {field} unread counter for {user_id}: {e}")
+
+
+async def adjust_unread_many(db: AsyncIOMotorDatabase, field: str, deltas: Dict[str, int]) -> None:
+    """Apply per-user deltas to one counter in a single bulk write."""
+    operations = [
+        UpdateOne({"_id": user_id}, _adjust(field, delta), upsert=True)
+        for user_id, delta in deltas.items() if delta and user_id
+    ]
+    if not operations:
+        return
+    try:
+        await db.unread_counters.bulk_write(operations, ordered=False)
+        await publish_badges(db, list(deltas))
+    except Exception as e:
+        logger.error(f"Error adjusting {field} unread counters: {e}")
+
+
+async def set_unread(db: AsyncIOMotorDatabase, user_id: str, field: str, value: int) -> None:
+    """Overwrite one of the user's unread counters with a value computed from source."""
+    try:
+        await db.unread_counters.update_one({"_id": user_id}, {"$set": {field: max(value, 0)}}, upsert=True)
+        await publish_badges(db, [user_id])
+    except Exception as e:
+        logger.error(f"Error setting {field} unread counter for {user_id}: {e}")
+
+
+# ============================================
+# SOURCE COUNTS
+# ============================================
+
+async def count_unread_notifications(db: AsyncIOMotorDatabase, user_id: str) -> int:
+    return await db.notifications.count_documents({"user_id": user_id, "read_at": None})
+
+
+async def count_unread_messages(db: AsyncIOMotorDatabase, user_id: str) -> int:
+    rows = await db.inbox.aggregate([
+        {"$match": {"owner_id": user_id, "unread_count": {"$gt": 0}}},
+        {"$group": {"_id": None, "total": {"$sum": "$unread_count"}}}
+    ]).to_list(1)
+    return rows[0]["total"] if rows else 0
+
+
+SOURCE_COUNTS = {
+    NOTIFICATIONS: count_unread_notifications,
+    MESSAGES: count_unread_messages,
+}
+
+
+async def get_unread(db: AsyncIOMotorDatabase, user_id: str, field: str) -> int:
+    """A user's unread counter: one _id lookup, computed from source the first time."""
+    doc = await db.unread_counters.find_one({"_id": user_id}, {field: 1})
+    if doc and field in doc:
+        return doc[field]
+    value = await SOURCE_COUNTS[field](db, user_id)
+    # Only initialise if no concurrent write created the counter meanwhile
+    if doc:
+        await db.unread_counters.update_one(
+            {"_id": user_id, field: {"$exists": False}},
+            {"$set": {field: value}}
+        )
+    else:
+        await db.unread_counters.update_one(
+            {"_id": user_id},
+            {"$setOnInsert": {field: value}},
+            upsert=True
+        )
+    return value
+
+
+# ============================================
+# RECONCILIATION
+# ============================================
+
+class UnreadCounterReconciler:
+    """Periodically recompute every counter from source and repair drift"""
+
+    def __init__(self, db):
+        self.db = db
+        self.running = False
+        self._task = None
+        self.runs = 0
+        self.skipped = 0
+        self.repaired = 0
+
+    async def _source_totals(self) -> Dict[str, Dict[str, int]]:
+        notifications = {
+            row["_id"]: row["count"]
+            async for row in self.db.notifications.aggregate([
+                {"$match": {"read_at": None}},
+                {"$group": {"_id": "$user_id", "count": {"$sum": 1}}}
+            ])
+        }
+        messages = {
+            row["_id"]: row["count"]
+            async for row in self.db.inbox.aggregate([
+                {"$match": {"unread_count": {"$gt": 0}}},
+                {"$group": {"_id": "$owner_id", "count": {"$sum": "$unread_count"}}}
+            ])
+        }
+        return {NOTIFICATIONS: notifications, MESSAGES: messages}
+
+    async def reconcile(self) -> int:
+        """Fix every counter that disagrees with source; returns counters repaired."""
+        if not await acquire_lease(self.db, RECONCILE_LEASE, RECONCILE_INTERVAL_SECONDS):
+            self.skipped += 1
+            return 0
+
+        # Counters are read before source, so one that moves during the recount
+        # no longer matches the value read and its repair is skipped
+        stored = {
+            doc["_id"]: doc
+            async for doc in self.db.unread_counters.find(
+                {"$or": [{NOTIFICATIONS: {"$exists": True}}, {MESSAGES: {"$exists": True}}]},
+                {NOTIFICATIONS: 1, MESSAGES: 1}
+            )
+        }
+        totals = await self._source_totals()
+
+        operations = []
+        repaired = []
+        for user_id, doc in stored.items():
+            # Uninitialised counters stay missing; their first read computes them
+            fixes = {
+                field: totals[field].get(user_id, 0)
+                for field in (NOTIFICATIONS, MESSAGES)
+                if field in doc and doc[field] != totals[field].get(user_id, 0)
+            }
+            if fixes:
+                expected = {field: doc[field] for field in fixes}
+                operations.append(UpdateOne({"_id": user_id, **expected}, {"$set": fixes}))
+                repaired.append(user_id)
+
+        count = 0
+        if operations:
+            result = await self.db.unread_counters.bulk_write(operations, ordered=False)
+            count = result.modified_count
+            await publish_badges(self.db, repaired)
+            logger.info(f"🔢 Reconciled {count} unread counters ({len(operations) - count} changed meanwhile)")
+        self.runs += 1
+        self.repaired += count
+        return count
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "repaired": self.repaired,
+            "interval_seconds": RECONCILE_INTERVAL_SECONDS,
+        }
+
+    async def start(self):
+        """Start the reconciliation loop"""
+        if self.running:
+            logger.warning("Unread counter reconciler already running")
+            return
+
+        self.running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("🚀 Unread counter reconciler started")
+
+    async def stop(self):
+        """Stop the reconciliation loop"""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("🛑 Unread counter reconciler stopped")
+
+    async def _run_loop(self):
+        while self.running:
+            try:
+                await self.reconcile()
+                await asyncio.sleep(RECONCILE_INTERVAL_SECONDS)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Unread counter reconcile error: {e}")
+                await asyncio.sleep(RECONCILE_INTERVAL_SECONDS)
+
+
+# Global reconciler instance
+_reconciler: Optional[UnreadCounterReconciler] = None
+
+
+def get_unread_reconciler(db) -> UnreadCounterReconciler:
+    """Get or create the reconciler singleton"""
+    global _reconciler
+    if _reconciler is None:
+        _reconciler = UnreadCounterReconciler(db)
+    return _reconciler
+
+
+async def start_unread_reconciler(db):
+    """Start the unread counter reconciliation loop"""
+    reconciler = get_unread_reconciler(db)
+    await reconciler.start()
+
+
+async def stop_unread_reconciler():
+    """Stop the unread counter reconciliation loop"""
+    global _reconciler
+    if _reconciler:
+        await _reconciler.stop()
+        _reconciler = None
@@ -1,13 +1,20 @@
 """
 User Analytics and Tracking System
 Tracks user behavior, engagement, and app usage patterns
+
+Tracking and backfills write through the primary db handle; the stats and
+breakdown readers are called with the analytics read handle (see analytics_db).
 """
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Awaitable
+import time
+import asyncio
 from pydantic import BaseModel
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 import logging
+from query_batch import QueryBatch
+from leases import acquire_lease, release_lease
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +102,191 @@ async def get_internal_user_ids(db: AsyncIOMotorDatabase) -> set:
     return ids
 
 
+# Event audience stamps (set at ingestion, see stamp_event_audience)
+AUDIENCE_USER = "user"
+AUDIENCE_GUEST = "guest"
+AUDIENCE_INTERNAL = "internal"
+
+# How long the ingestion-side internal user set is trusted before re-reading
+INTERNAL_IDS_CACHE_TTL_SECONDS = 300
+
+_internal_ids_cache: Dict[str, Any] = {"ids": set(), "loaded_at": 0.0}
+
+# system document recording that every event is stamped, and for which internal users
+AUDIENCE_STATE_ID = "event_audience"
+
+# Lease held by the worker running the audience backfill (renewed per batch)
+AUDIENCE_BACKFILL_LEASE_SECONDS = 600
+
+# Whether every user_events document carries an is_internal stamp (see audience_filter)
+_audience_state: Dict[str, Any] = {"complete": False, "task": None}
+
+
+async def get_internal_user_ids_cached(db: AsyncIOMotorDatabase) -> set:
+    """
+    Internal user IDs for ingestion, refreshed at most every few minutes.
+    A refresh also notices a finished backfill (run by another worker) and
+    re-stamps events when the internal user set changed since the last one.
+    """
+    now = time.monotonic()
+    if now - _internal_ids_cache["loaded_at"] > INTERNAL_IDS_CACHE_TTL_SECONDS:
+        _internal_ids_cache["ids"] = await get_internal_user_ids(db)
+        _internal_ids_cache["loaded_at"] = now
+        state = await db.system.find_one({"_id": AUDIENCE_STATE_ID}) or {}
+        _audience_state["complete"] = bool(state.get("complete"))
+        if not state.get("complete") or set(state.get("internal_ids", [])) != _internal_ids_cache["ids"]:
+            schedule_event_audience_sync(db)
+    return _internal_ids_cache["ids"]
+
+
+def event_meta(user_id: Optional[str], event_type: Optional[str]) -> Dict[str, Any]:
+    """
+    metaField of a user_events document (see user_events_migration). Key order
+    is fixed so every event of one user and type lands in the same buckets.
+    """
+    return {"user_id": user_id, "event_type": event_type}
+
+
+async def stamp_event_audience(db: AsyncIOMotorDatabase, event: dict) -> dict:
+    """
+    Stamp is_internal/audience (and the time-series meta) on an event
+    document before insert. Analytics then exclude staff traffic with an
+    indexed {"is_internal": False} match instead of a $nin over the internal
+    user list.
+    """
+    event["meta"] = event_meta(event.get("user_id"), event.get("event_type"))
+    if event.get("is_guest"):
+        event["is_internal"] = False
+        event["audience"] = AUDIENCE_GUEST
+    elif event.get("user_id") in await get_internal_user_ids_cached(db):
+        event["is_internal"] = True
+        event["audience"] = AUDIENCE_INTERNAL
+    else:
+        event["is_internal"] = False
+        event["audience"] = AUDIENCE_USER
+    return event
+
+
+def audience_filter(include_internal: bool = False) -> dict:
+    """
+    user_events filter excluding internal traffic (empty when include_internal).
+    Until the audience backfill has finished, unstamped (pre-stamp) events
+    count as external.
+    """
+    if include_internal:
+        return {}
+    return {"is_internal": False} if _audience_state["complete"] else {"is_internal": {"$ne": True}}
+
+
+async def backfill_event_audience(
+    db: AsyncIOMotorDatabase,
+    batch_size: int = 5000,
+    max_batches: Optional[int] = None,
+    on_batch: Optional[Callable[[], Awaitable[Any]]] = None
+) -> Dict[str, int]:
+    """
+    Stamp is_internal/audience on existing user_events and re-stamp events of
+    users whose is_internal flag changed. Resumable: each batch only touches
+    events that are unstamped or stamped wrong, so reruns pick up where a
+    previous run stopped.
+    """
+    internal_ids = list(await get_internal_user_ids(db))
+    stats = {"internal": 0, "unflagged": 0, "guest": 0, "user": 0}
+    
+    # Events of internal users (small set of users, one update each)
+    result = await db.user_events.update_many(
+        {"user_id": {"$in": internal_ids}, "is_internal": {"$ne": True}},
+        {"$set": {"is_internal": True, "audience": AUDIENCE_INTERNAL}}
+    )
+    stats["internal"] = result.modified_count
+    
+    # Events stamped internal for users that are no longer internal
+    result = await db.user_events.update_many(
+        {"is_internal": True, "user_id": {"$nin": internal_ids}},
+        {"$set": {"is_internal": False, "audience": AUDIENCE_USER}}
+    )
+    stats["unflagged"] = result.modified_count
+    
+    # Unstamped events, in _id batches to keep each write short
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        docs = await db.user_events.find(
+            {"is_internal": {"$exists": False}},
+            {"_id": 1, "is_guest": 1}
+        ).limit(batch_size).to_list(batch_size)
+        if not docs:
+            break
+        guest_ids = [d["_id"] for d in docs if d.get("is_guest")]
+        user_ids = [d["_id"] for d in docs if not d.get("is_guest")]
+        if guest_ids:
+            result = await db.user_events.update_many(
+                {"_id": {"$in": guest_ids}},
+                {"$set": {"is_internal": False, "audience": AUDIENCE_GUEST}}
+            )
+            stats["guest"] += result.modified_count
+        if user_ids:
+            # Internal users were stamped above, so the rest are regular users
+            result = await db.user_events.update_many(
+                {"_id": {"$in": user_ids}},
+                {"$set": {"is_internal": False, "audience": AUDIENCE_USER}}
+            )
+            stats["user"] += result.modified_count
+        batches += 1
+        if on_batch:
+            await on_batch()
+    
+    logger.info(f"Backfilled user_events audience: {stats}")
+    return stats
+
+
+async def sync_event_audience(db: AsyncIOMotorDatabase) -> Dict[str, Any]:
+    """
+    Startup step: run the audience backfill to completion (resumable, one
+    worker at a time) unless it already ran for the current internal users,
+    then switch audience_filter to the exact {"is_internal": False} match.
+    """
+    state = await db.system.find_one({"_id": AUDIENCE_STATE_ID}) or {}
+    internal_ids = await get_internal_user_ids(db)
+    if state.get("complete") and set(state.get("internal_ids", [])) == internal_ids:
+        _audience_state["complete"] = True
+        return {"up_to_date": True}
+    
+    if not await acquire_lease(db, AUDIENCE_STATE_ID, AUDIENCE_BACKFILL_LEASE_SECONDS):
+        return {"running_elsewhere": True}
+    try:
+        stats = await backfill_event_audience(
+            db, on_batch=lambda: acquire_lease(db, AUDIENCE_STATE_ID, AUDIENCE_BACKFILL_LEASE_SECONDS)
+        )
+        await db.system.update_one(
+            {"_id": AUDIENCE_STATE_ID},
+            {"$set": {
+                "complete": True,
+                "internal_ids": sorted(internal_ids),
+                "completed_at": datetime.now(timezone.utc),
+            }},
+            upsert=True
+        )
+        _audience_state["complete"] = True
+        return stats
+    finally:
+        await release_lease(db, AUDIENCE_STATE_ID)
+
+
+def schedule_event_audience_sync(db: AsyncIOMotorDatabase) -> None:
+    """Run sync_event_audience in the background unless this worker already is."""
+    task = _audience_state["task"]
+    if task is not None and not task.done():
+        return
+    
+    async def run():
+        try:
+            await sync_event_audience(db)
+        except Exception as e:
+            logger.error(f"Event audience sync failed: {e}")
+    
+    _audience_state["task"] = asyncio.create_task(run())
+
+
 async def track_user_event(
     db: AsyncIOMotorDatabase,
     user_id: str,
@@ -121,13 +313,14 @@ async def track_user_event(
             "timestamp": datetime.now(timezone.utc),
             "session_id": session_id
         }
+        await stamp_event_audience(db, event)
         
         await db.user_events.insert_one(event)
         
         # Update daily activity summary
         await update_daily_activity(db, user_id, event_type)
         
-        logger.info(f"Tracked event {event_type} for user {user_id}")
+        logger.debug(f"Tracked event {event_type} for user {user_id}")
         
     except Exception as e:
         logger.error(f"Error tracking user event: {e}")
@@ -472,137 +665,53 @@ async def get_admin_analytics(
         start_date = datetime.now(timezone.utc) - timedelta(days=days)
         today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
         
-        # Get internal user IDs to exclude
-        excluded_user_ids = set()
-        if not include_internal:
-            excluded_user_ids = await get_internal_user_ids(db)
+        # Indexed equality on the ingestion-time stamp instead of $nin over internal IDs
+        exclude_filter = audience_filter(include_internal)
         
-        # Build exclude filter
-        exclude_filter = {}
-        if excluded_user_ids:
-            exclude_filter = {"user_id": {"$nin": list(excluded_user_ids)}}
+        # All queries below are independent: run them concurrently
+        batch = QueryBatch(db)
         
         # Total users (excluding internal accounts)
         user_count_filter = {}
         if not include_internal:
             user_count_filter = {"is_internal": {"$ne": True}}
-        total_users = await db.users.count_documents(user_count_filter)
+        batch.count("total_users", "users", user_count_filter)
         
         # Active users (users with events in period, excluding internal)
-        active_query = {"timestamp": {"$gte": start_date}}
-        if excluded_user_ids:
-            active_query["user_id"] = {"$nin": list(excluded_user_ids)}
-        active_users_list = await db.user_events.distinct("user_id", active_query)
-        active_users = len([u for u in active_users_list if u not in excluded_user_ids])
+        active_query = {**exclude_filter, "timestamp": {"$gte": start_date}}
+        batch.distinct("active_users_list", "user_events", "user_id", active_query)
         
         # Daily active users (today)
-        dau_query = {"timestamp": {"$gte": today}}
-        if excluded_user_ids:
-            dau_query["user_id"] = {"$nin": list(excluded_user_ids)}
-        dau_list = await db.user_events.distinct("user_id", dau_query)
-        dau = len([u for u in dau_list if u not in excluded_user_ids])
-        
-        # Helper for counting events
-        async def count_events(event_type: str) -> int:
-            query = {
+        dau_query = {**exclude_filter, "timestamp": {"$gte": today}}
+        batch.distinct("dau_list", "user_events", "user_id", dau_query)
+        
+        # Event counts excluding internal users
+        for event_type in [
+            "workout_started", "workout_completed", "post_created", "post_liked",
+            "post_commented", "user_followed", "user_unfollowed", "workout_skipped",
+            "workout_abandoned", "profile_viewed", "app_session_start", "app_opened",
+            "screen_viewed", "tab_switched", "exercise_completed", "mood_selected",
+            "equipment_selected",
+        ]:
+            batch.count(event_type, "user_events", {
+                **exclude_filter,
                 "event_type": event_type,
                 "timestamp": {"$gte": start_date},
-            }
-            if excluded_user_ids:
-                query["user_id"] = {"$nin": list(excluded_user_ids)}
-            return await db.user_events.count_documents(query)
-        
-        # Total workouts started/completed
-        total_workouts_started = await count_events("workout_started")
-        total_workouts_completed = await count_events("workout_completed")
-        
-        # Total posts created
-        total_posts = await count_events("post_created")
-        
-        # Total likes
-        total_likes = await count_events("post_liked")
-        
-        # Total comments
-        total_comments = await count_events("post_commented")
-        
-        # Total follows
-        total_follows = await count_events("user_followed")
-        
-        # Total unfollows
-        total_unfollows = await count_events("user_unfollowed")
-        
-        # Workouts skipped
-        workouts_skipped = await count_events("workout_skipped")
-        
-        # Workouts abandoned
-        workouts_abandoned = await count_events("workout_abandoned")
-        
-        # Profile views
-        profile_views = await count_events("profile_viewed")
-        
-        # App sessions
-        app_sessions = await count_events("app_session_start")
-        
-        # App opens (foreground)
-        app_opens = await count_events("app_opened")
-        
-        # Screen views
-        screen_views = await count_events("screen_viewed")
-        
-        # Tab switches
-        tab_switches = await count_events("tab_switched")
-        
-        # Exercises completed
-        exercises_completed = await count_events("exercise_completed")
-        
-        # Mood selections
-        mood_selections = await count_events("mood_selected")
-        
-        # Equipment selections
-        equipment_selections = await count_events("equipment_selected")
-        
-        # Difficulty selections
-        difficulty_selections = await db.user_events.count_documents({
-            "event_type": "difficulty_selected",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        # Featured workout events
-        featured_workout_clicks = await db.user_events.count_documents({
-            "event_type": "featured_workout_clicked",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        featured_workout_starts = await db.user_events.count_documents({
-            "event_type": "featured_workout_started",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        featured_workout_completions = await db.user_events.count_documents({
-            "event_type": "featured_workout_completed",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        # Cart events
-        workouts_added_to_cart = await db.user_events.count_documents({
-            "event_type": "workout_added_to_cart",
-            "timestamp": {"$gte": start_date}
-        })
-        
-        workouts_removed_from_cart = await db.user_events.count_documents({
-            "event_type": "workout_removed_from_cart",
-            "timestamp": {"$gte": start_date}
-        })
+            })
         
-        cart_views = await db.user_events.count_documents({
-            "event_type": "cart_viewed",
-            "timestamp": {"$gte": start_date}
-        })
+        # Difficulty, featured workout and cart events (all users)
+        for event_type in [
+            "difficulty_selected", "featured_workout_clicked", "featured_workout_started",
+            "featured_workout_completed", "workout_added_to_cart",
+            "workout_removed_from_cart", "cart_viewed",
+        ]:
+            batch.count(event_type, "user_events", {
+                "event_type": event_type,
+                "timestamp": {"$gte": start_date}
+            })
         
         # New users in period
-        new_users = await db.users.count_documents({
-            "created_at": {"$gte": start_date}
-        })
+        batch.count("new_users", "users", {"created_at": {"$gte": start_date}})
         
         # Most popular mood categories (from mood_selected events)
         mood_pipeline = [
@@ -625,8 +734,40 @@ async def get_admin_analytics(
                 "$limit": 10
             }
         ]
-        
-        popular_moods = await db.user_events.aggregate(mood_pipeline).to_list(length=10)
+        batch.aggregate("popular_moods", "user_events", mood_pipeline, 10)
+        
+        r = await batch.run()
+        
+        total_users = r["total_users"]
+        active_users = len(r["active_users_list"])
+        dau = len(r["dau_list"])
+        new_users = r["new_users"]
+        
+        workouts_started = r["workout_started"]
+        total_workouts = r["workout_completed"]
+        total_posts = r["post_created"]
+        total_likes = r["post_liked"]
+        total_comments = r["post_commented"]
+        total_follows = r["user_followed"]
+        total_unfollows = r["user_unfollowed"]
+        workouts_skipped = r["workout_skipped"]
+        workouts_abandoned = r["workout_abandoned"]
+        profile_views = r["profile_viewed"]
+        app_sessions = r["app_session_start"]
+        app_opens = r["app_opened"]
+        screen_views = r["screen_viewed"]
+        tab_switches = r["tab_switched"]
+        exercises_completed = r["exercise_completed"]
+        mood_selections = r["mood_selected"]
+        equipment_selections = r["equipment_selected"]
+        difficulty_selections = r["difficulty_selected"]
+        featured_workout_clicks = r["featured_workout_clicked"]
+        featured_workout_starts = r["featured_workout_started"]
+        featured_workout_completions = r["featured_workout_completed"]
+        workouts_added_to_cart = r["workout_added_to_cart"]
+        workouts_removed_from_cart = r["workout_removed_from_cart"]
+        cart_views = r["cart_viewed"]
+        popular_moods = r["popular_moods"]
         
         # Map mood IDs to friendly display names
         mood_display_names = {
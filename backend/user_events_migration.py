@@ -0,0 +1,294 @@
+"""
+user_events Time-Series Migration
+Moves user_events to a MongoDB time-series collection (timeField "timestamp",
+metaField "meta" = {user_id, event_type}, granularity "hours"). Events are
+stored in per-user, per-type buckets with columnar compression, and a
+time-window scan reads a few buckets instead of every event document.
+
+Time-series collections can't be renamed, so the swap comes first and the
+copy second, and the app stays online throughout:
+- swap: rename user_events to user_events_legacy and create the time-series
+  user_events (plus its registry indexes) in its place; new events land in it
+  right away. An event inserted between the two commands auto-creates a plain
+  collection, which is moved aside as another copy source
+- copy: copy legacy events newest-first in batches, checkpointing the last _id
+  per source in system.user_events_migration, so dashboards get recent history
+  back first and an interrupted copy resumes where it stopped
+- verify: compare per-day event counts before the swap between sources and
+  the time-series collection
+- drop-legacy: drop the sources once verify has passed
+
+Events keep top-level user_id/event_type next to meta, so every existing
+filter, index and $group works unchanged; each bucket holds a single
+(user_id, event_type), so the copies compress to almost nothing and bucket
+min/max prune on them exactly. Requires MongoDB 8.0+: the audience backfill
+and guest aliasing update non-meta fields, which older servers reject on
+time-series collections.
+
+CLI:
+    python user_events_migration.py status
+    python user_events_migration.py swap
+    python user_events_migration.py copy [--batch-size 5000]
+    python user_events_migration.py verify
+    python user_events_migration.py drop-legacy
+"""
+import asyncio
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import CollectionInvalid
+
+from index_registry import INDEXES, sync_indexes
+from user_analytics import event_meta
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "user_events"
+LEGACY_COLLECTION = "user_events_legacy"
+
+TIMESERIES_OPTIONS = {"timeField": "timestamp", "metaField": "meta", "granularity": "hours"}
+
+# system collection document holding swap time, sources and copy checkpoints
+STATE_ID = "user_events_migration"
+
+MIN_SERVER_VERSION = (8, 0)
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Attempts to claim the user_events name from inserts racing the swap
+MAX_SWAP_ATTEMPTS = 5
+
+
+class MigrationError(Exception):
+    pass
+
+
+async def get_state(db: AsyncIOMotorDatabase) -> Dict[str, Any]:
+    return await db.system.find_one({"_id": STATE_ID}) or {}
+
+
+async def _set_state(db: AsyncIOMotorDatabase, update: Dict[str, Any]) -> None:
+    await db.system.update_one({"_id": STATE_ID}, update, upsert=True)
+
+
+async def collection_type(db: AsyncIOMotorDatabase, name: str) -> Optional[str]:
+    """'timeseries', 'collection', 'view', or None if it doesn't exist."""
+    infos = await db.list_collections(filter={"name": name}).to_list(1)
+    return infos[0].get("type", "collection") if infos else None
+
+
+async def _check_server_version(db: AsyncIOMotorDatabase) -> None:
+    info = await db.client.admin.command("buildInfo")
+    version = tuple(info.get("versionArray", [0, 0])[:2])
+    if version < MIN_SERVER_VERSION:
+        raise MigrationError(
+            f"MongoDB {info.get('version')} can't update non-meta fields of time-series "
+            f"collections; {'.'.join(map(str, MIN_SERVER_VERSION))}+ is required"
+        )
+
+
+def to_timeseries_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """A legacy event as the time-series collection stores it (timestamp must be a date)."""
+    timestamp = doc.get("timestamp")
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            timestamp = None
+    if not isinstance(timestamp, datetime):
+        timestamp = doc["_id"].generation_time
+    return {**doc, "timestamp": timestamp, "meta": event_meta(doc.get("user_id"), doc.get("event_type"))}
+
+
+# ============================================
+# SWAP
+# ============================================
+
+async def swap(db: AsyncIOMotorDatabase) -> Dict[str, Any]:
+    """Put an empty time-series user_events in place of the plain collection."""
+    if await collection_type(db, COLLECTION) == "timeseries":
+        logger.info("user_events is already a time-series collection")
+        return await get_state(db)
+    await _check_server_version(db)
+    if await collection_type(db, LEGACY_COLLECTION):
+        raise MigrationError(f"{LEGACY_COLLECTION} already exists; finish or undo the previous migration first")
+
+    swapped_at = datetime.now(timezone.utc)
+    sources: List[str] = []
+    if await collection_type(db, COLLECTION):
+        await db[COLLECTION].rename(LEGACY_COLLECTION)
+        sources.append(LEGACY_COLLECTION)
+
+    for attempt in range(MAX_SWAP_ATTEMPTS):
+        try:
+            await db.create_collection(COLLECTION, timeseries=TIMESERIES_OPTIONS)
+            break
+        except CollectionInvalid:
+            # An insert recreated user_events as a plain collection in between
+            stray = f"{LEGACY_COLLECTION}_{attempt + 1}"
+            await db[COLLECTION].rename(stray)
+            sources.append(stray)
+    else:
+        raise MigrationError(f"Could not create time-series {COLLECTION} after {MAX_SWAP_ATTEMPTS} attempts")
+
+    await sync_indexes(db, {COLLECTION: INDEXES[COLLECTION]})
+    await _set_state(db, {"$set": {
+        "swapped_at": swapped_at,
+        "sources": sources,
+        "checkpoints": {},
+        "done": [],
+        "copied": 0,
+        "verified": False,
+    }})
+    logger.info(f"🔀 user_events is now time-series; copy from {sources}")
+    return await get_state(db)
+
+
+# ============================================
+# COPY
+# ============================================
+
+async def _copy_source(db: AsyncIOMotorDatabase, source: str, checkpoint: Any, batch_size: int) -> int:
+    copied = 0
+    first_batch = True
+    while True:
+        query = {"_id": {"$lt": checkpoint}} if checkpoint is not None else {}
+        docs = await db[source].find(query).sort("_id", -1).limit(batch_size).to_list(batch_size)
+        if not docs:
+            return copied
+
+        ids = [doc["_id"] for doc in docs]
+        if first_batch:
+            # A run interrupted between insert and checkpoint left this batch behind
+            # (time-series collections have no unique _id to reject the repeats)
+            await db[COLLECTION].delete_many({"_id": {"$in": ids}})
+            first_batch = False
+        await db[COLLECTION].insert_many([to_timeseries_doc(doc) for doc in docs], ordered=False)
+
+        checkpoint = ids[-1]
+        copied += len(docs)
+        await _set_state(db, {"$set": {f"checkpoints.{source}": checkpoint}, "$inc": {"copied": len(docs)}})
+        logger.info(f"📦 Copied {copied} events from {source} (down to {checkpoint.generation_time:%Y-%m-%d})")
+
+
+async def copy(db: AsyncIOMotorDatabase, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Any]:
+    """Copy every source into the time-series collection; resumable."""
+    state = await get_state(db)
+    if not state.get("swapped_at"):
+        raise MigrationError("Run swap before copy")
+
+    for source in state.get("sources", []):
+        if source in state.get("done", []):
+            continue
+        await _copy_source(db, source, state.get("checkpoints", {}).get(source), batch_size)
+        await _set_state(db, {"$addToSet": {"done": source}})
+    return await get_state(db)
+
+
+# ============================================
+# VERIFY / CLEANUP
+# ============================================
+
+def _per_day_pipeline(before: datetime, normalize: bool) -> List[Dict[str, Any]]:
+    day = {"$dateToString": {"format": "%Y-%m-%d", "date": "$ts"}}
+    if not normalize:
+        return [
+            {"$match": {"timestamp": {"$lt": before}}},
+            {"$group": {"_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$timestamp"}}, "count": {"$sum": 1}}},
+        ]
+    # Legacy timestamps are normalised the same way to_timeseries_doc does
+    return [
+        {"$project": {"ts": {"$ifNull": [
+            {"$convert": {"input": "$timestamp", "to": "date", "onError": None, "onNull": None}},
+            {"$toDate": "$_id"}
+        ]}}},
+        {"$match": {"ts": {"$lt": before}}},
+        {"$group": {"_id": day, "count": {"$sum": 1}}},
+    ]
+
+
+async def verify(db: AsyncIOMotorDatabase) -> Dict[str, Any]:
+    """Compare per-day counts of pre-swap events between the sources and user_events."""
+    state = await get_state(db)
+    if not state.get("swapped_at"):
+        raise MigrationError("Nothing to verify: swap has not run")
+    swapped_at = state["swapped_at"].replace(tzinfo=timezone.utc)
+
+    expected: Dict[str, int] = {}
+    for source in state.get("sources", []):
+        async for row in db[source].aggregate(_per_day_pipeline(swapped_at, True), allowDiskUse=True):
+            expected[row["_id"]] = expected.get(row["_id"], 0) + row["count"]
+    actual = {
+        row["_id"]: row["count"]
+        async for row in db[COLLECTION].aggregate(_per_day_pipeline(swapped_at, False), allowDiskUse=True)
+    }
+
+    mismatches = {
+        day: {"expected": expected.get(day, 0), "actual": actual.get(day, 0)}
+        for day in sorted(set(expected) | set(actual))
+        if expected.get(day, 0) != actual.get(day, 0)
+    }
+    ok = not mismatches and set(state.get("done", [])) >= set(state.get("sources", []))
+    await _set_state(db, {"$set": {"verified": ok}})
+    return {
+        "ok": ok,
+        "expected": sum(expected.values()),
+        "actual": sum(actual.values()),
+        "mismatched_days": mismatches,
+    }
+
+
+async def drop_legacy(db: AsyncIOMotorDatabase) -> List[str]:
+    """Drop the copy sources; only after a passing verify."""
+    state = await get_state(db)
+    if not state.get("verified"):
+        raise MigrationError("Run verify (and have it pass) before dropping legacy events")
+    sources = state.get("sources", [])
+    for source in sources:
+        await db.drop_collection(source)
+    await _set_state(db, {"$set": {"legacy_dropped_at": datetime.now(timezone.utc)}})
+    return sources
+
+
+async def _main(command: str, batch_size: int) -> int:
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ.get('MONGO_URL', 'mongodb://localhost:27017'))
+    db = client[os.environ.get('DB_NAME', 'mood_app')]
+    try:
+        if command == "status":
+            print(f"user_events type: {await collection_type(db, COLLECTION)}")
+            result: Any = await get_state(db)
+        elif command == "swap":
+            result = await swap(db)
+        elif command == "copy":
+            result = await copy(db, batch_size)
+        elif command == "verify":
+            result = await verify(db)
+        elif command == "drop-legacy":
+            result = await drop_legacy(db)
+        else:
+            print(__doc__)
+            return 2
+        print(result)
+        return 1 if isinstance(result, dict) and result.get("ok") is False else 0
+    except MigrationError as e:
+        print(f"error: {e}")
+        return 1
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    args = sys.argv[1:]
+    batch_size = DEFAULT_BATCH_SIZE
+    if "--batch-size" in args:
+        batch_size = int(args[args.index("--batch-size") + 1])
+    sys.exit(asyncio.run(_main(args[0] if args else "", batch_size)))
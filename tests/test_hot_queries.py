@@ -0,0 +1,57 @@
+"""
+Hot query plans: every query in index_registry.HOT_QUERIES must be served by
+an index. Runs against MONGO_URL in a scratch database (indexes synced from
+the registry, dropped afterwards); skipped when no server is reachable.
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+motor_asyncio = pytest.importorskip("motor.motor_asyncio")
+
+# Time allowed to find a server before the test is skipped
+SERVER_SELECTION_TIMEOUT_MS = 2000
+
+
+async def _explain_in_scratch_db():
+    from dotenv import load_dotenv
+    from index_registry import sync_indexes, explain_hot_queries
+
+    load_dotenv(BACKEND_DIR / ".env")
+    client = motor_asyncio.AsyncIOMotorClient(
+        os.environ.get("MONGO_URL", "mongodb://localhost:27017"),
+        serverSelectionTimeoutMS=SERVER_SELECTION_TIMEOUT_MS,
+    )
+    try:
+        try:
+            await client.admin.command("ping")
+        except Exception as e:
+            return None, f"MongoDB not reachable: {e}"
+
+        db = client[f"{os.environ.get('DB_NAME', 'mood_app')}_plan_check"]
+        try:
+            await sync_indexes(db)
+            return await explain_hot_queries(db), None
+        finally:
+            await client.drop_database(db.name)
+    finally:
+        client.close()
+
+
+def test_hot_queries_use_indexes():
+    results, skip_reason = asyncio.run(_explain_in_scratch_db())
+    if skip_reason:
+        pytest.skip(skip_reason)
+
+    failures = [
+        f"{r['collection']}.{r['name']}: {r.get('error') or ' <- '.join(r['stages'])}"
+        for r in results
+        if r["collscan"] or r.get("error")
+    ]
+    assert not failures, "Hot queries without an index:\n" + "\n".join(failures)